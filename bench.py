@@ -0,0 +1,442 @@
+import sys, os, json, time, logging, tempfile, functools, tracemalloc, threading, subprocess
+
+from lib import spl_validator
+from lib import pool
+from lib import daemon
+from lib import macros
+from lib import macro_index
+from lib import confs
+from lib import dashboards
+from lib import corpus_index
+from lib import near_duplicates
+from lib import prefix_trie
+from lib import canonical
+from lib.ply import yacc
+
+# Usage: python bench.py [benchmark_name ...]
+# Runs all the benchmarks when no name is given
+
+def load_corpus():
+	with open('test_conf.json') as f:
+		conf = json.load(f)
+	return [conf["test_cases"][t]["search"] for t in conf["test_cases"]]
+
+def timed(fun,rounds=5):
+	best=None
+	for i in range(rounds):
+		st=time.perf_counter()
+		fun()
+		dt=time.perf_counter()-st
+		if best is None or dt < best:
+			best=dt
+	return best
+
+# Cost of collecting each facet of the result, measured separately
+def bench_facets():
+	corpus=load_corpus()
+	spl_validator.analyze(corpus[0],print_errs=False)
+	def run(facets):
+		return lambda: [spl_validator.analyze(s,print_errs=False,facets=facets) for s in corpus]
+	base=timed(run([]))
+	print("[facets] {} queries, no facet: {:.1f} ms".format(len(corpus),base*1000))
+	for facet in sorted(spl_validator.FACETS):
+		dt=timed(run([facet]))
+		print("[facets] {:<14} {:.1f} ms ({:+.1f} ms)".format(facet,dt*1000,(dt-base)*1000))
+	dt=timed(run(None))
+	print("[facets] {:<14} {:.1f} ms ({:+.1f} ms)".format("all",dt*1000,(dt-base)*1000))
+
+# Long eval case() expressions, the content of the expression is only read
+# once per assignment instead of being rebuilt at each reduction
+def bench_case_eval():
+	spl_validator.analyze("index=a",print_errs=False)
+	for n in [500,2000,8000]:
+		s='index=a | eval x=case('+",".join('f={},"v{}"'.format(i,i) for i in range(n))+')'
+		dt=timed(lambda: spl_validator.analyze(s,print_errs=False))
+		print("[case_eval] {} branches ({} chars): {:.1f} ms".format(n,len(s),dt*1000))
+
+# Memory held by the results of 1000 analyzed queries
+def bench_memory():
+	corpus=load_corpus()
+	spl_validator.analyze(corpus[0],print_errs=False)
+	queries=[corpus[i % len(corpus)] for i in range(1000)]
+	tracemalloc.start()
+	res=[spl_validator.analyze(s,print_errs=False) for s in queries]
+	size=tracemalloc.get_traced_memory()
+	tracemalloc.stop()
+	print("[memory] {} results held: {:.1f} KB (peak {:.1f} KB)".format(len(res),size[0]/1024,size[1]/1024))
+
+# Text which is not SPL at all (pasted log lines), rejected after max_errors
+def bench_errors():
+	spl_validator.analyze("index=a",print_errs=False)
+	line='2024-01-01 12:00:00,123 INFO [main] (Worker-3) user=bob action="login" status=ok {"k": [1,2]} #$% ;; \\n'
+	for n in [10,200,2000]:
+		s=line*n
+		r=spl_validator.analyze(s,print_errs=False)
+		dt=timed(lambda: spl_validator.analyze(s,print_errs=False))
+		print("[errors] {} log lines ({} chars): {} errors, truncated={}, {:.1f} ms".format(n,len(s),r["errors_count"],r["errors"]["truncated"],dt*1000))
+
+# Adversarial queries analyzed with and without complexity budgets
+def bench_budgets():
+	spl_validator.analyze("index=a",print_errs=False)
+	budgets={"max_length":100000,"max_tokens":5000,"max_depth":50,"timeout":0.1}
+	queries={
+		"nested parenthesis":"index=a | eval x="+"("*3000+"1"+")"*3000,
+		"long IN list":"index=a x IN ("+",".join(str(i) for i in range(50000))+")",
+		"long query":"index=a "+"| eval x=1 "*5000
+	}
+	for name in queries:
+		s=queries[name]
+		free=timed(lambda: spl_validator.analyze(s,print_errs=False),rounds=1)
+		dt=timed(lambda: spl_validator.analyze(s,print_errs=False,**budgets))
+		r=spl_validator.analyze(s,print_errs=False,**budgets)
+		print("[budgets] {:<20} no budget: {:.1f} ms, with budgets: {:.1f} ms ({})".format(name,free*1000,dt*1000,r["errors"].get("budget",{}).get("budget")))
+
+# Worst case lexing time against the input length, on inputs which used to
+# make the lexer regexes backtrack
+def bench_lexer():
+	spl_validator.analyze("index=a",print_errs=False)
+	adversarial={"pattern_run":"a<","timespecifier":"+a","dquote_escapes":'"\\',"squote_escapes":"'\\","name_template":"a<<","pattern_dates":"1/"}
+	for name in adversarial:
+		times=[]
+		for n in [1000,4000,16000]:
+			s=adversarial[name]*n
+			times.append("{} chars: {:.1f} ms".format(len(s),timed(lambda: spl_validator.tokenize(s),rounds=3)*1000))
+		print("[lexer] {:<15} {}".format(name,", ".join(times)))
+
+# Lexing throughput of the lexer backends on the test corpus
+def bench_lexer_backends():
+	corpus=load_corpus()
+	spl_validator.tokenize(corpus[0])
+	s=" ".join(corpus)
+	base=None
+	for backend in spl_validator.LEXER_BACKENDS:
+		lx=spl_validator.get_lexer(backend)
+		def run():
+			lx.input(s)
+			token=lx.token
+			while not token() is None:
+				pass
+		dt=timed(run)
+		base=dt if base is None else base
+		print("[lexer_backends] {:<8} {} chars: {:.1f} ms ({:.0f} Kchars/s, x{:.2f})".format(backend,len(s),dt*1000,len(s)/dt/1000,base/dt))
+
+# Parse loops on the test corpus: PLY parseopt (used by analyze), parseopt_notrack
+# and the loop generated by lrgen. The tokens are read beforehand, and the loops
+# are also timed with the grammar rules replaced by no-ops (parseopt_notrack
+# cannot run the grammar rules, which read the positions of the symbols)
+def bench_parser_backends():
+	corpus=load_corpus()
+	spl_validator.analyze(corpus[0],print_errs=False)
+	for backend in spl_validator.PARSER_BACKENDS:
+		spl_validator.analyze(corpus[0],print_errs=False,parser_backend=backend)
+		dt=timed(lambda: [spl_validator.analyze(s,print_errs=False,parser_backend=backend) for s in corpus])
+		print("[parser_backends] analyze {:<6} {} queries: {:.1f} ms".format(backend,len(corpus),dt*1000))
+	ply=spl_validator.get_parser("ply")
+	lalr=spl_validator.get_parser("lalr")
+	tokens=[spl_validator.tokenize(s) for s in corpus]
+	loops={
+		"parseopt": lambda lx,tf: ply.parseopt(None,lexer=lx,tracking=True,tokenfunc=tf),
+		"parseopt_notrack": lambda lx,tf: ply.parseopt_notrack(None,lexer=lx,tokenfunc=tf),
+		"lalr": lambda lx,tf: lalr.parse(None,lexer=lx,tokenfunc=tf)
+	}
+	def run(loop):
+		for s,toks in zip(corpus,tokens):
+			spl_validator.init_analyser()
+			lx=spl_validator.get_lexer("ply")
+			lx.lexdata=s
+			loop(lx,functools.partial(next,iter(toks),None))
+	def noop(p):
+		pass
+	callables=[p.callable for p in ply.productions]
+	prods=lalr.prods
+	for name in loops:
+		dt=None
+		if name != "parseopt_notrack":
+			spl_validator.params["max_errors"]=None
+			dt=timed(lambda: run(loops[name]))
+		for p in ply.productions:
+			p.callable=noop
+		lalr.prods=[(pname,plen,nt,noop) for pname,plen,nt,f in prods]
+		try:
+			dn=timed(lambda: run(loops[name]))
+		finally:
+			for p,f in zip(ply.productions,callables):
+				p.callable=f
+			lalr.prods=prods
+		print("[parser_backends] {:<17} grammar rules: {}, no-op rules: {:.1f} ms".format(name,"-" if dt is None else "{:.1f} ms".format(dt*1000),dn*1000))
+
+# Building the LALR tables from scratch (what happens when the grammar or the
+# list of commands changes), with and without the debugging file parser.out
+def bench_tables():
+	log=logging.getLogger("bench")
+	log.setLevel(logging.CRITICAL)
+	for debug in [False,True]:
+		with tempfile.TemporaryDirectory() as d:
+			dt=timed(lambda: yacc.yacc(module=spl_validator,debug=debug,errorlog=log,outputdir=d,tabmodule="bench_parsetab",write_tables=False),rounds=1)
+		print("[tables] debug={}: {:.2f} s".format(debug,dt))
+
+# Registering hundreds of custom commands at runtime (no parse tables rebuild)
+def bench_custom_commands():
+	spl_validator.analyze("index=a",print_errs=False)
+	names=["custom_bench_{}".format(i) for i in range(500)]
+	dt=timed(lambda: [spl_validator.register_command(n) for n in names],rounds=1)
+	s=" | ".join(["index=a"]+names)
+	da=timed(lambda: spl_validator.analyze(s,print_errs=False))
+	r=spl_validator.analyze(s,print_errs=False)
+	print("[custom_commands] {} commands registered in {:.1f} ms, query using all of them: {:.1f} ms ({} errors)".format(len(names),dt*1000,da*1000,r["errors_count"]))
+
+# Command profiles: loading a profile on first use, then analyzing with it
+# (same parse tables as the default profile)
+def bench_profiles():
+	corpus=load_corpus()
+	spl_validator.analyze(corpus[0],print_errs=False)
+	with tempfile.TemporaryDirectory() as d:
+		path=os.path.join(d,"bench.json")
+		with open(os.path.join("lib","spl_commands.json")) as f, open(path,"w") as g:
+			g.write(f.read())
+		spl_validator.register_profile("bench",path)
+		dt=timed(lambda: spl_validator.analyze(corpus[0],print_errs=False,profile="bench"),rounds=1)
+		print("[profiles] first use of a profile: {:.1f} ms".format(dt*1000))
+		for profile in [None,"bench"]:
+			dt=timed(lambda: [spl_validator.analyze(s,print_errs=False,profile=profile) for s in corpus])
+			print("[profiles] {:<8} {} queries: {:.1f} ms".format(str(profile),len(corpus),dt*1000))
+
+# Batch analysis of the test corpus (repeated) with the worker pool, and start
+# time of the pool: warm workers forked from the forkserver against spawned ones
+def bench_pool():
+	corpus=load_corpus()
+	queries=corpus*10
+	spl_validator.analyze(corpus[0],print_errs=False)
+	dt=timed(lambda: [spl_validator.analyze(s,print_errs=False) for s in queries],rounds=1)
+	print("[pool] serial {} queries: {:.1f} ms".format(len(queries),dt*1000))
+	for method in ["forkserver","spawn"]:
+		st=time.perf_counter()
+		with pool.ValidatorPool(4,start_method=method) as vp:
+			vp.analyze(corpus[:4])
+			ds=time.perf_counter()-st
+			dt=timed(lambda: vp.analyze(queries),rounds=1)
+		print("[pool] {:<10} 4 workers, first results after {:.1f} ms, {} queries: {:.1f} ms".format(method,ds*1000,len(queries),dt*1000))
+
+# Latency of checking one query from a new process (like a git hook): importing
+# spl_validator and loading the tables against asking the daemon
+def bench_daemon():
+	q="index=a | stats count by x | eval y=x*2"
+	commands={
+		"import": [sys.executable,"-c","from lib import spl_validator; spl_validator.analyze({!r},print_errs=False)".format(q)],
+		"client": [sys.executable,"-m","lib.client","-a",None,q]
+	}
+	with tempfile.TemporaryDirectory() as d:
+		address=os.path.join(d,"bench.sock")
+		commands["client"][4]=address
+		server=daemon.make_server(address)
+		threading.Thread(target=server.serve_forever,daemon=True).start()
+		for name in commands:
+			dt=timed(lambda: subprocess.run(commands[name],check=False))
+			print("[daemon] {:<6} one query in a new process: {:.1f} ms".format(name,dt*1000))
+		server.shutdown()
+		server.server_close()
+
+# Loading the macros of an etc/apps tree of 300 apps (default and local
+# macros.conf), without cache and then from the cache
+def bench_apps_tree():
+	with tempfile.TemporaryDirectory() as d:
+		apps=os.path.join(d,"apps")
+		for i in range(300):
+			for folder in ["default","local"]:
+				os.makedirs(os.path.join(apps,"app{:03d}".format(i),folder))
+				with open(os.path.join(apps,"app{:03d}".format(i),folder,"macros.conf"),"w") as f:
+					for j in range(20):
+						f.write("[app{}_macro{}(1)]\nargs = x\ndefinition = index=$x$ sourcetype={} \\\n  | stats count by host\n\n".format(i,j,folder))
+		cache=os.path.join(d,"cache.json")
+		cold=timed(lambda: macros.loadAppsTree(apps,False),rounds=3)
+		macros.loadAppsTree(apps,cache)
+		warm=timed(lambda: macros.loadAppsTree(apps,cache))
+		print("[apps_tree] 600 macros.conf files, no cache: {:.1f} ms, cached: {:.1f} ms".format(cold*1000,warm*1000))
+
+# Expanding queries calling nested macros (chains of 20 macros), the definitions
+# being analyzed once into the dependency graph
+def bench_macro_graph():
+	with tempfile.TemporaryDirectory() as d:
+		path=os.path.join(d,"macros.conf")
+		with open(path,"w") as f:
+			for c in range(50):
+				for i in range(20):
+					f.write("[m{}_{}]\ndefinition = `m{}_{}` | eval x{}=1\n".format(c,i,c,i+1,i))
+				f.write("[m{}_20]\ndefinition = index=a\n".format(c))
+		q=" | append [search `m{}_0`]"
+		s="search `m0_0`"+"".join(q.format(c) for c in range(1,50))
+		macros.handleMacros(s,[path])
+		dt=timed(lambda: [macros.handleMacros(s,[path]) for i in range(100)])
+		print("[macro_graph] 100 expansions of a query calling 50 chains of 20 nested macros: {:.1f} ms".format(dt*1000))
+
+# Query calling 100 times a macro with a large definition (eval of 500 terms),
+# expanded in the query text (the expanded text is lexed) or spliced as tokens
+# (the definition is lexed once)
+def bench_macro_splicing():
+	with tempfile.TemporaryDirectory() as d:
+		path=os.path.join(d,"macros.conf")
+		with open(path,"w") as f:
+			f.write("[big(1)]\nargs = f\ndefinition = eval $f$="+"+".join("x{}".format(i) for i in range(500))+"\n")
+		s="index=a"+"".join(" | `big(f{})`".format(i % 10) for i in range(100))
+		for mode in spl_validator.MACRO_EXPANSIONS:
+			spl_validator.analyze(s,print_errs=False,macro_files=[path],macro_expansion=mode)
+			dt=timed(lambda: spl_validator.analyze(s,print_errs=False,macro_files=[path],macro_expansion=mode))
+			print("[macro_splicing] {:<6} 100 calls of a macro of 500 terms: {:.1f} ms".format(mode,dt*1000))
+
+# Macro usage index of 40000 searches calling 2000 macros (chains of 5 macros):
+# first indexing, update of 100 searches, and searches affected by a change of
+# the definitions
+def bench_macro_index():
+	old_conf={}
+	for c in range(400):
+		for i in range(5):
+			old_conf["m{}_{}".format(c,i)]={"definition":"`m{}_{}` | eval x=1".format(c,i+1) if i < 4 else "index=a"}
+	new_conf=dict(old_conf)
+	for c in range(0,400,100):
+		new_conf["m{}_4".format(c)]={"definition":"index=b"}
+	searches={"s{}".format(i):"search `m{}_{}` | stats count by host".format(i % 400,i % 5) for i in range(40000)}
+	with tempfile.TemporaryDirectory() as d:
+		mindex=macro_index.MacroUsageIndex(os.path.join(d,"index.db"))
+		dt=timed(lambda: mindex.update(searches),rounds=1)
+		print("[macro_index] {} searches indexed: {:.1f} ms".format(len(searches),dt*1000))
+		for i in range(100):
+			searches["s{}".format(i)]+=" | `m0_0`"
+		dt=timed(lambda: mindex.update(searches),rounds=1)
+		print("[macro_index] update after 100 changed searches: {:.1f} ms".format(dt*1000))
+		r=mindex.affected(old_conf,new_conf)
+		dt=timed(lambda: mindex.affected(old_conf,new_conf))
+		print("[macro_index] {} searches affected by a change of 4 macros: {:.1f} ms".format(len(r),dt*1000))
+		mindex.close()
+
+# Reading a savedsearches.conf file of 50000 multi-line searches: streaming
+# reader against configparser (macros.loadFile), time and peak memory, and time
+# to get a sample of 100 searches
+def bench_confs():
+	with tempfile.TemporaryDirectory() as d:
+		path=os.path.join(d,"savedsearches.conf")
+		with open(path,"w") as f:
+			for i in range(50000):
+				f.write("[search {}]\nsearch = index=a sourcetype=s{} \\\n| stats count by host \\\n| where count > {}\ncron_schedule = */5 * * * *\nenableSched = 1\n\n".format(i,i,i))
+		readers={
+			"streaming": lambda: sum(1 for r in confs.read([path])),
+			"configparser": lambda: len(macros.loadFile(path))
+		}
+		for name in readers:
+			dt=timed(readers[name],rounds=1)
+			tracemalloc.start()
+			readers[name]()
+			peak=tracemalloc.get_traced_memory()[1]
+			tracemalloc.stop()
+			print("[confs] {:<12} 50000 searches: {:.1f} ms, peak {:.1f} MB".format(name,dt*1000,peak/1024/1024))
+		dt=timed(lambda: list(confs.read([path],limit=100)))
+		print("[confs] sample of 100 searches: {:.2f} ms".format(dt*1000))
+
+def bench_dashboards():
+	# 200 dashboards of 20 panels, sharing the same 40 distinct searches
+	with tempfile.TemporaryDirectory() as d:
+		for i in range(200):
+			with open(os.path.join(d,"dash{}.xml".format(i)),"w") as f:
+				f.write('<form>\n<fieldset><input type="text" token="idx"><default>main</default></input></fieldset>\n')
+				for j in range(20):
+					f.write('<row><panel><chart><search><query>index=$idx$ sourcetype=s{} | stats count by host | where count &gt; 10</query></search></chart></panel></row>\n'.format((i+j)%40))
+				f.write('</form>\n')
+		dt=timed(lambda: list(dashboards.read([d])),rounds=1)
+		panels=list(dashboards.read([d]))
+		print("[dashboards] extraction of {} panels: {:.1f} ms".format(len(panels),dt*1000))
+		dt=timed(lambda: dashboards.validate(panels),rounds=1)
+		print("[dashboards] validate, distinct queries: {:.1f} ms".format(dt*1000))
+		dt=timed(lambda: [spl_validator.analyze(p.query,print_errs=False) for p in panels],rounds=1)
+		print("[dashboards] analyze of each panel:      {:.1f} ms".format(dt*1000))
+
+def bench_corpus_index():
+	n=10000
+	cmds=["stats count by host","transaction host","dedup src_ip","eval x=1","top limit=5 user","lookup geo ip OUTPUT city","table _time host"]
+	corpus={"s{}".format(i):"index=i{} sourcetype=st{} f{}=1 | {} | {}".format(i%50,i%200,i%1000,cmds[i%7],cmds[(i//7)%7]) for i in range(n)}
+	with tempfile.TemporaryDirectory() as d:
+		ix=corpus_index.CorpusIndex(os.path.join(d,"corpus.db"))
+		dt=timed(lambda: ix.update(corpus),rounds=1)
+		print("[corpus_index] index of {} searches: {:.1f} s".format(n,dt))
+		dt=timed(lambda: ix.update(corpus),rounds=1)
+		print("[corpus_index] update, no change: {:.1f} ms".format(dt*1000))
+		dt=timed(lambda: ix.searches("field","f7"))
+		print("[corpus_index] searches reading a field: {:.2f} ms".format(dt*1000))
+		dt=timed(lambda: ix.searches("command",["transaction","dedup"]))
+		print("[corpus_index] searches using two commands: {:.2f} ms".format(dt*1000))
+		dt=timed(lambda: [spl_validator.analyze(q,print_errs=False) for q in list(corpus.values())[:1000]],rounds=1)
+		print("[corpus_index] same question by analysis: {:.1f} s (extrapolated)".format(dt*n/1000))
+		ix.close()
+
+def bench_near_duplicates():
+	# 20000 searches, 2000 distinct ones each with 9 copies differing by a number
+	corpus={"s{}".format(i):"index=i{0} sourcetype=st{0} | eval v{0}=f{0} | stats count by v{0}, h{0} | where count > {1}".format(i%2000,i) for i in range(20000)}
+	st=time.perf_counter()
+	clusters=near_duplicates.find_clusters(corpus)
+	print("[near_duplicates] 20000 searches: {} clusters of {} searches in {:.1f} s".format(len(clusters),sum(len(c.names) for c in clusters),time.perf_counter()-st))
+	with pool.ValidatorPool(2) as p:
+		st=time.perf_counter()
+		clusters=near_duplicates.find_clusters(corpus,pool=p)
+		print("[near_duplicates] 20000 searches, 2 workers: {:.1f} s".format(time.perf_counter()-st))
+	queries=list(corpus.values())[:2000]
+	dt=timed(lambda: [near_duplicates.signature(q) for q in queries],rounds=1)
+	print("[near_duplicates] signature: {:.0f} us".format(dt/len(queries)*1e6))
+
+def bench_prefix_trie():
+	# 40000 searches, 400 heads of 100 searches each
+	corpus=lambda n: (("s{}".format(i),"index=i{0} sourcetype=st{0} | stats count by f{0} | where count > {1} | sort - count".format(i%400,i)) for i in range(n))
+	trie=prefix_trie.PrefixTrie()
+	dt=timed(lambda: trie.update(corpus(40000)),rounds=1)
+	print("[prefix_trie] 40000 searches in one pass: {:.1f} s".format(dt))
+	tracemalloc.start()
+	prefix_trie.PrefixTrie().update(corpus(10000))
+	peak=tracemalloc.get_traced_memory()[1]
+	tracemalloc.stop()
+	print("[prefix_trie] 10000 searches: peak {:.1f} MB".format(peak/1024/1024))
+	dt=timed(lambda: trie.shared(min_searches=50))
+	print("[prefix_trie] {} shared prefixes: {:.1f} ms".format(len(trie.shared(min_searches=50)),dt*1000))
+
+def bench_canonical():
+	queries=[t["search"] for t in json.load(open("test_conf.json"))["test_cases"].values()]
+	steps={
+		"tokenize": lambda: [spl_validator.tokenize(q,lexer_backend="scanner") for q in queries],
+		"fingerprint": lambda: [canonical.fingerprint(q) for q in queries],
+		"analyze": lambda: [spl_validator.analyze(q,print_errs=False) for q in queries]
+	}
+	for name in steps:
+		dt=timed(steps[name])
+		print("[canonical] {:<12} {:.1f} us per query".format(name,dt/len(queries)*1e6))
+	distinct=len(set(queries))
+	print("[canonical] {} distinct queries, {} distinct fingerprints".format(distinct,len(set(canonical.fingerprint(q) for q in queries))))
+
+benchmarks={
+	"facets": bench_facets,
+	"case_eval": bench_case_eval,
+	"memory": bench_memory,
+	"errors": bench_errors,
+	"budgets": bench_budgets,
+	"lexer": bench_lexer,
+	"lexer_backends": bench_lexer_backends,
+	"parser_backends": bench_parser_backends,
+	"tables": bench_tables,
+	"custom_commands": bench_custom_commands,
+	"profiles": bench_profiles,
+	"pool": bench_pool,
+	"daemon": bench_daemon,
+	"apps_tree": bench_apps_tree,
+	"macro_graph": bench_macro_graph,
+	"macro_splicing": bench_macro_splicing,
+	"macro_index": bench_macro_index,
+	"confs": bench_confs,
+	"dashboards": bench_dashboards,
+	"corpus_index": bench_corpus_index,
+	"near_duplicates": bench_near_duplicates,
+	"prefix_trie": bench_prefix_trie,
+	"canonical": bench_canonical
+}
+
+if __name__ == "__main__":
+	selection = sys.argv[1:] if len(sys.argv) > 1 else list(benchmarks.keys())
+	for name in selection:
+		if not name in benchmarks:
+			print("[ERROR] Unknown benchmark '{}', expected one of {}".format(name,list(benchmarks.keys())))
+			continue
+		benchmarks[name]()
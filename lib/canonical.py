@@ -0,0 +1,159 @@
+import re, hashlib
+
+from . import spl_validator
+
+#---------------------------
+#    CANONICAL FORMATTER
+#---------------------------
+
+# Canonical text of a query, for the dedup of equivalent queries and as a cache
+# key. Only the tokens of the query are read (scanner lexer), so it runs at the
+# speed of the lexer:
+# * the spaces are normalized: one space between the terms, none around the
+#   comparison operators, after an opening or before a closing parenthesis and
+#   before a comma, one after a comma. The tokens written without space between
+#   them (like count(x)) are kept together.
+# * the commands and clauses (by, as, output...) are lowercase, the boolean
+#   operators uppercase
+# * the leading search command of a query is dropped, the terms of a search
+#   without boolean operators, parentheses or macro calls (the expansion of a
+#   macro may depend on the terms around it) are sorted, as are the options
+#   (name=value) written right after a command
+# * a quoted simple value (name or number) is unquoted when it is a search term,
+#   or the value of a search comparison or of an option; the expressions (eval,
+#   where, fieldformat) keep their order and quotes
+# The subsearches are formatted the same way. A query with lexer errors is only
+# normalized on its spaces.
+
+# Comparison operators, a term with the operands around them
+COMPARISONS = frozenset(["EQ","NEQ","DEQ","COMP_OP"])
+BOOLEANS = frozenset(["OR_OP","AND_OP","NOT_OP"])
+# Tokens making the order of the terms of a search significant
+ORDERED = BOOLEANS | frozenset(["LPAREN","RPAREN","QLPAREN","QRPAREN","MACRO"])
+# Commands whose arguments are expressions, kept in order and quoted as written
+EXPRESSION_COMMANDS = frozenset(["CMD_EVAL","CMD_WHERE","CMD_FIELDFORMAT"])
+# Clauses written lowercase
+CLAUSES = frozenset(["as","by","groupby","over","output","outputnew","with","in","sortby"])
+# Strings which can be written without quotes
+SIMPLE_VALUE = re.compile(r'[a-zA-Z0-9_][a-zA-Z0-9_\.]*$')
+
+def token_text(query,tok):
+    if tok.type in BOOLEANS:
+        return tok.value.upper()
+    text = query[tok.lexpos:tok.endlexpos].strip()
+    if text.lower() in CLAUSES and spl_validator.keywords.get(text.lower()) == tok.type:
+        return text.lower()
+    return text
+
+def unquoted(query,tok):
+    if tok.type == "STRING" and query[tok.lexpos] == '"' and SIMPLE_VALUE.match(tok.value) and not tok.value.lower() in spl_validator.keywords:
+        return tok.value
+    return token_text(query,tok)
+
+# Whether two tokens are written without space between them
+def glued(query,prev,tok):
+    return prev.endlexpos == tok.lexpos and not query[prev.endlexpos-1].isspace()
+
+# Terms of a stage, as lists of tokens (a subsearch being a term of its own)
+def stage_terms(query,tokens):
+    terms = []
+    i = 0
+    while i < len(tokens):
+        tok = tokens[i]
+        if tok.type == "LBRACK":
+            depth, j = 1, i + 1
+            while j < len(tokens) and depth > 0:
+                depth += {"LBRACK":1,"RBRACK":-1}.get(tokens[j].type,0)
+                j += 1
+            terms.append(tokens[i:j])
+            i = j
+            continue
+        if len(terms) > 0 and terms[-1][0].type != "LBRACK":
+            prev = terms[-1][-1]
+            if prev.type != "COMMA" and (tok.type in COMPARISONS or tok.type == "COMMA" or prev.type in COMPARISONS or glued(query,prev,tok)):
+                terms[-1].append(tok)
+                i += 1
+                continue
+        terms.append([tok])
+        i += 1
+    return terms
+
+# Text of a term, unquote: whether the simple values can be unquoted
+def term_text(query,term,unquote):
+    if term[0].type == "LBRACK":
+        return "[" + pipeline(query,term[1:-1],True) + "]"
+    if unquote and len(term) == 1:
+        return unquoted(query,term[0])
+    if unquote and len(term) == 3 and term[1].type in COMPARISONS:
+        return token_text(query,term[0]) + token_text(query,term[1]) + unquoted(query,term[2])
+    return "".join(token_text(query,t) for t in term)
+
+# Text of the terms, with the spaces of the canonical form
+def join_terms(texts):
+    text = ""
+    for t in texts:
+        if len(text) > 0 and not text.endswith("(") and not t.startswith(")"):
+            text += " "
+        text += t
+    return text
+
+# Sorted search terms, if their order does not matter
+def search_terms(query,terms):
+    texts = [term_text(query,t,True) for t in terms]
+    if not any(tok.type in ORDERED for t in terms for tok in t):
+        texts.sort()
+    return texts
+
+# first: whether the stage is the base search of the query
+def stage(query,tokens,first):
+    if len(tokens) == 0:
+        return ""
+    cmd = tokens[0]
+    if first or cmd.type == "CMD_SEARCH":
+        if cmd.type == "CMD_SEARCH":
+            tokens = tokens[1:]
+        texts = search_terms(query,stage_terms(query,tokens))
+        return join_terms(texts if first else ["search"] + texts)
+    head = token_text(query,cmd)
+    if cmd.type in spl_validator.keywords.values():
+        head = head.lower()
+    terms = stage_terms(query,tokens[1:])
+    if cmd.type in EXPRESSION_COMMANDS:
+        return join_terms([head] + [term_text(query,t,False) for t in terms])
+    # Options of the command
+    n = 0
+    while n < len(terms) and len(terms[n]) == 3 and terms[n][1].type == "EQ":
+        n += 1
+    options = sorted(term_text(query,t,True) for t in terms[:n])
+    return join_terms([head] + options + [term_text(query,t,False) for t in terms[n:]])
+
+# Canonical text of the pipeline of the tokens (query or subsearch, starting
+# with a command)
+def pipeline(query,tokens,subsearch=False):
+    stages = [[]]
+    depth = 0
+    for tok in tokens:
+        if tok.type == "LBRACK":
+            depth += 1
+        elif tok.type == "RBRACK":
+            depth -= 1
+        elif tok.type == "PIPE" and depth == 0:
+            stages.append([])
+            continue
+        stages[-1].append(tok)
+    texts = [stage(query,st,n == 0 and not subsearch) for n, st in enumerate(stages)]
+    if texts[0] == "" and len(texts) > 1:
+        return "| " + " | ".join(texts[1:])
+    return " | ".join(texts)
+
+# Canonical text of a query
+def canonicalize(query,profile=None):
+    tokens = spl_validator.tokenize(query,lexer_backend="scanner",profile=profile,macro_tokens=True)
+    if len(spl_validator.errors["list"]) > 0:
+        return " ".join(query.split())
+    return pipeline(query,tokens)
+
+# Fingerprint of a query (128 bits, hexadecimal), the same for the queries with
+# the same canonical text
+def fingerprint(query,profile=None):
+    return hashlib.blake2b(canonicalize(query,profile).encode("utf-8"),digest_size=16).hexdigest()
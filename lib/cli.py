@@ -0,0 +1,88 @@
+import argparse
+
+from . import spl_validator
+
+#---------------------------
+#       COMMAND LINE
+#---------------------------
+
+# Usage: python -m lib <command> [options]
+
+def cmd_build_tables(args):
+    for path in spl_validator.build_tables(debug=args.debug):
+        print("[BUILD] {}".format(path))
+    return 0
+
+# The daemon warms the analyzer up when imported
+def cmd_serve(args):
+    from . import daemon
+    print("[SERVE] Listening on {}".format(args.address or daemon.default_address()))
+    daemon.serve(args.address,args.macro_paths)
+    return 0
+
+# Language server on stdin/stdout
+def cmd_lsp(args):
+    from . import lsp
+    return lsp.main()
+
+# Clusters of near-duplicates of the saved searches of savedsearches.conf files
+# or etc/apps trees
+def cmd_duplicates(args):
+    from . import confs, near_duplicates, pool
+    searches = (("{}/{}".format(r.app,r.stanza) if not r.app is None else r.stanza, r.search) for r in confs.read(args.paths))
+    if args.processes > 1:
+        with pool.ValidatorPool(args.processes) as workers:
+            clusters = near_duplicates.find_clusters(searches,args.threshold,pool=workers)
+    else:
+        clusters = near_duplicates.find_clusters(searches,args.threshold)
+    for line in near_duplicates.report(clusters):
+        print(line)
+    return 0
+
+# Pipeline prefixes shared by the scheduled saved searches
+def cmd_prefixes(args):
+    from . import confs, prefix_trie, pool
+    def scheduled(r):
+        return args.all or (r.metadata.get("enableSched","0").lower() in ("1","true") and not r.metadata.get("disabled","0").lower() in ("1","true"))
+    searches = (("{}/{}".format(r.app,r.stanza) if not r.app is None else r.stanza, r.search) for r in confs.read(args.paths) if scheduled(r))
+    trie = prefix_trie.PrefixTrie(args.max_depth)
+    if args.processes > 1:
+        with pool.ValidatorPool(args.processes) as workers:
+            trie.update(searches,pool=workers)
+    else:
+        trie.update(searches)
+    for line in prefix_trie.report(trie.shared(args.min_searches,args.min_stages)):
+        print(line)
+    return 0
+
+def build_arg_parser():
+    ap = argparse.ArgumentParser(prog="python -m lib",description="SPL validator")
+    sub = ap.add_subparsers(dest="command")
+    sub.required = True
+    p = sub.add_parser("build-tables",help="generate the lexer and parser tables ahead of time (for read-only installs)")
+    p.add_argument("--debug",action="store_true",help="also write the PLY debugging file parser.out")
+    p.set_defaults(func=cmd_build_tables)
+    p = sub.add_parser("serve",help="run the validation daemon, queried with python -m lib.client")
+    p.add_argument("-a","--address",default=None,help="socket path or host:port to listen on")
+    p.add_argument("-m","--macro-path",action="append",default=[],dest="macro_paths",help="macro file, or folder of macro files, the clients can use (repeatable)")
+    p.set_defaults(func=cmd_serve)
+    p = sub.add_parser("lsp",help="run the language server (Language Server Protocol over stdio)")
+    p.set_defaults(func=cmd_lsp)
+    p = sub.add_parser("duplicates",help="report the clusters of near-duplicate saved searches")
+    p.add_argument("paths",nargs="+",help="savedsearches.conf files or etc/apps folders")
+    p.add_argument("-t","--threshold",type=float,default=0.7,help="lowest estimated similarity of two near-duplicates (default 0.7)")
+    p.add_argument("-p","--processes",type=int,default=1,help="number of worker processes computing the signatures")
+    p.set_defaults(func=cmd_duplicates)
+    p = sub.add_parser("prefixes",help="report the pipeline prefixes shared by many scheduled searches (summary indexing candidates)")
+    p.add_argument("paths",nargs="+",help="savedsearches.conf files or etc/apps folders")
+    p.add_argument("-m","--min-searches",type=int,default=10,help="lowest number of searches sharing a prefix (default 10)")
+    p.add_argument("-s","--min-stages",type=int,default=2,help="lowest number of stages of a prefix, base search included (default 2)")
+    p.add_argument("-d","--max-depth",type=int,default=6,help="number of stages of the searches kept (default 6)")
+    p.add_argument("-a","--all",action="store_true",help="also read the searches which are not scheduled")
+    p.add_argument("-p","--processes",type=int,default=1,help="number of worker processes analyzing the searches")
+    p.set_defaults(func=cmd_prefixes)
+    return ap
+
+def main(argv=None):
+    args = build_arg_parser().parse_args(argv)
+    return args.func(args)
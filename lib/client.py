@@ -0,0 +1,130 @@
+import os, sys, json, socket, argparse, ipaddress
+from collections import namedtuple
+
+#---------------------------
+#       DAEMON CLIENT
+#---------------------------
+
+# Client of the validation daemon (see daemon.py). It does not import
+# spl_validator, so a client process only pays for its own startup, the parser
+# is already warm in the daemon.
+# Protocol: one JSON object per line in each direction. A request has the query,
+# the macro files and the options of analyze, the response is either
+# {"result": ...} or {"error": message}.
+
+# Usage: python -m lib.client [options] [query]   (query read on stdin if missing)
+
+# Same fields as spl_validator.ErrorEntry
+ErrorEntry = namedtuple("ErrorEntry",["start_pos","end_pos","reason","token_type","token_value"])
+
+# Folder of the socket of the current user, spl_validator in $XDG_RUNTIME_DIR
+# or in the cache folder of the user ($XDG_CACHE_HOME, by default ~/.cache),
+# created by the daemon readable by the user only
+def socket_dir():
+    base = os.environ.get("XDG_RUNTIME_DIR") or os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"),".cache")
+    return os.path.join(base,"spl_validator")
+
+# Unix domain socket in the folder of the user, localhost TCP where there is none
+def default_address():
+    if hasattr(socket,"AF_UNIX"):
+        return os.path.join(socket_dir(),"daemon.sock")
+    return "127.0.0.1:8765"
+
+# "host:port" for TCP (a loopback host only, ValueError otherwise, the daemon
+# has no authentication), a path for a Unix domain socket
+def parse_address(address):
+    if not os.sep in address and ":" in address:
+        host, port = address.rsplit(":",1)
+        host = host.strip("[]")
+        if host == "localhost":
+            return socket.AF_INET, (host,int(port))
+        try:
+            ip = ipaddress.ip_address(host)
+        except ValueError:
+            ip = None
+        if ip is None or not ip.is_loopback:
+            raise ValueError("Not a loopback address: {}".format(address))
+        return socket.AF_INET if ip.version == 4 else socket.AF_INET6, (host,int(port))
+    return socket.AF_UNIX, address
+
+# JSON result of the daemon -> structure returned by spl_validator.analyze (the
+# error identifiers are tuples again and the errors ErrorEntry)
+def decode_result(res):
+    errors = res["errors"]
+    eids = [tuple(eid) for eid in errors["list"]]
+    decoded = {
+        "list": eids,
+        "ref": {eid:[ErrorEntry(*e) for e in entries] for eid,entries in zip(eids,errors["ref"])},
+        "truncated": errors["truncated"],
+        "messages": dict(zip(eids,errors["messages"]))
+    }
+    if "budget" in errors:
+        decoded["budget"] = errors["budget"]
+    return {"data": res["data"], "errors": decoded, "errors_count": res["errors_count"]}
+
+class DaemonError(Exception):
+    pass
+
+# Connection to the daemon, kept open for the next requests
+class Client(object):
+    def __init__(self,address=None,timeout=None):
+        family, addr = parse_address(address or default_address())
+        self.sock = socket.socket(family,socket.SOCK_STREAM)
+        self.sock.settimeout(timeout)
+        self.sock.connect(addr)
+        self.rfile = self.sock.makefile("rb")
+
+    # Same arguments as spl_validator.analyze, except verbose and print_errs
+    def analyze(self,query,macro_files=[],**options):
+        req = {"query": query, "macro_files": list(macro_files), "options": options}
+        self.sock.sendall(json.dumps(req).encode("utf-8") + b"\n")
+        line = self.rfile.readline()
+        if not line:
+            raise DaemonError("Connection closed by the daemon")
+        res = json.loads(line.decode("utf-8"))
+        if "error" in res:
+            raise DaemonError(res["error"])
+        return decode_result(res["result"])
+
+    def close(self):
+        self.rfile.close()
+        self.sock.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self,exc_type,exc_value,tb):
+        self.close()
+
+# Analyzes a single query with the daemon
+def analyze(query,address=None,macro_files=[],**options):
+    with Client(address) as c:
+        return c.analyze(query,macro_files,**options)
+
+def build_arg_parser():
+    ap = argparse.ArgumentParser(prog="python -m lib.client",description="Checks a query with the SPL validator daemon (python -m lib serve)")
+    ap.add_argument("query",nargs="?",help="query to check, read on stdin if missing")
+    ap.add_argument("-a","--address",default=None,help="address of the daemon, socket path or host:port (default {})".format(default_address()))
+    ap.add_argument("-m","--macro-file",action="append",default=[],dest="macro_files",help="macros.conf file to expand the macros (repeatable)")
+    ap.add_argument("-p","--profile",default=None,help="command profile")
+    ap.add_argument("--json",action="store_true",help="print the full result as JSON")
+    return ap
+
+# Exit code: 0 without errors, 1 with errors, 2 when the daemon cannot be used
+def main(argv=None):
+    args = build_arg_parser().parse_args(argv)
+    query = args.query if not args.query is None else sys.stdin.read()
+    try:
+        r = analyze(query,args.address,args.macro_files,profile=args.profile)
+    except (OSError,ValueError,DaemonError) as e:
+        print("[ERROR] {}".format(e),file=sys.stderr)
+        return 2
+    if args.json:
+        print(json.dumps({"data": r["data"], "errors_count": r["errors_count"], "errors": [r["errors"]["messages"][eid] for eid in r["errors"]["list"]]}))
+    else:
+        for eid in r["errors"]["list"]:
+            print(r["errors"]["messages"][eid])
+    return 1 if r["errors_count"] > 0 else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,139 @@
+import os
+from collections import namedtuple
+
+from . import spl_validator
+
+#---------------------------
+#   SAVED SEARCHES READER
+#---------------------------
+
+# Streaming reader of the Splunk .conf files: the stanzas are read line by line
+# and yielded one at a time, a file is never loaded whole. As in macros.loadFile,
+# a line ending with a backslash continues on the next line (the newline is
+# kept in the value).
+# The saved searches of savedsearches.conf files, and of the apps of an
+# etc/apps tree, are read as SavedSearch records, which can be analyzed as they
+# are read (validate), or only the first ones for a sample.
+
+# Settings of a saved search kept as its schedule metadata
+SCHEDULE_KEYS = ("disabled","enableSched","cron_schedule","schedule_window","dispatch.earliest_time","dispatch.latest_time","is_visible")
+
+# app: folder of the app (None for a single file), lineno: line of the stanza
+SavedSearch = namedtuple("SavedSearch",["app","stanza","search","metadata","path","lineno"])
+
+# Yields the stanzas of a conf file as (stanza name, settings, line number),
+# each with its own settings only. The settings before the first stanza are
+# yielded as a [default] stanza.
+def read_own_stanzas(path):
+    name, settings, lineno = "default", {}, 0
+    with open(path,"r",encoding="utf-8",errors="replace") as f:
+        lines = iter(enumerate(f,1))
+        for n, line in lines:
+            line = line.rstrip("\r\n")
+            # Continuation lines
+            while line.endswith("\\"):
+                nxt = next(lines,None)
+                if nxt is None:
+                    line = line[:-1]
+                    break
+                line = line[:-1] + "\n" + nxt[1].rstrip("\r\n")
+            stripped = line.strip()
+            if len(stripped) == 0 or stripped.startswith("#"):
+                continue
+            if stripped.startswith("[") and stripped.endswith("]"):
+                if lineno > 0 or len(settings) > 0:
+                    yield name, settings, lineno
+                name, settings, lineno = stripped[1:-1], {}, n
+            elif "=" in line:
+                key, _, value = line.partition("=")
+                settings[key.strip()] = value.strip()
+    if lineno > 0 or len(settings) > 0:
+        yield name, settings, lineno
+
+# Yields the stanzas of a conf file as (stanza name, settings, line number)
+# The settings of the [default] stanza (and of the settings before the first
+# stanza) are the defaults of the next stanzas of the file, they are collected
+# in defaults when given. The settings of overrides (the [default] stanza of a
+# file of higher precedence) take precedence over them, the settings of the
+# stanza over both.
+def read_stanzas(path,defaults=None,overrides={}):
+    if defaults is None:
+        defaults = {}
+    for name, settings, lineno in read_own_stanzas(path):
+        if name == "default":
+            defaults.update(settings)
+        else:
+            yield name, {**defaults,**overrides,**settings}, lineno
+
+def saved_search(app,name,settings,path,lineno):
+    metadata = {k:settings[k] for k in SCHEDULE_KEYS if k in settings}
+    return SavedSearch(app,name,settings["search"],metadata,path,lineno)
+
+# Yields the saved searches (stanzas with a search) of a savedsearches.conf file
+def read_saved_searches(path,app=None):
+    for name, settings, lineno in read_stanzas(path):
+        if "search" in settings:
+            yield saved_search(app,name,settings,path,lineno)
+
+# Yields the saved searches of the apps of an etc/apps tree, app by app (in
+# ASCII order). The settings of local/savedsearches.conf take precedence over
+# the ones of default/savedsearches.conf: the local file of an app is read
+# first (it usually only holds a few changed settings), then its default file
+# is streamed with the local settings applied. From the lowest to the highest
+# precedence, the settings of a stanza are the ones of the default [default],
+# the local [default], the default stanza and the local stanza.
+def read_apps_tree(apps_dir):
+    for app in sorted(os.listdir(apps_dir)):
+        default = os.path.join(apps_dir,app,"default","savedsearches.conf")
+        local = os.path.join(apps_dir,app,"local","savedsearches.conf")
+        defaults, local_defaults, overrides = {}, {}, {}
+        if os.path.isfile(local):
+            for name, settings, lineno in read_own_stanzas(local):
+                if name == "default":
+                    local_defaults.update(settings)
+                else:
+                    overrides[name] = (settings,lineno)
+        if os.path.isfile(default):
+            for name, settings, lineno in read_stanzas(default,defaults,local_defaults):
+                if name in overrides:
+                    settings.update(overrides.pop(name)[0])
+                if "search" in settings:
+                    yield saved_search(app,name,settings,default,lineno)
+        # Stanzas only defined locally
+        for name, (settings, lineno) in overrides.items():
+            settings = {**defaults,**local_defaults,**settings}
+            if "search" in settings:
+                yield saved_search(app,name,settings,local,lineno)
+
+# Yields the saved searches of the given paths (savedsearches.conf files or
+# etc/apps trees), at most limit of them (None for all)
+def read(paths,limit=None):
+    if not limit is None and limit <= 0:
+        return
+    count = 0
+    for path in paths:
+        records = read_apps_tree(path) if os.path.isdir(path) else read_saved_searches(path)
+        for record in records:
+            yield record
+            count += 1
+            if count == limit:
+                return
+
+# Yields (record, result of analyze) for the saved search records, read as they
+# are analyzed. With a worker pool (pool.ValidatorPool), the records are sent
+# in batches, so only a batch is held in memory.
+# kwargs are the arguments of analyze (print_errs is False unless given)
+def validate(records,pool=None,batch_size=256,**kwargs):
+    kwargs.setdefault("print_errs",False)
+    if pool is None:
+        for record in records:
+            yield record, spl_validator.analyze(record.search,**kwargs)
+        return
+    batch = []
+    for record in records:
+        batch.append(record)
+        if len(batch) == batch_size:
+            yield from zip(batch,pool.analyze([r.search for r in batch],**kwargs))
+            batch = []
+    if len(batch) > 0:
+        yield from zip(batch,pool.analyze([r.search for r in batch],**kwargs))
@@ -0,0 +1,209 @@
+import hashlib, sqlite3
+
+from . import spl_validator
+from . import macro_index
+from . import canonical
+
+#---------------------------
+#      CORPUS INDEX
+#---------------------------
+
+# Persistent inverted index (SQLite) of a corpus of searches: the fields read,
+# commands, lookups, indexes, sourcetypes and macros of each search, taken from
+# the results of analyze, are stored as postings lists (term -> searches). The
+# searches are analyzed once, when added or when their canonical text changed:
+# the fingerprint (canonical.fingerprint) is only computed when the text itself
+# changed, and a change of spaces or case alone is not analyzed again. The
+# questions on the corpus ("which searches read src_ip", "which use
+# transaction") are then answered from the index without parsing again.
+#
+# field: input fields of the searches and subsearches, command: their commands,
+# index / sourcetype: values of the index= and sourcetype= filters, lookup:
+# tables of the lookup, inputlookup and outputlookup commands (read from the
+# tokens of the search), macro: stanzas of the macro calls written in the search
+KINDS = ("field","command","lookup","index","sourcetype","macro")
+
+# Tokens of the commands reading or writing a lookup table
+LOOKUP_COMMANDS = frozenset(["CMD_LOOKUP","CMD_INPUTLOOKUP","CMD_OUTPUTLOOKUP","CMD_INPUTCSV","CMD_OUTPUTCSV"])
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS searches (id INTEGER PRIMARY KEY, name TEXT NOT NULL UNIQUE, digest TEXT NOT NULL, fingerprint TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS terms (id INTEGER PRIMARY KEY, kind TEXT NOT NULL, term TEXT NOT NULL, UNIQUE (kind, term));
+CREATE TABLE IF NOT EXISTS postings (term INTEGER NOT NULL, search INTEGER NOT NULL, PRIMARY KEY (term, search)) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS postings_search ON postings (search);
+"""
+# Version of the schema, kept in the user_version of the database. Statements
+# upgrading an index of each older version to the next one: the fingerprints
+# of the searches of a version 0 index are empty, a search whose text changed
+# is then analyzed again.
+SCHEMA_VERSION = 1
+MIGRATIONS = {
+    0: "ALTER TABLE searches ADD COLUMN fingerprint TEXT NOT NULL DEFAULT ''"
+}
+
+def digest(query):
+    return hashlib.sha1(query.encode("utf-8")).hexdigest()
+
+# Filters of a search, the nested ones (OR, NOT...) included
+def walk_filters(filters):
+    for f in filters or []:
+        if f.get("type") == "filter":
+            yield f
+        else:
+            yield from walk_filters(f.get("filters"))
+
+# Tables of the lookup commands of a query
+def lookup_tables(query,profile=None):
+    tokens = spl_validator.tokenize(query,lexer_backend="scanner",profile=profile)
+    tables = set()
+    for i, tok in enumerate(tokens):
+        if not tok.type in LOOKUP_COMMANDS:
+            continue
+        j = i + 1
+        # Options (name=value) before the table
+        while j + 1 < len(tokens) and tokens[j+1].type == "EQ":
+            j += 3
+        if j < len(tokens) and tokens[j].type != "PIPE":
+            tables.add(str(tokens[j].value).strip('"'))
+    return tables
+
+# Terms of a search by kind, from the result of its analysis
+def search_terms(query,r,profile=None):
+    terms = {kind:set() for kind in KINDS}
+    data = r["data"]
+    searches = [data["main"]] + [sub["data"] for sub in data["subsearches"]]
+    for s in searches:
+        if not s:
+            continue
+        terms["field"].update(f for f in s.get("input") or [] if isinstance(f,str))
+        terms["command"].update(s.get("cmd") or [])
+        for f in walk_filters(s.get("filters")):
+            if len(f["input"]) == 1 and f["input"][0] in ("index","sourcetype") and f["op"] == ["="]:
+                values = f["value"] if isinstance(f["value"],list) else [f["value"]]
+                terms[f["input"][0]].update(v for v in values if isinstance(v,str))
+    terms["lookup"] = lookup_tables(query,profile)
+    terms["macro"] = macro_index.called_stanzas(query)
+    return terms
+
+class CorpusIndex(object):
+    # path: SQLite database file (":memory:" for an index which is not kept)
+    def __init__(self,path):
+        self.db = sqlite3.connect(path)
+        self.migrate()
+        # (kind, term) -> id of the terms
+        self.term_ids = {(kind,term):tid for tid, kind, term in self.db.execute("SELECT id, kind, term FROM terms")}
+
+    # Creates the tables, or upgrades the ones of an index built by an older
+    # version
+    def migrate(self):
+        version = self.db.execute("PRAGMA user_version").fetchone()[0]
+        if version > SCHEMA_VERSION:
+            raise ValueError("Corpus index of version {}, newer than the supported one ({})".format(version,SCHEMA_VERSION))
+        exists = self.db.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'searches'").fetchone()
+        with self.db:
+            if not exists is None:
+                for v in range(version,SCHEMA_VERSION):
+                    self.db.execute(MIGRATIONS[v])
+            self.db.execute("PRAGMA user_version = {}".format(SCHEMA_VERSION))
+        self.db.executescript(SCHEMA)
+
+    def term_id(self,kind,term):
+        tid = self.term_ids.get((kind,term))
+        if tid is None:
+            tid = self.db.execute("INSERT INTO terms (kind, term) VALUES (?, ?)",(kind,term)).lastrowid
+            self.term_ids[(kind,term)] = tid
+        return tid
+
+    # Analyzes and indexes the new and changed searches, searches is a dict (or
+    # an iterable of pairs) search name -> query. The analyses are run by the
+    # worker pool pool (pool.ValidatorPool) when given, kwargs are the arguments
+    # of analyze (macro_files, profile...). Returns the number of searches
+    # indexed.
+    def update(self,searches,pool=None,**kwargs):
+        if isinstance(searches,dict):
+            searches = searches.items()
+        kwargs.setdefault("print_errs",False)
+        known = {name:(d,fp) for name, d, fp in self.db.execute("SELECT name, digest, fingerprint FROM searches")}
+        changed, reformatted = [], []
+        for name, query in searches:
+            d = digest(query)
+            if known.get(name,(None,None))[0] == d:
+                continue
+            fp = canonical.fingerprint(query,kwargs.get("profile"))
+            if known.get(name,(None,None))[1] == fp:
+                reformatted.append((d,name))
+            else:
+                changed.append((name,query,d,fp))
+        with self.db:
+            self.db.executemany("UPDATE searches SET digest = ? WHERE name = ?",reformatted)
+        queries = [query for name, query, d, fp in changed]
+        if pool is None:
+            results = (spl_validator.analyze(q,**kwargs) for q in queries)
+        else:
+            results = pool.imap(queries,**kwargs)
+        try:
+            self.index_results(changed,results,kwargs.get("profile"))
+        except BaseException:
+            # Terms of the rolled back transaction
+            self.term_ids = {(kind,term):tid for tid, kind, term in self.db.execute("SELECT id, kind, term FROM terms")}
+            raise
+        return len(changed)
+
+    def index_results(self,changed,results,profile):
+        with self.db:
+            for (name, query, d, fp), r in zip(changed,results):
+                self.db.execute("INSERT INTO searches (name, digest, fingerprint) VALUES (?, ?, ?) ON CONFLICT (name) DO UPDATE SET digest = excluded.digest, fingerprint = excluded.fingerprint",(name,d,fp))
+                sid = self.db.execute("SELECT id FROM searches WHERE name = ?",(name,)).fetchone()[0]
+                self.db.execute("DELETE FROM postings WHERE search = ?",(sid,))
+                terms = search_terms(query,r,profile)
+                self.db.executemany("INSERT INTO postings (term, search) VALUES (?, ?)",[(self.term_id(kind,t),sid) for kind in KINDS for t in terms[kind]])
+
+    def remove(self,names):
+        with self.db:
+            for name in names:
+                row = self.db.execute("SELECT id FROM searches WHERE name = ?",(name,)).fetchone()
+                if not row is None:
+                    self.db.execute("DELETE FROM postings WHERE search = ?",row)
+                    self.db.execute("DELETE FROM searches WHERE id = ?",row)
+
+    # Makes the index match the given searches: updates them and removes the
+    # searches not given
+    def sync(self,searches,pool=None,**kwargs):
+        if not isinstance(searches,dict):
+            searches = dict(searches)
+        self.remove([name for (name,) in self.db.execute("SELECT name FROM searches") if not name in searches])
+        return self.update(searches,pool,**kwargs)
+
+    # Names of the searches with the term of the given kind, or with all the
+    # terms when several are given (list)
+    def searches(self,kind,terms):
+        if not kind in KINDS:
+            raise ValueError("Unknown kind '{}', expected one of {}".format(kind,list(KINDS)))
+        if isinstance(terms,str):
+            terms = [terms]
+        tids = set(self.term_ids.get((kind,t)) for t in terms)
+        if None in tids:
+            return set()
+        query = "SELECT s.name FROM postings p JOIN searches s ON s.id = p.search WHERE p.term IN ({}) GROUP BY p.search HAVING COUNT(*) = ?".format(",".join("?" * len(tids)))
+        return set(name for (name,) in self.db.execute(query,list(tids) + [len(tids)]))
+
+    # Terms of the given kind with their number of searches, most used first
+    def terms(self,kind):
+        query = "SELECT t.term, COUNT(*) FROM terms t JOIN postings p ON p.term = t.id WHERE t.kind = ? GROUP BY t.id ORDER BY COUNT(*) DESC, t.term"
+        return self.db.execute(query,(kind,)).fetchall()
+
+    # Terms of a search by kind (None if the search is not indexed)
+    def search_terms(self,name):
+        row = self.db.execute("SELECT id FROM searches WHERE name = ?",(name,)).fetchone()
+        if row is None:
+            return None
+        terms = {kind:set() for kind in KINDS}
+        for kind, term in self.db.execute("SELECT t.kind, t.term FROM postings p JOIN terms t ON t.id = p.term WHERE p.search = ?",row):
+            terms[kind].add(term)
+        return terms
+
+    def __len__(self):
+        return self.db.execute("SELECT COUNT(*) FROM searches").fetchone()[0]
+
+    def close(self):
+        self.db.close()
@@ -0,0 +1,142 @@
+import os, json, signal, socket, threading, socketserver
+
+from . import spl_validator
+from . import nodes
+from . import preload
+from .client import default_address, parse_address
+
+#---------------------------
+#       VALIDATION DAEMON
+#---------------------------
+
+# Long-running process keeping the analyzer warm (tables loaded once), serving
+# the analyses to the clients (see client.py) on a Unix domain socket or on a
+# localhost TCP port. Each connection can send several requests, one JSON object
+# per line. The analyzer uses global state, so the analyses are serialized.
+# The clients can only use the macro files under the macro paths given to the
+# daemon (files, or folders like an etc/apps tree), none by default.
+
+# Options of analyze accepted in the requests
+ANALYZE_OPTIONS = frozenset(["facets","max_errors","max_length","max_tokens","max_depth","timeout","lexer_backend","parser_backend","profile"])
+
+analyze_lock = threading.Lock()
+
+# Result of analyze -> JSON object (the error identifiers and references are
+# lists in the order of the errors, the messages are rendered)
+def encode_result(r):
+    errors = r["errors"]
+    encoded = {
+        "list": errors["list"],
+        "ref": [errors["ref"][eid] for eid in errors["list"]],
+        "truncated": errors["truncated"],
+        "messages": [errors["messages"][eid] for eid in errors["list"]]
+    }
+    if "budget" in errors:
+        encoded["budget"] = errors["budget"]
+    return {"data": nodes.to_dict(r["data"]), "errors": encoded, "errors_count": r["errors_count"]}
+
+# Whether path is one of the allowed macro paths or under one of them (the real
+# paths are compared, a symbolic link cannot lead out of them)
+def allowed_path(path,macro_paths):
+    real = os.path.realpath(path)
+    for allowed in macro_paths:
+        allowed = os.path.realpath(allowed)
+        if real == allowed or real.startswith(allowed.rstrip(os.sep) + os.sep):
+            return True
+    return False
+
+# Request (JSON object) -> response (JSON object), macro_paths: paths of the
+# allowed macro files
+def handle_request(req,macro_paths=()):
+    if not isinstance(req,dict) or not isinstance(req.get("query"),str):
+        return {"error": "Invalid request, expected an object with a query"}
+    options = req.get("options",{})
+    unknown = set(options) - ANALYZE_OPTIONS
+    if len(unknown) > 0:
+        return {"error": "Unknown options {}, expected some of {}".format(sorted(unknown),sorted(ANALYZE_OPTIONS))}
+    macro_files = req.get("macro_files",[])
+    if not isinstance(macro_files,list) or not all(isinstance(p,str) for p in macro_files):
+        return {"error": "Invalid macro_files, expected a list of paths"}
+    denied = [p for p in macro_files if not allowed_path(p,macro_paths)]
+    if len(denied) > 0:
+        return {"error": "Macro files {} are not under the macro paths of the daemon".format(denied)}
+    try:
+        with analyze_lock:
+            r = spl_validator.analyze(req["query"],verbose=False,print_errs=False,macro_files=macro_files,**options)
+            return {"result": encode_result(r)}
+    except Exception as e:
+        # Wrong options, unreadable or malformed macro files... the connection
+        # is kept for the next requests
+        return {"error": "{}: {}".format(type(e).__name__,e)}
+
+class RequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        for line in self.rfile:
+            try:
+                req = json.loads(line.decode("utf-8"))
+            except ValueError:
+                res = {"error": "Invalid JSON request"}
+            else:
+                res = handle_request(req,self.server.macro_paths)
+            self.wfile.write(json.dumps(res).encode("utf-8") + b"\n")
+
+class UnixServer(socketserver.ThreadingMixIn,socketserver.UnixStreamServer):
+    daemon_threads = True
+
+class TCPServer(socketserver.ThreadingMixIn,socketserver.TCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+class TCP6Server(TCPServer):
+    address_family = socket.AF_INET6
+
+# Server listening on address (socket path or host:port), the analyzer is warmed
+# up by the preload module. macro_paths: files or folders of the macro files the
+# clients can use.
+def make_server(address=None,macro_paths=()):
+    family, addr = parse_address(address or default_address())
+    if family == socket.AF_INET:
+        server = TCPServer(addr,RequestHandler)
+    elif family == socket.AF_INET6:
+        server = TCP6Server(addr,RequestHandler)
+    else:
+        private_dir(os.path.dirname(os.path.abspath(addr)),address is None)
+        # Socket left by a daemon which did not stop cleanly
+        if os.path.exists(addr):
+            os.remove(addr)
+        # The socket is created readable by the user only, never accessible
+        # between the bind and a chmod
+        umask = os.umask(0o177)
+        try:
+            server = UnixServer(addr,RequestHandler)
+        finally:
+            os.umask(umask)
+    server.macro_paths = list(macro_paths)
+    return server
+
+# Checks that the folder of the socket is only accessible by the current user
+# (PermissionError otherwise), create: whether it is created (the default
+# folder, see client.socket_dir)
+def private_dir(path,create):
+    if create:
+        os.makedirs(path,mode=0o700,exist_ok=True)
+    st = os.stat(path)
+    if (hasattr(os,"getuid") and st.st_uid != os.getuid()) or st.st_mode & 0o077 != 0:
+        raise PermissionError("The folder of the socket {} must belong to the current user and be accessible by this user only (mode 0700)".format(path))
+
+def stop(signum,frame):
+    raise KeyboardInterrupt
+
+# Serves until interrupted (SIGINT or SIGTERM)
+def serve(address=None,macro_paths=()):
+    server = make_server(address,macro_paths)
+    if threading.current_thread() is threading.main_thread():
+        signal.signal(signal.SIGTERM,stop)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if isinstance(server,UnixServer) and os.path.exists(server.server_address):
+            os.remove(server.server_address)
@@ -0,0 +1,162 @@
+import os, re, json
+import xml.etree.ElementTree as ET
+from collections import namedtuple
+
+from . import spl_validator
+
+#---------------------------
+#   DASHBOARD SEARCHES
+#---------------------------
+
+# Extraction of the searches of the dashboards, Simple XML (<query> of the
+# <search> elements) and Dashboard Studio (ds.search and ds.chain data sources
+# of the JSON definition). The XML is parsed incrementally (iterparse), the
+# rows and panels being dropped once read. The token placeholders ($tok$) are
+# replaced by the default values of the inputs, and the post-process searches
+# (base / ds.chain) are appended to their base search.
+# The identical searches of all the dashboards are analyzed once, the result
+# being given to each panel using the search.
+
+# dashboard: path of the dashboard file, panel: position of the panel in the
+# dashboard (row1/panel2) or id of the visualization or search
+Panel = namedtuple("Panel",["dashboard","panel","query"])
+
+# Elements giving the text of a search in Simple XML (searchString and
+# searchTemplate are the older names of query)
+QUERY_TAGS = frozenset(["query","searchString","searchTemplate"])
+# Visualization elements, a panel of their own when directly in a row
+VIZ_TAGS = frozenset(["chart","table","event","single","map","viz","html"])
+# $token$ or $token|filter$ ($$ being a literal $)
+TOKEN = re.compile(r'\$([^\$\s\|]+)(\|[^\$\s]*)?\$')
+
+def substitute_tokens(query,defaults):
+    return TOKEN.sub(lambda m: defaults.get(m.group(1),m.group(0)),query)
+
+# Post-process search appended to its base search
+def chain(base,post):
+    post = post.strip()
+    if post.startswith("|"):
+        post = post[1:].strip()
+    return base.rstrip() + " | " + post if len(post) > 0 else base
+
+# Yields the (panel, query) of the searches of a Simple XML dashboard, and the
+# default values of its tokens in defaults
+def read_simple_xml(path,defaults):
+    searches = []   # [label, id, base, query]
+    row = panel = 0
+    in_panel = False
+    stack = []
+    for event, elem in ET.iterparse(path,events=("start","end")):
+        tag = elem.tag
+        if event == "start":
+            if tag == "row":
+                row += 1
+                panel = 0
+            elif tag == "panel" or (tag in VIZ_TAGS and not in_panel and len(stack) > 0 and stack[-1] == "row"):
+                panel += 1
+                in_panel = True
+            elif tag == "search":
+                label = "row{}/panel{}".format(row,panel) if in_panel else "search:{}".format(elem.get("id","{}".format(len(searches)+1)))
+                searches.append([label,elem.get("id"),elem.get("base"),""])
+            stack.append(tag)
+            continue
+        stack.pop()
+        if tag in QUERY_TAGS and len(searches) > 0 and "search" in stack:
+            searches[-1][3] = elem.text or ""
+        elif tag == "input" and not elem.get("token") is None:
+            value = elem.findtext("default")
+            if value is None:
+                value = elem.findtext("initialValue")
+            if not value is None:
+                defaults[elem.get("token")] = value
+        elif tag == "definition":
+            # Dashboard Studio dashboard (version 2), its JSON definition
+            yield from read_studio_json(json.loads(elem.text or "{}"),defaults)
+        if tag == "panel" or (tag in VIZ_TAGS and len(stack) > 0 and stack[-1] == "row"):
+            in_panel = False
+        if tag in ("row","panel","input"):
+            elem.clear()
+    by_id = {s[1]:s for s in searches if not s[1] is None}
+    for label, sid, base, query in searches:
+        # Chains of post-process searches
+        seen = set()
+        while not base is None and base in by_id and not base in seen:
+            seen.add(base)
+            query = chain(by_id[base][3],query)
+            base = by_id[base][2]
+        if len(query.strip()) > 0:
+            yield label, query
+
+# Yields the (panel, query) of the data sources of a Dashboard Studio
+# definition, the panel being the first visualization using the data source
+def read_studio_json(definition,defaults):
+    for inp in definition.get("inputs",{}).values():
+        options = inp.get("options",{})
+        if "token" in options and "defaultValue" in options:
+            value = options["defaultValue"]
+            defaults[options["token"]] = ",".join(value) if isinstance(value,list) else str(value)
+    sources = definition.get("dataSources",{})
+    panels = {}
+    for viz_id, viz in definition.get("visualizations",{}).items():
+        for ds_id in viz.get("dataSources",{}).values():
+            panels.setdefault(ds_id,viz_id)
+    for ds_id, ds in sources.items():
+        options = ds.get("options",{})
+        if not ds.get("type") in ("ds.search","ds.chain") or not "query" in options:
+            continue
+        query = options["query"]
+        base = options.get("extend")
+        seen = set()
+        while not base is None and base in sources and not base in seen:
+            seen.add(base)
+            query = chain(sources[base].get("options",{}).get("query",""),query)
+            base = sources[base].get("options",{}).get("extend")
+        yield panels.get(ds_id,"ds:{}".format(ds_id)), query
+
+# Yields the searches of a dashboard file (Simple XML, or a Dashboard Studio
+# JSON definition in a .json file), the tokens replaced by their default values
+# A file which cannot be read or parsed is reported (logged, and added to errors
+# as (path, message) when given) and yields no search
+def extract(path,errors=None):
+    defaults = {}
+    try:
+        if path.endswith(".json"):
+            with open(path,"r",encoding="utf-8",errors="replace") as f:
+                found = list(read_studio_json(json.load(f),defaults))
+        else:
+            found = list(read_simple_xml(path,defaults))
+    except (OSError,ET.ParseError,ValueError) as e:
+        spl_validator.logger.warning("{} ({})".format(e,path))
+        if not errors is None:
+            errors.append((path,str(e)))
+        return
+    for label, query in found:
+        yield Panel(path,label,substitute_tokens(query,defaults).strip())
+
+# Yields the searches of the dashboards of the given paths (dashboard files or
+# folders, like the data/ui/views folders of the apps, walked recursively), the
+# files which cannot be parsed being skipped (see extract)
+def read(paths,errors=None):
+    for path in paths:
+        if os.path.isdir(path):
+            for root, dirs, files in os.walk(path):
+                dirs.sort()
+                for name in sorted(files):
+                    if name.endswith(".xml") or name.endswith(".json"):
+                        yield from extract(os.path.join(root,name),errors)
+        else:
+            yield from extract(path,errors)
+
+# Analyzes the searches of the panels, each distinct query once (with the worker
+# pool pool.ValidatorPool when given), returns the list of (panel, result)
+# kwargs are the arguments of analyze (print_errs is False unless given)
+def validate(panels,pool=None,**kwargs):
+    kwargs.setdefault("print_errs",False)
+    panels = list(panels)
+    queries = list(dict.fromkeys(p.query for p in panels))
+    if pool is None:
+        results = [spl_validator.analyze(q,**kwargs) for q in queries]
+    else:
+        results = pool.analyze(queries,**kwargs)
+    by_query = dict(zip(queries,results))
+    return [(p,by_query[p.query]) for p in panels]
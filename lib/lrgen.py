@@ -0,0 +1,349 @@
+import os, zlib, base64, types, importlib
+from array import array
+
+#---------------------------
+#    LALR PARSE MODULE
+#---------------------------
+
+# Generates a Python module specialized to the grammar of a PLY parser. The
+# tables are flat lists of integers (states and symbols are numbered, the action
+# of a state for a terminal is action[state*width+terminal]) and the reductions
+# are dispatched by production number to the same p_* functions.
+# The parse loop is the one of LRParser.parseopt (error recovery included) with
+# line and position tracking always on, as analyze uses it. The generated module
+# is stored next to parsetab.py and regenerated when the grammar signature changes.
+
+# Marks a missing entry (syntax error) in the action table
+ERROR = 0x7fff
+
+# Rows of {column: value} -> flat array of signed shorts, compressed
+def pack(rows,width,default):
+    table = array('h',[default]) * (len(rows) * width)
+    for i,row in enumerate(rows):
+        for col,value in row.items():
+            table[i*width + col] = value
+    return base64.b64encode(zlib.compress(table.tobytes(),9)).decode("ascii")
+
+# Compressed table -> flat list, the equal values share the same int object
+def unpack(data):
+    table = array('h')
+    table.frombytes(zlib.decompress(base64.b64decode(data)))
+    values = {}
+    return list(map(values.setdefault,table,table))
+
+# Source of the parse module for the tables of the LRParser lr
+def generate(modname,lr,signature):
+    terminals = set(["$end","error"])
+    for st in lr.action.values():
+        terminals.update(st.keys())
+    terminals = sorted(terminals)
+    nonterminals = sorted(set(p.name for p in lr.productions))
+    tid = {t:i for i,t in enumerate(terminals)}
+    ntid = {n:i for i,n in enumerate(nonterminals)}
+    nstates = max(max(lr.action.keys()),max(lr.goto.keys())) + 1
+    # One more column for the token types unknown to the grammar (always an error)
+    width = len(terminals) + 1
+    action = [{tid[t]:a for t,a in lr.action.get(s,{}).items()} for s in range(nstates)]
+    goto = [{ntid[n]:g for n,g in lr.goto.get(s,{}).items()} for s in range(nstates)]
+    for s in range(nstates):
+        for a in action[s].values():
+            if a >= ERROR or a <= -ERROR:
+                raise ValueError("Parse tables too large for the parse module")
+    defaulted = [lr.defaulted_states.get(s) for s in range(nstates)]
+    lines = [
+        "# {}.py".format(modname),
+        "# This file is automatically generated by lrgen.py. Do not edit.",
+        "from .lrgen import unpack, Symbol, Production",
+        "from .ply.yacc import call_errorfunc",
+        "",
+        "signature = {!r}".format(signature),
+        "",
+        "terminals = {!r}".format(tid),
+        "width = {}".format(width),
+        "nonterminals = {}".format(len(nonterminals)),
+        "action = unpack({!r})".format(pack(action,width,ERROR)),
+        "goto = unpack({!r})".format(pack(goto,len(nonterminals),-1)),
+        "defaulted = {!r}".format(defaulted),
+        "",
+        "# Productions: name, length, nonterminal number, function",
+        "prod_name = {!r}".format([p.name for p in lr.productions]),
+        "prod_len = {!r}".format([p.len for p in lr.productions]),
+        "prod_nt = {!r}".format([ntid[p.name] for p in lr.productions]),
+        "prod_func = {!r}".format([p.func for p in lr.productions]),
+        "",
+        PARSE_LOOP.replace("{ERROR}",str(ERROR))
+    ]
+    return "\n".join(lines)
+
+# Grammar symbols of the parse module (same attributes as ply.yacc.YaccSymbol)
+class Symbol(object):
+    __slots__ = ("type","value","lineno","lexpos","endlineno","endlexpos","lexer")
+
+    def __str__(self):
+        return self.type
+
+    def __repr__(self):
+        return str(self)
+
+# Object passed to the grammar rules, same interface as ply.yacc.YaccProduction
+class Production(object):
+    __slots__ = ("slice","stack","lexer","parser")
+
+    def __getitem__(self,n):
+        try:
+            if n >= 0:
+                return self.slice[n].value
+        except TypeError:
+            return [s.value for s in self.slice[n]]
+        return self.stack[n].value
+
+    def __setitem__(self,n,v):
+        self.slice[n].value = v
+
+    def __len__(self):
+        return len(self.slice)
+
+    def lineno(self,n):
+        return getattr(self.slice[n],'lineno',0)
+
+    def set_lineno(self,n,lineno):
+        self.slice[n].lineno = lineno
+
+    def linespan(self,n):
+        startline = getattr(self.slice[n],'lineno',0)
+        endline = getattr(self.slice[n],'endlineno',startline)
+        return startline, endline
+
+    def lexpos(self,n):
+        return getattr(self.slice[n],'lexpos',0)
+
+    def set_lexpos(self,n,lexpos):
+        self.slice[n].lexpos = lexpos
+
+    def lexspan(self,n):
+        startpos = getattr(self.slice[n],'lexpos',0)
+        endpos = getattr(self.slice[n],'endlexpos',startpos)
+        return startpos, endpos
+
+    def error(self):
+        raise SyntaxError
+
+# Parser using a generated parse module, with the parse() method of LRParser
+# The LRParser lr is kept for the error recovery functions (errok, restart)
+class GeneratedParser(object):
+    def __init__(self,module,pdict,lr):
+        self.module = module
+        # Production number -> (name, length, nonterminal number, function)
+        self.prods = [(name,plen,nt,pdict[f] if f else None) for name,plen,nt,f in
+                      zip(module.prod_name,module.prod_len,module.prod_nt,module.prod_func)]
+        self.errorfunc = pdict.get("p_error")
+        self.lr = lr
+
+    def parse(self,input=None,lexer=None,debug=False,tracking=True,tokenfunc=None):
+        return self.module.parse(self,input,lexer,tokenfunc)
+
+# Loads the parse module modname of the package of the grammar pdict, it is
+# (re)generated from the tables of lr when missing or built for another signature
+def load(modname,pdict,lr,signature,outputdir):
+    package = pdict.get("__package__")
+    try:
+        module = importlib.import_module(package + "." + modname if package else modname)
+        if module.signature == signature:
+            return GeneratedParser(module,pdict,lr)
+    except ImportError:
+        pass
+    try:
+        return build(modname,pdict,lr,signature,outputdir)
+    except IOError:
+        # Read-only install, the module is only built in memory
+        return build(modname,pdict,lr,signature,None)
+
+# Generates the parse module modname and writes it in outputdir (if not None)
+def build(modname,pdict,lr,signature,outputdir):
+    package = pdict.get("__package__")
+    fullname = package + "." + modname if package else modname
+    source = generate(modname,lr,signature)
+    if not outputdir is None:
+        with open(os.path.join(outputdir,modname + ".py"),"w") as f:
+            f.write(source)
+    module = types.ModuleType(fullname)
+    module.__package__ = package
+    exec(compile(source,fullname,"exec"),module.__dict__)
+    return GeneratedParser(module,pdict,lr)
+
+# Parse loop of the generated module, adapted from LRParser.parseopt
+PARSE_LOOP = '''
+def parse(gp,input,lexer,tokenfunc):
+    lr = gp.lr
+    prods = gp.prods
+    errorfunc = gp.errorfunc
+    lookahead = None
+    lookaheadstack = []
+    pslice = Production()
+    errorcount = 0
+    error_count = 3
+
+    pslice.lexer = lexer
+    pslice.parser = lr
+
+    if input is not None:
+        lexer.input(input)
+
+    if tokenfunc is None:
+        get_token = lexer.token
+    else:
+        get_token = tokenfunc
+    lr.token = get_token
+
+    statestack = []
+    lr.statestack = statestack
+    symstack = []
+    lr.symstack = symstack
+
+    pslice.stack = symstack
+    errtoken = None
+
+    statestack.append(0)
+    sym = Symbol()
+    sym.type = '$end'
+    symstack.append(sym)
+    state = 0
+    while True:
+        t = defaulted[state]
+        if t is None:
+            if lookahead is None:
+                if not lookaheadstack:
+                    lookahead = get_token()
+                else:
+                    lookahead = lookaheadstack.pop()
+                if lookahead is None:
+                    lookahead = Symbol()
+                    lookahead.type = '$end'
+            t = action[state*width + terminals.get(lookahead.type,width-1)]
+
+        if t < 0:
+            # Reduction, dispatched by production number
+            pname, plen, pnt, func = prods[-t]
+            sym = Symbol()
+            sym.type = pname
+            sym.value = None
+            if plen:
+                targ = symstack[-plen-1:]
+                targ[0] = sym
+                t1 = targ[1]
+                sym.lineno = t1.lineno
+                sym.lexpos = t1.lexpos
+                t1 = targ[-1]
+                if t1.__class__ is Symbol:
+                    sym.endlineno = t1.endlineno
+                    sym.endlexpos = t1.endlexpos
+                else:
+                    sym.endlineno = t1.lineno
+                    sym.endlexpos = getattr(t1, 'endlexpos', t1.lexpos)
+                pslice.slice = targ
+                try:
+                    del symstack[-plen:]
+                    lr.state = state
+                    func(pslice)
+                    del statestack[-plen:]
+                    symstack.append(sym)
+                    state = goto[statestack[-1]*nonterminals + pnt]
+                    statestack.append(state)
+                except SyntaxError:
+                    lookaheadstack.append(lookahead)
+                    symstack.extend(targ[1:-1])
+                    statestack.pop()
+                    state = statestack[-1]
+                    sym.type = 'error'
+                    sym.value = 'error'
+                    lookahead = sym
+                    errorcount = error_count
+                    lr.errorok = False
+            else:
+                sym.lineno = sym.endlineno = lexer.lineno
+                sym.lexpos = sym.endlexpos = lexer.lexpos
+                targ = [sym]
+                pslice.slice = targ
+                try:
+                    lr.state = state
+                    func(pslice)
+                    symstack.append(sym)
+                    state = goto[statestack[-1]*nonterminals + pnt]
+                    statestack.append(state)
+                except SyntaxError:
+                    lookaheadstack.append(lookahead)
+                    statestack.pop()
+                    state = statestack[-1]
+                    sym.type = 'error'
+                    sym.value = 'error'
+                    lookahead = sym
+                    errorcount = error_count
+                    lr.errorok = False
+            continue
+
+        if t != {ERROR}:
+            if t > 0:
+                # Shift
+                statestack.append(t)
+                state = t
+                symstack.append(lookahead)
+                lookahead = None
+                if errorcount:
+                    errorcount -= 1
+                continue
+            # Accept
+            n = symstack[-1]
+            return getattr(n, 'value', None)
+
+        # Syntax error, same recovery as LRParser.parseopt
+        if errorcount == 0 or lr.errorok:
+            errorcount = error_count
+            lr.errorok = False
+            errtoken = lookahead
+            if errtoken.type == '$end':
+                errtoken = None
+            if errorfunc:
+                if errtoken and not hasattr(errtoken, 'lexer'):
+                    errtoken.lexer = lexer
+                lr.state = state
+                tok = call_errorfunc(errorfunc, errtoken, lr)
+                if lr.errorok:
+                    lookahead = tok
+                    errtoken = None
+                    continue
+            else:
+                return
+        else:
+            errorcount = error_count
+
+        if len(statestack) <= 1 and lookahead.type != '$end':
+            lookahead = None
+            errtoken = None
+            state = 0
+            del lookaheadstack[:]
+            continue
+
+        if lookahead.type == '$end':
+            return
+
+        if lookahead.type != 'error':
+            sym = symstack[-1]
+            if sym.type == 'error':
+                sym.endlineno = getattr(lookahead, 'lineno', sym.lineno)
+                sym.endlexpos = getattr(lookahead, 'lexpos', sym.lexpos)
+                lookahead = None
+                continue
+            t = Symbol()
+            t.type = 'error'
+            t.lineno = t.endlineno = getattr(lookahead, 'lineno', 0)
+            t.lexpos = t.endlexpos = getattr(lookahead, 'lexpos', 0)
+            t.value = lookahead
+            lookaheadstack.append(lookahead)
+            lookahead = t
+        else:
+            sym = symstack.pop()
+            lookahead.lineno = sym.lineno
+            lookahead.lexpos = sym.lexpos
+            statestack.pop()
+            state = statestack[-1]
+'''
@@ -0,0 +1,258 @@
+import sys, json, time, bisect, threading
+
+from . import spl_validator
+# Imported for its side effect: the parse tables are loaded when the server
+# starts instead of delaying the first diagnostics
+from . import preload
+
+#---------------------------
+#       LANGUAGE SERVER
+#---------------------------
+
+# Language Server Protocol over stdio, publishing the errors of the analysis of
+# the open documents as diagnostics. The documents are fully synchronized (each
+# change gives the whole text).
+# The changes are debounced: a document is analyzed once it was not changed for
+# `delay` seconds, a later change replacing the pending text. A running analysis
+# is cancelled as soon as its document changes, and the diagnostics of a stale
+# version are never published, so typing fast never queues up analyses.
+# Only the text of the documents waiting for an analysis is kept (the results are
+# not), the memory does not grow with the number of open documents.
+
+# Usage: python -m lib lsp
+
+# JSON-RPC error codes
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+
+# LSP message types (window/showMessage)
+MESSAGE_ERROR = 1
+
+# LSP diagnostic severities
+SEVERITY_ERROR = 1
+SEVERITY_WARNING = 2
+
+# Reads a message (Content-Length framing), None at the end of the stream
+def read_message(rfile):
+    length = None
+    while True:
+        line = rfile.readline()
+        if not line:
+            return None
+        line = line.strip()
+        if not line:
+            break
+        name, _, value = line.decode("ascii").partition(":")
+        if name.strip().lower() == "content-length":
+            length = int(value)
+    if length is None:
+        return None
+    return json.loads(rfile.read(length).decode("utf-8"))
+
+def write_message(wfile,msg):
+    body = json.dumps(msg).encode("utf-8")
+    wfile.write("Content-Length: {}\r\n\r\n".format(len(body)).encode("ascii") + body)
+    wfile.flush()
+
+# Offsets of the query -> LSP positions (line, UTF-16 code units in the line)
+class PositionMap(object):
+    def __init__(self,text):
+        self.text = text
+        self.starts = [0]
+        pos = text.find("\n")
+        while pos >= 0:
+            self.starts.append(pos + 1)
+            pos = text.find("\n",pos + 1)
+
+    def position(self,offset):
+        offset = max(0,min(offset,len(self.text)))
+        line = bisect.bisect_right(self.starts,offset) - 1
+        part = self.text[self.starts[line]:offset]
+        if not part.isascii():
+            return {"line": line, "character": len(part.encode("utf-16-le")) // 2}
+        return {"line": line, "character": len(part)}
+
+# Errors of a result of analyze -> LSP diagnostics (the latest reported error of
+# each error identifier, as in the messages). The range of an error on a token
+# is the token (its identifier is its position and value), the start and end
+# positions of the error also covering some context before it.
+def diagnostics(text,r):
+    pm = PositionMap(text)
+    diags = []
+    for eid in r["errors"]["list"]:
+        e = r["errors"]["ref"][eid][-1]
+        if not e.token_type is None:
+            st,ed = eid[0],eid[0] + len(eid[1])
+        else:
+            st,ed = e.start_pos,e.end_pos
+        # Positions relative to the end of the query
+        if st < 0:
+            st,ed = max(0,len(text) + st), max(0,len(text) + ed)
+        reason = e.reason
+        severity = SEVERITY_ERROR
+        if reason.startswith("[WARNING] "):
+            reason = reason[len("[WARNING] "):]
+            severity = SEVERITY_WARNING
+        if not e.token_type is None:
+            reason = "{} '{}'".format(reason,e.token_value)
+        diags.append({"range": {"start": pm.position(st), "end": pm.position(max(st,ed))}, "severity": severity, "source": "spl_validator", "message": reason})
+    return diags
+
+class LanguageServer(object):
+    # delay: seconds without change before a document is analyzed
+    # options: arguments of analyze (profile, lexer_backend...), can be given by
+    #   the client in the initializationOptions
+    def __init__(self,rfile,wfile,delay=0.3,options={}):
+        self.rfile = rfile
+        self.wfile = wfile
+        self.delay = delay
+        self.options = dict(options)
+        self.write_lock = threading.Lock()
+        self.cond = threading.Condition()
+        # uri -> latest version of the open documents
+        self.versions = {}
+        # uri -> (version, text, due time) of the documents to analyze
+        self.pending = {}
+        self.stopped = False
+        self.shutdown_requested = False
+        self.handlers = {
+            "initialize": self.on_initialize,
+            "shutdown": self.on_shutdown,
+            "textDocument/didOpen": self.on_did_open,
+            "textDocument/didChange": self.on_did_change,
+            "textDocument/didClose": self.on_did_close
+        }
+
+    def send(self,msg):
+        with self.write_lock:
+            write_message(self.wfile,msg)
+
+    # Reads and handles the messages until exit (or the end of the input)
+    # Returns the exit code
+    def run(self):
+        worker = threading.Thread(target=self.analysis_loop,daemon=True)
+        worker.start()
+        try:
+            while True:
+                msg = read_message(self.rfile)
+                if msg is None or msg.get("method") == "exit":
+                    break
+                self.handle(msg)
+        finally:
+            with self.cond:
+                self.stopped = True
+                self.cond.notify()
+            worker.join()
+        return 0 if self.shutdown_requested else 1
+
+    def handle(self,msg):
+        method = msg.get("method")
+        handler = self.handlers.get(method)
+        if not "id" in msg:
+            # Notification, the unknown ones are ignored
+            if not handler is None:
+                handler(msg.get("params",{}))
+            return
+        if handler is None:
+            self.send({"jsonrpc": "2.0", "id": msg["id"], "error": {"code": METHOD_NOT_FOUND, "message": "Unknown method {}".format(method)}})
+            return
+        try:
+            result = handler(msg.get("params",{}))
+        except ValueError as e:
+            self.send({"jsonrpc": "2.0", "id": msg["id"], "error": {"code": INVALID_PARAMS, "message": str(e)}})
+            return
+        self.send({"jsonrpc": "2.0", "id": msg["id"], "result": result})
+
+    # The profile is checked here (ValueError when unknown) rather than failing
+    # each analysis
+    def on_initialize(self,params):
+        opts = params.get("initializationOptions") or {}
+        if "profile" in opts:
+            spl_validator.get_profile(opts["profile"])
+        for k in ("profile","lexer_backend","parser_backend","max_errors"):
+            if k in opts:
+                self.options[k] = opts[k]
+        return {
+            "capabilities": {"textDocumentSync": {"openClose": True, "change": 1}},
+            "serverInfo": {"name": "spl_validator"}
+        }
+
+    def on_shutdown(self,params):
+        self.shutdown_requested = True
+        return None
+
+    def on_did_open(self,params):
+        doc = params["textDocument"]
+        self.schedule(doc["uri"],doc.get("version",0),doc["text"])
+
+    def on_did_change(self,params):
+        doc = params["textDocument"]
+        changes = params["contentChanges"]
+        if len(changes) > 0:
+            # Full synchronization, the last change is the whole text
+            self.schedule(doc["uri"],doc.get("version",0),changes[-1]["text"])
+
+    def on_did_close(self,params):
+        uri = params["textDocument"]["uri"]
+        with self.cond:
+            self.versions.pop(uri,None)
+            self.pending.pop(uri,None)
+        self.publish(uri,None,[])
+
+    # Replaces the pending analysis of the document, which is analyzed once not
+    # changed for delay seconds
+    def schedule(self,uri,version,text):
+        with self.cond:
+            self.versions[uri] = version
+            self.pending[uri] = (version,text,time.monotonic() + self.delay)
+            self.cond.notify()
+
+    def publish(self,uri,version,diags):
+        params = {"uri": uri, "diagnostics": diags}
+        if not version is None:
+            params["version"] = version
+        self.send({"jsonrpc": "2.0", "method": "textDocument/publishDiagnostics", "params": params})
+
+    def show_error(self,message):
+        self.send({"jsonrpc": "2.0", "method": "window/showMessage", "params": {"type": MESSAGE_ERROR, "message": message}})
+
+    # Next document due for an analysis, None once stopped
+    def next_due(self):
+        with self.cond:
+            while not self.stopped:
+                now = time.monotonic()
+                uri = min(self.pending,key=lambda u: self.pending[u][2],default=None)
+                if not uri is None and self.pending[uri][2] <= now:
+                    version, text, due = self.pending.pop(uri)
+                    return uri, version, text
+                self.cond.wait(None if uri is None else self.pending[uri][2] - now)
+        return None
+
+    def is_stale(self,uri,version):
+        return self.stopped or self.versions.get(uri) != version
+
+    # Analyses run in this thread only (the analyzer uses global state)
+    # A failed analysis is reported to the client, the other documents are
+    # still analyzed
+    def analysis_loop(self):
+        while True:
+            item = self.next_due()
+            if item is None:
+                return
+            uri, version, text = item
+            try:
+                r = spl_validator.analyze(text,print_errs=False,cancel=lambda: self.is_stale(uri,version),**self.options)
+                diags = diagnostics(text,r)
+            except spl_validator.AnalysisCancelled:
+                continue
+            except Exception as e:
+                self.show_error("Analysis of {} failed: {}: {}".format(uri,type(e).__name__,e))
+                continue
+            with self.cond:
+                if self.is_stale(uri,version):
+                    continue
+                self.publish(uri,version,diags)
+
+def main():
+    server = LanguageServer(sys.stdin.buffer,sys.stdout.buffer)
+    return server.run()
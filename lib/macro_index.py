@@ -0,0 +1,106 @@
+import hashlib, sqlite3
+
+from . import macros
+
+#---------------------------
+#    MACRO USAGE INDEX
+#---------------------------
+
+# Persistent inverted index (SQLite) from the macro stanzas (name and arity, as
+# looked up by macros.expandMacro) to the searches calling them. Only the calls
+# written in the searches are stored: the searches using a macro through other
+# macros are found with the dependency graph of the current definitions, so the
+# index stays valid when the definitions change. The searches are updated
+# incrementally, a search is only indexed again when its text changed.
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS searches (id TEXT PRIMARY KEY, digest TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS uses (stanza TEXT NOT NULL, search TEXT NOT NULL, PRIMARY KEY (stanza, search)) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS uses_search ON uses (search);
+"""
+
+# SQLite limit on the number of parameters of a statement
+MAX_PARAMS = 500
+
+def digest(query):
+    return hashlib.sha1(query.encode("utf-8")).hexdigest()
+
+# Stanzas of the macros called in a query
+def called_stanzas(query):
+    stanzas = set()
+    for mcall in macros.MACRO_CALL.findall(query):
+        call = macros.parseMacroCall(mcall)
+        if not call is None:
+            stanzas.add(call[0])
+    return stanzas
+
+# Stanzas added, removed or with a setting changed between two macro confs
+def changed_stanzas(old_conf,new_conf):
+    return set(s for s in set(old_conf) | set(new_conf) if old_conf.get(s) != new_conf.get(s))
+
+class MacroUsageIndex(object):
+    # path: SQLite database file (":memory:" for an index which is not kept)
+    def __init__(self,path):
+        self.db = sqlite3.connect(path)
+        self.db.executescript(SCHEMA)
+
+    # Indexes the new and changed searches, searches is a dict (or an iterable
+    # of pairs) search id -> query. Returns the number of searches indexed.
+    def update(self,searches):
+        if isinstance(searches,dict):
+            searches = searches.items()
+        known = dict(self.db.execute("SELECT id, digest FROM searches"))
+        count = 0
+        with self.db:
+            for sid, query in searches:
+                d = digest(query)
+                if known.get(sid) == d:
+                    continue
+                self.db.execute("DELETE FROM uses WHERE search = ?",(sid,))
+                self.db.executemany("INSERT INTO uses (stanza, search) VALUES (?, ?)",[(s,sid) for s in called_stanzas(query)])
+                self.db.execute("INSERT OR REPLACE INTO searches (id, digest) VALUES (?, ?)",(sid,d))
+                count += 1
+        return count
+
+    def remove(self,ids):
+        with self.db:
+            for sid in ids:
+                self.db.execute("DELETE FROM uses WHERE search = ?",(sid,))
+                self.db.execute("DELETE FROM searches WHERE id = ?",(sid,))
+
+    # Makes the index match the given searches: updates them and removes the
+    # searches not given
+    def sync(self,searches):
+        if not isinstance(searches,dict):
+            searches = dict(searches)
+        self.remove([sid for (sid,) in self.db.execute("SELECT id FROM searches") if not sid in searches])
+        return self.update(searches)
+
+    # Ids of the searches calling one of the stanzas, or one of the macros
+    # calling them when the graph of the definitions (macros.MacroGraph) is given
+    def searches(self,stanzas,graph=None):
+        stanzas = set(stanzas)
+        if not graph is None:
+            stanzas = graph.dependents(stanzas)
+        stanzas = sorted(stanzas)
+        found = set()
+        for i in range(0,len(stanzas),MAX_PARAMS):
+            part = stanzas[i:i+MAX_PARAMS]
+            query = "SELECT DISTINCT search FROM uses WHERE stanza IN ({})".format(",".join("?" * len(part)))
+            found.update(sid for (sid,) in self.db.execute(query,part))
+        return found
+
+    # Ids of the searches affected by a change of the macro definitions, from
+    # the conf before (old_conf) to the conf after (new_conf), as loaded by
+    # macros.loadFile: the callers of the changed macros are looked for in both
+    # versions of the definitions
+    def affected(self,old_conf,new_conf):
+        changed = changed_stanzas(old_conf,new_conf)
+        stanzas = macros.MacroGraph(old_conf,False).dependents(changed) | macros.MacroGraph(new_conf,False).dependents(changed)
+        return self.searches(stanzas)
+
+    def __len__(self):
+        return self.db.execute("SELECT COUNT(*) FROM searches").fetchone()[0]
+
+    def close(self):
+        self.db.close()
@@ -1,4 +1,5 @@
-import configparser, re
+import configparser, re, os, json, hashlib
+from concurrent.futures import ThreadPoolExecutor
 
 '''
 Doc:
@@ -23,39 +24,125 @@ def loadFile(fpath):
 	config.read_string(fcontent)
 	data={}
 	for s in config.sections():
-		data[s]=config[s]
+		data[s]=dict(config[s])
 	return data
 
+#------------
+# APPS TREE
+#------------
+# Version of the format of the cache files of the apps trees
+APPS_CACHE_VERSION=1
+
+# Conf files of an etc/apps tree, from the lowest to the highest precedence
+# (Splunk global context): the local folders of the apps take precedence over
+# their default folders, and between two apps the one whose folder name comes
+# first in ASCII order takes precedence
+def appsTreeFiles(apps_dir,conf_name="macros.conf"):
+	apps=sorted(d for d in os.listdir(apps_dir) if os.path.isdir(os.path.join(apps_dir,d)))
+	files=[]
+	for folder in ["default","local"]:
+		for app in reversed(apps):
+			path=os.path.join(apps_dir,app,folder,conf_name)
+			if os.path.isfile(path):
+				files.append(path)
+	return files
+
+# Folder of the cache files of the current user ($XDG_CACHE_HOME/spl_validator,
+# by default ~/.cache/spl_validator), created readable by the user only
+def appsTreeCacheDir():
+	base=os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"),".cache")
+	return os.path.join(base,"spl_validator")
+
+# Default cache file of an apps tree, in the cache folder of the user
+def appsTreeCachePath(apps_dir):
+	h=hashlib.sha1(os.path.abspath(apps_dir).encode("utf-8")).hexdigest()[:16]
+	return os.path.join(appsTreeCacheDir(),"macros-{}.json".format(h))
+
+# Whether a cache file can be trusted: owned by the current user and not
+# writable by the group or the others (the definitions it holds are expanded
+# in the queries)
+def trustedCache(path):
+	st=os.stat(path)
+	if hasattr(os,"getuid") and st.st_uid != os.getuid():
+		return False
+	return st.st_mode & 0o022 == 0
+
+# Loads the macros.conf files of an etc/apps tree into a single index (stanza ->
+# settings), the settings of a stanza being merged following the precedence of
+# the files. The files are read by a pool of threads, and the index is cached in
+# cache_path (default in the cache folder of the user, False for no cache) along
+# with the modification times and sizes of the files: it is only rebuilt when
+# one of them changed, or when a file was added or removed. A cache file of
+# another user, or writable by others, is not read.
+def loadAppsTree(apps_dir,cache_path=None,workers=8):
+	files=appsTreeFiles(apps_dir)
+	stamps=[]
+	for path in files:
+		st=os.stat(path)
+		stamps.append([path,st.st_mtime_ns,st.st_size])
+	if cache_path is None:
+		cache_path=appsTreeCachePath(apps_dir)
+	if cache_path:
+		try:
+			if trustedCache(cache_path):
+				with open(cache_path,"r",encoding="utf-8") as f:
+					cache=json.load(f)
+				if cache.get("version") == APPS_CACHE_VERSION and cache.get("files") == stamps:
+					return cache["macros"]
+		except (OSError,ValueError):
+			pass
+	with ThreadPoolExecutor(max_workers=workers) as ex:
+		confs=list(ex.map(loadFile,files))
+	index={}
+	for conf in confs:
+		for stanza in conf:
+			index.setdefault(stanza,{}).update(conf[stanza])
+	if cache_path:
+		# Written aside then renamed, a concurrent reader never sees a partial file
+		tmp="{}.{}.tmp".format(cache_path,os.getpid())
+		try:
+			os.makedirs(os.path.dirname(os.path.abspath(cache_path)),mode=0o700,exist_ok=True)
+			with open(os.open(tmp,os.O_WRONLY|os.O_CREAT|os.O_EXCL,0o600),"w",encoding="utf-8") as f:
+				json.dump({"version":APPS_CACHE_VERSION,"files":stamps,"macros":index},f)
+			os.replace(tmp,cache_path)
+		except OSError:
+			pass
+	return index
+
+# Macro calls in a text (content between backticks)
+MACRO_CALL=re.compile("`([^`]+)`")
+# Expected format : macro_name OR macro_name(arg1) OR macro_name(arg1,arg2) OR macro_name(name1=arg1,name2=arg2)
+MACRO_CALL_FORMAT=re.compile('(?P<macro_name>[a-zA-Z][a-zA-Z0-9_\.-]*)(\((?P<args>[^,\(\)]+(,[^,\(\)]+)*)\))?')
+
+# Splits a macro call into its stanza name (macro_name OR macro_name(args_number))
+# and its arguments (None without argument), None when the format is wrong
+def parseMacroCall(macro):
+	m = MACRO_CALL_FORMAT.search(macro)
+	if m is None:
+		return None
+	mname = m.group("macro_name")
+	margs = m.group("args")
+	if margs is None:
+		return mname,None
+	margs = margs.split(",")
+	# Reformat args, like trim quotes
+	for i in range(0,len(margs)):
+		arg=margs[i]
+		if re.match('".*"',arg):
+			arg=arg.strip('"')
+		margs[i]=arg
+	return "{}({})".format(mname,len(margs)),margs
+
 # Based on the macro conf provided, expand the given macro call
 # return an object with attribute "success" indicate if operation went well
 # and "text" with either the error message or the expanded macro
 def expandMacro(macro,mconf):
-	# Expected format : macro_name OR macro_name(arg1) OR macro_name(arg1,arg2) OR macro_name(name1=arg1,name2=arg2)
-	reg = re.compile('(?P<macro_name>[a-zA-Z][a-zA-Z0-9_\.-]*)(\((?P<args>[^,\(\)]+(,[^,\(\)]+)*)\))?')
-	m = reg.search(macro)
-	mname = m.group("macro_name")
-	margs = m.group("args")
-	nb_args=0
+	call = parseMacroCall(macro)
 	# Returns an error if we could not even get the macro name
-	if mname is None:
+	if call is None:
 		return {"success":False,"text":"Wrong macro call format"}
-	if not margs is None:	# if any arg
-		if "," in margs:	# iif args list, split
-			margs = margs.split(",")
-			nb_args=len(margs)
-		else:
-			nb_args=1
-			margs=[margs]
-		# Reformat args, like trim quotes
-		for i in range(0,len(margs)):
-			arg=margs[i]
-			if re.match('".*"',arg):
-				arg=arg.strip('"')
-			margs[i]=arg
-	if nb_args > 0:	# Builds the expected stanza name of format macro_name OR macro_name(args_number)
-		stanza="{}({})".format(mname,nb_args)
-	else:
-		stanza=mname
+	stanza,margs = call
+	nb_args = 0 if margs is None else len(margs)
 	#If macro stanza found
 	if stanza in mconf:
 		if nb_args > 0:
@@ -80,40 +167,176 @@ def expandMacro(macro,mconf):
 	else:	# Macro not found, either wrong call or it does not exists
 		return {"success":False,"text":"Could not find macro with stanza {}".format(stanza)}
 
-def handleMacros(spl,macro_defs_paths=[]):
+#------------
+# DEPENDENCY GRAPH
+#------------
+# Definitions of macros analyzed once: the macros called by each definition
+# (stanza -> stanzas), the cycles, a topological order (the macros before the
+# ones calling them) and the fully expanded bodies of the macros without
+# arguments. A query is then expanded in a single pass, each macro call being
+# replaced by its expansion, whatever the depth of the nesting.
+# expand: whether the bodies of the macros are expanded (not needed to only
+# follow the dependencies)
+class MacroGraph:
+	def __init__(self,mconf,expand=True):
+		self.mconf=mconf
+		self.deps={}
+		for stanza in mconf:
+			self.deps[stanza]=[]
+			for mcall in MACRO_CALL.findall(mconf[stanza].get("definition","")):
+				call=parseMacroCall(mcall)
+				if not call is None and call[0] in mconf and not call[0] in self.deps[stanza]:
+					self.deps[stanza].append(call[0])
+		self.order,self.cycles=self.sortDependencies()
+		# Macros part of a cycle, never expanded
+		self.cyclic=set(stanza for cycle in self.cycles for stanza in cycle)
+		# stanza -> (expanded body, macro calls found and expanded in it)
+		self.bodies={}
+		for stanza in self.order if expand else []:
+			if not "(" in stanza and not stanza in self.cyclic:
+				self.bodies[stanza]=self.expandBody(stanza,0)
+
+	# Depth first search (iterative, the nesting is not bounded)
+	# Returns the topological order and the cycles found (lists of stanzas)
+	def sortDependencies(self):
+		order=[]
+		cycles=[]
+		state={}	# stanza -> 1 while visited, 2 once done
+		for root in self.deps:
+			if root in state:
+				continue
+			state[root]=1
+			path=[root]
+			stack=[iter(self.deps[root])]
+			while stack:
+				dep=next(stack[-1],None)
+				if dep is None:
+					stack.pop()
+					done=path.pop()
+					state[done]=2
+					order.append(done)
+				elif not dep in state:
+					state[dep]=1
+					path.append(dep)
+					stack.append(iter(self.deps[dep]))
+				elif state[dep] == 1:
+					cycles.append(path[path.index(dep):]+[dep])
+		return order,cycles
+
+	def expandBody(self,stanza,depth):
+		stats={"found":set(),"expanded":set()}
+		return self.expandText(self.mconf[stanza].get("definition",""),stats,depth),stats
+
+	# Replaces the macro calls of text by their expansion
+	# stats: dict with the sets "found" and "expanded" of the macro calls
+	def expandText(self,text,stats,depth=0):
+		return MACRO_CALL.sub(lambda m: self.expandCall(m.group(1),stats,depth),text)
+
+	def expandCall(self,mcall,stats,depth):
+		stats["found"].add(mcall)
+		call=parseMacroCall(mcall)
+		# The calls built from the arguments (macro_$x$) are not in the graph,
+		# the depth limit stops the cycles they could make
+		if call is None or not call[0] in self.mconf or call[0] in self.cyclic or depth >= MAX_MACRO_DEPTH:
+			return "`{}`".format(mcall)
+		if call[1] is None:
+			body=self.bodies.get(call[0])
+			if body is None:
+				body=self.expandBody(call[0],depth+1)
+			text,inner=body
+			stats["found"] |= inner["found"]
+			stats["expanded"] |= inner["expanded"]
+		else:
+			res=expandMacro(mcall,self.mconf)
+			if not res["success"]:
+				return "`{}`".format(mcall)
+			# The definitions with arguments are expanded once the arguments are
+			# replaced
+			text=self.expandText(res["text"],stats,depth+1)
+		stats["expanded"].add(mcall)
+		return text
+
+	# Fully expanded text of a macro call, None when it cannot be expanded
+	def expansion(self,mcall):
+		stats={"found":set(),"expanded":set()}
+		text=self.expandCall(mcall,stats,0)
+		return text if mcall in stats["expanded"] else None
+
+	# Macros calling the given ones, directly or through other macros (the
+	# given ones included)
+	def dependents(self,stanzas):
+		callers={}
+		for stanza in self.deps:
+			for dep in self.deps[stanza]:
+				callers.setdefault(dep,[]).append(stanza)
+		found=set(stanzas)
+		todo=list(found)
+		while todo:
+			for caller in callers.get(todo.pop(),[]):
+				if not caller in found:
+					found.add(caller)
+					todo.append(caller)
+		return found
+
+	# Description of the cycles, for the error messages
+	def cycleErrors(self):
+		return ["Macro cycle: {}".format(" -> ".join(cycle)) for cycle in self.cycles]
+
+# Graphs of the loaded definitions, by list of files
+macro_graphs={}
+# Maximum number of graphs kept, the oldest ones are dropped first
+MAX_MACRO_GRAPHS=32
+# Maximum nesting of the macro calls
+MAX_MACRO_DEPTH=100
+
+# Modification stamp of a macro definition file, or of the macros.conf files of
+# an etc/apps tree (a change of one of them changes the stamp)
+def pathStamp(p):
+	if os.path.isdir(p):
+		files=appsTreeFiles(p)
+	else:
+		files=[p]
+	stamp=[]
+	for path in files:
+		st=os.stat(path)
+		stamp.append((path,st.st_mtime_ns,st.st_size))
+	return tuple(stamp)
+
+# Loads the macro definition files (if not already loaded, or changed since) and
+# returns the graph of their definitions, with its key in macro_graphs. Only the
+# given files are used, the first one defining a macro wins.
+def loadGraph(macro_defs_paths=[]):
 	global macro_defs
 	# In case only 1 string is given instead of a list
 	if not isinstance(macro_defs_paths,list):
 		macro_defs_paths=[macro_defs_paths]
-	# Loading all macro definition files
+	# Loading the macro definition files, a folder being an etc/apps tree
+	key=[]
 	for p in macro_defs_paths:
-		if not p in macro_defs:	#Not loading again if already in cache
-			macro_defs[p]=loadFile(p)
-	ret={"text":spl,"unique_macros_found":0,"unique_macros_expanded":0}
-	#Extracting macro calls from the spl
-	mcalls=list(set(re.findall("`([^`]+)`",spl)))
-	nb_rec=1
-	while len(mcalls) > 0 and nb_rec < 100:
-		msub={}
-		# Trying to expand the macros accross all the available definitions
-		for p in macro_defs:
-			for mcall in mcalls:
-				if not mcall in msub:
-					res=expandMacro(mcall,macro_defs[p])
-					if res["success"]:
-						msub[mcall]=res["text"]
-		# Replacing in the original string
-		ret["unique_macros_found"] += len(mcalls)
-		ret["unique_macros_expanded"] += len(msub)
-		for mcall in msub:
-			ret["text"]=ret["text"].replace("`{}`".format(mcall),msub[mcall])
-		mcalls=list(set(re.findall("`([^`]+)`",ret["text"])))
-		# To stop the repetition in case there some macros that could not be expanded
-		# No need to try in vain 100 times if the previous attempt didn't achieve anything
-		if len(msub) == 0:
-			mcalls=[]	
-		nb_rec += 1
-	return ret
+		stamp=pathStamp(p)
+		if not p in macro_defs or macro_defs[p][0] != stamp:	#Not loading again if unchanged
+			if os.path.isdir(p):
+				macro_defs[p]=(stamp,loadAppsTree(p))
+			else:
+				macro_defs[p]=(stamp,loadFile(p))
+		key.append((p,stamp))
+	key=tuple(key)
+	graph=macro_graphs.get(key)
+	if graph is None:
+		mconf={}
+		for p in macro_defs_paths:
+			for stanza,settings in macro_defs[p][1].items():
+				mconf.setdefault(stanza,settings)
+		while len(macro_graphs) >= MAX_MACRO_GRAPHS:
+			del macro_graphs[next(iter(macro_graphs))]
+		graph=macro_graphs[key]=MacroGraph(mconf)
+	return key,graph
+
+def handleMacros(spl,macro_defs_paths=[]):
+	key,graph=loadGraph(macro_defs_paths)
+	stats={"found":set(),"expanded":set()}
+	text=graph.expandText(spl,stats)
+	return {"text":text,"unique_macros_found":len(stats["found"]),"unique_macros_expanded":len(stats["expanded"]),"errors":graph.cycleErrors()}
 
 '''
 s="`foobar(arg1,arg2)` source=*sysmon* | stats count by host | eval max=`fooeval(a,b)`"
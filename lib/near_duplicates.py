@@ -0,0 +1,158 @@
+import re, hashlib
+from array import array
+from collections import namedtuple
+
+from . import spl_validator
+
+#---------------------------
+#     NEAR-DUPLICATES
+#---------------------------
+
+# Clusters of near-duplicate searches (searches only differing by a few tokens,
+# like copies with another threshold or time range), candidates for a merge.
+# Each query is turned into the shingles (k consecutive tokens) of its token
+# stream, the tokens being normalized (type and lowercased value, the numbers
+# by their type only), and into the MinHash signature of its shingles (the
+# minimum of each of the num_perm hash functions on the shingles, the hash
+# values of a shingle being the 32-bit words of its blake2b digests). The
+# signatures are split into bands, and the searches sharing a band (LSH bucket)
+# are compared on their signatures: the ones with an estimated similarity
+# (Jaccard) of at least the threshold are in the same cluster.
+# The signatures are computed in chunks (by the worker processes of a
+# pool.ValidatorPool when given) and kept packed (4 bytes per value), the
+# buckets are built one band at a time.
+
+# Hash values of a shingle per blake2b digest (64 bytes)
+DIGEST_VALUES = 16
+WHITESPACES = re.compile(r'\s+')
+
+# members: names of the searches, similarity: lowest estimated similarity of the
+# pairs linking them
+Cluster = namedtuple("Cluster",["names","similarity"])
+
+# Normalized tokens of a query, as "TYPE:value" strings (the macro calls
+# included, searches only differing by their macros are not duplicates)
+def features(query,profile=None):
+    found = []
+    for tok in spl_validator.tokenize(query,lexer_backend="scanner",profile=profile,macro_tokens=True):
+        if tok.type == "NUMBER":
+            found.append(tok.type)
+        else:
+            found.append("{}:{}".format(tok.type,WHITESPACES.sub(" ",str(tok.value)).lower()))
+    return found
+
+# Shingles (k consecutive normalized tokens) of a query
+def shingles(query,k=2,profile=None):
+    feats = features(query,profile)
+    if len(feats) == 0:
+        return set()
+    return set("\x1f".join(feats[i:i+k]) for i in range(max(1,len(feats) - k + 1)))
+
+# MinHash signature of a query (num_perm packed 32-bit values), None for a query
+# without tokens
+def signature(query,num_perm=64,k=2,profile=None):
+    digests = -(-num_perm // DIGEST_VALUES)
+    rows = []
+    for sh in shingles(query,k,profile):
+        data = sh.encode("utf-8")
+        values = array("I")
+        for d in range(digests):
+            values.frombytes(hashlib.blake2b(data,digest_size=64,salt=d.to_bytes(16,"little")).digest())
+        rows.append(values)
+    if len(rows) == 0:
+        return None
+    return array("I",list(map(min,zip(*rows)))[:num_perm]).tobytes()
+
+# Estimated Jaccard similarity of two signatures
+def similarity(sig1,sig2):
+    v1, v2 = memoryview(sig1).cast("I"), memoryview(sig2).cast("I")
+    return sum(x == y for x, y in zip(v1,v2)) / len(v1)
+
+# Yields the (name, signature) of the searches (dict name -> query, or iterable
+# of pairs), computed by the worker pool pool when given
+def signatures(searches,num_perm=64,k=2,pool=None,profile=None):
+    if isinstance(searches,dict):
+        searches = searches.items()
+    names = []
+    def queries():
+        for name, query in searches:
+            names.append(name)
+            yield query
+    if pool is None:
+        sigs = (signature(q,num_perm,k,profile) for q in queries())
+    else:
+        sigs = pool.map(signature,queries(),num_perm=num_perm,k=k,profile=profile)
+    for i, sig in enumerate(sigs):
+        yield names[i], sig
+        names[i] = None
+
+class DisjointSets(object):
+    def __init__(self,n):
+        self.parent = list(range(n))
+        # root -> lowest similarity of the links of its set
+        self.similarity = {}
+
+    def find(self,i):
+        root = i
+        while self.parent[root] != root:
+            root = self.parent[root]
+        while self.parent[i] != root:
+            self.parent[i], i = root, self.parent[i]
+        return root
+
+    def union(self,i,j,sim):
+        ri, rj = self.find(i), self.find(j)
+        low = min(sim,self.similarity.pop(ri,1.0),self.similarity.pop(rj,1.0))
+        self.parent[rj] = ri
+        self.similarity[ri] = low
+
+# Clusters of near-duplicates of the searches (dict name -> query, or iterable of
+# pairs), largest first
+# threshold: lowest estimated similarity of two near-duplicates
+# num_perm: size of the signatures, split into bands of num_perm/bands values
+#   (the pairs of similarity s share a band with a probability of
+#   1-(1-s^rows)^bands, about 0.99 for s = 0.7 with the defaults)
+# k: number of tokens of the shingles
+def find_clusters(searches,threshold=0.7,num_perm=64,bands=16,k=2,pool=None,profile=None):
+    if num_perm % bands != 0:
+        raise ValueError("num_perm ({}) must be a multiple of bands ({})".format(num_perm,bands))
+    names, sigs = [], []
+    for name, sig in signatures(searches,num_perm,k,pool,profile):
+        if not sig is None:
+            names.append(name)
+            sigs.append(sig)
+    sets = DisjointSets(len(sigs))
+    width = 4 * num_perm // bands
+    for band in range(bands):
+        buckets = {}
+        for i, sig in enumerate(sigs):
+            buckets.setdefault(sig[band*width:(band+1)*width],[]).append(i)
+        for members in buckets.values():
+            # Members compared to a leader, the ones too far from it to the next
+            # leader
+            while len(members) > 1:
+                lead, rest = members[0], []
+                for m in members[1:]:
+                    if sets.find(m) == sets.find(lead):
+                        continue
+                    sim = similarity(sigs[lead],sigs[m])
+                    if sim >= threshold:
+                        sets.union(lead,m,sim)
+                    else:
+                        rest.append(m)
+                members = rest
+        del buckets
+    groups = {}
+    for i in range(len(sigs)):
+        groups.setdefault(sets.find(i),[]).append(names[i])
+    clusters = [Cluster(sorted(g,key=str),sets.similarity[root]) for root, g in groups.items() if len(g) > 1]
+    clusters.sort(key=lambda c: (-len(c.names),-c.similarity,str(c.names[0])))
+    return clusters
+
+# Lines of the report of the clusters
+def report(clusters):
+    lines = []
+    for n, c in enumerate(clusters,1):
+        lines.append("[CLUSTER {}] {} searches, similarity >= {:.2f}".format(n,len(c.names),c.similarity))
+        lines += ["    {}".format(name) for name in c.names]
+    return lines
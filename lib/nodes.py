@@ -0,0 +1,262 @@
+
+#---------------------------
+#       PARSE TREE NODES
+#---------------------------
+
+# Semantic values built by the grammar rules. Each node class only has the
+# attributes of its result keys (__slots__), but nodes can still be used like
+# the dicts the grammar rules used to build: node["input"], "filters" in node,
+# node.get("content"). to_dict() gives back the result schema of analyze.
+
+# Result keys which are not valid attribute names
+ATTRS = {"fields-effect":"fields_effect"}
+KEYS = {"fields_effect":"fields-effect"}
+
+class Node(object):
+    __slots__ = ("type",)
+
+    def __getitem__(self,key):
+        attr = ATTRS.get(key,key)
+        if attr in self.attrs:
+            try:
+                return getattr(self,attr)
+            except AttributeError:
+                pass
+        raise KeyError(key)
+
+    def __setitem__(self,key,value):
+        attr = ATTRS.get(key,key)
+        if not attr in self.attrs:
+            raise KeyError("{} node has no '{}' key".format(type(self).__name__,key))
+        setattr(self,attr,value)
+
+    def __contains__(self,key):
+        attr = ATTRS.get(key,key)
+        return attr in self.attrs and hasattr(self,attr)
+
+    def get(self,key,default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def pop(self,key,*default):
+        try:
+            value = self[key]
+        except KeyError:
+            if len(default) > 0:
+                return default[0]
+            raise
+        delattr(self,ATTRS.get(key,key))
+        return value
+
+    def keys(self):
+        return [KEYS.get(a,a) for a in self.order if hasattr(self,a)]
+
+    def items(self):
+        return [(k,self[k]) for k in self.keys()]
+
+    def to_dict(self):
+        return {k:to_dict(v) for k,v in self.items()}
+
+    def __repr__(self):
+        return repr(self.to_dict())
+
+# Converts nested nodes to the plain dicts and lists of the result schema
+def to_dict(value):
+    if isinstance(value,Node):
+        return value.to_dict()
+    elif isinstance(value,list):
+        return [to_dict(v) for v in value]
+    elif isinstance(value,dict):
+        return {k:to_dict(v) for k,v in value.items()}
+    return value
+
+#---------------------------
+# Node classes
+#---------------------------
+
+# mainsearch / search_exp
+class Search(Node):
+    __slots__ = ("input","output","fields_effect","content","cmd","filters")
+
+    def __init__(self,stype,input,output,fields_effect,content,cmd,filters):
+        self.type = stype
+        self.input = input
+        self.output = output
+        self.fields_effect = fields_effect
+        self.content = content
+        self.cmd = cmd
+        self.filters = filters
+
+# subsearch / subsearches, "field" is set when used as a field name
+class Subsearch(Node):
+    __slots__ = ("input","output","content","filters","field")
+
+    def __init__(self,stype,input,output,content,filters):
+        self.type = stype
+        self.input = input
+        self.output = output
+        self.content = content
+        self.filters = filters
+
+class Command(Node):
+    __slots__ = ("input","output","fields_effect","content","cmd","filters","op","file")
+
+    def __init__(self,input,output,fields_effect,content,cmd,**extra):
+        self.type = "command"
+        self.input = input
+        self.output = output
+        self.fields_effect = fields_effect
+        self.content = content
+        self.cmd = cmd
+        for k in extra:
+            setattr(self,k,extra[k])
+
+# filters / filters_logic_term / filters_logic_factor
+class FilterList(Node):
+    __slots__ = ("input","output","content","op","filters")
+
+    def __init__(self,ftype,input,output,content,op,filters):
+        self.type = ftype
+        self.input = input
+        self.output = output
+        self.content = content
+        self.op = op
+        self.filters = filters
+
+# filter / filter_subsearch / filter_phrase
+class Filter(Node):
+    __slots__ = ("input","output","value","op")
+
+    def __init__(self,ftype,input,value,op):
+        self.type = ftype
+        self.input = input
+        self.output = []
+        self.value = value
+        self.op = op
+
+    def copy(self):
+        value = self.value
+        if isinstance(value,list):
+            value = list(value)
+        return Filter(self.type,list(self.input),value,list(self.op))
+
+# fields_list / any_fields_list / rfields_list / rfield_term / sort_clause
+class FieldList(Node):
+    __slots__ = ("input","output")
+
+    def __init__(self,ftype,input,output):
+        self.type = ftype
+        self.input = input
+        self.output = output
+
+# field_name / sort_term
+class Field(Node):
+    __slots__ = ("field",)
+
+    def __init__(self,ftype,field):
+        self.type = ftype
+        self.field = field
+
+# value / value_concat / value_concat_factor / args_value
+class Value(Node):
+    __slots__ = ("value",)
+
+    def __init__(self,vtype,value):
+        self.type = vtype
+        self.value = value
+
+# args_list / args_term
+class Args(Node):
+    __slots__ = ("args",)
+
+    def __init__(self,atype,args):
+        self.type = atype
+        self.args = args
+
+# Position of a token spliced from the expansion of a macro call (see
+# spl_validator.splice_macro): the position of the call in the query, with the
+# (start, end) span of the call, its expanded text and the position of the token
+# in it. The parser copies the positions of the tokens to the rules, so an
+# expression knows where it starts and ends in the expansions.
+class MacroPos(int):
+    def __new__(cls,pos,call,expansion,offset):
+        self = int.__new__(cls,pos)
+        self.call = call
+        self.expansion = expansion
+        self.offset = offset
+        return self
+
+    def __reduce__(self):
+        return MacroPos, (int(self),self.call,self.expansion,self.offset)
+
+# Text of the query between start and end as in the expanded query: the calls
+# spliced (calls: start of the call -> (end of the call, expanded text)) are
+# replaced by their expansion, a start or end in an expansion (MacroPos) is
+# taken in its text
+def expanded_slice(text,start,end,calls):
+    if isinstance(start,MacroPos):
+        if isinstance(end,MacroPos) and end.call == start.call:
+            return start.expansion[start.offset:end.offset]
+        parts = [start.expansion[start.offset:]]
+        pos = start.call[1]
+    else:
+        parts = []
+        pos = start
+    stop = end.call[0] if isinstance(end,MacroPos) else end
+    for cstart in sorted(c for c in calls if pos <= c < stop):
+        cend, expansion = calls[cstart]
+        if cend <= stop:
+            parts += [text[pos:cstart],expansion]
+            pos = cend
+    parts.append(text[pos:stop])
+    if isinstance(end,MacroPos):
+        parts.append(end.expansion[:end.offset])
+    return "".join(parts)
+
+# Expression node: instead of rebuilding the text of the expression at each
+# reduction, it only keeps the (start, end) span of the expression in the
+# analyzed text. The "content" key is sliced from the text when it is read.
+# calls: macro calls spliced in the query (see expanded_slice), None without
+# splicing
+class Expression(Node):
+    __slots__ = ("input","output","function","text","start","end","calls")
+
+    def __init__(self,etype,text,start,end,calls=None):
+        self.type = etype
+        self.input = []
+        self.output = []
+        self.text = text
+        self.start = start
+        self.end = end
+        self.calls = calls
+
+    def __getitem__(self,key):
+        if key == "content":
+            if self.calls is None:
+                return self.text[self.start:self.end]
+            return expanded_slice(self.text,self.start,self.end,self.calls)
+        return Node.__getitem__(self,key)
+
+    def __contains__(self,key):
+        return key == "content" or Node.__contains__(self,key)
+
+    def keys(self):
+        return [k for k in self.order if k in self]
+
+    def span(self):
+        return self.start, self.end
+
+# Attributes (and their order in the results) of each node class
+for cls in [Node,Search,Subsearch,Command,FilterList,Filter,FieldList,Field,Value,Args,Expression]:
+    cls.order = tuple(a for c in reversed(cls.__mro__) for a in getattr(c,"__slots__",()))
+    cls.attrs = frozenset(cls.order)
+Expression.order = ("type","input","output","function","content")
+Expression.attrs = frozenset(["type","input","output","function"])
+
+# Builds an expression node spanning the symbols of the production p
+# (same positions as p.lexpos(1) and p.lexspan(len(p)-1)[1], without the calls)
+def expression(etype,p):
+    first,last = p.slice[1],p.slice[-1]
+    return Expression(etype,p.lexer.lexdata,first.lexpos,getattr(last,"endlexpos",last.lexpos),p.lexer.macro_calls)
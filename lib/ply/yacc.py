@@ -2072,13 +2072,20 @@ def traverse(x, N, stack, F, X, R, FP):
     F[x] = FP(x)             # F(X) <- F'(x)
 
     rel = R(x)               # Get y's related to x
+    seen = None
     for y in rel:
         if N[y] == 0:
             traverse(y, N, stack, F, X, R, FP)
         N[x] = min(N[x], N[y])
+        fx = F[x]
+        # Set of the elements of F(x), rebuilt if the list was changed elsewhere
+        # (the lists of F can be shared)
+        if seen is None or len(seen) != len(fx):
+            seen = set(fx)
         for a in F.get(y, []):
-            if a not in F[x]:
-                F[x].append(a)
+            if a not in seen:
+                seen.add(a)
+                fx.append(a)
     if N[x] == d:
         N[stack[-1]] = MAXINT
         F[stack[-1]] = F[x]
@@ -2171,21 +2178,29 @@ class LRGeneratedTable(LRTable):
         # Now we generate the goto set in a way that guarantees uniqueness
         # of the result
 
-        s = self.lr_goto_cache.get(x)
-        if not s:
-            s = {}
-            self.lr_goto_cache[x] = s
-
         gs = []
         for p in I:
             n = p.lr_next
             if n and n.lr_before == x:
-                s1 = s.get(id(n))
-                if not s1:
-                    s1 = {}
-                    s[id(n)] = s1
                 gs.append(n)
-                s = s1
+        g = self.lr0_goto_set(gs, x)
+        self.lr_goto_cache[(id(I), x)] = g
+        return g
+
+    # Unique goto set for the list of items gs (the items after the transition on x)
+
+    def lr0_goto_set(self, gs, x):
+        s = self.lr_goto_cache.get(x)
+        if not s:
+            s = {}
+            self.lr_goto_cache[x] = s
+
+        for n in gs:
+            s1 = s.get(id(n))
+            if not s1:
+                s1 = {}
+                s[id(n)] = s1
+            s = s1
         g = s.get('$end')
         if not g:
             if gs:
@@ -2193,7 +2208,6 @@ class LRGeneratedTable(LRTable):
                 s['$end'] = g
             else:
                 s['$end'] = gs
-        self.lr_goto_cache[(id(I), x)] = g
         return g
 
     # Compute the LR(0) sets of item function
@@ -2216,8 +2230,23 @@ class LRGeneratedTable(LRTable):
                 for s in ii.usyms:
                     asyms[s] = None
 
+            # Items of each goto(I,X) set, computed in a single pass over I
+            # instead of one pass per symbol
+            gsets = {}
+            for p in I:
+                n = p.lr_next
+                if n:
+                    gs = gsets.get(n.lr_before)
+                    if gs is None:
+                        gsets[n.lr_before] = [n]
+                    else:
+                        gs.append(n)
+
             for x in asyms:
-                g = self.lr0_goto(I, x)
+                g = self.lr_goto_cache.get((id(I), x))
+                if not g:
+                    g = self.lr0_goto_set(gsets.get(x, []), x)
+                    self.lr_goto_cache[(id(I), x)] = g
                 if not g or id(g) in self.lr0_cidhash:
                     continue
                 self.lr0_cidhash[id(g)] = len(C)
@@ -2284,12 +2313,14 @@ class LRGeneratedTable(LRTable):
 
     def find_nonterminal_transitions(self, C):
         trans = []
+        found = set()
         for stateno, state in enumerate(C):
             for p in state:
                 if p.lr_index < p.len - 1:
                     t = (stateno, p.prod[p.lr_index+1])
                     if t[1] in self.grammar.Nonterminals:
-                        if t not in trans:
+                        if t not in found:
+                            found.add(t)
                             trans.append(t)
         return trans
 
@@ -2490,15 +2521,24 @@ class LRGeneratedTable(LRTable):
     # -----------------------------------------------------------------------------
 
     def add_lookaheads(self, lookbacks, followset):
+        # The lookaheads of each (production, state) are gathered in a dict used
+        # as an ordered set (same order as appending the new ones to the list)
+        found = {}
         for trans, lb in lookbacks.items():
+            f = dict.fromkeys(followset.get(trans, []))
             # Loop over productions in lookback
             for state, p in lb:
-                if state not in p.lookaheads:
-                    p.lookaheads[state] = []
-                f = followset.get(trans, [])
-                for a in f:
-                    if a not in p.lookaheads[state]:
-                        p.lookaheads[state].append(a)
+                laheads = found.get((id(p), state))
+                if laheads is None:
+                    if state not in p.lookaheads:
+                        p.lookaheads[state] = []
+                    laheads = dict.fromkeys(p.lookaheads[state])
+                    found[(id(p), state)] = (p, state, laheads)
+                else:
+                    laheads = laheads[2]
+                laheads.update(f)
+        for p, state, laheads in found.values():
+            p.lookaheads[state] = list(laheads)
 
     # -----------------------------------------------------------------------------
     # add_lalr_lookaheads()
@@ -2540,6 +2580,9 @@ class LRGeneratedTable(LRTable):
 
         actionp = {}                  # Action production array (temporary)
 
+        # The actions are only described when the log is kept (parser.out)
+        debug = not isinstance(log, NullLogger)
+
         log.info('Parsing method: %s', self.lr_method)
 
         # Step 1: Construct C = { I0, I1, ... IN}, collection of LR(0) items
@@ -2558,12 +2601,13 @@ class LRGeneratedTable(LRTable):
             st_action  = {}
             st_actionp = {}
             st_goto    = {}
-            log.info('')
-            log.info('state %d', st)
-            log.info('')
-            for p in I:
-                log.info('    (%d) %s', p.number, p)
-            log.info('')
+            if debug:
+                log.info('')
+                log.info('state %d', st)
+                log.info('')
+                for p in I:
+                    log.info('    (%d) %s', p.number, p)
+                log.info('')
 
             for p in I:
                     if p.len == p.lr_index + 1:
@@ -2578,7 +2622,8 @@ class LRGeneratedTable(LRTable):
                             else:
                                 laheads = self.grammar.Follow[p.name]
                             for a in laheads:
-                                actlist.append((a, p, 'reduce using rule %d (%s)' % (p.number, p)))
+                                if debug:
+                                    actlist.append((a, p, 'reduce using rule %d (%s)' % (p.number, p)))
                                 r = st_action.get(a)
                                 if r is not None:
                                     # Whoa. Have a shift/reduce or reduce/reduce conflict
@@ -2638,7 +2683,8 @@ class LRGeneratedTable(LRTable):
                             j = self.lr0_cidhash.get(id(g), -1)
                             if j >= 0:
                                 # We are in a shift state
-                                actlist.append((a, p, 'shift and go to state %d' % j))
+                                if debug:
+                                    actlist.append((a, p, 'shift and go to state %d' % j))
                                 r = st_action.get(a)
                                 if r is not None:
                                     # Whoa have a shift/reduce or shift/shift conflict
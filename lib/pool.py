@@ -0,0 +1,141 @@
+import os, sys, time, multiprocessing
+
+from . import spl_validator
+
+try:
+    import resource
+except ImportError:
+    # Windows
+    resource = None
+
+#---------------------------
+#       WORKER POOL
+#---------------------------
+
+# Pool of worker processes analyzing batches of queries. The workers are forked
+# from a forkserver which imported the preload module (the tables are built
+# before the first fork), so they start warm instead of importing spl_validator
+# and loading the tables again. As the analyses grow the memory of a worker
+# (results, caches of the macros...), a worker is replaced after a given number
+# of queries.
+# The forkserver of a program is started once, with the preload list of the
+# first pool using it. Where it is not available (Windows), the workers are
+# spawned and warmed up by the initializer.
+# As with any use of multiprocessing, the main module of the program must be
+# importable without running the analyses (if __name__ == "__main__" guard).
+
+PRELOAD_MODULE = __name__.rsplit(".",1)[0] + ".preload"
+
+# Called once in each worker, warms it up if it was not forked warm
+def init_worker():
+    from . import preload
+
+# Applies func (spl_validator.analyze, or another module-level function) to a
+# chunk of queries in a worker, after the registrations of the program
+# (spl_validator.registrations, sent with each chunk as they can change after
+# the start of the pool)
+# Returns the results and the stats of the worker
+def apply_chunk(args):
+    func, queries, kwargs, regs = args
+    spl_validator.apply_registrations(regs)
+    st = time.perf_counter()
+    results = [func(s,**kwargs) for s in queries]
+    stats = {"pid": os.getpid(), "queries": len(queries), "time": time.perf_counter() - st, "maxrss": max_rss()}
+    return results, stats
+
+# Peak resident memory of the current process in KB (None when not available)
+def max_rss():
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Bytes on macOS, KB elsewhere
+    return rss // 1024 if sys.platform == "darwin" else rss
+
+class ValidatorPool(object):
+    # processes: number of workers (default the number of CPUs)
+    # max_queries_per_worker: a worker is replaced once it analyzed this many
+    #   queries (rounded up to whole chunks), None to keep the workers
+    # chunksize: number of queries sent to a worker at once
+    # start_method: multiprocessing start method, forkserver when available
+    def __init__(self,processes=None,max_queries_per_worker=None,chunksize=16,start_method=None):
+        if start_method is None:
+            start_method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+        if chunksize < 1:
+            raise ValueError("chunksize must be at least 1")
+        if not max_queries_per_worker is None:
+            if max_queries_per_worker < 1:
+                raise ValueError("max_queries_per_worker must be at least 1 (or None)")
+            chunksize = min(chunksize,max_queries_per_worker)
+        self.processes = processes if not processes is None else os.cpu_count()
+        self.max_queries_per_worker = max_queries_per_worker
+        self.chunksize = chunksize
+        self.start_method = start_method
+        ctx = multiprocessing.get_context(start_method)
+        if start_method == "forkserver":
+            ctx.set_forkserver_preload([PRELOAD_MODULE])
+        maxtasks = None
+        if not max_queries_per_worker is None:
+            maxtasks = -(-max_queries_per_worker // chunksize)
+        # Worker pid -> stats (queries analyzed, time spent analyzing, peak memory)
+        self.workers = {}
+        self.pool = ctx.Pool(self.processes,initializer=init_worker,maxtasksperchild=maxtasks)
+
+    # Yields the results of the analysis of the queries, in order
+    # kwargs are the arguments of spl_validator.analyze (print_errs is False
+    # unless given)
+    def imap(self,queries,**kwargs):
+        kwargs.setdefault("print_errs",False)
+        return self.map(spl_validator.analyze,queries,**kwargs)
+
+    # Yields func(query,**kwargs) for the queries, in order, computed by the
+    # workers (func must be a module-level function, sent to them by name)
+    def map(self,func,queries,**kwargs):
+        for results, stats in self.pool.imap(apply_chunk,self.chunks(func,queries,kwargs)):
+            self.update_stats(stats)
+            for r in results:
+                yield r
+
+    # Results of the analysis of the queries, in order
+    def analyze(self,queries,**kwargs):
+        return list(self.imap(queries,**kwargs))
+
+    def chunks(self,func,queries,kwargs):
+        regs = spl_validator.registrations()
+        chunk = []
+        for s in queries:
+            chunk.append(s)
+            if len(chunk) == self.chunksize:
+                yield func, chunk, kwargs, regs
+                chunk = []
+        if len(chunk) > 0:
+            yield func, chunk, kwargs, regs
+
+    def update_stats(self,stats):
+        w = self.workers.get(stats["pid"])
+        if w is None:
+            w = self.workers[stats["pid"]] = {"pid": stats["pid"], "queries": 0, "chunks": 0, "time": 0.0, "maxrss": None}
+        w["queries"] += stats["queries"]
+        w["chunks"] += 1
+        w["time"] += stats["time"]
+        w["maxrss"] = stats["maxrss"]
+
+    # Stats of the workers which analyzed queries (including the ones replaced)
+    def stats(self):
+        return [dict(w) for w in self.workers.values()]
+
+    def close(self):
+        self.pool.close()
+        self.pool.join()
+
+    def terminate(self):
+        self.pool.terminate()
+        self.pool.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self,exc_type,exc_value,tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.terminate()
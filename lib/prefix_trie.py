@@ -0,0 +1,168 @@
+from array import array
+from collections import namedtuple
+
+from . import spl_validator
+
+#---------------------------
+#   SHARED PIPELINE PREFIXES
+#---------------------------
+
+# Prefix trie of the pipelines of a corpus of searches: the prefixes (base
+# search and first commands) shared by many searches are candidates for a
+# summary index or a report acceleration. Each search is split into its
+# pipeline stages (the commands of the main search, the pipes of the
+# subsearches being kept in their command), each stage normalized from its
+# tokens: the terms of a base search without boolean operators are sorted
+# (index=fw sourcetype=pan and sourcetype=pan index=fw are the same prefix),
+# the strings are quoted again and the spaces are normalized. Only the searches
+# analyzed without error are inserted.
+# The searches are read in one pass: the trie keeps the stages of the first
+# max_depth commands of each search and the ids of the searches under each
+# node (4 bytes per search and level), never the queries.
+
+# Tokens of comparisons, a term with the names around them
+COMPARISONS = frozenset(["EQ","NEQ","DEQ","COMP_OP"])
+# Tokens making the order of the terms of a base search significant (a macro
+# call may expand to boolean operators)
+BOOLEANS = frozenset(["OR_OP","NOT_OP","LPAREN","RPAREN","MACRO"])
+
+# stages: normalized stages of the prefix, names: searches sharing it
+SharedPrefix = namedtuple("SharedPrefix",["stages","names"])
+
+def token_text(tok):
+    if tok.type == "STRING":
+        return '"{}"'.format(" ".join(tok.value.split()))
+    return str(tok.value)
+
+# Normalized text of a stage from its tokens (the macro calls included), text
+# the raw text of the stage (for a stage without tokens)
+def stage_key(tokens,text,base):
+    if len(tokens) == 0:
+        return " ".join(text.split())
+    terms = []
+    i = 0
+    while i < len(tokens):
+        if i + 2 < len(tokens) and tokens[i+1].type in COMPARISONS:
+            terms.append("".join(token_text(t) for t in tokens[i:i+3]))
+            i += 3
+        else:
+            terms.append(token_text(tokens[i]))
+            i += 1
+    if base:
+        if tokens[0].type == "CMD_SEARCH":
+            terms = terms[1:]
+        if not any(t.type in BOOLEANS for t in tokens):
+            terms.sort()
+    return " ".join(terms)
+
+# Normalized pipeline stages of a query, the first one being the base search
+# ("" for a query starting with a pipe)
+def stages(query,profile=None):
+    found = []
+    tokens, depth, start = [], 0, 0
+    for tok in spl_validator.tokenize(query,lexer_backend="scanner",profile=profile,macro_tokens=True):
+        if tok.type == "LBRACK":
+            depth += 1
+        elif tok.type == "RBRACK":
+            depth -= 1
+        elif tok.type == "PIPE" and depth == 0:
+            found.append(stage_key(tokens,query[start:tok.lexpos],len(found) == 0))
+            tokens, start = [], tok.lexpos + 1
+            continue
+        tokens.append(tok)
+    found.append(stage_key(tokens,query[start:],len(found) == 0))
+    return found
+
+# Stages of a query analyzed without error (None otherwise), at most max_depth
+# kwargs are the arguments of analyze
+def search_stages(query,max_depth=None,**kwargs):
+    kwargs.setdefault("print_errs",False)
+    if spl_validator.analyze(query,**kwargs)["errors_count"] > 0:
+        return None
+    return stages(query,kwargs.get("profile"))[:max_depth]
+
+class PrefixTrie(object):
+    # max_depth: number of stages of the searches kept (base search included)
+    def __init__(self,max_depth=6):
+        self.max_depth = max_depth
+        self.names = []
+        # (parent node, stage) -> node, node 0 being the root
+        self.children = {}
+        self.stages = [None]
+        self.parents = [None]
+        # Ids of the searches of each node
+        self.searches = [array("I")]
+
+    def add(self,name,stages):
+        sid = len(self.names)
+        self.names.append(name)
+        node = 0
+        self.searches[0].append(sid)
+        for stage in stages[:self.max_depth]:
+            child = self.children.get((node,stage))
+            if child is None:
+                child = self.children[(node,stage)] = len(self.stages)
+                self.stages.append(stage)
+                self.parents.append(node)
+                self.searches.append(array("I"))
+            self.searches[child].append(sid)
+            node = child
+
+    # Analyzes and inserts the searches (dict name -> query, or iterable of
+    # pairs), analyzed by the worker pool pool when given. Returns the number of
+    # searches inserted (the ones with errors are left out).
+    def update(self,searches,pool=None,**kwargs):
+        if isinstance(searches,dict):
+            searches = searches.items()
+        names = []
+        def queries():
+            for name, query in searches:
+                names.append(name)
+                yield query
+        if pool is None:
+            found = (search_stages(q,self.max_depth,**kwargs) for q in queries())
+        else:
+            found = pool.map(search_stages,queries(),max_depth=self.max_depth,**kwargs)
+        count = 0
+        for i, st in enumerate(found):
+            if not st is None:
+                self.add(names[i],st)
+                count += 1
+            names[i] = None
+        return count
+
+    def prefix(self,node):
+        found = []
+        while node != 0:
+            found.append(self.stages[node])
+            node = self.parents[node]
+        return found[::-1]
+
+    # Prefixes of at least min_stages stages shared by at least min_searches
+    # searches, the longest ones: a prefix is left out when all its searches
+    # share a longer one. Most shared first.
+    def shared(self,min_searches=10,min_stages=2):
+        depth = [0] * len(self.stages)
+        longer = set()
+        for (parent, stage), node in self.children.items():
+            if len(self.searches[node]) == len(self.searches[parent]):
+                longer.add(parent)
+        found = []
+        for node in range(1,len(self.stages)):
+            depth[node] = depth[self.parents[node]] + 1
+            count = len(self.searches[node])
+            if count >= min_searches and depth[node] >= min_stages and not node in longer:
+                found.append(SharedPrefix(self.prefix(node),[self.names[i] for i in self.searches[node]]))
+        found.sort(key=lambda p: (-len(p.names),-len(p.stages),p.stages))
+        return found
+
+    def __len__(self):
+        return len(self.names)
+
+# Lines of the report of the shared prefixes
+def report(prefixes):
+    lines = []
+    for n, p in enumerate(prefixes,1):
+        lines.append("[PREFIX {}] {} searches: {}".format(n,len(p.names)," | ".join(p.stages)))
+        lines += ["    {}".format(name) for name in p.names]
+    return lines
@@ -0,0 +1,17 @@
+from . import spl_validator
+
+#---------------------------
+#       PRELOAD
+#---------------------------
+
+# Imported by the forkserver of the worker pool (see pool.py): the commands conf
+# and the parse tables are loaded once in the forkserver, the workers forked
+# from it start with them and share their memory pages (copy-on-write)
+
+def warm_up():
+    spl_validator.params["verbose"]=False
+    spl_validator.params["print_errs"]=False
+    spl_validator.init_analyser()
+    spl_validator.get_parser("lalr")
+
+warm_up()
@@ -0,0 +1,139 @@
+import re
+from functools import partial
+
+#---------------------------
+#       SCANNER
+#---------------------------
+
+# Alternative to the PLY lexer producing the same tokens (type, value, lexpos,
+# lineno). All the rules of a lexer state are compiled in a single regex, each
+# alternative being followed by an empty named group giving the matched rule
+# (lastgroup). As the alternatives do not start with a group, the regex engine
+# can skip the ones which cannot start with the current character. The command
+# names and reserved words are found with a dict lookup, the other tokens
+# needing a post-processing go through a dispatch table.
+# It can be given to yacc.parse as lexer (input(), token(), lexdata, lexpos and
+# lineno are the only attributes used by the parser and the grammar rules).
+
+FLOAT_VALUE = re.compile(r'^\d+\.\d+$')
+
+# Same attributes as ply.lex.LexToken (set by the scanner, without __init__ call)
+class Token(object):
+    __slots__ = ("type","value","lineno","lexpos","endlexpos","lexer")
+
+    def __str__(self):
+        return 'LexToken(%s,%r,%d,%d)' % (self.type, self.value, self.lineno, self.lexpos)
+
+    def __repr__(self):
+        return str(self)
+
+class Scanner(object):
+    # rules: lexer state -> list of (token type, regex), in the order PLY tries them
+    # ignore: characters ignored between the tokens
+    # keywords: lowercase word -> token type, for the command names and reserved words
+    # error: function(pos,char) called for the illegal characters
+    def __init__(self,rules,ignore,keywords,error):
+        self.masters = {}
+        for state in rules:
+            regex = "|".join("(?:{})(?P<{}>)".format(r,name) for name,r in rules[state])
+            self.masters[state] = re.compile(regex,re.VERBOSE).match
+        self.ignore = ignore
+        self.skip_ignored = re.compile("[{}]*".format(re.escape(ignore))).match
+        self.keywords = keywords
+        self.error = error
+        # Whether the macro calls are returned as MACRO tokens or ignored
+        self.macro_tokens = False
+        self.dispatch = {
+            "STRING": string_token,
+            "FLOAT": float_token,
+            "NUMBER": number_token
+        }
+        self.lineno = 1
+        self.input("")
+
+    def input(self,s):
+        self.lexdata = s
+        self.lexpos = 0
+        self.begin("INITIAL")
+        self.token = partial(next,self.tokens(s),None)
+
+    def begin(self,state):
+        self.state = state
+        self.match = self.masters[state]
+
+    def current_state(self):
+        return self.state
+
+    # Once a string of a kind of quote is not terminated, the next ones are not
+    # either (see the lexer states in spl_validator)
+    def quote_failed(self,state):
+        if self.state == "INITIAL":
+            self.begin(state)
+        elif self.state != state and self.state != "noquote":
+            self.begin("noquote")
+
+    def tokens(self,s):
+        end = len(s)
+        pos = 0
+        match = self.match
+        keywords = self.keywords
+        dispatch = self.dispatch
+        lineno = self.lineno
+        ignore = self.ignore
+        while pos < end:
+            if s[pos] in ignore:
+                pos = self.skip_ignored(s,pos).end()
+                continue
+            m = match(s,pos)
+            if m is None:
+                self.lexpos = pos
+                self.error(pos,s[pos])
+                if s[pos] == "'":
+                    self.quote_failed("nosquote")
+                    match = self.match
+                pos += 1
+                continue
+            tok = Token()
+            tok.type = ttype = m.lastgroup
+            tok.value = value = m.group()
+            tok.lineno = lineno
+            tok.lexpos = pos
+            tok.endlexpos = self.lexpos = pos = m.end()
+            if ttype == "NAME" or ttype == "TEXT":
+                # Command names and reserved words are lowercase
+                lower = value.lower()
+                kw = keywords.get(lower)
+                if not kw is None:
+                    tok.type = kw
+                    tok.value = value = lower
+                if value.isdigit():
+                    tok.type = "NUMBER"
+                if "." in value and FLOAT_VALUE.match(value):
+                    tok.type = "FLOAT"
+            elif ttype == "MACRO":
+                # Kept for the macro splicing (see spl_validator.spliced_tokens)
+                if not self.macro_tokens:
+                    continue
+            elif ttype == "QUOTE":
+                self.quote_failed("nodquote")
+                match = self.match
+            elif ttype in dispatch:
+                dispatch[ttype](tok)
+            yield tok
+            # The reader of the tokens can move the position past a token it
+            # extended (see spl_validator.long_tokens)
+            pos = self.lexpos
+        self.lexpos = pos + 1
+
+def string_token(tok):
+    tok.value = tok.value[1:-1]
+    if tok.value == "(":
+        tok.type = "QLPAREN"
+    elif tok.value == ")":
+        tok.type = "QRPAREN"
+
+def float_token(tok):
+    tok.value = float(tok.value)
+
+def number_token(tok):
+    tok.value = int(tok.value)
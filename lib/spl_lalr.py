@@ -0,0 +1,194 @@
+# spl_lalr.py
+# This file is automatically generated by lrgen.py. Do not edit.
+from .lrgen import unpack, Symbol, Production
+from .ply.yacc import call_errorfunc
+
+signature = 'leftEQNEQCOMP_OPDEQleftPLUSMINUSleftTIMESDIVIDErightAND_OPIMPL_ANDleftOR_OPrightUMINUSNOT_OPAND_OP AS_CLAUSE BOTTOM_OP BY_CLAUSE CASE_OP CMD_ABSTRACT CMD_ACCUM CMD_ADDCOLTOTALS CMD_ADDINFO CMD_ADDTOTALS CMD_ANALYSEFIELDS CMD_ANOMALIES CMD_ANOMALOUSVALUE CMD_ANOMALYDETECTION CMD_APPEND CMD_APPENDCOLS CMD_APPENDPIPE CMD_ARULES CMD_ASSOCIATE CMD_AUDIT CMD_AUTOREGRESS CMD_BIN CMD_BUCKETDIR CMD_CEFOUT CMD_CHART CMD_CLUSTER CMD_COFILTER CMD_COLLECT CMD_CONCURRENCY CMD_CONTINGENCY CMD_CONVERT CMD_CORRELATE CMD_CUSTOM CMD_DATAMODEL CMD_DBINSPECT CMD_DEDUP CMD_DELETE CMD_DELTA CMD_DIFF CMD_EREX CMD_EVAL CMD_EVENTCOUNT CMD_EVENTSTATS CMD_EXPAND CMD_EXTRACT CMD_FIELDFORMAT CMD_FIELDS CMD_FIELDSUMMARY CMD_FILLDOWN CMD_FILLNULL CMD_FINDTYPES CMD_FLATTEN CMD_FOLDERIZE CMD_FOREACH CMD_FORMAT CMD_FROM CMD_GAUGE CMD_GENTIMES CMD_GEOM CMD_GEOMFILTER CMD_GEOSTATS CMD_HEAD CMD_HIGHLIGHT CMD_HISTORY CMD_ICONIFY CMD_INPUTCSV CMD_INPUTLOOKUP CMD_IPLOCATION CMD_JOIN CMD_KMEANS CMD_KVFORM CMD_LOADJOB CMD_LOCALIZE CMD_LOCALOP CMD_LOOKUP CMD_MAKECONTINUOUS CMD_MAKEMV CMD_MAKERESULTS CMD_MAP CMD_MCOLLECT CMD_METADATA CMD_METASEARCH CMD_MEVENTCOLLECT CMD_MPREVIEW CMD_MSTATS CMD_MULTIKV CMD_MULTISEARCH CMD_MVCOMBINE CMD_MVEXPAND CMD_NOMV CMD_OUTLIER CMD_OUTPUTCSV CMD_OUTPUTLOOKUP CMD_OUTPUTTEXT CMD_PIVOT CMD_PREDICT CMD_RANGEMAP CMD_RARE CMD_REDISTRIBUTE CMD_REGEX CMD_RELEVANCY CMD_RELTIME CMD_RENAME CMD_REPLACE CMD_REQUIRE CMD_REST CMD_RETURN CMD_REVERSE CMD_REX CMD_RTORDER CMD_SAVEDSEARCH CMD_SCRIPT CMD_SCRUB CMD_SEARCH CMD_SEARCHTXN CMD_SELFJOIN CMD_SENDEMAIL CMD_SET CMD_SETFIELDS CMD_SICHART CMD_SISTATS CMD_SITIMECHART CMD_SITOP CMD_SORT CMD_SPATH CMD_STATS CMD_STRCAT CMD_STREAMSTATS CMD_TABLE CMD_TAGS CMD_TAIL CMD_TIMECHART CMD_TIMEWRAP CMD_TOP CMD_TRANSACTION CMD_TRANSPOSE CMD_TRENDLINE CMD_TSCOLLECT CMD_TSTATS CMD_TYPEAHEAD CMD_TYPELEARNER CMD_TYPER CMD_UNION CMD_UNIQ CMD_UNTABLE CMD_WALKLEX CMD_WHERE CMD_X11 CMD_XMLKV CMD_XMLUNESCAPE CMD_XPATH CMD_XYSERIES COLON COLSUMMARY_OP COMMA COMP_OP DATE DEQ DIVIDE DOT EQ FALSELABEL_OP FILTER_OP FLOAT GROUPBY_CLAUSE IN_OP LBRACK LIMIT_OP LPAREN MACRO MINUS MOD NAME NEQ NOTCHAR NOTIN_OP NOT_OP NUMBER NUMCOLS_OP OR_OP OUTPUT_NEW_OP OUTPUT_OP OVER_OP PATTERN PERIOD_OP PIPE PLUS PREFIX_OP QLPAREN QRPAREN QUOTE RANGE_OP RBRACK ROWSUMMARY_OP RPAREN SHOWOTHER_OP SORTBY_CLAUSE SPLITCOL_OP SPLITROW_OP STRING TERM_OP TEXT TIMES TIMESPECIFIER TRUELABEL_OP WITH_OPmainsearch : search_expsearch_exp : filters\n              | filters PIPE commands\n              | PIPE commandssubsearch : LBRACK new_scope commands RBRACK\n                 | LBRACK new_scope PIPE commands RBRACKsubsearches : subsearches subsearch\n                   | subsearchnew_scope :subpipeline : LBRACK commands RBRACK\n                   | LBRACK PIPE commands RBRACKfilters : filters OR_OP filters_logic_term\n               | filters filters_logic_term %prec IMPL_AND\n               | filters_logic_termfilters_logic_term : filters_logic_term AND_OP filters_logic_factor\n                          | filters_logic_term COMMA filters_logic_factor\n                          | filters_logic_term filters_logic_factor %prec IMPL_AND\n                          | filters_logic_factorfilters_logic_factor : filter\n                            | filter filters_logic_factor %prec IMPL_AND\n                            | filter COMMA filters_logic_factor\n                            | filter AND_OP filters_logic_factor\n                            | NOT_OP filters_logic_factor\n                            | LPAREN filters RPARENfilter : field_name_logic EQ value\n              | field_name_logic EQ value_opfilter : field_name_logic NEQ value\n              | field_name_logic NEQ value_opfilter : subsearchfilter : field_name_logic COMP_OP NUMBER\n              | field_name_logic COMP_OP FLOAT\n              | field_name_logic COMP_OP subsearchfilter : NUMBER COMP_OP field_name_logic\n              | FLOAT COMP_OP field_name_logic\n              | subsearch COMP_OP field_name_logicfilter : field_name_logic IN_OP LPAREN values_list RPARENfilter : CASE_OP LPAREN value RPAREN\n              | TERM_OP LPAREN value RPARENfilter : field_name_logic EQ TIMES\n              | TIMESfilter : field_name_logic NEQ TIMESfilter : valuefilter : filter NAME errorexpression : expression OR_OP expression_logic_term\n                  | expression_logic_termexpression_logic_term : expression_logic_term AND_OP expression_logic_factor\n                             | expression_logic_term expression_logic_factor\n                             | expression_logic_factorexpression_logic_factor : expression_value\n                               | NOT_OP expression_logic_factor\n                               | LPAREN expression RPAREN\n                               | QLPAREN expression_logic_factor QRPARENexpression_logic_factor : expression_value IN_OP LPAREN values_list RPARENexpression_value : expr_fun_call\n                        | value\n                        | commands_names\n                        | op_names\n                        | expression_value PATTERN\n                        | PATTERN expression_valueexpression_logic_factor : expression_logic_factor PLUS expression_logic_factor\n                               | expression_logic_factor MINUS expression_logic_factor\n                               | expression_logic_factor TIMES expression_logic_factor\n                               | expression_logic_factor DIVIDE expression_logic_factor\n                               | expression_logic_factor DEQ expression_logic_factor\n                               | expression_logic_factor EQ expression_logic_factor\n                               | expression_logic_factor NEQ expression_logic_factor\n                               | expression_logic_factor COMP_OP expression_logic_factor\n                               | expression_logic_factor MOD expression_logic_factor\n                               | expression_logic_factor DOT expression_logic_factorexpr_fun_call : NAME LPAREN expression_fun_args RPAREN\n                     | NAME LPAREN RPAREN\n                     | commands_names LPAREN expression_fun_args RPAREN\n                     | commands_names LPAREN RPAREN\n                     | op_names LPAREN expression_fun_args RPAREN\n                     | op_names LPAREN RPAREN\n                     | NOTCHAR NAME LPAREN expression_fun_args RPAREN\n                     | NOTCHAR NAME LPAREN RPAREN\n                     | NOTCHAR commands_names LPAREN expression_fun_args RPAREN\n                     | NOTCHAR commands_names LPAREN RPAREN\n                     | NOTCHAR op_names LPAREN expression_fun_args RPAREN\n                     | NOTCHAR op_names LPAREN RPARENexpression_fun_args : expression_fun_args COMMA expression \n                           | expressioncommands : commands PIPE command\n                | commandcommands : commands PIPE error\n                | commands PIPE commands_names errorcommands_names : CMD_ABSTRACT\n                      | CMD_ACCUM\n                      | CMD_ADDCOLTOTALS\n                      | CMD_ADDINFO\n                      | CMD_ADDTOTALS\n                      | CMD_ANALYSEFIELDS\n                      | CMD_ANOMALIES\n                      | CMD_ANOMALOUSVALUE\n                      | CMD_ANOMALYDETECTION\n                      | CMD_APPEND\n                      | CMD_APPENDCOLS\n                      | CMD_APPENDPIPE\n                      | CMD_ARULES\n                      | CMD_AUDIT\n                      | CMD_AUTOREGRESS\n                      | CMD_BIN\n                      | CMD_BUCKETDIR\n                      | CMD_CEFOUT\n                      | CMD_CHART\n                      | CMD_CLUSTER\n                      | CMD_COFILTER\n                      | CMD_COLLECT\n                      | CMD_CONCURRENCY\n                      | CMD_CONTINGENCY\n                      | CMD_CONVERT\n                      | CMD_CORRELATE\n                      | CMD_DATAMODEL\n                      | CMD_DBINSPECT\n                      | CMD_DEDUP\n                      | CMD_DELETE\n                      | CMD_DELTA\n                      | CMD_DIFF\n                      | CMD_EREX\n                      | CMD_EVAL\n                      | CMD_EVENTCOUNT\n                      | CMD_EVENTSTATS\n                      | CMD_EXPAND\n                      | CMD_EXTRACT\n                      | CMD_FIELDFORMAT\n                      | CMD_FIELDS\n                      | CMD_FIELDSUMMARY\n                      | CMD_FILLDOWN\n                      | CMD_FILLNULL\n                      | CMD_FINDTYPES\n                      | CMD_FLATTEN\n                      | CMD_FOLDERIZE\n                      | CMD_FOREACH\n                      | CMD_FORMAT\n                      | CMD_FROM\n                      | CMD_GAUGE\n                      | CMD_GENTIMES\n                      | CMD_GEOM\n                      | CMD_GEOMFILTER\n                      | CMD_GEOSTATS\n                      | CMD_HEAD\n                      | CMD_HIGHLIGHT\n                      | CMD_HISTORY\n                      | CMD_ICONIFY\n                      | CMD_INPUTCSV\n                      | CMD_INPUTLOOKUP\n                      | CMD_IPLOCATION\n                      | CMD_JOIN\n                      | CMD_KMEANS\n                      | CMD_KVFORM\n                      | CMD_LOADJOB\n                      | CMD_LOCALIZE\n                      | CMD_LOCALOP\n                      | CMD_LOOKUP\n                      | CMD_MAKECONTINUOUS\n                      | CMD_MAKEMV\n                      | CMD_MAKERESULTS\n                      | CMD_MAP\n                      | CMD_MCOLLECT\n                      | CMD_METADATA\n                      | CMD_METASEARCH\n                      | CMD_MEVENTCOLLECT\n                      | CMD_MPREVIEW\n                      | CMD_MSTATS\n                      | CMD_MULTIKV\n                      | CMD_MULTISEARCH\n                      | CMD_MVCOMBINE\n                      | CMD_MVEXPAND\n                      | CMD_NOMV\n                      | CMD_OUTLIER\n                      | CMD_OUTPUTCSV\n                      | CMD_OUTPUTLOOKUP\n                      | CMD_OUTPUTTEXT\n                      | CMD_PIVOT\n                      | CMD_PREDICT\n                      | CMD_RANGEMAP\n                      | CMD_RARE\n                      | CMD_REDISTRIBUTE\n                      | CMD_REGEX\n                      | CMD_RELEVANCY\n                      | CMD_RELTIME\n                      | CMD_RENAME\n                      | CMD_REPLACE\n                      | CMD_REQUIRE\n                      | CMD_REST\n                      | CMD_RETURN\n                      | CMD_REVERSE\n                      | CMD_REX\n                      | CMD_RTORDER\n                      | CMD_SAVEDSEARCH\n                      | CMD_SCRIPT\n                      | CMD_SCRUB\n                      | CMD_SEARCH\n                      | CMD_SEARCHTXN\n                      | CMD_SELFJOIN\n                      | CMD_SENDEMAIL\n                      | CMD_SET\n                      | CMD_SETFIELDS\n                      | CMD_SICHART\n                      | CMD_SISTATS\n                      | CMD_SITIMECHART\n                      | CMD_SITOP\n                      | CMD_SORT\n                      | CMD_SPATH\n                      | CMD_STATS\n                      | CMD_STRCAT\n                      | CMD_STREAMSTATS\n                      | CMD_TABLE\n                      | CMD_TAGS\n                      | CMD_TAIL\n                      | CMD_TIMECHART\n                      | CMD_TIMEWRAP\n                      | CMD_TOP\n                      | CMD_TRANSACTION\n                      | CMD_TRANSPOSE\n                      | CMD_TRENDLINE\n                      | CMD_TSCOLLECT\n                      | CMD_TSTATS\n                      | CMD_TYPEAHEAD\n                      | CMD_TYPELEARNER\n                      | CMD_TYPER\n                      | CMD_UNION\n                      | CMD_UNIQ\n                      | CMD_UNTABLE\n                      | CMD_WALKLEX\n                      | CMD_X11\n                      | CMD_XMLKV\n                      | CMD_XMLUNESCAPE\n                      | CMD_XPATH\n                      | CMD_XYSERIES\n                      | CMD_CUSTOM\n                      op_names : SORTBY_CLAUSE\n                | OUTPUT_OP\n                | OUTPUT_NEW_OP\n                | CASE_OP\n                | TERM_OP\n                | PREFIX_OP\n                | OVER_OP\n                | BOTTOM_OP\n                | SPLITROW_OP\n                | SPLITCOL_OP\n                | FILTER_OP\n                | LIMIT_OP\n                | ROWSUMMARY_OP\n                | COLSUMMARY_OP\n                | SHOWOTHER_OP\n                | NUMCOLS_OP\n                | RANGE_OP\n                | PERIOD_OP\n                | TRUELABEL_OP\n                | FALSELABEL_OP\n                command : CMD_SEARCH filterscommand : CMD_STATS args_list agg_terms_list BY_CLAUSE fields_list args_list\n               | CMD_STATS agg_terms_list BY_CLAUSE fields_list args_list\n               | CMD_STATS args_list agg_terms_list BY_CLAUSE fields_list\n               | CMD_STATS agg_terms_list BY_CLAUSE fields_list\n               | CMD_STATS args_list agg_terms_list args_list\n               | CMD_STATS agg_terms_list args_list\n               | CMD_STATS args_list agg_terms_list \n               | CMD_STATS agg_terms_list\n               | CMD_SISTATS args_list agg_terms_list BY_CLAUSE fields_list args_list\n               | CMD_SISTATS agg_terms_list BY_CLAUSE fields_list args_list\n               | CMD_SISTATS args_list agg_terms_list BY_CLAUSE fields_list\n               | CMD_SISTATS agg_terms_list BY_CLAUSE fields_list\n               | CMD_SISTATS args_list agg_terms_list args_list\n               | CMD_SISTATS agg_terms_list args_list\n               | CMD_SISTATS args_list agg_terms_list \n               | CMD_SISTATS agg_terms_listcommand : CMD_EVAL eval_exprseval_exprs : eval_exprs COMMA eval_expr_assign\n                  | eval_expr_assigneval_expr_assign : field_name EQ expressioneval_expr_fun_value : CMD_EVAL LPAREN expression RPARENeval_expr_fun : eval_expr_fun_value AS_CLAUSE field_name\n                     | eval_expr_fun_valuecommand : CMD_FIELDS PLUS fields_list\n               | CMD_FIELDS fields_listcommand : CMD_FIELDS MINUS fields_listcommand : CMD_RENAME rfields_listcommand : CMD_DEDUP NUMBER args_list fields_list args_list SORTBY_CLAUSE sort_clause\n               | CMD_DEDUP NUMBER fields_list args_list SORTBY_CLAUSE sort_clause\n               | CMD_DEDUP NUMBER args_list fields_list SORTBY_CLAUSE sort_clause\n               | CMD_DEDUP args_list fields_list args_list SORTBY_CLAUSE sort_clause\n               | CMD_DEDUP fields_list args_list SORTBY_CLAUSE sort_clause\n               | CMD_DEDUP args_list fields_list SORTBY_CLAUSE sort_clause\n               | CMD_DEDUP NUMBER args_list fields_list args_list\n               | CMD_DEDUP NUMBER fields_list args_list\n               | CMD_DEDUP NUMBER args_list fields_list\n               | CMD_DEDUP args_list fields_list args_list\n               | CMD_DEDUP fields_list args_list\n               | CMD_DEDUP args_list fields_listcommand : CMD_DEDUP NUMBER fields_list SORTBY_CLAUSE sort_clause\n               | CMD_DEDUP fields_list SORTBY_CLAUSE sort_clause\n               | CMD_DEDUP NUMBER fields_list\n               | CMD_DEDUP fields_listcommand : CMD_ABSTRACT\n               | CMD_ADDCOLTOTALS\n               | CMD_ADDTOTALS\n               | CMD_ADDINFO\n               | CMD_ANOMALOUSVALUE\n               | CMD_ANOMALYDETECTION\n               | CMD_AUDIT\n               | CMD_FILLNULL\n               | CMD_REVERSE\n               | CMD_APPENDPIPE\n               | CMD_ASSOCIATE\n               | CMD_TRANSACTION\n               | CMD_CORRELATE\n               | CMD_DBINSPECT\n               | CMD_DELETE\n               | CMD_DIFF\n               | CMD_EVENTCOUNT\n               | CMD_FIELDSUMMARY\n               | CMD_FILLDOWN\n               | CMD_GEOMFILTER\n               | CMD_HISTORY\n               | CMD_LOCALIZE\n               | CMD_LOCALOP\n               | CMD_MAKERESULTS\n               | CMD_OUTLIER\n               | CMD_KMEANS\n               | CMD_MPREVIEW\n               | CMD_OUTPUTTEXT\n               | CMD_RELEVANCY\n               | CMD_RELTIME\n               | CMD_REQUIRE\n               | CMD_RTORDER\n               | CMD_SCRUB\n               | CMD_TAGS\n               | CMD_TSCOLLECT\n               | CMD_TYPER\n               | CMD_UNIQ\n               | CMD_XMLUNESCAPEcommand : CMD_EXPAND field_name\n               | CMD_FLATTEN field_name\n               | CMD_NOMV field_namecommand : CMD_ANALYSEFIELDS args_term\n               | CMD_APPENDPIPE args_term\n               | CMD_CEFOUT args_term\n               | CMD_HISTORY args_term\n               | CMD_OUTPUTTEXT args_term\n               | CMD_XMLUNESCAPE args_termcommand : CMD_ABSTRACT args_list\n               | CMD_BUCKETDIR args_list\n               | CMD_CLUSTER args_list\n               | CMD_COLLECT args_list\n               | CMD_CONCURRENCY args_list\n               | CMD_DBINSPECT args_list\n               | CMD_DIFF args_list\n               | CMD_EVENTCOUNT args_list\n               | CMD_FOLDERIZE args_list\n               | CMD_GENTIMES args_list\n               | CMD_GEOMFILTER args_list\n               | CMD_MAKERESULTS args_list\n               | CMD_KVFORM args_list\n               | CMD_LOCALIZE args_list\n               | CMD_METADATA args_list\n               | CMD_MPREVIEW args_list\n               | CMD_RTORDER args_list\n               | CMD_SENDEMAIL args_list\n               | CMD_SCRUB args_list\n               | CMD_TSCOLLECT args_list\n               | CMD_TYPEAHEAD args_list\n               | CMD_TYPER args_list\n               | CMD_WALKLEX args_listcommand : CMD_TABLE fields_list\n               | CMD_FILLDOWN fields_list\n               | CMD_HIGHLIGHT fields_list\n               | CMD_ICONIFY fields_listcommand : CMD_ADDCOLTOTALS command_params_fields_or_args\n               | CMD_ADDTOTALS command_params_fields_or_args\n               | CMD_FILLNULL command_params_fields_or_args\n               | CMD_ANOMALOUSVALUE command_params_fields_or_args\n               | CMD_ANOMALYDETECTION command_params_fields_or_args\n               | CMD_ARULES command_params_fields_or_args\n               | CMD_ASSOCIATE command_params_fields_or_args\n               | CMD_TRANSACTION command_params_fields_or_args\n               | CMD_FIELDSUMMARY command_params_fields_or_args\n               | CMD_OUTLIER command_params_fields_or_args\n               | CMD_KMEANS command_params_fields_or_args\n               | CMD_MCOLLECT command_params_fields_or_args\n               | CMD_MEVENTCOLLECT command_params_fields_or_args\n               | CMD_SCRIPT command_params_fields_or_args\n               | CMD_SELFJOIN command_params_fields_or_args\n               | CMD_TAGS command_params_fields_or_args\n               | CMD_XYSERIES command_params_fields_or_argscommand : CMD_CUSTOM command_params_fields_or_args\n               | CMD_CUSTOMcommand : CMD_WHERE expressioncommand : CMD_ACCUM field_name AS_CLAUSE field_name\n               | CMD_ACCUM field_namecommand : CMD_ANOMALIES args_list BY_CLAUSE fields_list\n               | CMD_ANOMALIES BY_CLAUSE fields_list\n               | CMD_ANOMALIES args_list\n               | CMD_ANOMALIEScommand : CMD_APPEND args_list subsearch\n               | CMD_APPENDCOLS args_list subsearch\n               | CMD_APPEND subsearch\n               | CMD_APPENDCOLS subsearchcommand : CMD_APPENDPIPE args_term subpipeline\n               | CMD_APPENDPIPE subpipelinecommand : CMD_AUTOREGRESS rfield_term NAME EQ NUMBER\n               | CMD_AUTOREGRESS field_name NAME EQ NUMBER\n               | CMD_AUTOREGRESS rfield_term NAME EQ NAME\n               | CMD_AUTOREGRESS field_name NAME EQ NAME\n               | CMD_AUTOREGRESS rfield_term\n               | CMD_AUTOREGRESS field_namecommand : CMD_BIN args_list rfield_term args_list\n               | CMD_BIN args_list field_name args_list\n               | CMD_BIN args_list field_name args_list AS_CLAUSE field_name args_list\n               | CMD_BIN field_name args_list AS_CLAUSE field_name args_list\n               | CMD_BIN args_list field_name args_list AS_CLAUSE field_name\n               | CMD_BIN field_name args_list AS_CLAUSE field_name\n               | CMD_BIN rfield_term args_list\n               | CMD_BIN field_name args_list\n               | CMD_BIN args_list rfield_term\n               | CMD_BIN args_list field_name\n               | CMD_BIN rfield_term\n               | CMD_BIN field_namecommand : CMD_CHART command_chart_1 command_chart_2\n               | CMD_SICHART command_chart_1 command_chart_2command_chart_1 : args_list agg_or_eval_list\n                       | agg_or_eval_listcommand_chart_2 : command_chart_by_1\n                       | command_chart_by_2\n                       | command_chart_over\n                       | command_chart_over command_chart_by_1\n                       | command_chart_by_1 args_term\n                       | command_chart_by_2 args_term\n                       | command_chart_over args_term\n                       | command_chart_over command_chart_by_1 args_termcommand_chart_by_2 : BY_CLAUSE field_name args_list field_name args_list chart_where_clause\n                          | BY_CLAUSE field_name args_list field_name args_list\n                          | BY_CLAUSE field_name field_name args_list chart_where_clause\n                          | BY_CLAUSE field_name field_name args_list\n                          | BY_CLAUSE field_name args_list field_name chart_where_clause\n                          | BY_CLAUSE field_name args_list field_name\n                          | BY_CLAUSE field_name field_name chart_where_clause\n                          | BY_CLAUSE field_name field_namecommand_chart_by_1 : BY_CLAUSE field_name args_list chart_where_clause\n                          | BY_CLAUSE field_name args_list\n                          | BY_CLAUSE field_name chart_where_clause\n                          | BY_CLAUSE field_namecommand_chart_over : OVER_OP field_name args_list\n                          | OVER_OP field_namechart_where_clause : agg_term IN_OP CMD_TOP NUMBER\n                          | agg_term IN_OP BOTTOM_OP NUMBER\n                          | agg_term NOTIN_OP CMD_TOP NUMBER\n                          | agg_term NOTIN_OP BOTTOM_OP NUMBER\n                          | agg_term COMP_OP NUMBER\n                          | agg_term COMP_OP FLOATcommand : CMD_COFILTER field_name field_namecommand : CMD_CONTINGENCY args_list field_name fields_list args_list\n               | CMD_CONTINGENCY args_list field_name fields_list\n               | CMD_CONTINGENCY field_name fields_list args_list\n               | CMD_CONTINGENCY field_name field_namecommand : CMD_CONVERT args_term convert_list\n               | CMD_CONVERT convert_list args_term\n               | CMD_CONVERT convert_listconvert_list : convert_list COMMA convert_fun\n                    | convert_list convert_fun\n                    | convert_funconvert_fun : NAME LPAREN field_name RPAREN\n                   | NAME LPAREN field_name RPAREN AS_CLAUSE field_name\n                   | NAME LPAREN TIMES RPAREN\n                   | NAME LPAREN TIMES RPAREN AS_CLAUSE field_namecommand : CMD_DATAMODEL field_name field_name args_list field_name args_list\n               | CMD_DATAMODEL field_name field_name field_name args_list\n               | CMD_DATAMODEL field_name field_name args_list field_name \n               | CMD_DATAMODEL field_name args_list field_name args_list\n               | CMD_DATAMODEL field_name field_name args_list\n               | CMD_DATAMODEL field_name args_list field_name \n               | CMD_DATAMODEL field_name args_list\n               | CMD_DATAMODEL args_list\n               | CMD_DATAMODEL field_name field_name field_name\n               | CMD_DATAMODEL field_name field_name\n               | CMD_DATAMODEL field_name\n               | CMD_DATAMODELcommand : CMD_DELTA args_term field_name AS_CLAUSE field_name\n               | CMD_DELTA field_name AS_CLAUSE field_name args_term\n               | CMD_DELTA field_name AS_CLAUSE field_name\n               | CMD_DELTA args_term field_name\n               | CMD_DELTA field_name args_term\n               | CMD_DELTA field_namecommand : CMD_EREX args_list field_name args_list\n               | CMD_EREX args_list field_name\n               | CMD_EREX field_name args_list\n               | CMD_EREX args_listcommand : CMD_EVENTSTATS args_term agg_terms_list BY_CLAUSE fields_list\n               | CMD_EVENTSTATS agg_terms_list BY_CLAUSE fields_list args_term\n               | CMD_EVENTSTATS agg_terms_list args_term BY_CLAUSE fields_list\n               | CMD_EVENTSTATS agg_terms_list BY_CLAUSE fields_list\n               | CMD_EVENTSTATS args_term agg_terms_list\n               | CMD_EVENTSTATS agg_terms_list args_term\n               | CMD_EVENTSTATS agg_terms_list\n               command : CMD_EXTRACT args_list value args_list\n               | CMD_EXTRACT value args_list\n               | CMD_EXTRACT args_list value\n               | CMD_EXTRACT args_list\n               | CMD_EXTRACT value\n               | CMD_EXTRACTcommand : CMD_FIELDFORMAT field_name EQ expression_logic_factorcommand : CMD_FINDTYPES args_term field_name field_name\n               | CMD_FINDTYPES args_term field_name\n               | CMD_FINDTYPES args_term\n               | CMD_FINDTYPEScommand : CMD_FOREACH args_list fields_list args_list subsearch_foreach\n               | CMD_FOREACH fields_list args_list subsearch_foreach\n               | CMD_FOREACH args_list fields_list subsearch_foreach\n               | CMD_FOREACH fields_list subsearch_foreach\n               | CMD_FOREACH args_list TIMES args_list subsearch_foreach\n               | CMD_FOREACH TIMES args_list subsearch_foreach\n               | CMD_FOREACH args_list TIMES subsearch_foreach\n               | CMD_FOREACH TIMES subsearch_foreachsubsearch_foreach : LBRACK CMD_EVAL eval_expr_assign RBRACKcommand : CMD_FORMAT args_list STRING STRING STRING STRING STRING STRING args_list\n               | CMD_FORMAT STRING STRING STRING STRING STRING STRING args_list\n               | CMD_FORMAT args_list STRING STRING STRING STRING STRING STRING\n               | CMD_FORMAT STRING STRING STRING STRING STRING STRING\n               | CMD_FORMAT args_list\n               | CMD_FORMATcommand : CMD_FROM field_name COLON field_name\n               | CMD_FROM field_name STRING DOT STRING\n               | CMD_FROM field_name field_name\n               | CMD_FROM field_namecommand : CMD_GAUGE field_or_num_listcommand : CMD_GEOM args_list field_name args_list\n               | CMD_GEOM args_list field_name\n               | CMD_GEOM field_name args_list\n               | CMD_GEOM field_name\n               | CMD_GEOMcommand : CMD_GEOSTATS args_list agg_terms_list BY_CLAUSE field_name args_list\n               | CMD_GEOSTATS args_list agg_terms_list BY_CLAUSE field_name\n               | CMD_GEOSTATS agg_terms_list BY_CLAUSE field_name args_list\n               | CMD_GEOSTATS args_list agg_terms_list args_list\n               | CMD_GEOSTATS args_list agg_terms_list\n               | CMD_GEOSTATS agg_terms_list args_list\n               | CMD_GEOSTATS agg_terms_listcommand : CMD_HEAD args_list expression args_list\n               | CMD_HEAD expression args_list\n               | CMD_HEAD args_list expression\n               | CMD_HEAD expression\n               | CMD_HEADcommand : CMD_INPUTLOOKUP args_list field_name CMD_WHERE expression\n               | CMD_INPUTLOOKUP field_name CMD_WHERE expression\n               | CMD_INPUTLOOKUP args_list field_name\n               | CMD_INPUTLOOKUP field_name\n               | CMD_INPUTCSV args_list field_name CMD_WHERE expression\n               | CMD_INPUTCSV field_name CMD_WHERE expression\n               | CMD_INPUTCSV args_list field_name\n               | CMD_INPUTCSV field_namecommand : CMD_IPLOCATION args_list field_name args_list\n               | CMD_IPLOCATION field_name args_list\n               | CMD_IPLOCATION args_list field_name\n               | CMD_IPLOCATION field_name\n               | CMD_IPLOCATIONcommand : CMD_JOIN args_list fields_list args_list subsearch args_list\n               | CMD_JOIN args_list fields_list args_list subsearch\n               | CMD_JOIN fields_list args_list subsearch args_list\n               | CMD_JOIN args_list fields_list subsearch args_list\n               | CMD_JOIN args_list fields_list subsearch\n               | CMD_JOIN fields_list args_list subsearch\n               | CMD_JOIN fields_list subsearch\n               | CMD_JOIN args_list subsearch args_list\n               | CMD_JOIN args_list subsearch\n               | CMD_JOIN subsearch args_list\n               | CMD_JOIN subsearchcommand : CMD_LOADJOB value args_list\n               | CMD_LOADJOB args_list\n               | CMD_LOADJOB valuecommand : CMD_LOOKUP field_name any_fields_list OUTPUT_OP any_fields_list\n               | CMD_LOOKUP field_name any_fields_list OUTPUT_NEW_OP any_fields_list\n               | CMD_LOOKUP field_name any_fields_list\n               | CMD_LOOKUP field_namecommand : CMD_LOOKUP args_list field_name any_fields_list OUTPUT_OP any_fields_list\n               | CMD_LOOKUP args_list field_name any_fields_list OUTPUT_NEW_OP any_fields_list\n               | CMD_LOOKUP args_list field_name any_fields_list\n               | CMD_LOOKUP args_list field_namecommand : CMD_MAKECONTINUOUS args_list field_name args_list\n               | CMD_MAKECONTINUOUS field_name args_list\n               | CMD_MAKECONTINUOUS args_list field_name\n               | CMD_MAKECONTINUOUS args_listcommand : CMD_MAKEMV args_list field_name args_list\n               | CMD_MAKEMV args_list field_name\n               | CMD_MAKEMV field_name args_list\n               | CMD_MAKEMV field_namecommand : CMD_MAP args_list value\n               | CMD_MAP value args_list\n               | CMD_MAP value\n               | CMD_MAP args_listcommand : CMD_METASEARCH filters\n               | CMD_METASEARCHcommand : CMD_MSTATS mstats_1 mstats_2\n               | CMD_MSTATS mstats_1mstats_1 : args_list agg_terms_list args_list\n                | args_list agg_terms_list\n                | agg_terms_list args_list\n                | agg_terms_listmstats_2 : mstats_2_where mstats_2_by\n                | mstats_2_where\n                | mstats_2_bymstats_2_where : CMD_WHERE filters args_list mstats_2_by\n                      | CMD_WHERE filters mstats_2_by\n                      | CMD_WHERE filters args_list\n                      | CMD_WHERE filtersmstats_2_by : BY_CLAUSE fields_list args_list\n                   | GROUPBY_CLAUSE fields_list args_list\n                   | BY_CLAUSE fields_list\n                   | GROUPBY_CLAUSE fields_listcommand : CMD_MULTIKV args_list CMD_FIELDS fields_list args_list FILTER_OP values_list args_list\n               | CMD_MULTIKV args_list CMD_FIELDS fields_list args_list FILTER_OP values_list\n               | CMD_MULTIKV args_list CMD_FIELDS fields_list FILTER_OP values_list args_list\n               | CMD_MULTIKV CMD_FIELDS fields_list args_list NAME values_list args_list\n               | CMD_MULTIKV CMD_FIELDS fields_list FILTER_OP values_list args_list\n               | CMD_MULTIKV args_list CMD_FIELDS fields_list FILTER_OP values_list\n               | CMD_MULTIKV CMD_FIELDS fields_list args_list FILTER_OP values_list\n               | CMD_MULTIKV CMD_FIELDS fields_list FILTER_OP values_list\n               | CMD_MULTIKV args_list CMD_FIELDS fields_list args_list\n               | CMD_MULTIKV args_list CMD_FIELDS fields_list\n               | CMD_MULTIKV CMD_FIELDS fields_list args_list\n               | CMD_MULTIKV CMD_FIELDS fields_list\n               | CMD_MULTIKV args_list FILTER_OP values_list args_list\n               | CMD_MULTIKV FILTER_OP values_list args_list\n               | CMD_MULTIKV args_list FILTER_OP values_list\n               | CMD_MULTIKV FILTER_OP values_list\n               | CMD_MULTIKV args_listcommand : CMD_MULTISEARCH subsearchescommand : CMD_MVCOMBINE args_term field_name\n               | CMD_MVCOMBINE field_name args_term\n               | CMD_MVCOMBINE field_name\n               | CMD_MVEXPAND args_term field_name\n               | CMD_MVEXPAND field_name args_term\n               | CMD_MVEXPAND field_namecommand : CMD_OUTPUTLOOKUP args_list field_name args_list\n               | CMD_OUTPUTLOOKUP args_list field_name\n               | CMD_OUTPUTLOOKUP field_name args_list\n               | CMD_OUTPUTLOOKUP field_name\n               | CMD_OUTPUTCSV args_list field_name args_list\n               | CMD_OUTPUTCSV args_list field_name\n               | CMD_OUTPUTCSV field_name args_list\n               | CMD_OUTPUTCSV field_namecommand : CMD_PIVOT field_name field_name pivot_elementpivot_element : pivot_cell_value pivot_split pivot_element_2\n                     | pivot_cell_value COMMA pivot_split COMMA pivot_element_2\n                     | pivot_cell_value pivot_split\n                     | pivot_cell_value COMMA pivot_split\n                     | pivot_cell_valuepivot_cell_value : NAME LPAREN field_name RPAREN AS_CLAUSE field_name\n                        | NAME LPAREN field_name RPARENpivot_split : pivot_splitcol COMMA pivot_split\n                   | pivot_splitrow COMMA pivot_split\n                   | pivot_splitcol pivot_split\n                   | pivot_splitrow pivot_split\n                   | pivot_splitcol\n                   | pivot_splitrowpivot_splitcol : SPLITCOL_OP field_name RANGE_OP basic_args_list\n                      | SPLITCOL_OP field_name PERIOD_OP NAME\n                      | SPLITCOL_OP field_name TRUELABEL_OP field_name FALSELABEL_OP field_name\n                      | SPLITCOL_OP field_name TRUELABEL_OP field_name\n                      | SPLITCOL_OP field_name FALSELABEL_OP field_name\n                      | SPLITCOL_OP field_namepivot_splitrow : SPLITROW_OP field_name RANGE_OP basic_args_list\n                      | SPLITROW_OP field_name PERIOD_OP NAME\n                      | SPLITROW_OP field_name TRUELABEL_OP field_name FALSELABEL_OP field_name\n                      | SPLITROW_OP field_name TRUELABEL_OP field_name\n                      | SPLITROW_OP field_name FALSELABEL_OP field_name\n                      | SPLITROW_OP field_name\n                      | SPLITROW_OP field_name AS_CLAUSE field_name RANGE_OP args_list\n                      | SPLITROW_OP field_name AS_CLAUSE field_name PERIOD_OP NAME\n                      | SPLITROW_OP field_name AS_CLAUSE field_name TRUELABEL_OP field_name FALSELABEL_OP field_name\n                      | SPLITROW_OP field_name AS_CLAUSE field_name TRUELABEL_OP field_name\n                      | SPLITROW_OP field_name AS_CLAUSE field_name FALSELABEL_OP field_name\n                      | SPLITROW_OP field_name AS_CLAUSE field_namepivot_element_2 : pivot_element_term pivot_element_2\n                       | pivot_element_termpivot_element_term : FILTER_OP field_name COMP_OP value\n                          | FILTER_OP field_name IN_OP value\n                          | FILTER_OP field_name NAME value\n                          | LIMIT_OP field_name BY_CLAUSE CMD_TOP NUMBER NAME LPAREN field_name RPAREN\n                          | LIMIT_OP field_name BY_CLAUSE BOTTOM_OP NUMBER NAME LPAREN field_name RPAREN\n                          | ROWSUMMARY_OP NAME\n                          | COLSUMMARY_OP NAME\n                          | SHOWOTHER_OP NAME\n                          | CMD_SORT NUMBER sort_clause\n                          | CMD_SORT sort_clause\n                          | CMD_SORT NUMBER sort_clause NAME\n                          | CMD_SORT sort_clause NAME command : CMD_PREDICT predict_listpredict_list : predict_list field_name args_list\n                    | predict_list rfield_term args_list\n                    | predict_list fields_list\n                    | predict_list rfields_list\n                    | fields_list args_list\n                    | rfields_list args_list\n                    | fields_list\n                    | rfields_listcommand : CMD_RANGEMAP args_listcommand : CMD_RARE args_list fields_list BY_CLAUSE fields_list args_list\n               | CMD_RARE args_list fields_list BY_CLAUSE fields_list\n               | CMD_RARE fields_list BY_CLAUSE fields_list args_list\n               | CMD_RARE fields_list BY_CLAUSE fields_list\n               | CMD_RARE args_list fields_list args_list\n               | CMD_RARE args_list fields_list\n               | CMD_RARE fields_list args_list\n               | CMD_RARE fields_listcommand : CMD_REDISTRIBUTE args_term BY_CLAUSE fields_list\n               | CMD_REDISTRIBUTE BY_CLAUSE fields_list args_term\n               | CMD_REDISTRIBUTE BY_CLAUSE fields_list\n               | CMD_REDISTRIBUTE args_term\n               | CMD_REDISTRIBUTEcommand : CMD_REGEX field_name EQ STRING\n               | CMD_REGEX field_name NEQ STRING\n               | CMD_REGEX STRINGcommand : CMD_REPLACE replace_list IN_OP fields_list\n               | CMD_REPLACE replace_listreplace_list : replace_list value WITH_OP value\n                    | replace_list COMMA value WITH_OP value\n                    | value WITH_OP valuecommand : CMD_REST args_list value args_list\n               | CMD_REST args_list value\n               | CMD_REST value args_list\n               | CMD_REST valuecommand : CMD_RETURN NUMBER args_list fields_list args_list\n               | CMD_RETURN NUMBER args_list fields_list\n               | CMD_RETURN NUMBER fields_list args_list\n               | CMD_RETURN NUMBER fields_list\n               | CMD_RETURN NUMBER args_list\n               | CMD_RETURN args_list fields_list args_list\n               | CMD_RETURN args_list fields_list\n               | CMD_RETURN fields_list args_list\n               | CMD_RETURN fields_list\n               | CMD_RETURN args_list\n               | CMD_RETURNcommand : CMD_REX args_list STRING args_list\n               | CMD_REX args_list STRING\n               | CMD_REX STRING args_list\n               | CMD_REX STRINGcommand : CMD_SAVEDSEARCH args_list field_name args_list\n               | CMD_SAVEDSEARCH args_list field_name\n               | CMD_SAVEDSEARCH field_name args_list\n               | CMD_SAVEDSEARCH field_namecommand : CMD_SEARCHTXN field_name filterscommand : CMD_SET NAME subsearch subsearch\n               | CMD_SET CMD_DIFF subsearch subsearch\n               | CMD_SET CMD_UNION subsearch subsearchcommand : CMD_SETFIELDS str_args_listcommand : CMD_SORT NUMBER sort_clause\n               | CMD_SORT sort_clause\n               | CMD_SORT NUMBER sort_clause NAME\n               | CMD_SORT sort_clause NAMEsort_clause : sort_clause COMMA sort_term\n                   | sort_termsort_term : PLUS field_name\n                 | MINUS field_name\n                 | field_namecommand : CMD_SPATH args_list field_name args_list\n               | CMD_SPATH args_list field_name\n               | CMD_SPATH field_name args_list\n               | CMD_SPATH field_name\n               | CMD_SPATH args_list\n               | CMD_SPATHcommand : CMD_STRCAT args_term strcat_fields\n               | CMD_STRCAT strcat_fields args_term\n               | CMD_STRCAT strcat_fieldsstrcat_fields : strcat_fields field_name\n                     | field_namecommand : CMD_STREAMSTATS streamstats_args agg_terms_list streamstats_args BY_CLAUSE fields_list streamstats_args\n               | CMD_STREAMSTATS agg_terms_list streamstats_args BY_CLAUSE fields_list streamstats_args\n               | CMD_STREAMSTATS streamstats_args agg_terms_list BY_CLAUSE fields_list streamstats_args\n               | CMD_STREAMSTATS streamstats_args agg_terms_list streamstats_args BY_CLAUSE fields_list\n               | CMD_STREAMSTATS streamstats_args agg_terms_list BY_CLAUSE fields_list\n               | CMD_STREAMSTATS agg_terms_list BY_CLAUSE fields_list streamstats_args\n               | CMD_STREAMSTATS agg_terms_list BY_CLAUSE fields_list\n               | CMD_STREAMSTATS agg_terms_list streamstats_args BY_CLAUSE fields_list\n               | CMD_STREAMSTATS streamstats_args agg_terms_list streamstats_args\n               | CMD_STREAMSTATS agg_terms_list streamstats_args\n               | CMD_STREAMSTATS streamstats_args agg_terms_list\n               | CMD_STREAMSTATS agg_terms_liststreamstats_args : streamstats_args COMMA args_term\n                        | streamstats_args args_term\n                        | args_termcommand : CMD_TAIL NUMBER\n               | CMD_TAILcommand : CMD_TIMECHART args_list agg_or_eval_list BY_CLAUSE field_name args_list CMD_WHERE chart_where_clause args_list\n               | CMD_TIMECHART args_list agg_or_eval_list BY_CLAUSE field_name args_list CMD_WHERE chart_where_clause\n               | CMD_TIMECHART args_list agg_or_eval_list BY_CLAUSE field_name args_list\n               | CMD_TIMECHART args_list agg_or_eval_list BY_CLAUSE field_name\n               | CMD_TIMECHART agg_or_eval_list BY_CLAUSE field_name args_list CMD_WHERE chart_where_clause args_list\n               | CMD_TIMECHART agg_or_eval_list BY_CLAUSE field_name args_list CMD_WHERE chart_where_clause\n               | CMD_TIMECHART agg_or_eval_list BY_CLAUSE field_name args_list\n               | CMD_TIMECHART agg_or_eval_list BY_CLAUSE field_name\n               | CMD_TIMECHART args_list agg_terms_list args_list\n               | CMD_TIMECHART args_list agg_terms_list\n               | CMD_TIMECHART agg_terms_list args_list\n               | CMD_TIMECHART agg_terms_list\n               | CMD_SITIMECHART args_list agg_or_eval_list BY_CLAUSE field_name args_list CMD_WHERE chart_where_clause args_list\n               | CMD_SITIMECHART args_list agg_or_eval_list BY_CLAUSE field_name args_list CMD_WHERE chart_where_clause\n               | CMD_SITIMECHART args_list agg_or_eval_list BY_CLAUSE field_name args_list\n               | CMD_SITIMECHART args_list agg_or_eval_list BY_CLAUSE field_name\n               | CMD_SITIMECHART agg_or_eval_list BY_CLAUSE field_name args_list CMD_WHERE chart_where_clause args_list\n               | CMD_SITIMECHART agg_or_eval_list BY_CLAUSE field_name args_list CMD_WHERE chart_where_clause\n               | CMD_SITIMECHART agg_or_eval_list BY_CLAUSE field_name args_list\n               | CMD_SITIMECHART agg_or_eval_list BY_CLAUSE field_name\n               | CMD_SITIMECHART args_list agg_terms_list args_list\n               | CMD_SITIMECHART args_list agg_terms_list\n               | CMD_SITIMECHART agg_terms_list args_list\n               | CMD_SITIMECHART agg_terms_listcommand : CMD_TIMEWRAP args_list args_value args_list\n               | CMD_TIMEWRAP args_list args_value\n               | CMD_TIMEWRAP args_value args_list\n               | CMD_TIMEWRAP args_valuecommand : CMD_TOP NUMBER command_params_by_and_fields_or_args\n               | CMD_TOP command_params_by_and_fields_or_args\n               | CMD_SITOP NUMBER command_params_by_and_fields_or_args\n               | CMD_SITOP command_params_by_and_fields_or_argscommand : CMD_TRANSPOSE args_list NUMBER args_list\n               | CMD_TRANSPOSE args_list NUMBER\n               | CMD_TRANSPOSE NUMBER args_list\n               | CMD_TRANSPOSE args_list\n               | CMD_TRANSPOSE NUMBER\n               | CMD_TRANSPOSEcommand : CMD_TRENDLINE agg_terms_listcommand : CMD_TSTATS agg_terms_list tstats_from tstats_where tstats_by\n               | CMD_TSTATS agg_terms_list tstats_where tstats_by\n               | CMD_TSTATS agg_terms_list tstats_by\n               | CMD_TSTATS agg_terms_list tstats_from tstats_where\n               | CMD_TSTATS agg_terms_list tstats_from tstats_by\n               | CMD_TSTATS agg_terms_list tstats_from\n               | CMD_TSTATS agg_terms_list tstats_where\n               | CMD_TSTATS agg_terms_list\n               | CMD_TSTATS args_list agg_terms_list tstats_from tstats_where tstats_by\n               | CMD_TSTATS args_list agg_terms_list tstats_where tstats_by\n               | CMD_TSTATS args_list agg_terms_list tstats_by\n               | CMD_TSTATS args_list agg_terms_list tstats_from tstats_where\n               | CMD_TSTATS args_list agg_terms_list tstats_from tstats_by\n               | CMD_TSTATS args_list agg_terms_list tstats_from\n               | CMD_TSTATS args_list agg_terms_list tstats_where\n               | CMD_TSTATS args_list agg_terms_listtstats_from : CMD_FROM field_name\n                   | CMD_FROM args_termtstats_where : CMD_WHERE filterststats_by : BY_CLAUSE fields_list args_term\n                 | BY_CLAUSE agg_terms_list args_term\n                 | BY_CLAUSE fields_list\n                 | BY_CLAUSE agg_terms_listcommand : CMD_TYPELEARNER args_term field_name\n               | CMD_TYPELEARNER field_name args_term\n               | CMD_TYPELEARNER args_term\n               | CMD_TYPELEARNER field_name\n               | CMD_TYPELEARNERcommand : CMD_UNION args_list union_datasets args_list\n               | CMD_UNION args_list union_datasets\n               | CMD_UNION union_datasets args_list\n               | CMD_UNION union_datasetsunion_datasets : union_datasets COMMA subsearch\n                      | union_datasets subsearch\n                      | union_datasets COMMA union_named_dataset\n                      | union_datasets union_named_dataset\n                      | subsearch\n                      | union_named_datasetunion_named_dataset : CMD_DATAMODEL TEXT STRING\n                           | CMD_SAVEDSEARCH TEXT STRING\n                           | CMD_LOOKUP TEXT STRING\n                           | CMD_INPUTLOOKUP TEXT STRING\n                           | NAMEcommand : CMD_UNTABLE field_name field_name field_namecommand : CMD_X11 NAME LPAREN field_name RPAREN AS_CLAUSE field_name\n               | CMD_X11 NAME LPAREN field_name RPARENcommand : CMD_XMLKV args_term field_name\n               | CMD_XMLKV field_name args_term\n               | CMD_XMLKV args_term\n               | CMD_XMLKV field_name\n               | CMD_XMLKVcommand : CMD_XPATH args_list STRING args_list\n               | CMD_XPATH args_list STRING\n               | CMD_XPATH STRING args_list\n               | CMD_XPATH STRINGcommand_params_by_and_fields_or_args : command_params_fields_or_args BY_CLAUSE fields_list args_list\n                                            | command_params_fields_or_args BY_CLAUSE fields_list\n                                            | BY_CLAUSE fields_list args_list\n                                            | BY_CLAUSE fields_list\n                                            | command_params_fields_or_argscommand_params_fields_or_args : args_list fields_list args_list\n                                     | args_list fields_list\n                                     | fields_list args_list\n                                     | args_list\n                                     | fields_listagg_terms_list : agg_terms_list COMMA agg_term\n                      | agg_terms_list agg_term\n                      | agg_termagg_term : NAME LPAREN agg_term_arg RPAREN AS_CLAUSE field_name\n                | NAME LPAREN agg_term_arg RPAREN AS_CLAUSE TIMES\n                | NAME LPAREN agg_term_arg RPAREN\n                | NAME AS_CLAUSE field_name\n                | NAME AS_CLAUSE TIMES\n                | PREFIX_OP LPAREN agg_term_arg RPAREN\n                | NAMEagg_term_arg : eval_expr_fun_value\n                    | field_name\n                    | field_name EQ\n                    | TIMESagg_term_arg : CASE_OP LPAREN agg_term_arg RPAREN\n                    | TERM_OP LPAREN agg_term_arg RPAREN\n                    | PREFIX_OP LPAREN agg_term_arg RPARENagg_or_eval_list : agg_terms_list\n                        | eval_expr_funany_fields_list : any_fields_list COMMA rfield_term\n                       | any_fields_list rfield_term\n                       | any_fields_list COMMA field_name\n                       | any_fields_list field_name\n                       | rfield_term\n                       | field_namerfields_list : rfields_list COMMA rfield_term\n                    | rfields_list rfield_term\n                    | rfield_termfields_list : fields_list COMMA field_name\n                   | fields_list field_name\n                   | field_name\n                   | fields_list COMMA TIMES\n                   | fields_list TIMES\n                   | TIMESrfield_term : field_name AS_CLAUSE field_name\n                   | field_name AS_CLAUSE TIMES\n                   | field_name AS_CLAUSE PATTERN\n                   | TIMES AS_CLAUSE PATTERN\n                   | PATTERN AS_CLAUSE TIMES\n                   | PATTERN AS_CLAUSE PATTERNfield_name : NAME\n                  | PATTERN\n                  | STRING\n                  | commands_names\n                  | op_namesfield_name : NAME LPAREN field_name RPAREN\n                  | commands_names LPAREN field_name RPARENfield_name : subsearchfield_name_logic : NAME\n                        | PATTERN\n                        | STRING\n                        | commands_names\n                        | op_names\n                        | subsearchfield_or_num_list : field_or_num_list field_or_num\n                         | field_or_numfield_or_num : field_name\n                    | NUMBER\n                    | MINUS NUMBERargs_list : args_list args_term\n                 | args_termargs_term : NAME EQ args_value\n                 | commands_names EQ args_value\n                 | op_names EQ args_valueargs_term : subsearchargs_value : value\n                  | eval_expr_fun_value\n                  | expr_fun_call\n                  | TIMES\n                  | chart_limit\n                  | op_names\n                  | commands_names\n                  | QLPAREN args_value QRPAREN\n                  | AND_OP\n                  | OR_OP\n                  | NOT_OPbasic_args_list : basic_args_list basic_args_term\n                       | basic_args_termbasic_args_term : NAME EQ args_valuestr_args_list : str_args_list COMMA str_args_term\n                     | str_args_termstr_args_term : NAME EQ STRING\n                     | commands_names EQ STRING\n                     | op_names EQ STRINGchart_limit : BOTTOM_OP NUMBER\n                   | CMD_TOP NUMBERvalue : NUMBER\n             | FLOAT\n             | MINUS NUMBER %prec UMINUS\n             | MINUS FLOAT %prec UMINUSvalue : value_concatvalue_concat : value_concat value_concat_factor\n             | value value_concat_factorvalue_concat_factor : DOT valuevalue_concat_factor : DOT expr_fun_callvalue : QUOTE NAME QUOTE\n             | STRING\n             | NAME\n             | PATTERN\n             | QUOTE QUOTE\n             | QLPAREN\n             | QRPAREN\n             | commands_names\n             | op_names\n             | TEXTvalue : TIMESPECIFIERvalue : DATEvalue : MINUS NAMEvalues_list : values_list COMMA value\n                   | values_list value\n                   | valuevalue : subsearchvalue : DIVIDE valuevalue_op : PLUS\n                | MINUS\n                | TIMES\n                | DIVIDE\n                | COMMA\n                | DOT\n                | COLON'
+
+terminals = {'$end': 0, 'AND_OP': 1, 'AS_CLAUSE': 2, 'BOTTOM_OP': 3, 'BY_CLAUSE': 4, 'CASE_OP': 5, 'CMD_ABSTRACT': 6, 'CMD_ACCUM': 7, 'CMD_ADDCOLTOTALS': 8, 'CMD_ADDINFO': 9, 'CMD_ADDTOTALS': 10, 'CMD_ANALYSEFIELDS': 11, 'CMD_ANOMALIES': 12, 'CMD_ANOMALOUSVALUE': 13, 'CMD_ANOMALYDETECTION': 14, 'CMD_APPEND': 15, 'CMD_APPENDCOLS': 16, 'CMD_APPENDPIPE': 17, 'CMD_ARULES': 18, 'CMD_ASSOCIATE': 19, 'CMD_AUDIT': 20, 'CMD_AUTOREGRESS': 21, 'CMD_BIN': 22, 'CMD_BUCKETDIR': 23, 'CMD_CEFOUT': 24, 'CMD_CHART': 25, 'CMD_CLUSTER': 26, 'CMD_COFILTER': 27, 'CMD_COLLECT': 28, 'CMD_CONCURRENCY': 29, 'CMD_CONTINGENCY': 30, 'CMD_CONVERT': 31, 'CMD_CORRELATE': 32, 'CMD_CUSTOM': 33, 'CMD_DATAMODEL': 34, 'CMD_DBINSPECT': 35, 'CMD_DEDUP': 36, 'CMD_DELETE': 37, 'CMD_DELTA': 38, 'CMD_DIFF': 39, 'CMD_EREX': 40, 'CMD_EVAL': 41, 'CMD_EVENTCOUNT': 42, 'CMD_EVENTSTATS': 43, 'CMD_EXPAND': 44, 'CMD_EXTRACT': 45, 'CMD_FIELDFORMAT': 46, 'CMD_FIELDS': 47, 'CMD_FIELDSUMMARY': 48, 'CMD_FILLDOWN': 49, 'CMD_FILLNULL': 50, 'CMD_FINDTYPES': 51, 'CMD_FLATTEN': 52, 'CMD_FOLDERIZE': 53, 'CMD_FOREACH': 54, 'CMD_FORMAT': 55, 'CMD_FROM': 56, 'CMD_GAUGE': 57, 'CMD_GENTIMES': 58, 'CMD_GEOM': 59, 'CMD_GEOMFILTER': 60, 'CMD_GEOSTATS': 61, 'CMD_HEAD': 62, 'CMD_HIGHLIGHT': 63, 'CMD_HISTORY': 64, 'CMD_ICONIFY': 65, 'CMD_INPUTCSV': 66, 'CMD_INPUTLOOKUP': 67, 'CMD_IPLOCATION': 68, 'CMD_JOIN': 69, 'CMD_KMEANS': 70, 'CMD_KVFORM': 71, 'CMD_LOADJOB': 72, 'CMD_LOCALIZE': 73, 'CMD_LOCALOP': 74, 'CMD_LOOKUP': 75, 'CMD_MAKECONTINUOUS': 76, 'CMD_MAKEMV': 77, 'CMD_MAKERESULTS': 78, 'CMD_MAP': 79, 'CMD_MCOLLECT': 80, 'CMD_METADATA': 81, 'CMD_METASEARCH': 82, 'CMD_MEVENTCOLLECT': 83, 'CMD_MPREVIEW': 84, 'CMD_MSTATS': 85, 'CMD_MULTIKV': 86, 'CMD_MULTISEARCH': 87, 'CMD_MVCOMBINE': 88, 'CMD_MVEXPAND': 89, 'CMD_NOMV': 90, 'CMD_OUTLIER': 91, 'CMD_OUTPUTCSV': 92, 'CMD_OUTPUTLOOKUP': 93, 'CMD_OUTPUTTEXT': 94, 'CMD_PIVOT': 95, 'CMD_PREDICT': 96, 'CMD_RANGEMAP': 97, 'CMD_RARE': 98, 'CMD_REDISTRIBUTE': 99, 'CMD_REGEX': 100, 'CMD_RELEVANCY': 101, 'CMD_RELTIME': 102, 'CMD_RENAME': 103, 'CMD_REPLACE': 104, 'CMD_REQUIRE': 105, 'CMD_REST': 106, 'CMD_RETURN': 107, 'CMD_REVERSE': 108, 'CMD_REX': 109, 'CMD_RTORDER': 110, 'CMD_SAVEDSEARCH': 111, 'CMD_SCRIPT': 112, 'CMD_SCRUB': 113, 'CMD_SEARCH': 114, 'CMD_SEARCHTXN': 115, 'CMD_SELFJOIN': 116, 'CMD_SENDEMAIL': 117, 'CMD_SET': 118, 'CMD_SETFIELDS': 119, 'CMD_SICHART': 120, 'CMD_SISTATS': 121, 'CMD_SITIMECHART': 122, 'CMD_SITOP': 123, 'CMD_SORT': 124, 'CMD_SPATH': 125, 'CMD_STATS': 126, 'CMD_STRCAT': 127, 'CMD_STREAMSTATS': 128, 'CMD_TABLE': 129, 'CMD_TAGS': 130, 'CMD_TAIL': 131, 'CMD_TIMECHART': 132, 'CMD_TIMEWRAP': 133, 'CMD_TOP': 134, 'CMD_TRANSACTION': 135, 'CMD_TRANSPOSE': 136, 'CMD_TRENDLINE': 137, 'CMD_TSCOLLECT': 138, 'CMD_TSTATS': 139, 'CMD_TYPEAHEAD': 140, 'CMD_TYPELEARNER': 141, 'CMD_TYPER': 142, 'CMD_UNION': 143, 'CMD_UNIQ': 144, 'CMD_UNTABLE': 145, 'CMD_WALKLEX': 146, 'CMD_WHERE': 147, 'CMD_X11': 148, 'CMD_XMLKV': 149, 'CMD_XMLUNESCAPE': 150, 'CMD_XPATH': 151, 'CMD_XYSERIES': 152, 'COLON': 153, 'COLSUMMARY_OP': 154, 'COMMA': 155, 'COMP_OP': 156, 'DATE': 157, 'DEQ': 158, 'DIVIDE': 159, 'DOT': 160, 'EQ': 161, 'FALSELABEL_OP': 162, 'FILTER_OP': 163, 'FLOAT': 164, 'GROUPBY_CLAUSE': 165, 'IN_OP': 166, 'LBRACK': 167, 'LIMIT_OP': 168, 'LPAREN': 169, 'MINUS': 170, 'MOD': 171, 'NAME': 172, 'NEQ': 173, 'NOTCHAR': 174, 'NOTIN_OP': 175, 'NOT_OP': 176, 'NUMBER': 177, 'NUMCOLS_OP': 178, 'OR_OP': 179, 'OUTPUT_NEW_OP': 180, 'OUTPUT_OP': 181, 'OVER_OP': 182, 'PATTERN': 183, 'PERIOD_OP': 184, 'PIPE': 185, 'PLUS': 186, 'PREFIX_OP': 187, 'QLPAREN': 188, 'QRPAREN': 189, 'QUOTE': 190, 'RANGE_OP': 191, 'RBRACK': 192, 'ROWSUMMARY_OP': 193, 'RPAREN': 194, 'SHOWOTHER_OP': 195, 'SORTBY_CLAUSE': 196, 'SPLITCOL_OP': 197, 'SPLITROW_OP': 198, 'STRING': 199, 'TERM_OP': 200, 'TEXT': 201, 'TIMES': 202, 'TIMESPECIFIER': 203, 'TRUELABEL_OP': 204, 'WITH_OP': 205, 'error': 206}
+width = 208
+nonterminals = 83
+action = unpack('eNrsXQe4FDXXPtm5FyuKgIIiTQR77733ThHsvWHvBX+vvaHYewe7gB38Piv23nvvFf0Uu85u/s3NhuTs7kyyu7Nh7u553meymTln5pL35SSZTCbD23gek4G3zQn9YQEYAAvCQBgEC8HCsAgsCovB4rBE3rokLAVLwzKwLCwHy8MKsCKsBCvDKrAq3A2rweqwBqwJa8HasA6sC+vB+rABbAgbwcawCWwKm8HmsAVsCVvB1rANDIYhMBSGwbYwHEbAdrA97AA7wk6wM+wCu8JusDvsAXvCXrA37AP7wn4wEvaHA+BAOAgOhkPgUDgMDocj4Eg4Co6GY+BYOA5GwfHwf3ACtMGJcBKcDKfAqXAanA5nwJlwFpwNo+EcOBfGwHlwPlwAF8JFcDFcApfCZXA5XAFXwlVwNVwD18J1cD3cAGNhHNwIN8HNcAvcCrfB7XBHvvzjYQJMhDvhrnz+YRCc9c2n/dpzT8B/YY72XA94EGaBnvl81/Z93jYzdIZH8/n74F6YBN1gCrTk9+6HXjA/zAeP5fMP5bdH4B74DzwA3aEL9Ia5oA88XjgfCr+ElIITB2lGjlP9Vv/67SnQ9duTFdVvJl6Fudhr8Aa8Dn9DV/YmvAXdWHf2HszC3oe3YW42D/sX/oEeLIR5WRZyMB/rxT6EOdn87CN4BT6G3uwT6MNehE+hL/sD+rH+7CX4DD6Hd2AB9idwGMAWZAPZIAZsIfYFLMwWYTOxL2FmthhblC3OlmDfAWNLsq/ga1iKLc2WYd/AsmxWlmHLsdnY97A8W4GtyFZiK7O/4FtYla3CfoDV2OpsDbYmW4utzabCj/AyrMN+gnXZeuxdWJ/9DzZgs7Of4TnYkHVmAduIbcJ6shdgazaEbco2Y8/D5mwL1on9Aluyrdg2bDD7AIayYWwabMta2HD2K2zMfoMRrJV1Ydux7dnvsAObg/mNn2l8RybiZxqn+HGPn51ZafxM49HxM43r+BF+On6m8YfyW3T8/MR/4jKNg92jsWGWX3MmN23DOc1vdWzK83/ku7XHz48UPxXEz65l4udHFD+7MzN+fjTi50cUPz/m4+dHbmt/qH/g7/5HHK20f0D6pFsfQqXYZ3o/bq/puX1R327vRHp6b/O3uUzjYPdobJjl15yJbSTTNpzT/FbHpjz/C/4Fl2kc7B6NDbP8Mr8/k7me4eBQWXROWAaHit/q2JT6LBMuE8o0DnaPxoZZfpk/gKmctuGc5rc6NuX5S4dLhzKNg92jsWGWX+YPZCqnbTin+a2OTXl+d96dyzQOdo/Ghll+nS/PykFMWRS/1bEp9enGu3GZxsHu0dgwy6/z5Vk5mCmL4rc6NqU+7/J3uUzjYPdobJjl15zJTdtwTvNbHZvy/EHhoFCmcbB7NDbM8sv8cJSTGI58hoeK3+rYlPoMDAeGMo2D3aOxYZZf5rdFOYltkc+2oeK3OjalPguFC4UyjYPdo7Fhll/mh6GcxDDkMyxU/FbHptSnf9g/lGkc7B6NDbP8Mj8U5SSGIp+hoeK3OjalPv3CfqFM42D3aGyY5Zf5ISgnMQT5DAkVv9WxWToW9ycn2FHriOefNCNnBuCwotHqw6fvH1rTOPYSoQtc/ZoBmIuRrH680f/6+uEoh6g50sFnQOgCV79mQCVc1Mab0GeB0AWufs2ASriojbf2p+ihC1z9mgGVcFEbb0KfPqELXP2aAZVwURtvQp/eoQtc/ZoBlXBRG294ftWJjOZXVT+/6lim5lfxNjG/6rjpfbNjmJ5fdTyLn181ip3Eeuf39fyqW7kLXP0ISULocwt3gasfIUkIfW7mLnD1IyQJoc9N3AWufoQkIfS5kbvA1Y+QJIQ+47gLXP0ISULoM5a7wNWPkCSEPjdwF7j6EZKE0Od67gJXP0KSEPpcx13g6kdIEkKfa7kLXP0ISULocw13gasfIUkIfa7mLnD1IyQJoc9V3AWufoQkIfS5krvA1Y+QJIQ+V3AXuPoRkoTQ53LuAlc/QpIQ+lzGXeDqR0gSQp9LuQtc/QhJQuhzCXeBqx8hSQh9LuYucPUjJAmhz0XcBa5+hCQh9LmQu8DVj5AkhD4XcBe4+hGShNDnfO4CVz9CkhD6nMdd4OpHSBJCnzHcBa5+hCQh9DmXu8DVj5AkhD7ncBe4+hGShNBnNHeBqx8hSQh9zuYucPUjJAmhz1ncBa5+hCQh9DmTu8DVj5AkhD5ncBe4+hGShNDndO4CVz9CkhD6nMZd4OpHSBJCn1O5C1z9CElC6HMKd4GrHyFJCH1O5i5w9SMkCaHPSdwFrn6EJCH0OZG7wNWPkCSEPo4fSW2jJd1mwKdp88kJ3AWufoQkIfT5P+4CVz9CkhD6HM9d4OpHSBJCn1HcBa5+hCQh9DmOu8DVj5AkhD7Hche4+hGSRPvqcdwFrn6EJCH0OZq7wNWPkCTa19HmLnD1IySJ9jXMuQtc/QhJQuhzBHeBqx8hSbR/Z4O7wNWPkCTav4vCXeDqR0gS7V+n4S5w9SMkCaHPIdwFrn6EJCH0OZi7wNWPkCSEPgdxF7j6EZKE0OdA7gJXP0KSEPocwF3g6kdIEkKf/bkLXP0ISULoM5K7wNWPkCSEPvtxF7j6EZKE0Gdf7gJXP0KSEPrsw13g6kdIEkKfvbkLXP0ISULosxd3gasfIUkIffbkLnD1IyQJoc8e3AWufoQkIfTZnbvA1Y+QJIQ+u3EXuPoRkoTQZ1fuAlc/QpIQ+uzCXeDqR0gSQp+duQtc/QhJQuizE3eBqx8hSQh9duQucPUjJAmhzw7cBa5+hCQh9Nmeu8DVj5AkhD7bcRe4+hGShNBnBHeBqx8hSQh9hnMXuPoRkoTQZ1vuAlc/QpIQ+gzjLnD1IyQJoc9Q7gJXP0KSEPoM4S5w9SMkCaHPYO4CVz9CkhD6bMNd4OpHSBJCn625C1z9CElC6LMVd4GrHyFJCH225C5w9SMkCaHPFtwFrn6EJCH02Zy7wNWPkCSEPptxF7j6EZKE0GdT7gJXP0KSEPpswl3g6kdIEkKfjbkLXP0ISULosxF3gasfIUkIfTbkLnD1IyQJoc8G3AWufoQkIfRZn7vA1Y+QJIQ+63EXuPoRkoTQZ13uAlc/QpIQ+qzDXeDqR0gSQp+1uQtc/QhJQuizFneBqx8hSQh91uQucPUjJAmhzxrcBa5+hCQh9Fmdu8DVj5AkhD6rcRe4+hGShNBnVe4CVz9CkhD6rMJd4OpHSBJCn5W5C1z9CElC6LMSd4GrHyFJCH1W5C5w9SMkCaHPCtwFrn6EJCH0WZ67wNWPkCSEPstxF7j6EZKE0GdZ7gJXP0KSEPosw13g6kdIEkKfpbkLXP0ISULosxR3gasfIUkIfZbkLnD1IyQJoc8S3AWufoQkIfRZnLvA1Y+QJIQ+i3EXuPoRkoTQZ1HuAlc/QpIQ+izCXeDqR0gSQp+FuQtc/QhJQuizEHeBqx8hSQh9BnEXuPoRkoTQZyB3gasfIUkIfRbkLnD1IyQJoc8A7gJXP0KSEPoswF3g6kdIEkKf/twFrn6EJCH06cdd4OpHSBJCn77cBa5+hCQh9OnDXeDqR0gSQp/e3AWufoQkIfSZn7vA1Y+QJIQ+vbgLXP0ISULoMx93gasfIUkIfeblLnD1IyQJoU9P7gJXP0KSEPr04C5w9SMkCaHPPNwFrn6EJCH0mZu7wNWPkCSEPl25C1z9CElC6DMXd4GrHyFJCH26cBe4+hGShNBnTu4CVz9CkhD6zMFd4OpHSBJCn87cBa5+hCQh9Jmdu8DVj5AkhD6zcRe4+hGShNBnVu4CVz9CkhD6zMJd4OpHSBJCn5m5C1z9CElC6DMTd4GrHyFJCH06cRe4+hGShNCnlbvA1Y+QJIQ+LdwFrn6EJCH0MfEqzMVegzfgdfgburI34S3oxrqz92AW9j68DXOzedi/8A/0YCHMy7KQg/lYL/YhzMnmZx/BK/Ax9GafQB/2InwKfdkf0I/1Zy/BZ/A5vAMLsD+BwwC2IBvIBjFgC7EvYGG2CJuJfQkzs8XYomxxtgT7Dhhbkn0FX8NSbGm2DPsGlmWzsgxbjs3Gvofl2QpsRbYSW5n9Bd/CqmwV9gOsxlZna7A12VpsbTYVfoSXYR32E6zL1mPvwvrsf7ABm539DM/BhqwzC9hGbBPWk70AW7MhbFO2GXseNmdbsE7sF9iSbcW2YYPZBzCUDWPTYFvWwoazX2Fj9huMYK2sC9uObc9+hx3YHKyYNR+YDLxtTugPC8AAWBAGwiBYCBaGRWBRWAwWhyXy1iVhKVgaloFlYTlYHlaAFWElWBlWgVXhblgNVoc1YE1YC9aGdWBdWA/Whw1gQ9gINoZNYFPYDDaHLWBL2Aq2hm1gMAyBoTAMtoXhMAK2g+1hB9gRdoKdYRfYFXaD3WEP2BP2gr1hH9gX9oORsD8cAAfCQXAwHAKHwmFwOBwBR8JRcDQcA8fCcTAKjof/gxOgDU6Ek+BkOAVOhdPgdDgDzoSz4GwYDefAuTAGzoPz4QK4EC6Ci+ESuBQug8vhCrgSroKr4Rq4Fq6D6+EGGAvj4Ea4CW6GW+BWuA1uhzvy5R8PE2Ai3Al35fMPQ/vM6Hzarz33BPwX5mjP9YAHYRbomc93BcnszNAZHs3n74N7YRJ0gyntx++HXjA/zAeP5fceym+PwD3wH3gAukMX6A1zQR94vHD+r3xHJtJ42D0aG2b5RX7nds7kpm04p/Splk15fshnRLw2M06tqIa8g/TxDMy4G//U/qS1/dH6nMhIn0r00RD6yJzQR+bONmoxrQ9vk/qMKViL9eFtJxUspA/p08z6XFxWn0uYqt/K63MpI33qr8/VLF6fK1m8Ptcy0mfGxM84p/gZS/rUXZ9bputzI6u0fjPj550c6VMPfcZH9g8E41qfd3Lx/YO3SZ86x09x+/M20uftXHz8vEX6eNbnLaTPWxZ93szRiItfYMZt/L9B8eM5ft5A8fOGJX5eJ3086/M60ud1iz6vUf3mGZhxG/+vUvx4jp9XUfy8aomfVyh+PAMzbuP/ZYqfBONnErPfn76M4udly/3pS6SP5/rtJaTPS5b67UXSx7M+LyJ9XrTo8wK1P56BGbfx/zzFj+fx0edR/DxvaX+eo/jxDMy4jf9nKX48x8+zKH6etcTPM6SPZ32eQfo8Y9HnadLHc//taaTP05b+21Okj+f5O08hfZ6y6PMk6eO5fnsS6fOkpX57gvTxrM8TSJ8nLPo8Tvp41udxpM/jFn2m0P2PZ2DGbfw/RvHjOX4eQ/HzmCV+HiV9PPevH0X6PGrpvz1C+njW5xGkzyMWfR4mfTzXbw8jfR621G8PkT6e9XkI6fOQRZ8Hqf/mGZhxG///JX08AzNu4/8/pI9nYMZt/D9A7Y/n9ucB1P48YGl/JpM+nvWZjPSZbNFnEunj+f5nEtJnkuX+537Sx3P83I/0ud8SP/eRPp71uQ/pc59Fn3up/+YZmHEb//dQ/HiOn3tQ/NyTo/VDaP0Q0of0IX1IHx/tT5w+1P6QPqQP6UP6kD6kD+lD+pA+pA/pQ/qQPqQP6UP6kD6kD+nT3OPXtD456UP6kD4dc/4b6UP6kD6kD+lD+pA+pE9t+oyi+aOe9RmF5o+OylH8+Pi+5rFM6fMDE9/XnCa+MJzfvmfHGN9n+mV6/Exl5b6vOSqvT+/8Pn1fs6PMTzyiUL/9wUgfP+OjR6D67QiaH0/j16QP6UPf1yR9EtQHMuX0YZkZr89sGdLH9v3t2TMzrn4jfdKtD9Vv9H5WR21/SJ+06NMtk0z/uj+Nj3qOn/5o/KB/juKnoz1fIH2o/aH+dTL961mp/Un4+Q9vE89/+k6PH/P5z/H5+Jm1vf3pBfL5z6w5ev7Tke9/Wil+PI9ft6L+Wys9/+lw/beFMlqfP7Kkj9/4EYxrff7ImvoskqH4ofG3ZtdnqYypz5KZWvSZSvWb5/vTqah+m5ql+Enf/ekY5np/+inFT13mJ66YiZqf+GnWnJ/4aZbuT2n8jfSplz5vUP3mWZ83UP/gDeof0Ps/1D+oYPxa6qPGr+n9BeofkD6kD+lD+qSx/blzev96TiB9qtdnDlD6zAJCn64FfmeGzqD16QZT4M6sqc+dqH/dHbpAb5gLqH/QUcbf6qvP4Exz6DMkU9/3swjJoEedWKX6jeaPkj6kD93/kD6kD83fIX1mjD5u72/vkSF9aH0K6r8l8XxulcL4274Z0sdP/KyCnm+vkqX46Tj9g5E0/9rT84XjGD3fbobnPwvQ/Ko69w8OLpofvwBqfxbI0vydjtO/PpzaHxrfIX0SH99JCsdkGut527FVl+foTHqez7Vlao2fkzM4fk7KJBM/J2ZmVPyckKHxnfTVb7xN6XMa6ZPa9udc9P7pmSXvn47OuLc/nej+x3P/rRO6/+lE75fQ/APSp27zE38OadZafXFpUU8bM+7GP62v3Dzze0mfZPW5JR9/4zPJ6XNHh9VnQia55wu3F9Y/uC0jni/cmil+vnBzJvr5wthM6fOfu+n5dp36bxMzSbwfTPrUS597atLn+ZD61/V9/nN/Brc/gnGtz/MhvV8yIzA5dvz6gYzP8WuKn9L4eTCTTP9tAtVvnsd3JqD6bUJI4zv0/JRQjEcTen56KdVvnuu3S1H9dinVbx1oftUTMfOraH0KP+tTxM0fLV2f4n/8f1ymcbB7NDbM8mvO5KZtOKf5rY5Nip+OED9T+VQu0zjYPRobZvk1Z3LTNpzT/FbHJsVPR4gf0ifd+gwKB4UyjYPdo7Fhll/mh6OcxHDkMzxU/FbHJm97Nn+P+x3/jss0DnaPxoZZfs2Z3LQN5+T//+rZpPrNX/32FMTVb89laH2+5PR5PfMwvJqR+ryceS1TOv/gpUz8+6evZOLfb3wxQ/qkWZ+3SvQh1Ip3MlHr872dIXbShPcS1WOx0AWufs2ASriojTdqf+q3/sGHhfmJtD5FOp//fFZ2fsjnlvXFvqD360kf0of0ofWRSJ8U6SPxKszFXoM34HX4G7qyN+Et6Ma6s/dgFvY+vA1zs3nYv/AP9GAhzMuykIP5WC/2IczJ5mcfwSvwMfRmn0Af9iJ8Cn3ZH9CP9WcvwWfwObwDC7A/gcMAtiAbyAYxYAuxL2BhtgibiX0JM7PF2KJscbYE+w4YW5J9BV/DUmxptgz7BpZls7IMW47Nxr6H5dkKbEW2EluZ/QXfwqpsFfYDrMZWZ2uwNdlabG02FX6El2Ed9hOsy9Zj78L67H+wAZud/QzPwYasMwvYRmwT1pO9AFuzIWxTthl7HjZnW7BO7BfYkm3FtmGD2QcwlA1j02Bb1sKGs19hY/YbjGCtrAvbjm3Pfocd2Bys1juaHyq6P1oqdIGrXzOgEi5q463969ChC1z9mgGVcFEbb0Kf+UMXuPo1AyrhojbehD6Lhy5w9WsGVMJFbbwJfRYMXeDq1wyohIvaeKOx5hmLqQ49uR6hC1z9mgGVcFEbb0KfZUIXuPo1AyrhojbehD5Lhy5w9WsGVMJFbbxFzc+i+W9JcVEbb0KfhUIXuPo1AyrhojbehD4DQxe4+jUDKuGiNt6EPv1DF7j6NQMq4aI23oQ+/UIXuPo1AyrhojbehD49Qxe4+jUDKuGiNt6EPt25C1z9CElC6NONu8DVj5AkhD5ZTuNgfnFqRU9gf+M7MpHGw+7R2DDLL/I7t3MmN23DOfV+SbVslmr1Z2bF4K/MP5m/M32DlYJ/M2Fm5WCVAIKlgvchm1k1WC3oH/QLVg8WCNYMBgQLBmsFaweZYIVgnSAI/si0BOsGrcF6wa+ZTsH6wfzBBsGGwW+ZmYKZg1xmo6B3MDDYONgk2DTYLBgUbB7MEmwRbBksEcwaLBlsHWwVbBMMDuYMFgqGBLMFswdDg2HBtkHnYHiwdLBwMCJYJugSbBdsH+wQ7BjsFPQJ5gh2CXYO5gp2DXYLdg/2CPYM9gq6Bt2C3zN7B92DfYJ9A57ZL5g7GBksG8wT/JzZP1guWCQ4IDgoWCOYljkyOCY4ODgk+CVzaHBYsHjQIzg8OCI4Kjg6YMGxwXFBz2BUsGhwfDBvcGAwX/B/wWJBF3ZC0Bb0Ck4Mlg/8RdpPGd4WcHo/y+/7WYJxPX8n4K7vB9P8qjSu3/tvTupzSkD6uOtzWlD9+nyCca3Pv7l4fTYLXeDq1wyQXIhUbpobnFObnc0or/bv1IQyjYfdo3kguTDjRx01LaaH5s/01bxrdk1L4TtP+d+zghPCeAg/AuZCsX9GgBk6M1C8mql5rjqOjxZb6E4xGZwdEAdpxui66rNRKDYbXHyaBZILzKE8alq0Ryl/2lqOXXUl6dGVq7Qrj0a8tfFhll/mtTrqqMqfE2heNcfFV8Pnllq7cro/7Qj3p78W7k/H0P2pp/vTX9H96a+W+9NpOWrhK8f5NfQJMOM2/n8mfapALazhc4n/euOCuvavdwnFZoOLT/OhPHsXBuqotmEvNzalPjuHYrPBxaf5EM2ePKpt2MuNTanPTqHYbHDxaT5Esyct2oa93NiU+uwYis0GF5/mQ3n2LgrUUW3DXm5sSn12CMVmg4tP8yGaPXlU27CXG5tSnxGh2Gxw8Wk+RLMnj2ob9nJjk8Z30vr9LPP7mt/nSJ/K9bkkqF4fwbjW5/tcqT6XBbR+VUeJn/1CmcbD7tHYMMsv86Y+6qhpMT2K+dPWcuwqf+mxdyjTeNg9Ghtm+WXe1EcdNS2mRzF/2lqOXeUvPb6l9qeK+u2KKtufcfn67VvU/nxbpv0Za9RvB4QqPSCMRry18WGWX+ZNffS+mTPtmD9tLceu8tfnX0UzUFKNq0mf1EKMk14T2MZUm3382iy/Gps2Odw5LM1hjkvHvZV/eevONH4wg74fXNn9D+mTbn3epf51XcZ3IBOlz7uof/1uoX89Nig/vkPPt12fZOO8Zv+MQO/L59uK16g5BNoa9fRbe9DzOdcncThvzo/X+/L5nOJVodzzOe1f3krP5yp9Elf87E3Pj9f7Zk57lHs+p/3LW+n5XKVP4oqfvWnofTNn2kufz2n/8lblcSv1D+rSfxsfOf/6VtQ/uNUyv5dQK86o6+jLuTS/1DMw4zb+zwpl/XZWSPWbn/tTwbiu384K4+9Pzyzocybp4+n+9Eykz5lh/PyDc6h+8wzMuI3/s0kf3+975yrh/yzSxzMw4zb+R5M+vt/Hz1XC/wTSJ0Hc7HAvhBm38X8Q6eMZmPFK+KfvN/r4fuOtFY03nEHx43s8KFcJ/6eTPp6BGbfxP47Grz2PX49D49fjLOPXY0kfz/qMRfqMtehzA+njWZ8bkD43WPQ5jdofz8CM2/g/n+LH8/tz56P4Od/y/ty1pI/n+u1apM+1lvrtDqrfPAMzbuP/Koofz/FzFYqfqyzxcw3p41mfa5A+11j0OZXqN8/AjNv4P4X08QzMuI3/K6h+81y/XYHqtyss9dvtFD+egRm38X85xY/n+Lkcxc/llvi5lPTxrM+lSJ9LLfqcQPWbZ2DGbfxfQvHjOX4uQfFziSV+LiJ9POtzEdLnIos+t1H95hmYcRv/d5M+noEZt/F/F+njGZhxG/93kj6egRm38T+R9PEMzLiN//Gkj2dgxm3830L9a8/961tQ//oWS//6ZtLHsz43I31utuhzE+njWZ+bkD43WfS5kfTxrM+NSJ8bLfpcT/p41ud6pM/1Fn2uI30863Md0uc6iz5Xkz6e9bka6XO1RZ8rSR/P+lyJ9LnSos9lpI9nfS5D+lxm0edi0sezPhcjfS626HMh6eNZnwuRPhda9LmA9PH8fskFSJ8LLO+XnEf6eNbnPKTPeRZ9xpA+nvUZg/QZY9HnTHq+4BmYcRv/J5M+noEZt/F/EunjGZhxG/8nkj6egRm38d9G+ngGZtzG//+RPp6BGbfxfzzp4xmYcRv/x5E+Pub0BlGM2/h/g98e0P1ppfenb3De1jef6wfq/vRYpu5Pf2A980en5fd/zW/fs2PYo3l/eX/6S/7+VJx7P0xl88N88Fh+76H8pu5PR+XvT3vnz+4D6v70Vf4qF6nMRSHe2vgwyy/z9wav8ruCO4P7g7sDdVx5TQjuyx+7J4jibXwQ/9cmBup6vO0V/goXqcxFId7a+DDLH8UFb5sU2HibHFTyNzWofqv8+UIl9Zsaf/tl+vcBVf2Gvw9YWr+RPunWZ0A4ICR9KtVHsNY3n/Zrzyl9BoRKnwHhNDYg1PoMCLU+4gytz4DwofyG9RkQan2e589zkcpcFOKtjQ+z/FFclDteC29Sn+f4c1ykMheFeGvjwyw/5mIki+OoFt6kPs/yZ7lIZS4K8dbGh1n+KC7U8QeDZHiT+jzDn+EilbkoxFsbH2b5o7hQxx8KkuFN6jMwHEj9g4r7B4K1vvm0X3tO9Q8GtvcPBoY989s0NrC9fzAwFP2DgUb/QJxxP/QC2T8YmO8fDCzqHww0+geDwkGhSGUuCvHWxodZ/igu1PFHgmR4o/uf5Oe/8TY1P+TRIGr+m7z/UfND8P1P6fy3Y3L5fEAjzP5wTC56rxRHFuZXPRFQ/PiZP3okml91pNP3g6l+S1qf6PlvcfVb6fdPSR/f8VNZ+3Noe/22USi2aMRbGx9m+SVbJuTR4pxpV+eLX8G49jo0Z17dtFD8dIT4OYTix3P8HILi5xBL/OxH80Pqgmci71kw4zb+983br6L7n8TxbBDHeNReFKj9Sbr9Kf/9+nFO/euxRv96J3r/x3P/YCd0f7qT5f50x/b6jfTxp8+OSJ8dLfrsEorNBhefZoHkQrN/RqCOSsuFgeJVoZg/bS3HrvKXHjvnf68JRLpzGI14a+PDLL/Mm/Gj982cacf8aWs5dpV/oX4LxWaDi0+zQHKh2T87UEel5aJA8apQzJ+2lmNX+UuPHUKx2eDi0yyQXGj2RwfqqGkxPYr509Zy7Cp/6TEiFJsNLj7NAsmFWb+po6bF9CjmT1vLsav8cR/kNbpHrTter5rjJPvXs2Wof51vlWLHR2fPuI6PTo9BGoerO2rh+KiQ+HPHadaaanImjuMHMpX+xSNJn7qjWo7fzP9vmEr1W91BHM8InMHx/ltBrVcgJImuReyeU5c7Fbr/aZb7H3q+UOv8N5qfOKOen5I+jTl/lJA0PkyoPV+e5h9UET8fW9cf7ZaJGn9bHj3fXj7nNv5GqPr+pyhSPk20J7xMTqXL5KIRb218mOWXecyh2jdzmGN8rulvXt20yN8FqH7z3H9bANVvC+Ti+28DSR/P86sGIn0G0vtZHfr+tFdezS9pfqLH+OmF4qeXJX56UP3muf3pgfTpkaPxg478fhahPpgc+wTb/fl2l0L99h29X19B/JxmHT+Inr8jGB/DVPx0sbQ/s1P7k/D6ibxNrJ/Yd3qEmOsnHp9vf2Zvb3/U+juz5+LXT5yN9Kmp/RnJKm1/ZkP9g9ks8SPX4aH1kSpdH0lzdkag1zMyLUqdUv6K2Sy/L8/uH6q0fxiNeGvjwyy/zGvOzg7UcWxR+pTyV8xm+X15dr9Qpf3CaMRbGx9m+WVeczY6UMexRelTyl8xm+X3zffsaf2DytY/6Bkqznoaaxuo9Q/wGgml/BWzWX6f7lGSwY91nfnUifpvnsdHO6H+Wyca35kh+txSw/j1zwHpU5/vn/4aJDG/6rISffYOxRaNeGvjwyy/zGP21L6Zi2LXtEoLZlcfFfgzS/Hjd/xaMK7j58+sGT9/BDR+nWb8WdIXnEbxU2H8/B3U1n+bhuJnGoqff0ri5xfSJ/H6bamMqc+SGazPL0ifX7Lx/eutQ5VuHUYj3tr4MMuvONOQR3UO+5Typ63l2DV14W1bhSrdKoxGvLXxYZZfcaYhj+oc9inlT1vLsWvqwtu2DFW6ZRiNeGvjwyy/4kxDHtU57FPKn7aWY9fUhVB/hAmMz1H/IK3vZ/1I/TfP96c/ov7bj1ma35u+9Xf0/B3b/LevCvEDLaRPkvOrHox8P0swrvX5iuJnhnyfdsVMMt+n/YzaHw/tz22Bjp/PUPvzWdY2v4q+P1f5/CpzX8+vqvb7c+W9CuvQ0/dPq/j+qbl/dlDr90/LexW+40DfP63i+6fm/uig1u+flveS+vQ0ZgTR/Cr378sI3uTWc/rxntN9lLUcb/qMjWK86PtMHWP84MMsjZDZ0dqS4Moi2eg9Gn/raPHzLsWPA2ZKMH4w4+9S/HTo+HmTxg88j1+/icYP3qTxtw43v5e+H1yv+b3J1G/m/N5nqX6rQh/8dRH3+m1EOAWeRfXbs6h+GxEKfcTVlT5PkT6e3w9+CunzlKX9eZr08dw/eBrp87RFnymkj8f3s8T3T6cgfaZk479/Sv2DdN///Ifix7M+/0Hx858svd/Y8devIn3SWr/dT/Wb5/i5H9Vv91v6b3eTPp7Xr7o7a65fdXc2fn7VPaSP5/vTe1D83GOJn7um6zMnkD7Vx88coPSZBUT8dC3wOzN0hkfhKZD6dIMpcBeKn7uQPt2hC/SGuUDHz4TC86E+LfQULhq9Hdjp68jghGz0Hj2f62jz428r1G+3ZUmfaH1uy9rnxwsmXebH34bmx99maX/OrWv/YIGW5oifAS3u/YNzUf/gXHp+Wmd9TuL1/34W6VN9/60zL3f/cxyLuv+R+qj+m+39knNoflWC6OGwag5m3Mb/X/Tt2gThwib2ceOf6re0fl/mLBrf8Tw+ehbqv51F/bcOHT+nU/x4jp/TUfycTvHToZ/PnUzx4zl+TkbxczLFT4eOnxMofjzHzwkofk6g+OnQ/betKH486sMyU2ArFD9blZn/tkKL1me/kLddFYh0vzAa8dbGh1l+mTf10ftmzrRj/rS1HLvKX3psTPHj+f2fjVH8bJyNf/9nI9KnCn2usOpzS+T8+I2QPhtZ5seLdf6vDuj7C/6+v2B+XaEcu/j7CxtS/HjuX2+I4mdD6l936PeD1yzEzyq0vqWn/sGaKH7WtPQPVi08X12N5id6wqrZ6D16ftoRxg9K5+8QqscaETXPmonUSCvS/J0asVNY2XHMuI3/5al/XUX9tk5Lufd/1mpxmf+2PHp/YXnL+z+E2jCS1evK67ZQ/2BGvD9X2fzRJah+8/z+3BLo/mcJGj/o0OMHAyh+POszAMXPgGy8PguSPp7HdxZE+iyYdfm+M+mTjvVDNmkpbn/6UPx41qcPip8+1D/o0PPf5qP48Rw/86H4mc85fmh9ivqtT6H0EetTxN2flq5PQfD9fiOB9CH41ae2/kFbptb25+QMbn9OyiTT/pyYmVH9gxMyyayfeFtI+lSuz5AWmz7btkSu7xKa+twWxutzY6jSG8NoxFsbH2b5Zd7UR++bOdOuzlcepr95ddMif8eFKh0XRiPe2vgwyy/zpj5638yZdnW+8jD9zaubFvl7bajSa8NoxFsbH2b5ZV6zf0ag982c9tDnKw/T37y6aaHeVjIYk/AKLMNpJmKiWCdhfUaQPolir4T12Y70SRQHJqzP9kifuWl+YhXYoYb/45hxG/8rUT+hCtTCGj6X+K83dqT2It3zr0mfVGNnD/rQ8+0kx6/PzcS//zM64z7/oBv136rAbtaY2TXSAzNu43/OJtWnlnLPmS0+W++rXPT1sUVey/avofotresjzd6k8VNLuWfPFp+t91Uu+vrYIq81O8VPB42fmWh+ouf5ozOh+YkzWb6vOTPp43n+6MxIn5lp/nWHrt8Cih/P72cFKH4CS/3Gsipl2WjEWxsfZvkVZxryaHHOtGP+tLUcu6XnU/xUGj8jrfPfkvr+3O+F+YkH0vpVFehzmvX9xujvzwnGtT6/W+YnTgtlGg+7R2PDLL/Mm/rofTNn2tX5ysP0N69uWuTvL/T8zjMw4278J9n+zJah/lty7Y/CIfQUMJX4stA/OCqk/oGf/sGXqH/wZeh7/IDqt3rUb0dQ/ZZKvEv1m+f67V1Uv71rrd9uyV9pfCa5+u2ODlu/Tcgkt/7b7XlGf80fuy0j1n+7NVO8/tvNmej138Zm9Pv1b4Y0vuP3+cKb6P3GNy3xs2HoAle/ZoDkQqRiE+vzlbKkrOV5Kz4a5SWwQegCV79mgORCpHLT3OCc2uxsRnkJrB+6wNWvGSC5EKncNDc4pzY7m1FeAuuFLnD1awZILkQqN80NzqnNzmaUl8C6oQtc/ZoBkguRyk1zg3Nqs7MZ5dX+9mSo0nXCaMRbGx9m+RVnEv3C0YE8KnlcJ3wo0Lxqjs3raGvx1U2L/F07VOnaYTTirY0Ps/yKM4n+4dmBPCp5XDt8MNC8ao7N62hr8dVNi/wdEN6SGRCOz290fxp9f5pnCN3/DAjV/anIyftTkRP3PwNCcX/6YeT96YDQvD8dEMbfn64ZusDVrxkguRCp3DQ3OKc2O5tRXgJrhC5w9WsGSC5EKjfNDc6pzc5mlJfA6qELXP2aAZILkcpNc4NzarOzGeUlMChU6aAwGvHWxodZfsWZ4u+MQB6Ve4PCRwLNq+bYvI62Fl/dtBRW9+EucPVrBkguRFrMitx/K9DW8ry5sSn16cJd4OrXDJBciLSYFb2vrGIb1WJjszy7Up9FuQtc/ZoBkguRFrOi95VVbMe32Ngszy6ef3B3hp7/pPH7Mq/T/ETPwIzb+D+3YD+B5od4wrlh9B69f9oxv09L7U9a259Xqf3xDMy4jf8Xaf5OnefvnNSC5++8iObvvGiZv/MC6eN5ftULSJ8XLPo8R/VbFcDzR8v2uDJRFsH4AxlzLw4n5O1nBSeE8RB+BMyFyaHJ0JmB4tVMzXPVcXy02EJRUB+cEyR5tSkFnc70dH96eoe8Dz6jJbn6bQqq36bQ/WmHfv+H2p/q2h8jtgLdchS3P5rjatufO6l/7Xl8507Uv74zjF/fZSLp4/n+ZyLSZ2JI61d15PWrCIk/P0i0h3o51W+e4+dyVL9dbml/LiN9PLc/lyF9LqP2J2X6xLU/57cU63MhxY9nfS5E8XOhJX5+4b9wmcbB7tHYMMuvOZObtuGc5rc6NuX5P/OfuUzjYPdobJjl15zJTdtwTvNbHZvy/B/4D1ymcbB7NDbM8mvO5KZtOKf5rY5Nef73/Hsu0zjYPRobZvk1Z3LTNpzT/FbHpjz/Lf4Wl2kc7B6NDbP8mjO5aRvOaX6rY1Oe/y3/lss0DnaPxoZZfs2Z3LQN5zS/1bEpz/+Gf8NlGge7R2PDLL/mTGxifZdSL2lV/FbHpjz/a/41l2kc7B6NDbP8mjO5aRvOaX6rY1Oe/x5/j8s0DnaPxoZZfs2Z3LQN5zS/1bEpz587nDuUaRzsHo0Ns/yaM7lpG85pfqtjs/B9urBbKNM42D0aG2b5NWdy0zac0/xWx6Y8f55wnlCmcbB7NDbM8mvO5KZtOKf5rY5NeX7XsGso0zjYPRobZvk1Z3LTNpzT/FbHpjx/rnCuUKZxsHs0Nszya87kpm04p/mtjs3C+9thl1CmcbB7NDbM8mvO5KZtOKf5rY5Nef5X/Csu0zjYPRobZvk1Z2IT96elXtKq+K2OzcL6/vxLLtM42D0aG2b5NWdy0zac0/xWx6Y8/x3+DpdpHOwejQ2z/JozuWkbzml+q2NTnv85/5zLNA52j8aGWX7Nmdy0Dec0v9WxKc//jH/GZRoHu0djwyy/5kxu2oZzmt/q2JTnf8o/5TKNg92jsWGWX3MmN23DOc1vdWzS/Kra5u/Ef3/huOnzd8T6lmr+jv7+Qi+I/v4Cb9PrWy4ausDVrxmAuRjJ6seb0GeR0AWufs2ASriojTe9gl8l6wc2O2xcPBIkxZtcv9kFrn7NABsXDwZJ8SbXP3eBq18zwMbFQ0FSvAl9BoeDQ5nGwe7R2DDLrzmTm7bhnOx/Vc+mPP8j/hGXaRzsHo0Ns/yaM7lpG85pfqtjU54/PBweyjQOdo/Ghll+zZnctA3nNL/VsSnP3zbcNpRpHOwejQ2z/JozuWkbzml+q2NTnj8sHBbKNA52j8aGWX7Nmdy0Dec0v9WxKc8fGg4NZRoHu0djwyy/5kxu2oZzmt/q2JTnDwmHhDKNg92jsWGWX3MmN23DOc1vdWzK8z/hn3CZxsHu0dgwy685k5u24Zzmtzo25fkf84+5TONg92hsmOXXnMlN23BO81sdm7SSRBIYyWq/xkW09niq9bmY9EkRTkWKXlKBNq/CXOw1eANeh7+hK3sT3oJurDt7D2Zh78PbMDebh/0L/0APFsK8LAs5mI/1Yh/CnGx+9hG8Ah9Db/YJ9GEvwqfQl/0B/Vh/9hJ8Bp/DO7AA+xM4DGALsoFsEAO2EPsCFmaLsJnYlzAzW4wtyhZnS7DvgLEl2VfwNSzFlmbLsG9gWTYry7Dl2Gzse1iercBWZCuxldlf8C2sylZhP8BqbHW2BluTrcXWZlPhR3gZ1mE/wbpsPfYurM/+Bxuw2dnP8BxsyDqzgG3ENmE92QuwNRvCNmWbsedhc7YF68R+gS3ZVmwbNph9AEPZMDYNtmUtbDj7FTZmv8EI1sq6sO3Y9ux32IHNwfyquXDoAle/ZkAlXNTGW/s6F9RP8AzMuI3/20kfz8CME/8dF5e1mPOr5gSaX1X9/Ko5QM2vmgXE/KquhflRM0Nn0POrukH8/Kru0AV6w1wg51etyWn+W5rXV16W9Em1PiuRPqleH/YM0qcu+lzN4vW5krl9P+sk0sdz/Ixzip+xBX02IX08fH/uRlbt9+fOEW9y5Ugfv+uPCsa1Pu/kovsHt+b1eZv08fz9xreRPm/nouPnZrFSHOnjWZ+3kD5vxehzY16fN3M0juIXmPE4/m/K6/MGxY/n+HkDxc8bMfFzQ16f10kfz/q8jvR5PUaf6/P6vEb1m2dgxuP4vyqvz6sUP57j51UUP6/GxM8JeX1eofjxDMx4HP/r5/V5meInwfiZxOz3py+j+Hk55v70mrw+L5I+nuu3F5E+L8bUb4vk9XmB6jfPwIzH8X9eXp/nKX48j789j+Ln+Zj67dy8Ps9R/HgGZjyO/9F5fZ6l+PEcP8+i+Hk2Jn7OyuvzDOnjWZ9nkD7PxOhzel6fp0kfz/23p5E+T8f0307M6/MU6eN5fshTSJ+nYvRpy+vzJOnjuX57EunzZEz9dkRenydIH8/6PIH0eSJGn0Py+jxO+njW53Gkz+Mx+uyT12cK3f94BmY8jv+98/o8RvHjOX4eQ/HzWEz87J7X51HSx3P/+lGkz6Mx/bdheX0eIX086/MI0ueRGH1G5vV5mPTxXL89jPR5OKZ+2zGvz0Okj2d9HkL6PBSjz+C8Pg9S/80zMONx/G+W1+e/pI9nYMbj+N80r89/SB/PwIzH8b9RXp8HqP3x3P48gNqfB2Lan3Xz+kwmfTzrMxnpMzlGn7Xy+kwifTzf/0xC+kyKuf9ZMq/P/aSP5/i5H+lzf0z8DMrrcx/p41mf+5A+98Xos0Ben3up/+YZmPE4/vvl9bmH4sdz/NyD4ueemPjpRe9vp3p9ilNJn1Trczzpk2p9tiV9ZkD7E6cPbn/GkT6p1ucy0ifV+lxO+qRan0tIn1TrcxHpk2p9LiR9Uq3PKNIn1focRfqkWp/9SJ9U67ML6ZNqfVYjfVKtz4KkT6r16UP6pHL8Ws0PWYr0SbU+h5I+qdbnYNJnBsx/c9fnatIn1frsSvqkWp+dSJ9U67M26ZNqfVYnfVKtz7x5fUbR/FHP+oxC80dHxby/0JPiJ9Xz327J63NEIX7+YKSPn/G3I1D8HBEz/3osxU+qx0evI31Src+1pE+qvw94JelTN30gU04flqlEnyvqos9sGdLH9v3g2TMu9dulpE+q9VmZ6rdU3/9cTPp4bn8q0+cC0qdu+nTL1N6/Pj+vT38af/McP/3R+EH/XHT8jKH4SeX4tdLnbNIn1e3PmaRPqvvXp+X1mZXanyr16ZtP+4HS51im9emZ3/pOj59jmNbn+Hz8zNre/vSC+WE+eCy/Z+ozKh8/vcXMURD6nELxk+r7n5Pz+rRS/Hgev25F/bfWmOc//0fxk8r+20IZqc9xeX3+yJI+fuNHMK71+SNr6rNIxoyfYyl+Ut3+HEP61EWfpTKmPktmqtXn6Lw+U6l+83x/OhXVb1Oz0focSfEzg+5PxzCX+9PD8/p8SvGT8P3pD0zcn66Yj59f88e+Z+b96S/5+Pm0PX6mMnl/+mk2+v70MIqfVI+/HUj6pFqfg/L6vEH1m2d93kD9gzdi+gcHUPyk+v2F/UmfGTB+LfVR49dYH9w/2Jf0SXX7sxfpk2p99iR9Uq3PHqRPqtuf3fL63Dm9fz0nkD7V6zMHKH1mAaFP10KEzAydQevTDabAnVlTnztR/7o7dIHeMBdIfXam+En1+NsOdddncKY59BmSqcf7Wdtz+lpSsugBSV5tO6rfUj1/dATpk2p9hpM+qb7/GUL6pFqfoaRPqufvbEP6eNbH7f3tPQrzE7cmfVK9PsVWpE+qn89tmddnlcL4274Z0sdP/KyCnm+vko2Ony0oflLWPxiJ5l9vTvrU7fnCcaz25wsbkz6pfv6zYV6fBWh+VZ37BwcXzY9fALU/C2Sj+wcbUPykrH99OGp/1iN9Uj2+sw7pk+rxnTUSfz53TKaxnrcdW3V5jk6AiVUTip+2TK3xc3IGx89JmWTi58TMjIqfExJYH6k/1W8J68PblD6nJaDPKqRPXeLnXPT+6Zkl75+Ozri1P8vn9elE9z+e+2+d0P1Pp5j3S5aj+En1/INlSJ9Uz09cOq/PzyHNWqsvLi3qaWPG4/hfgtZXTnX8LE76pFqfFdv1uSUff+MzyelzR4fVZ0ImuecLtxfWP7gtI54v3Jopfr5wcyb6+cLYjHy+sJgRP3fT8+069d8mZqqdf7Ao6eNBn3uq1meFvD7Ph9S/ru/zn/szuP0RjGt9ng+j25+F6f2SumFy7Pj1A06j2wvR/Wnd4ufBTO39t4F5fSZQ/eZ5fGcCqt8mhNHjOwMoflL9/LQvtT91w6MJPD/tndfnUqrfPNdvl6L67dKY+m1+qt9SNr/qCTS/ar68PmFh/fgrWkgfd31OC6rvvwnGdf8tjFk/XmDz0AWufs0AyYVI5aa5wTm12dmM8jLupqh+S1H/TY3vCGTp+xie258s+j5G1lK/EdI7viNweijTeNg9mgeSC8yhPGpaTA/Nn+mredfsmhZ1Nj2fq8fzuQ8TeD6H+wc3tDS7Pv76B+NaovoHY/OW61qK2x/qH6Sp/3YT0ofqt3TXb6QPtT9Uv1Xb/vxWuD+9ncbfPI2//YbG335zuj+l/kFax3d+p/Edz+M7v6Pxnd8pfjrs823Sp37fN5vGor5vJvVR3zeLWz+E9KH4IX1q0+cH6h9Uoc8lQfX6/ID6Bz/kSvW5LKD4SXP83G3cn44MZRoPu0djwyy/zJv6qKOmxfQo5k9by7Gr/KXHPqFM42H3aGyY5Zd5Ux911LSYHsX8aWs5dpW/9PiO2h/P7c93qP35jtqfFLU/45zan7HG+M6BoUoPDKMRb218mOWXeVMfvW/mTDvmT1vLsav8KX78x8/9LS7xc18Lza+aMZjUQhykelackz4PlHhR/ZbG9f0F3qP+dV3619Hri72H+tfvFfrXD7aU719/SPp41udDpM+HBX0ejtDnI9LH8/PTj5A+HxX0eaSl/PPTHpz0qVyfHsabuz14/PqWxfHTg5vrW/bgpe2PuLrSZ3Th/dPRIenjp34bjd4/HR3Gj++cXdDnbNLHU/12NtLn7DB+fsjBObor8QvMeCX8vwpzsdfgDXgd/oau7E14C7qx7uw9mIW9D2/D3Gwe9i/8Az1YCPOyLORgPtaLfQhzsvnZR/AKfAy92SfQh70In0Jf9gf0Y/3ZS/AZfA7vwALsT+AwgC3IBrJBDNhC7AtYmC3CZmJfwsxsMbYoW5wtwb4DxpZkX8HXsBRbmi3DvoFl2awsw5Zjs7HvYXm2AluRrcRWZn/Bt7AqW4X9AKux1dkabE22FlubTYUf4WVYh/0E67L12LuwPvsfbMBmZz/Dc7Ah68wCthHbhPVkL8DWbAjblG3GnofN2RasE/sFtmRbsW3YYPYBDGXD2DTYlrWw4exX2Jj9BiNYK+vCtmPbs99hBzYHq1WfWwP6P5pmnIoUntJC8ZOu+KlqXIj61zT/jfSpQp/X+GtcpDIXhXhr48Msv8zfG7zG7wruDO4P7g7UceU1Ibgvf+yeIIq38UH8X5sYqOtR/FD9RvqQPqQP6UP6kD6kD+lD+pA+pA/pQ/qQPq76EJLDK4nOEX2aP81FKnNRiLc2PszyR3FR7ngtvEl9XuYvc5HKXBTirY0Ps/xRXCg2k+KNaiJ/uC32mfarNGs+cdybZ1w9Xyi2iecLvO2eSE3Gt1tei1RlYkDPT9PUf3ujhfrXadbn7Rh9nuJPcZHKXBTirY0Ps/xRXJQ7XnxsclDJ36T4SUf8vNtC96f+8B71xlKN90mfVOODOuhD7Q+t/0b6VPN+8FH0fqPn9XeOQu83HmVZf+fwdn02CsUWjXhr48Msv2TLhDxanDPt6nzxKxjXXofnzKubFvl7GOnjWZ/DkD6HWfQh1IqPqT+danxSV312of6B5/eDd0H9g10s68fvnPe+KiB9/OmzM9JnZ4s+u1H8eNZnN6TPbhZ9ds17f95C+vjTZ1ekz64WfXag9Q88AzNu43841W+e42c4ip/hlvjZlvTxrM+2SJ9tLfoMK+jzDX3fzJM+w5A+w+j7TPR8gfSpsz68bTvqx9Ud1XNM8UP1G82vqub9n+2pXvMMzLiN/9VIH8/AjLvxT/VbWueHrNSu336h2KIRb218mOWXeVMfvW/mTLt5vmBce62UK2ZX+VP8zJj1le3xY87fWZHan2rmHFjXeP0w0gMzTvz7xqeJrs+7AunnGZhx4n/G4MOEomjZnEqXzUUj3tr4MMsv85hDtW/mMMf4XNPfvLppof5bWu9/fja+DziAnp/WRZ/o/vUA9HxuQC5+fHQQ6eNZn0FIn0EWfXrnvX+jGcQe0TsXvUfjbx3t+c/81P/2DMy4jf95qf3xPH9nXtT+zGuZv9OT9PGsT0+kT0+LPl0L8fUn9REqwGnW0YHJmSiLYPyBjLlH/YOO+3xuroJ+f1P8eMJcuei9UnSm9qem+BnJKm1/OqP2p7Ol/ZmD9PHcP5gD6TMHzb/u0PPfZqL48dw/mAnFz0w5mj/qb37Ir0HS80Mk9g7FFo14a+PDLL/MY/bUvpmLYte0SgtmVx+l+Em6ftPxE90/iIuf0v4Bo/FRz8CMV8L/nzwJZFqTuU5aUas+1VyB6re01m/ZLNU4foEZJ/47ElpaiYM0o7VEn18pvjwDM+7GP/UP0jo/ZCda57ImzFRxi4EZt/G/TajSbcJoxFsbH2b5FWcmh+qItmufUv60tRy7pi68bYtQpVuE0Yi3Nj7M8ivONORRncM+pfxpazl2TV142/+y1P74fT4nGNftz/+y8fenP5E+nvX5Cenzk0Wfbwr6zNpK+rjrc5r1/eAHM1H6CMbHMKXPN1l6vt2R+9dfU/3muX77GtVvX1vi53PSx4M+twVan8+RPp9b9PmC9PEcP18gfb6w6PMRjb85oHOC48qY8Y9o/K1Dz397j+LHAXMmGD+Y8fcofjp0/LxF/QPP/YO3UP/gLUv/4G3Sx7M+byN93qbxgw69/tvzFD9V6DMirC5+RoRT4HkUP8+j+BkRCn3E1Sl+ZlT9Vtn8txfb40coNiKMRry18WGWX+ZNffS+mTPt5vmCce31YraYXeUvPZ6j+s1z/DyH6rfnLP2DZ0gfz/o8g/R5xqLPwaH4fqNIDw6jEW9tfJjll3lTH71v5kw75k9by7Gr/As6UfxUET/ztlb6fK5na4/WSTAu379+HMXP49nS/vVYY/2DQ0KVHhJGI97a+DDLL/OmPnrfzJl2zJ+2lmNX+UuPhyl+PD7fFvHzMIqfhy3x81/Sx3P/4L9In/9a+gcPkj6e9XkQ6fOgRZ/JpI9nfSYjfSZb9JlE+njWZxLSZ5JFn/vo+WlNGMkqPQMzbuP/Xoofz/FzL4qfey3xM5HixzMw4zb+bynY+9D6fDWiryODt2Sj90pxM8WPZ2DGb3aevzMnUPtT/fydOUC1P7OAmL/TtdB+zAydQbc/3UA9n+sF5ebvdIcu0BvmAj1/h56fpnt9WNIn3frcUehf35ElfaL1uSNrfz9LMOnyftYd6P2sOyz969sL+txO+sToc3vWHj+3Z93uf25H9z+30/y3OtdvJ3Fqf9Lcf+vM8fxr3ib6b8dN18ecf308i++/lc6/vpDGdxKYPzqo1X3+6IWofrswGz9/dAzpU4U+C7dGv78g46dvJip+xmTN+BmTjY+feUOVzhtGI97a+DDLL/OKMzF+rY5jy/QvLJXwZ2NTndP+XQxOIy7JwYVN7GM7YzSNv3kGZtzG/9mkj2dgxm38n0n6eAZm3Mb/GaSPZ2DGbfyfSv1rz8+3T0X3P6daxndOIX0863MK0ucUiz4nkj6e9TkR6XOiRZ820sezPm1Inzan8WtC0lgyoRVH9mt/P4vip7L42a/K97f3C6e0n6vjZ7/QjJ/92t/f3s94f/uAkOq3yvU5oEp9DsjrcwDS5wCkzwHt+hxg6LM5tT91WZ8i+vnc5qj92dzyfGEz0qcKfa6oUh/xftZmSJ/NLO9nie/QXR3Q9wH9fR/Q/PpfOXbx9wE3pfjx2L/eNDsFNkXxsymKn02zIn6Eh4qfTUgfj/psktdnE6TPJkifTdr12cTQZ+2CPsvS+uSe1q9aG+mzdtbl+7QUP2mdP7oW1W+ex3fWQvGzFs1P7NDxsxrFT13an1si9VkNxc9qTu0PIR1Ykb6vmWqs1ErrX3fE97MI/tY/cMUqrRQ/9Vg/Ptn3F0ifdOuzFPWva2p/RP1W2f3pUqh/vZTl/nRJ0sfz+MGSSJ8lLfosTPrURZ/o+9OFkT4LZ+P7b4uQPp7HrxdB+ixiGT8YRPp41mcQ0meQRZ+BpI/n9mcg0megpf3pR/p41qcf0qefRZ++pI9nffoiffpa9Jmf9PGsz/xIn/kt+vQifTzr0wvp08uiz7xZWv+t/uu/PQV6/bd50foH82Zd1n8jJIMexCrpQ0iRPnck8H5JW6bW9ufkDG5/Tsok0/6cmKlP+zOkxdY/2LYlcn0+9H7JHaFlfT56/8dz/+12pM/tYf3fb9y45lknmxVdYdOE5rFs0jqj6rfNE/rLt4QqvSWMRry18WGWX+Yxh2rfzGGO8bmmv3l10yJ/bwpVelMYjXhr48Msv8yb+uh9M2fa1fnKw/Q3r25a5O+1oUqvDaMRb218mOWXeWOFlkDvmzntoc9XHqa/eXXTQr3h9GELmj+aamxJ+qQaW5E+qcbWNP+6rvenvE3dn54Wub5/3PxrWn8n3RhM9VuqMYT0STWGlujTndYfrQK7Wb81NywyEjDjNv7nIn08AzM+l/P356j/ltTzhXMz8e/Pjc7Evz9n9t/maNL4qaXcc2SLz9b7Khd9fWyR14r27tyk+tRS7s7Z4rP1vsp1dmRcXivae1aa/+b5+emsaP7brJb5b7OQPp71mQXpM4tFn1bSx/P79a1In9ZsfP+ghfrXnoEZt/Gfyao0k41GvLXxYZZfcWZyqI6YOcxx8dW0f6nVPP+Pwvyq7Wh9vgrqt9Os789Ff59WMK6/T/tHSOuLpat/UNnzhV9DmcbD7tHYMMsv86Y+et/MmXZ1vvIw/c2rmxb5+2ehftuB6rcK4mdkS/Xx8yeaP/on1W8NsX7VTvRkKJX4ulC/HRVS/Pjpv32N+m9fU/3W4eo3U5+v6P0Sz/3rr1D/4CvH90t2pfYnlXif2h/P7c/7qP15n9qfDt3+vEftj+f25z3U/rxniZ+3SR/P+ryN9Hnbos9bpI9nfd5C+rwV0vzrdGJPpx7zOqELXP2aAZILkYqtn8GNzD0UaGt53oqPRnkJrB26wNWvGSC5EKnY+hvcyNyDgbaW5634aJSXwHKhC1z9mgGSC5HKTXODc2qzsxnlJbBs6AJXv2aA5EKkctPc4Jza7GxGeQm8Qe9xewZm3I1/6l+n9fncGLr/8bz+9Rh0/zMmjF//+jWq3zwDM27j/2WKH8/jBy+j+HnZMn7wEunjWZ+XkD4vWfR5ohBfZ7ZQzRONMxJk54kweq8Uj5M+nvF4GL1Xiqepf+AZmPGn6f5nhrQ/0f3ryp6fan1o/fj6rR+v9BHrx0t9yn8fMGr9eIqfpOPnkNa4+NHzQ2zjB//x3D84vaUR+m94/k7ZFiMTZRGMP5Ax9+JwN/UPPAMzbuP/LtLHMzDjd1H/rUPPfyN90q3PlVS/eQZm3Mb/FaSPZ2DGbfxfTOPXnsevL0bj1xdbxq8vIn0863MR0ucien+hDvos3Fo8vnMs0/qI8Z3jputzDNP6HM/Kje8c3ar0GZXvH/TOH9PjOx/wD7hM42D3aGyY5decyU3bcE7zWx2bhfez+PtcpnGwezQ2zPJrzuSmbTin+a2OTXn+v9wFrn6EJEF93RmBU5m5d4zlLYbbSCXPwIzb+M/lqP/mt38tGNf961yO+tcdev0dih/P83s5ih+ei5/fe0Yo03jYPZoHkgv0dLVw1LSYHpo/01fzrtk1LfJ309AFrn7NAMmFSOWmucE5tdnZjPIipAOjaG2dOuL4mtk9nmIl1TiO9Ek1/o/0qSO6F40A/F9rrVcgJIluReye0FrrFQhJomsRu22ttV7BxEmhTONh92geKC5MDk2GMK8qNc9Vx/HRYov8PTGUaTzsHs0DxYXWBzOEeVWpea46jo8WW+TvJqELXP2aAZILkcpNc4NzarOzGeUlsHHoAle/ZoDkQqRy09zgnNrsbEZ5EdKBE2N6FH/Q8wXPz+f+QM8X/qDncx36+dyfFD+en8/9ieLnT8vzuV9yVP9XjlpYw+farvQ/0qcKVMrabUHUucR/+nEKPZ9L94zFGH32D2UaD7tHY8Msv8xjDuVR02J6FPOnreXYVf7SY99QpvGwezQ2zPLLvKmPOmpaTI9i/rS1HLvKX3ocFKr0oDAa8dbGh1l+mTf10ftmzrRj/rS1HLvKX3rsFap0rzAa8dbGh1l+mTf10ftmzrRj/rS1HLvKX3rsGap0zzAa8dbGh1l+mTf10ftmzrRj/rS1HLvKX3rsEap0jzAa8dbGh1l+mTf10ftmzrRj/rS1HLvKX3rsHqp09zAa8dbGh1l+mTf10ftmzrRj/rS1HLvKX3rsGqp01zAa8dbGh1l+mTf10ftmzrRj/rS1HLvKX3rsFqp0tzAa8dbGh1l+mTf10ftmzrRj/rS1HLvKX3p8QuPXnsevP0Hj158Uxq9Pby0/fv0p6eP5+dynSJ9PC/qc0Vr++VwPTvpUrk8PY8ZaD16sz7mZuOdzPfjojNanBy99/iOurvT5mOLHc/x8jOLn40L8nEXx0yHjh+Yf1Bo/lerD20x9bOvzvU/P76rAbjWsQowZt/F/TmF9sXPo++ie2p9z0Ppi51jWF/uD3m3wDMw48Z/u9XfOscw9eJPfHohUbNGItzY+zPLLvLk+n9iX6/OJ3A9MrM8nPH7NH/ueHcP0ub8wdYWpTKzPV/x3RuXtcn2+Nwtx9Tp/nYtU5qIQb218mOWX+XuD1/ld+e3+4O5AHdde9+WP3RNE8TY+iP9rEwN1Pd72JH+Si1TmohBvbXyY5Tfzdwbm8VKWquNtYqCul+978Ce4SGUuCvHWxodZfjN/Z2AeL2WpOt4mBup6+X4cf1zcrXKZi0K8tfFhlj+KC8VmUrxJfabwKVykMheFeGvjwyx/FBeKzaR4K9wh8ce4SGUuCvHWxodZfjN/Z2AeV5YJQTxv44P4vzYxUNfL39vyR7lIZS4K8dbGh1l+M39nYB5XlglBPG/jg/i/NjFQ1+Ntj/BHuEhlLgrx1saHWX4zf2dgHleWCUE8b+OD+L82MVDX420P84e5SGUuCvHWxodZfjN/Z2AeV5YJQTxv44P4vzYxUNfjbQ/xh7hIZS4K8dbGh1l+mb83eCh/f3pnIO5P1XHlNSG4L3/sniCKt/FB/F+bGKjr8bYH+YNcpDIXhXhr48Msv8zfGzw4XR91XHkJfR7M6xPF2/gg/q9NDNT16PlcUt8/reX7GPr5Qun3MV7iL3GRylwU4q2ND7P8UVwoNpPiTerzIn+Ri1TmohBvbXyY5Y/iQrGZFG/0JKZ6nJfoG6NjYq42mbvA1a8ZUAkXtfFGcVAtJlTI3W1Bklcj+K3fzo+52v3cBa5+zYBKuKiNN4qDdMTPBTFX+w93gatfM6ASLmrjjcYP6jF+IOfvTGN6/o4eP/hl+viBnL8jxw8uivm+Jukz4/W5hPRJtT6XxehzLM2P9wzMuI3/o+n9rLq8fxr9fsnR6P2soy3rJxLqg8un95mvoNXdUogrp6tyVU367EP1m+f3f/ZB9ds+lvWV9857X91K+vjTZ2+kz960/nWHW//a1GcI9a89AzNu438w6eMZmHEb/0Opf+C5/RmK2p+hlvZnG4ofz8CMu/FP8ZPW/sH6VL/VRZ8bW6P0EYyPYUqf9XPx+qxb0GfdHOnjp/1ZF7U/6zrd//C2H6kdqjuI47Qifn7VzTEjdKtQ++N5fctVUP22iuX5wsqkj+f2Z2Wkz8qW9me5nEqXy0Uj3tr4MMsv86Y+et/MmXZ1vvIw/c2rmxZqFdKCW+kJXrp7DzH6LEjtj+f2Z0HU/ixoaX8WJn3qok90/21hpM/ClvGDhUgfz/GzENJnIXp+2qHHR/tQ/HiOnz4ofvpY4mc+0sezPvMhfeaj+q1Dfx+9G8VPXcbfbonUpxuKn25O83tJn7TGz5wUP57bnzlR/MxpaX9moXG4qnBvvg5S6yOVvC8f3Jc/dk/EM59ZcuMDc6/UY6Jhn5n08QzM+Mw0f8dj/fZrYK/f4tqf0votQ/HjGZjxDMVPh46fXJb+R/sFZtzGf0D1m2dgxgOq3zr0+DWn+s03sjF7hFTjfpopkmpMKtHnd4ovz8CME/8dCZNL4ufnLPXf/I5fC8Z1/+3nbPz96bekj2d9vkX6fJul59sd+v6H9PEcP5WNv31J9Ztnfb5E9duXVL+lfv3EuO+XfEz9b8/vN2LG3fin+Elr/LxP8eM5fjDjNv7fof6B5/7BO6h/8A71Dzp0//plip8q9BkRVqfPiHAKvIzi52UUPyNCoY+4utLnBdLHc/y8gPR5wVK/vUT6eNbnJaTPSxZ9Ds3H0lWBSA8NoxFvbXyY5Zd5Ux+9b+ZMO+ZPW8uxq/ylxzxcbBQ/lcWPYK2a8dFx+fsfca6On3l46fjoWOP9hbm52EifyvSZuwZ95kb6zG3Rh/rXPp8vjHN6vmDqc3io0sPDaMRbGx9m+WXe1EfvmznTjvnT1nLsKn/p8Qj136qIn3lbK42fJ1ufaJXx8wjqvz2SjY+fh0gfz/3rh5A+D1n61w+QPp71eQDp84BFn1tp/Nr3amLZ6L1SjC3ET5+WF1opfqp//jMH9G2R8TMLiOc/zxRaqJmhMzwKT4GMn24wBca2x08vkM9/xqL46Q4vtvaGuUA//7muoM91Warfalv/QDDpsn7Vdah+uy4bv/7BtQV9riV9atTnWkd9rkX6XGvRZ3xBn/GkT4w+47P2/sH4rFv/YDzSZ7ylf3Ax9d8SiJ9XW93X57sY6XOxJX7OI32q0Gfh1uj5IbxN9A/6TtfHnB9yfF6f81D/4Lxs/PyQi0ifBO5/3iiJn9dbo+q3i1D8XGSp3zpz0qdyfQRrKn4683LxcxyLip/O3Iyfzrw0fjpzHT/nU/x4Hj84H8XP+TR/x/P8RFv8yOcLKn5s8xPnC1U6XxiNeGvjwyy/zCvORjJlkzxqi9KnlD8bm+ocgdOofvNcv52G6rfTLPXbSaSPZ31OQvqcZNHn/2j82jMw4zb+jyF9qsA7NawjgRnXe++3fkCrU3jAh4myvCW1Px7bny2zU2BL1P5sidqfLbOi/REeqv3ZgvTxqM8WeX22QPpsgfTZol2fLQx91iF9PPff1kH6rEPjBx16ffJ1KX48f19zXRQ/61qe/6xB+tRFn+j4WQPps4ZFn9Xp/sczMOM2/lcmfTwDM27jfyXSxzMw4zb+V6D2x3P7swJqf1bI0vd/OvLzOUJtGMnqdeVP28fxlsmqdJlsNOKtjQ+z/DKvOBP6YB9lUTyX8lfMZvl9efbS1P54Ht9ZGrU/S1vGdxYjfTyPHyyG9FnM0j9YlPTxHD+LIn0WtcTPQqSP7+9vI30WsujTn/TxrE9/pE9/iz69SR/P+vRG+vS26NOTxnc8AzNu478H6eMZmHEb//OQPp6BGbfxPz6k9sdv+yMYN95vDC3rH4QqvTWMRry18WGWX+bRGgbT982caVfnKw/T37y6aZG/N4cqvTmMRry18WGWX+ZNffS+mTPt6nzlYfqbVzct1BKkE8NbiIM0YwTpk2psR/qkGtsjfa4NVXptGI14a+PDLL/MYw7VvpnDHONzTX/z6qalsH5VqNKxYTTirY0Ps/wyj9YAm75v5ky7Ol95mP7m1U2L/L0hVOkNYTTirY0Ps/wyb+qj982caVfnKw/T37y6aZG/14cqvT6MRry18WGWX+ZNffS+mTPt6nzlYfqbVzcthfXfQpVeF0Yj3tr4MMsv86Y+et/MmXZ1vvIw/c2rm5bC/FK6T61mjm6Y1Lm2K61I+lSBWljD59qutALpUwVqYQ2fa7vS8qRPFaiFNXyu7Upd6fmcZ2DGbfx3aVJ9ail3l2zx2Xpf5aKvjy3yWtHes9H8Hc/PT2dD83dms8zf+avwfPvzVtLHXZ+RLdXr8xd6vv1XSO/Xd+T3638LZRoPu0djwyy/zJv66H0zZ9rV+crD9DevbloofjpC/PxD86s8v1/yD2p//gnp/dOOFj9m/+Abih/P/etvUPx8Y+m/fUv6eNbnW6TPt9S/7tD12wcUP57j5wMUPx9Y4udD0sezPh8ifT606PMO6eNZn3eQPu9Y9FkrdIGrXzNAciFSuWlucE5tdjajvATOp/jxfH96Poqf8y33p+eRPp7rt/OQPudZ6rdXSB/P+ryC9HnFos9ThXruTJo17wlPhdF7pXiS5od4Bmbcxv8zpI9nYMZt/D8Q4l9CHEvJX8t25ckh/iXEsZT8tWxXnlTov00K5wTqv9Xy/XrVf5Pfr+9a6H+Vfr9+UmiuPzopxN+v7wL4+/X3Uv+6Lvent0SOX9+L+tf3Wu5P7yF9qtDnNKs+Z0fe/wjGxzClzz2W+58T8t5nBSI9IYxGvLXxYZZf5k199L7I/dSqeNV2df4u06+g/c2r79K+t4vh8SDdnzrgjATZeTCM3ivFf0kfz/hvGL1XikeoX+0ZmHEb/9eQPp6BGSf+049pMV/kvIT6156fL1yC7n8usc0P4R9ymcbB7tHYMMuvOZObtuGc5rc6Ngvzr7kLXP0ISaL9OTmn+s3v/APBuK7fgMeP7zDSx3P7w5A+jMe3PyeLd4JaTw7jIfwImAvNP2ZI82qm5rnqOD5abKF+bVowyqqFqN9uaEmmfrsjQ/WbbX78uJao+fFj85brWsq9v0D6kD6kT6X6tIUyjYfdo3mguND8Y4Ywryo1z1XH8dFiS2F9ihz1r/3e/wjGjfUpcvH3P3+TPp7vf/5G+vydi7//2T4Umw0uPs2HaPbkUW3DXm5sSn22C8Vmg4tP8yGaPXlU27CXG5tSn8+ofvNcv32G6rfPCvXb363l67ceNP5WhT49uGa/By/W59xMXP+6Bx+d0fr0KDM+Kq5O79cnFT+V6sPbTH2s79fnaPyrcuxWw2wnzLgb/xQ/aY2fzyl+PMcPZtzG/xekj2d9MOM2/n/nxLZfYMbd+Kf2p7L2Z+HW4vd/jmW6/RHv/xw3vf05hun25/jp6yOp939E+5NtVe3PqHz70zt/TL//8wB3gatfM6ASLmrjjeInuffndPz8wET8TMvv/5rfvmdm/PwyPX6mMh0/uv9WGj+TuAtc/ZoBlXBRG2/t7zdwF7j6NQMq4aI23qgvVS3Oa030ejFXu5e7wNWvGVAJF7XxRnGQjviBTtG2u7kLXP2aAZVwURtvFAfpiB8WEz93che4+jUDKuGiNt6EPvvT+KhnYMZt/B9I+ngGZtzG/0jSxzMw4zb+DyB9PAMzfgA93+7Q31/Ynea/eZ7/tjua/7a7ZX7v1lS/eQZm3Mb/+hQ/dYmf6PXfBON6/bf1LfGzMenjWZ+NkT4bW/TZkPSpiz43tkb1DzZE+myYi+8fbJBT6Qa5aMRbGx9m+RVnGvJocc60q/OVh+lvXt20UEtdC2YrM6Y5S8mxWTvV+nd2aV9/dJf2VS+jEW9tfJjlx+uD8rYzAnlUHBM5uf6oOqLy5nWUFR8ttsjf9Qrtz3o5an/83P+sh+5/1rP0D37KucDVrxkguRCp3DQ3OKe2atmU+qxK/TfP8bMqip9VLfGzdN579k4iXToXjXhr48Msv8yb+uh9M2fa1fnKw/Q3r25a5O+S+d/OnUS6ZC4a8dbGh1l+mTf10ftmzrSr85WH6W9e3bTI38WofvNcvy2G6rfFLPXboqSPZ30WRfosatFnEdLHsz6LIH0WsejTj8YRPAMzbuO/L+njGZhxG//zUP1Wl/Wrop9vz4Pqt3ks61fNTfHjGZhxG//dKX48x093FD/dLfHTQvHjGZhxG/9A+ngGZpz4Tzfm7EQcdBx0IbVSjblK9PktS6z4BWbcxv/3Wepf+x1/E4zr/vX32fjxt+9IH8/6fIf0+c6izydUv3nAbcb9LGbcxv8HpI9nfTDjNv5fo/rNc/32GqrfXrPUb6+QPp71eQXp84pFn1dJH8/6vIr0edWiz5OkTxX6zNta3fj1ODYFnkT6PJktHb8ey7Q+T5A+nvV5AunzhEWfI0KVHhFGI97a+DDLL/OmPnrfzJl2zJ+2lmNX+UuPw/K/VwUiPSyMRry18WGWX+ZNffS+mTPtmD9tLceu8i/MP+Bio/qtsvptHl59/SbONeYf8Pj6bW4uNtKnMn3mrkGfuZE+c1v0GVfoH/RpIX1q61/3bXHrX49D/YNxlv71jVn8S6gWrgxiP9tZg8JBoUzjYPdobJjll/nh03NnBMoyHPkMDxW/NjajvAT6h/1DmcbB7tHYMMsv80On584OlGUo8hkaKn5tbEZ5tc//DfuFMo2D3aOxYZZf5odMz40OlGUI8hkSKn5tbEZ5CXzBv+AyjYPdo7Fhll/m92cy1zMcHCqLzgnL4FDxa2Mzyqt9/ijvzmUaB7tHY8Msv86XZ+UgpiyKXxubUV4C3Xg3LtM42D0aG2b5db48KwczZVH82tiM8hK4oXD/c0OW7n9qu/8RTLrc/9yA7n9usNz/XF/Q53rSp0Z9rnfU53qkz/UWfS6h5wsJ6NOjk/vzuUuQPpdY9OnMSZ/K9RGsqe8zdeaVfd+sMze/b9aZl36fqTPX32e6gOLH8/PtC1D8XGCJH1q/t9bvm50R1Pp9wLjvm5E+tepTaf1WmT6XUv1Wl+9r9s1E6XNp1tTn0my8Pr1ClfYKoxFvbXyY5Zd5xdlIpmySR21R+pTyZ2NTnSNwXJM+9xlQw5tQ/UvO7TP9SF/rdTHjx2X75c9YgN7LSj3eb/2gzFefDm3S+Kml3IdmB3aKupr9utjj0KzYF1t5fQ5pUn1qKfch2YU6RV3Nfl3scUhW7B8SqQ/1r9P9/RLSh/QhfarXZ326P63L+juQidJnfTT+tn42fv2d9Ugf3+uTI33Ws4yPLpdV6XLZaMRbGx9m+WVecSbGD7CPsih1SvkrZrP8PrU/yYyPlh9/S2p8dHGq3zzXb4uj+m1xev7T4fpv1xrvL4Qh6eO3/yYY1/qEYXz/7W/Sx7M+fyN9/rbo8y/pU4U+I1uqb3/+Rfr8G8a3P1NJH8/9g6lIn6kWfb4jfRz0WbZTgutXIX2+s+jzKenjOX4+Rfp8atHnI9LHQZ/lE4yfj5A+H1n0uYD08T0/EelzgUWfZ0N68u8XmHEb//eTPp6BGbfxfx/p4xmYcTf+RftzQ0sy7c9sGWp/bONv41qixt/G5i3Xtej25+GCfme20P9sP3g4jN4rxUNUv3kGZtzG/6Okj2dgxm38X5W3r0Szfz3iqjB6rxQZer/R8/1pBq0vluH0/LSjPT9dpVOxPoQZiVWpfUk1ViN9Uo3VY/T5h76v6bl/8A/6vuY/Oeof1FefHrxYn3Mz8f2D0Rn3+fFf0fcdq8BuNYyGYcZt/H9N+njWBzNu4/9L0sezPphxG/8v8Be4SGUuCvHWxodZ/iguFJtJ8UZRUD0mVsjebUG1V7uPu8DVrxlQCRe18Sb0uYe7wNWvGVAJF7XxJvS5i7vA1a8ZUAkXtfEm9NmDxg88jx/sgcYP9rCMH+xJ+njWZ0+kz54WfTYkfeqiz9mR+gjGxzClz4YWfTYnfTzrsznSZ3OLPpvkVLpJLhrx1saHWX7FmYY8Wpwz7ep85WH6m1c3LfJ3U4ofz/GzKYqfTS3xs1FOpRvlohFvbXyY5VecacijxTnTrs5XHqa/eXXTYv6F9egJax7rppaFDUgfsVYUsdCw2ChS2w0TUJ36B7Q+H+lTjT6LU//a9/pIaHxncUv/OqTv0noGZpz470jYlHqQqcZmJfr8QOvzeW5/fkDr8/1gWZ/vddLHsz6vI31et+jzGOlThT7ztlbXvx6X718/hvR5rMz6ymON9RMfJX086/Mo0udRiz43ZfEvoVq4Moj93M6i+Enr9+cup/rN8/fnLkffn7s8S99vTJc+lcXPZRQ/ddEnun67DMXPZZb4uYL08Xz/cwXqv11huf85nvptnoEZt/G/I31fs2LU9n1NzPiOTt/XpPqNnp+SPtXrQ0gag+lJTqoxhPRJNYYmqg+1P0m2P3j9kGGdalk/5Fi6/6kCw2uIDsw48d9RUP7724c3qX61lPvwbPHZet9+Xewhr3U4RVEHjZ/DmlS5Wsp9WLb4bL1vvy72kNeKPmtkk+pTS7lHZvHZO3XS+7br7tDJ9Ni+k7yW3EzLjoUeyJ75Y7s34b3UntlazsVn79ZJ79uuu0sn02PnTvJacjMtu9L9bWqwR4wWG9DzOc/P5zZAz+c2sDyfWzar0mWz0Yi3Nj7M8su84kx8vx77KItSp5S/YjbL78uzs/T9Oc/fD86i789lLd8PzpE+nr8fnEP65CzfB+Skj2d9ONKHW/T5kfRx0GevBL9/+iPS58fQZX1yQtKYnImzPpBxvc5nFD8O8bNPgvHzGYqfzyh+OnT8EGqeb9ha6xVOibnCY/R9QM/AjD/m/H1aan/SOP/t1FCm8bB7NA8UF5p/zBDmVaXmueo4PlpsKdR9oUzjYfdoHigujPYDMYR5Val5rjqOjxZbqCVIC44lLVKNY0ifVOPoGH2+oe8zVYFavs+EGbfxvxet/+b5+eleaP23vSzrv22RU+kWuWjEWxsfZvkVZxryaHHOtKvzlYfpb17dtMjfLSl+PK9PviVan3xLS/xsllPpZrloxFsbH2b5FWca8mhxzrSr85WH6W9e3bRQK+8H+9NMtlTjANIn1TiQ9Ek1DqpJnzVyKl0jF414a+PDLL/izORQHTFzmGPzOtpafHXTIn9Xz6l09Vw04q2ND7P8ijMNebQ4Z9rV+crD9Devblrk71I5lS6Vi0a8tfFhll/mTX30vpkz7ep85WH6m1c3LfJ3iZxKl8hFI97a+DDLL/OmPnrfzJl2db7yMP3Nq5sWarnTh4NL+hJ/0fslnsdH/0Lvl/xleb/katLH8/qWV6P1E6+2rJ94FenjOX6uQvFzlSV+riR9POtzJdLnSos+O9HKCJ6BGSf+67R+QplRm8ONY0ckPOp2JI3ipRLbZqnctZ+rj9iviz22zYr96LOGNak+tZS79Fx9xH5d7DEsK/ajzxrapPrUUu7Sc/UR+3Wxx9Cs2LedRf3r+q2fWPr+QiXrJw5u0vippdyDs8XzE/XVVO7oTm5/eXBW7A+mXnYRZtz68cWIXz/+yCZVrpZyH5ktPlvv26+LPeS1os86okn1qaXcR2SLz9b79utiD3mtI6h+84xRdL+fahxP65PT90tIH/p+CbU/hBmAE6n9ofaH9CF9SJ9YfY7K37meSm1ZhTgqm9S5eu+obLmrAs3f8bz+KKD5O5Cl9flmBJJan+97Wt/S8/y379H6lt/T+pYdOn4+pvjxHD8fo/j52BI/V9PaSZ6BGbfxv1VOpVvlohFvbXyY5VecmRyqI2YOc2xeR1uLr25a5O86OZWuk4tGvLXxYZZfcaYhjxbnTLs6X3mY/ubVTYv8XTun0rVz0Yi3Nj7M8ivONOTR4pxpV+crD9PfvLppkb9r5VS6Vi4a8dbGh1l+xZmGPFqcM+3qfOVh+ptXNy3yd82cStfMRSPe2vgwy68405BHi3OmXZ2vPEx/8+qmRf7+TeM7nvvXf6Pxnb8t4zv/kD6e9fkH6fOPRZ9rSB/P+lyD9LnGaXyU9Klcn/j3t49jUe9vy+c/6v1t/Pyn9P1t0of0IX1q1WcMPUHN49wUsjCkSWdm11LuISXv/+irqdx5ndz+8pCs2I/+12zdpPrUUu7Sc/UR+3Wxx9ZZsR991ih6s8H3zNJsJfwf3KT61FLug7PFZ+t9lYue34vPldeSW7l/06pN+nyulnKvGhafrfdVLvr62CKvJbdV6VlpHXBBXXt9BzVp/VZLuQ/KFp+t9+3XxR7yWnIrd+4BTapPLeU+IIvPvrCT3rdfF3vIa8mt3Ln7N6k+tZR7/2zx2Xrffl3sIa8lt3Ln7tek+tRS7v2yxWfr/f2s/Td8rryW3Mr9m/ZtUn1qKfe+2eKz9b79uthDXktu5c7du0n1qaXce2fx2Rd10vv262IPeS25lTt3rybVp5Zy75UtPlvv26+LPeS15Fbu3J2bVJ9ayr1zFp99WSe9b7vuJZ1Mj4s7yWvJzbRc2ome/3SE9+d+ovnxnucf/ITmx/9kmR//A+njWZ8fkD4/WPT5nPTxrM/nSJ/PLfp8Qvp41ucTpM8nFn3+pflvnvX5F81/+9cy/22HJu1f11Ju89yRDB+xXxd77JAV+9Fnbd+k+tRS7u1L9NFH7NfFHttnxX70Wds1qT61lHu7En30Eft1scd2WbG/Hc0CmWG4iuYWphpX16TPNk0aWbWUu/RcfcR+XeyxTVbsR5+1WpPOGaml3KuFxWfrfZWLvj62/H87V5CbMBADpT30T7wEbiHkwIkz72lFgarlR73lATn0WktNZFWWlw2W4jSE7siyhINnJGcU5OyaZS72NOYU2m49jPf+8x4e9f3nEsabj/9s7+hXe+0tdPPx5xDPxx9D/3z8S8D/F3A+H/SBPo+4vnNLH5xfNZU94/xe/L5Bn7vrs8fKzwDz3DWNlWhPKdYG+3MT9weN2p9rjP25GvpMrE+t9Klx/uhd7IBV61nb60j6LDJdH/XUvfiO0RL/furn198wF3sKs8u0f/PUvaMYLbHNqzOYiz2F3Waqj6fuLcVoiW1encFc7ClshfmqAf1bRcP7t0rNV1XGfNUm0+fHU/eGYrTENq/OYC72FHadqT6eutek0ccniW1encFc7Clskak+nroLitES27w6g7nYC6y1TWAnvJnO2s5/oA/6N+z/QB/o8//0KTPtGTx1lxSjJbZ5dQZzsZfo32ZpH+j4Zm2XG/qsMn2mPHVfY+WKzaszVtTF/ahlpvp46r7GyhWbV2csqYv7UT9j6LKL')
+goto = unpack('eNrtnQmYFMXZx6drugcEVERY5dAPEIlyRBCNxBPv++B7vKMSFdENasAoBiL6CbIIolyiCAJLAC8ioJB8goCAsFyCFyoeiMitAppIJKJMZsYd2Bn6qK7prq635v97HlZwu2f/+1bVW2+9dSWT/NSLOX+vRuX3qsXisUTMihlVni1xeI/l/f9aef+uGasfS4II4SvxZDIRq8h5soSz3ERKfEneE4tjetnyRiP3e2HaUvd62SlSW/KqvJWAys5G2qujXqpHqQEbAAAAANHRDT2xItyLkgAA5NBb0Cs8yPneQ3nP3W9gpAsAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAsP/9432I3DXHf5d735zfSM07s3FLui7wlXi/kO4fH5CqR/1Tf8qMR13b8WOCrXwQ53uPuz6XVjkk9Wew0ip5eTrzKcMyX4fmfOJw188fyfnTnwlQpR1jKr8z2lBZ5Xjftiw3xhliKid51MsXPG35nO0TL3La6CWu5yaTaD1TXFS+bPDYcqoEW7qpnKaMShq42fIVEiX+Kko8sBKfDlv6ZEaEXv3vRuFe/f9JtPHXUC99MVOLWF0NZpGw5evk48vZZNq49+hsjoTR2VwibfwNAirnwV8GxnzynmgBiZjoTWVULiTSehahjQPlqCDRehaT9+pLlPGXS0nYchliogBZrs3cmR1vkZg7W0FC5UqpKt8mUS/fIaDyXRL+8j0SKt8noXIVCZUfkFD5IQmVH5FQuZqEyo9JqPyEhMpPNVqb5TY6+0zpVU9ZlWtIqPxcgkq38fhaElnWL0ioXEdC5ZckVK4noXIDCZUbyczp7sj5lG3GptS/txibja0en/4t509/KO+57YbI2n9nr/69xKzBThLRxg8Rq9zF9dx/Ilb5Y8jRxk++6+VuQ7Re/uxhS8Ycv+X6XtzmvT02b5jOn5+sxtL7KKqnnkiwXJUWsy/xA1gNJrv1OKs8UCGVQdTLg5g8f3kwE62XtZnfemmHyfncIczdE9VldVh4noivxEuEbVlPqi0Pc33OOSY63PW9YGOi+sK2bCDBlmlP1CjzREOmfrRxhIctGzMxlU0432ua99yRLNj48iiJ/jKZbEagxI9mhe47a87Cb+PHML0zgy2k1ktRla1TKluxlkyGyjbCXr2tJK/eLvXE8STq5QkeKk9iuVmDExlf1qA9py1/y3iyBicLl/gpEmOiU4VVniZR5enCKs+QqLJDwX3PmQX1PWdxqTxHsZjobNuY6DzhEj9XYomfL6zyAokqLxRWeZFElRcrVi8vYeGdVnMpC+/skitSv8flgfbjl7Fw+vGODGtZvbkqZf0rOerw1YK5jWsk5jaSyWsFVV4nUeX1wv7ydxL95Q3CKm+UmnMTHZ3dRGIM+ftKlTczHpWdWPpMnVuYmMrOJPzlbQVHwV2YDE90O4Fslni9LFWo9fQW/JQH93uvq+1vlT+Lf6dt5HaXYvHl3bYquxXcerpLaD33kPBE9wr3kPeR6CF7KNTG1aBXxPXygSol8hfWW7D8ywTf6+/6Xl/2CAvS1s71cpBgvRzABjK/9fIJ4TY+WGobHyI47hlW4LhnKPP26umswZOZ50ZEFhMNZzrsLR2ZWanzTOp3eZrTE0WxUmd0RuWzqZ87SmGVVSKblMqxmZ8/wVbFpL3/tzz1t/HcSicKzveMs43cnFfcTmXTmPrrgqcrpHIGU/3s5X8w1X1RWuXMlMpZRLKsswV7yDlS85eiMdFcxOr7MU+wxOdLLPEFWsxR8N6hsDDPsrhDQdyWi2DLwGxZEakteVUuRokXWb1MxCpi0ZV4cHl1e/Lz6ssy457lTG2V72dUrlIsPl/N0KrUYk1OiXzKXT6fM7F6+YnQeqINLj/tC5fvbeRUuTaQeummchMJlZuVUSnbX25hFPqerRwq8+/h+wo+FwBQpJTibGsAAAAgEFS8jXrbfuOcHUwnW4aTZU3Pjz8cT/+tT9ztU6Kd4Sur1PZIHHulAADAjbRXf5yMVx8Mrw4AAEAxvM+qf9K2h1VlZ/ZTrv2/auf+j1TAlkBG6xnv++zlUXGUONCJsfFCd7mPs/WXQe/2cB9Deqssl6ByfFx0B6x7Dyl3lzsA0aByngjIL3Fvrz5BglefCK8OAEkmxfX93fLXWD8v+Lt2Q7+HmKjAmAgqEV9WRZVcMEocnggljh4SJY42jhJHiaPEAQDwl1AJlVAJlVAJlTKjYOqrRKESAABAOOzI8brbMv+anPLnXndmfyt4npv9ndkg2hJ/TbkSz1c5M853l3u0KtNfZ6H1kAEnpanmidLMiaP1+GWe4Hq8+fFirHl65zay69UXStlbGq0tF8VRL4OyZUVR+gJQaL103pOyzPeelKU2b/DtSVlO4kydt3DyDwBFxor4yvjb8XcU6F/fj6dPSqvO+KONaO+AVZsyREwABM6HyvjLIMbjHym0C8k5Vl+t0P5xZ1t+XKnyEyXOzarLPlWgjq7x6MfXCmnEiEJVvhQ+I2Kd1Daud5Z1vVSvvlGDNYPO9XKTxHq5WekMTHp0tkX5uGffuOcrDeplY8GYpQnne03znvs6bjcP+Y2C9RLz4wCoMIbcrtAY0vuktB0STkr7LvKT0v7J0U9/H7lX3xkvvMQxKyWjje8isdujdap97I6roRKAaBAd6f4scaS7R/mRbpLMjU2GSWPdhrstT8qpN9sMZvKtqm/PWS9/m/ec/YrbuIk1MADI7ntMU17fo7stE7BlYLasLtGWB2jRj3tnYGrY2pQ3A1PT5HmqlhltBuZALpUHkSjxg00a2X/180SHeNYK59xGbdd37XIbdUzx3IaovzxUat8jqrKuRJX1tPDqzrYskWjLw7Swpew53cNNu5FufVOHOd16Lrtma1R+r1rqv4lYRc6TJZy7bWvlPVczJmOfbgOzkdnQDOrT0tmsxqbqPWQ2m9VEizauyz7dZiZvtGFHMDMpvQU/5UHBvfjNK/3l0WZSIX6llJpwca6Xx/iOggupl8eaOrfxFlJt2ZKELUWj4FYSo+DWmo8ofi3RlsdpMd/j3MbbSG3joirbVqpsxx1tHG+eYIajUg1+Y1K4a/MkU/TObPcb51/kvHH+JdxAophX987+ty8o+89X4iebuKk2+lg9W+KnKjCGBMEhezzewaRyNp7/WSnZueCzbW15Dolc8LnC0UbWE50noe8pvIc8X4LKC4j0kBRioos0H49fLHE8fokW43G+WalLzUTMIjQr5ZfLSGSsLyeh8goziDYedut5oEob72j2dmjx/xtxG78yx5ZXFdG8CgAAAAB+wTl/Och1xOKcv+xkDqzyJvKXdEr8FoVmS6nb8lapthTNbXSWmNu4TfO1BsNYYSXexfRT4re7lpxzlvUO1/eCzgWrTHpdcGnGGl0VXpu17zy3ESwqlXea2Jkti7vNdL38o4/16jgF3rv1dFe477knU+J/QokHWuL3kZmV6pEp+Qm2JTpp7/8tT/1tPHepTxQ8FWQcs5tJuR+nggiCUzoBKEb+7OLVe5liXr0n51xd/goye68OAADRM8Vwii97m9MYz5rBqbZPFFM2Sy+8V9U/JGFVvXO9/D/US99QWMvaR+mRLu40LDbUKvF+Zl/zERu/m85fDjCptHHde8iBUmeeH9P6jIhBWBERmC2fkGrLwRqct6GGyqHI/gMAgA2Y4QNeyD4x4H4D8z0AwKsDgB7S+YzbYcrvfoYnAgAAAACgEhPpEbktycskPYXzggAQhu9svH5GOGfjpVfq9E/9KTNUv398SOrPYEOfEwOGZb4OzfnE4a6fr8rtBNm1rKMNlVWO923LcmOcIaZyklHoSbzPSVgXPJlE65niovJlQ5U11m4qpxlYCe4HN1u+QqLEX0WJB1bi02FLn8yI0Kv/3Sjcq7+GEvfFTAPrL4NiFglbvk4+cptNpo17j3vmSBj3zCXSxt8goHIe/GVgzCfviRaQGFG8qYzKhURazyK0caAcFSRaz2LyXn2JMv5yKQlbLkNMFCDLtT7H+i0Ss1IrSKhcKVXl2yTq5TsEVL5Lwl++R0Ll+yRUriKh8gMSKj8kofIjEipXk1D5MQmVn5BQ+amh9z0p2dHZZ0qvJ8qqXENC5ecSVLqNx9eSyLJ+QULlOhIqvyShcj0JlRtIqNyowZzu9xLH4ztJ9OM/RKxyF9dz/4lY5Y8h18uffNfL3YZovfzZw5bOtwUmXd+zuy1wj80bbrcFVmPptf/VU08kWK5Ki9mXeBR3ITmrPFAhlUHUy4MKvNPQT708mInWy9rMb720w+R87hCPe/jqsjosPE/EV+IlwrasJ9WWh7k+5xxtHO76XrDRRn1hWzaQYMu0J2qUeaJhZPdD8tfLIzxs2ZiJqWzC+V7TvOeOFLoZx9lfHiXRXyaTzQiU+NGs0L1SzVn4bfwYpnfOrYXUeimqsnVKZSvWkslQ2UbYq7eV5NXbpZ44nkS9PMFD5Uk5v+s248TUv7cYm42tHp/eXvAWy+2251+eLFzip0iMiU4VVnmaRJWnC6s8Q6LKDgX3PWcW1PecxaXyHMViorNtY6LzhEv8XIklfr6wygskqrxQWOVFElVerFi9vEQoVuc7b+NSFt55G1ekfo/LA+3HL2Ph9OMdGVaJenNVyvpXctThqwVzG9dIzG0kk9cKqrxOosrrhf3l7yT6yxuEVd4oNecmOjq7icQY8veVKm9mPCo7sfQ5MLcwMZWdSfjL2wqOgrswGZ7odgLZLPF6WapQ6wnutO2utr9V/mnbd9pGbncpFl/ebauyW8Gtp7uE1nMPCU90r3APeR+JHrKHQm1cDXpFXC8fqFIif2G9Bcu/TPC9/q7v9WWPsCBt7XKLpWC9HMAGMr/18gnhNj5YahsfIjjuGVbguGco8/bq6azBk5nnRkQWEw1nOuzaHJlZqfNM6nd5mtMTRbFSZ3RG5bOpnztKYZVVIpuUyrGZnz/BVsWkvf+3PPW38dxKJwrO94yzjdyc17JOZdOY+itupyukcgZT/bzgfzDVfVFa5cyUyllEsqyzBXvIOVLzl6Ix0VzE6vsxT7DE50ss8QVKt56yyvu8R+LObGl4744bZcpo4yrf5T4at3aEwrOmcxTcyxSLgntyllV+ljU/Ch5j+ms95XnPjzXV6SGd2/hEySqfU7jE9/G8wipfIFAvs/34i2Zx7MWfXPQ9pD9b/s3GXird5rIj51O2GS+bfCtuvxW8T3e7Eew+iikk+p6pJFQ+FaegcppCtgQyRmc06qX/e6VeNYu7XjrbcjraOFHcIzfvOYqZtiUfbGZwlik68+zuiYKdeZ5NQqVOsbqtDsHs/xum/xUR81Di0kpcRfJvUH4+jv4kKFsuIJLXzh+Pp79uMd401RqP26lcmLKwWirplvgi5Wxpp7KChMrFJFQuIaFyKQmVy0ioXE5C5VskVK4goXIlekgAtI3cVpnvmerNne2v8gMFVVIt8Y9gSxA5zvnLz0jMPO+9Q8FUWaVK85AARMEXJNa5rSOyGo/GTArme4JjvUnBlhtIqNy0n8qNJrV66RxtbCERuW3FSp3AbPmVQrbMH+l+reS6YCCjXmZHZ9+YaOOV7YHISh0v1mKFSZGxHfs7Q/eXOyT24/8U9kTfmTI9kfsY0lnlv6Sq1Lte7kSsnse/kScqWGVZvDhaTzYK3oUouJIfFWw9pQat1iM6Hk9/3a3ceiKXe0sl9j0/Rz4628MTZUfeemIWhb7HsJLAhW6B9yhRl3gcJQ6KbnSWsDA6A2FR3cJIN6iR7gGW3mc91ZTqiSiMzmqh9UirlzTIH48fZGF+PChb1o7EloegjQemso4VbQbmUK4RZF2UOAf1tBqNY8Ut+nG+KLjEdxTcwNJ5PN7QErdlbd/Z/zrCZ+M1glcPTOURsKXW/lLX2VJdORIzI05RqsvouEbl96rF/sdKxKycJ0s4R9W18p6rGQt2fjy7uqSxxdtD2iFrn26TEFVms6xN0fdI85feJX6UAvUyuNuo7cnPEzU3f2njzXJ+96MtCmv/f2WpdWf2sRaV/GUpIhAAAqMF+vHAVLaELQmMIVtbrQIbpx1HosTbaL4iQtcbSEbFw1KpCpjvCUplW0uHPc/eI912Uka6xZE1OEGKLU907W1fEPTqcu8fB8HhXS/bK5DNopHbkJ1zO1koTyRb5Sm2Kk+1sB9SVkzkfZPYaVb4Xv10EjHRGRbulQqqXnZABiYwlWfCltJidb758WQyEauIcH48bM4isX7ibBIqz+FSeW7EbfzKnHWEV5k6t/GwOS+nxM/HWiQAAFnKBDPK/T3e6wjPCIASBH+zdzJ5dZX2jfM2ZHMNsgbSRhTOrecOnCVKK9bZWxtHsKjq5bUWf7283sJ4PCi6mvRt6T2ne0ORzunu38Zv0nw1XiecT0SyXt6seb28BfUyj1sRqxddtAEACAfvKPg2CVFwF0uP269U4Hb0kJr1kKWpFniH8jNAf9BkjupOS8wTdbXU8UR8a7PuCunskgGptvVHjtrg3ffcLeFUEDX4k9XdugezvIrHRPcqdKK+s8r7cO4/SXogcpMWucne30PntBoAqFAce557SsjA9EIGBgAAAAAAUbBSUfDDEqLgPoiCAQAAAACS/XDWkwJRsOje0ketgcxvFAxb2jNQyJayVT4WgkqMdIOrlyA48u95Tn+dnKojuDMbAAAAUJ+o7uF7HCuuAQAAY8jKMeQqc5i1xdhsqDWG3F/lkyRUPqWgShrQuDsO+AF3xwWnUrT1jMHuOKKMxQl+kfc94yS0ngmVP2N8lZnnv9r8XOeZ53KJe/EnaXEGGeDneayIQL0EgrykxS535zY+WWLf8zfNz798WWqsPsWiXy912e0xVcrZy9M0uOfZ25av4P5xEAJRl/irFmwZlC2nYyZcKX7x6jNsSmW4ITMmAgBQ9eoYUSSTr0kcQ87ECX7SSjx/rcGsVDljrUEwtnwdtoRXL0jlbK7xxBz4y8BUzsU8ZEC84Vl3naON2r5vsaxjikUb80ioLCRyW+A7cptvFfdI19mWJb5t2aAAW6KHLCZ/mUwu8uh7lrjUvn33USSTiVhF5b8qMm8s5cxKLst7Lvc+iiwrSKzbWInVJYG1nrdJ2PJdD5WNBU+Fa8L5XtO855zOqse5//5Hutmdhqss2LJQW35A5g6FUgMxUbHHROHzobXa+rhI5m3RetDG+Ua62VVPaySsevpci/OCsdMQqAiNeik7Cl5LOgpGrB5UD7kOeSJEblCJMSRIol4CAAAAAACAWD3sWL2rSX9E4T2Tsl7K/nEd8LblBim2HOGamwszM7jRCn9WapPUU0EoeKLNmp8DswUlnsdW7JyRVi/V4CvM96BeRsDXOBkEaEg9l1UU9ntSfqGEc/VFrbzn7PekJJPfKHwGWdnen7ENZy9rxbep8tyhvGf/Dn0PQORW1PwL4x7US6XYydUr7ctmlefNEoz1ffqCHV7ZrH+TUPkDCZWU2AV/CX+JyC2kEneeoxjExDzRj9ZAFrQnCl7l7hBU0iB4W/5UtLYEwSF739mxVvGcf7kH518CAAAAQNKIgiXERhS58I0o4gmcF1wo2ZtqzYT7TbXR2jKr0qqiMpFQVWXVPFF1G5XO+ctqrq1H7pk6QD+QsYYtgc4lflACq+rRenQaUeAEP9gSAKAedRBtINpQkENRL9F6OGMiufdK6aAS8FI3IV7i8m64q0dCZRieqCSBfhwAoCeILxEFVyWqu+MOT8CWQdmyfoKCygY5KhsmaNwPqR6ybyBplDgiQcMyzRIU7o5rTkLlMRJUOo8hj5W4ZlBcZQsSKltKVNkqgX26OmcN/Pc9sqON1gl973n2Pon31wkZnii6k3iPS/C38ehUtvGhksJp220xdxaYynawJTIwQFPGmP768fyTf05UaEQhh98kUGtAMcXq7YuujQO0nqBaj+j5RKclcD4RAACExenIbRSskvfEAPVUnpFQt8RVJmvLDlVaz5mwJQAB4jyiuIDELP6FUlUirw5UBLNSsloPdscFp5IGUa0LviSnZ7uUxLrgy7RYvazKaduINmhwuaSV4M5e/QoSsXpHzPABBUe6onNnV2PuTJhrSez2oMF1sCVAbgNRcA52e1KiW/vfWbO1/1RU0pjT3UcXhde9UrPlHVhDDFzGPaUYjwMAEKsrg90Ksj9g1RMAAABQSTcSq+q7E1kRgRVkiIkAAEEQ/FqDHlhrIMSfyZzSWWz0TPRCyUToiXqTWDP4oHSVD6FeRlovHyZRL/uQUNkXM3z7ofK6DbtZ/H7KeqMypTMwdrbsr6wtHyVyRgQAQGcG4LSaolPpjuz9kAMTFHZtPkZC5aAElft7AMgyBBkYANDGAQA+cM4Fj5SYC34GY8jAVI6CLTEej5xSAyqLSyUAacZk4oYJtuvWeu2dSy1PfX8891rmnibfc/nZrHFMJJvlHBONJTGLP06iynLMQyoQq/+VRL2cgNUliILRxgGAJ0IbB4BIfPkiifjyJRIqJyMKBkBR/gtnJn82')
+defaulted = [None, None, -1, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, -902, -899, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, -901, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, -903, -904, -905, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None]
+
+# Productions: name, length, nonterminal number, function
+prod_name = ["S'", 'mainsearch', 'search_exp', 'search_exp', 'search_exp', 'subsearch', 'subsearch', 'subsearches', 'subsearches', 'new_scope', 'subpipeline', 'subpipeline', 'filters', 'filters', 'filters', 'filters_logic_term', 'filters_logic_term', 'filters_logic_term', 'filters_logic_term', 'filters_logic_factor', 'filters_logic_factor', 'filters_logic_factor', 'filters_logic_factor', 'filters_logic_factor', 'filters_logic_factor', 'filter', 'filter', 'filter', 'filter', 'filter', 'filter', 'filter', 'filter', 'filter', 'filter', 'filter', 'filter', 'filter', 'filter', 'filter', 'filter', 'filter', 'filter', 'filter', 'expression', 'expression', 'expression_logic_term', 'expression_logic_term', 'expression_logic_term', 'expression_logic_factor', 'expression_logic_factor', 'expression_logic_factor', 'expression_logic_factor', 'expression_logic_factor', 'expression_value', 'expression_value', 'expression_value', 'expression_value', 'expression_value', 'expression_value', 'expression_logic_factor', 'expression_logic_factor', 'expression_logic_factor', 'expression_logic_factor', 'expression_logic_factor', 'expression_logic_factor', 'expression_logic_factor', 'expression_logic_factor', 'expression_logic_factor', 'expression_logic_factor', 'expr_fun_call', 'expr_fun_call', 'expr_fun_call', 'expr_fun_call', 'expr_fun_call', 'expr_fun_call', 'expr_fun_call', 'expr_fun_call', 'expr_fun_call', 'expr_fun_call', 'expr_fun_call', 'expr_fun_call', 'expression_fun_args', 'expression_fun_args', 'commands', 'commands', 'commands', 'commands', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'commands_names', 'op_names', 'op_names', 'op_names', 'op_names', 'op_names', 'op_names', 'op_names', 'op_names', 'op_names', 'op_names', 'op_names', 'op_names', 'op_names', 'op_names', 'op_names', 'op_names', 'op_names', 'op_names', 'op_names', 'op_names', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'eval_exprs', 'eval_exprs', 'eval_expr_assign', 'eval_expr_fun_value', 'eval_expr_fun', 'eval_expr_fun', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command_chart_1', 'command_chart_1', 'command_chart_2', 'command_chart_2', 'command_chart_2', 'command_chart_2', 'command_chart_2', 'command_chart_2', 'command_chart_2', 'command_chart_2', 'command_chart_by_2', 'command_chart_by_2', 'command_chart_by_2', 'command_chart_by_2', 'command_chart_by_2', 'command_chart_by_2', 'command_chart_by_2', 'command_chart_by_2', 'command_chart_by_1', 'command_chart_by_1', 'command_chart_by_1', 'command_chart_by_1', 'command_chart_over', 'command_chart_over', 'chart_where_clause', 'chart_where_clause', 'chart_where_clause', 'chart_where_clause', 'chart_where_clause', 'chart_where_clause', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'convert_list', 'convert_list', 'convert_list', 'convert_fun', 'convert_fun', 'convert_fun', 'convert_fun', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'subsearch_foreach', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'mstats_1', 'mstats_1', 'mstats_1', 'mstats_1', 'mstats_2', 'mstats_2', 'mstats_2', 'mstats_2_where', 'mstats_2_where', 'mstats_2_where', 'mstats_2_where', 'mstats_2_by', 'mstats_2_by', 'mstats_2_by', 'mstats_2_by', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'pivot_element', 'pivot_element', 'pivot_element', 'pivot_element', 'pivot_element', 'pivot_cell_value', 'pivot_cell_value', 'pivot_split', 'pivot_split', 'pivot_split', 'pivot_split', 'pivot_split', 'pivot_split', 'pivot_splitcol', 'pivot_splitcol', 'pivot_splitcol', 'pivot_splitcol', 'pivot_splitcol', 'pivot_splitcol', 'pivot_splitrow', 'pivot_splitrow', 'pivot_splitrow', 'pivot_splitrow', 'pivot_splitrow', 'pivot_splitrow', 'pivot_splitrow', 'pivot_splitrow', 'pivot_splitrow', 'pivot_splitrow', 'pivot_splitrow', 'pivot_splitrow', 'pivot_element_2', 'pivot_element_2', 'pivot_element_term', 'pivot_element_term', 'pivot_element_term', 'pivot_element_term', 'pivot_element_term', 'pivot_element_term', 'pivot_element_term', 'pivot_element_term', 'pivot_element_term', 'pivot_element_term', 'pivot_element_term', 'pivot_element_term', 'command', 'predict_list', 'predict_list', 'predict_list', 'predict_list', 'predict_list', 'predict_list', 'predict_list', 'predict_list', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'replace_list', 'replace_list', 'replace_list', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'sort_clause', 'sort_clause', 'sort_term', 'sort_term', 'sort_term', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'strcat_fields', 'strcat_fields', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'streamstats_args', 'streamstats_args', 'streamstats_args', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'tstats_from', 'tstats_from', 'tstats_where', 'tstats_by', 'tstats_by', 'tstats_by', 'tstats_by', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'union_datasets', 'union_datasets', 'union_datasets', 'union_datasets', 'union_datasets', 'union_datasets', 'union_named_dataset', 'union_named_dataset', 'union_named_dataset', 'union_named_dataset', 'union_named_dataset', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command', 'command_params_by_and_fields_or_args', 'command_params_by_and_fields_or_args', 'command_params_by_and_fields_or_args', 'command_params_by_and_fields_or_args', 'command_params_by_and_fields_or_args', 'command_params_fields_or_args', 'command_params_fields_or_args', 'command_params_fields_or_args', 'command_params_fields_or_args', 'command_params_fields_or_args', 'agg_terms_list', 'agg_terms_list', 'agg_terms_list', 'agg_term', 'agg_term', 'agg_term', 'agg_term', 'agg_term', 'agg_term', 'agg_term', 'agg_term_arg', 'agg_term_arg', 'agg_term_arg', 'agg_term_arg', 'agg_term_arg', 'agg_term_arg', 'agg_term_arg', 'agg_or_eval_list', 'agg_or_eval_list', 'any_fields_list', 'any_fields_list', 'any_fields_list', 'any_fields_list', 'any_fields_list', 'any_fields_list', 'rfields_list', 'rfields_list', 'rfields_list', 'fields_list', 'fields_list', 'fields_list', 'fields_list', 'fields_list', 'fields_list', 'rfield_term', 'rfield_term', 'rfield_term', 'rfield_term', 'rfield_term', 'rfield_term', 'field_name', 'field_name', 'field_name', 'field_name', 'field_name', 'field_name', 'field_name', 'field_name', 'field_name_logic', 'field_name_logic', 'field_name_logic', 'field_name_logic', 'field_name_logic', 'field_name_logic', 'field_or_num_list', 'field_or_num_list', 'field_or_num', 'field_or_num', 'field_or_num', 'args_list', 'args_list', 'args_term', 'args_term', 'args_term', 'args_term', 'args_value', 'args_value', 'args_value', 'args_value', 'args_value', 'args_value', 'args_value', 'args_value', 'args_value', 'args_value', 'args_value', 'basic_args_list', 'basic_args_list', 'basic_args_term', 'str_args_list', 'str_args_list', 'str_args_term', 'str_args_term', 'str_args_term', 'chart_limit', 'chart_limit', 'value', 'value', 'value', 'value', 'value', 'value_concat', 'value_concat', 'value_concat_factor', 'value_concat_factor', 'value', 'value', 'value', 'value', 'value', 'value', 'value', 'value', 'value', 'value', 'value', 'value', 'value', 'values_list', 'values_list', 'values_list', 'value', 'value', 'value_op', 'value_op', 'value_op', 'value_op', 'value_op', 'value_op', 'value_op']
+prod_len = [1, 1, 1, 3, 2, 4, 5, 2, 1, 0, 3, 4, 3, 2, 1, 3, 3, 2, 1, 1, 2, 3, 3, 2, 3, 3, 3, 3, 3, 1, 3, 3, 3, 3, 3, 3, 5, 4, 4, 3, 1, 3, 1, 3, 3, 1, 3, 2, 1, 1, 2, 3, 3, 5, 1, 1, 1, 1, 2, 2, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 4, 3, 4, 3, 4, 3, 5, 4, 5, 4, 5, 4, 3, 1, 3, 1, 3, 4, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 6, 5, 5, 4, 4, 3, 3, 2, 6, 5, 5, 4, 4, 3, 3, 2, 2, 3, 1, 3, 4, 3, 1, 3, 2, 3, 2, 7, 6, 6, 6, 5, 5, 5, 4, 4, 4, 3, 3, 5, 4, 3, 2, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 1, 2, 4, 2, 4, 3, 2, 1, 3, 3, 2, 2, 3, 2, 5, 5, 5, 5, 2, 2, 4, 4, 7, 6, 6, 5, 3, 3, 3, 3, 2, 2, 3, 3, 2, 1, 1, 1, 1, 2, 2, 2, 2, 3, 6, 5, 5, 4, 5, 4, 4, 3, 4, 3, 3, 2, 3, 2, 4, 4, 4, 4, 3, 3, 3, 5, 4, 4, 3, 3, 3, 2, 3, 2, 1, 4, 6, 4, 6, 6, 5, 5, 5, 4, 4, 3, 2, 4, 3, 2, 1, 5, 5, 4, 3, 3, 2, 4, 3, 3, 2, 5, 5, 5, 4, 3, 3, 2, 4, 3, 3, 2, 2, 1, 4, 4, 3, 2, 1, 5, 4, 4, 3, 5, 4, 4, 3, 4, 9, 8, 8, 7, 2, 1, 4, 5, 3, 2, 2, 4, 3, 3, 2, 1, 6, 5, 5, 4, 3, 3, 2, 4, 3, 3, 2, 1, 5, 4, 3, 2, 5, 4, 3, 2, 4, 3, 3, 2, 1, 6, 5, 5, 5, 4, 4, 3, 4, 3, 3, 2, 3, 2, 2, 5, 5, 3, 2, 6, 6, 4, 3, 4, 3, 3, 2, 4, 3, 3, 2, 3, 3, 2, 2, 2, 1, 3, 2, 3, 2, 2, 1, 2, 1, 1, 4, 3, 3, 2, 3, 3, 2, 2, 8, 7, 7, 7, 6, 6, 6, 5, 5, 4, 4, 3, 5, 4, 4, 3, 2, 2, 3, 3, 2, 3, 3, 2, 4, 3, 3, 2, 4, 3, 3, 2, 4, 3, 5, 2, 3, 1, 6, 4, 3, 3, 2, 2, 1, 1, 4, 4, 6, 4, 4, 2, 4, 4, 6, 4, 4, 2, 6, 6, 8, 6, 6, 4, 2, 1, 4, 4, 4, 9, 9, 2, 2, 2, 3, 2, 4, 3, 2, 3, 3, 2, 2, 2, 2, 1, 1, 2, 6, 5, 5, 4, 4, 3, 3, 2, 4, 4, 3, 2, 1, 4, 4, 2, 4, 2, 4, 5, 3, 4, 3, 3, 2, 5, 4, 4, 3, 3, 4, 3, 3, 2, 2, 1, 4, 3, 3, 2, 4, 3, 3, 2, 3, 4, 4, 4, 2, 3, 2, 4, 3, 3, 1, 2, 2, 1, 4, 3, 3, 2, 2, 1, 3, 3, 2, 2, 1, 7, 6, 6, 6, 5, 5, 4, 5, 4, 3, 3, 2, 3, 2, 1, 2, 1, 9, 8, 6, 5, 8, 7, 5, 4, 4, 3, 3, 2, 9, 8, 6, 5, 8, 7, 5, 4, 4, 3, 3, 2, 4, 3, 3, 2, 3, 2, 3, 2, 4, 3, 3, 2, 2, 1, 2, 5, 4, 3, 4, 4, 3, 3, 2, 6, 5, 4, 5, 5, 4, 4, 3, 2, 2, 2, 3, 3, 2, 2, 3, 3, 2, 2, 1, 4, 3, 3, 2, 3, 2, 3, 2, 1, 1, 3, 3, 3, 3, 1, 4, 7, 5, 3, 3, 2, 2, 1, 4, 3, 3, 2, 4, 3, 3, 2, 1, 3, 2, 2, 1, 1, 3, 2, 1, 6, 6, 4, 3, 3, 4, 1, 1, 1, 2, 1, 4, 4, 4, 1, 1, 3, 2, 3, 2, 1, 1, 3, 2, 1, 3, 2, 1, 3, 2, 1, 3, 3, 3, 3, 3, 3, 1, 1, 1, 1, 1, 4, 4, 1, 1, 1, 1, 1, 1, 1, 2, 1, 1, 1, 2, 2, 1, 3, 3, 3, 1, 1, 1, 1, 1, 1, 1, 1, 3, 1, 1, 1, 2, 1, 3, 3, 1, 3, 3, 3, 2, 2, 1, 1, 2, 2, 1, 2, 2, 2, 2, 3, 1, 1, 1, 2, 1, 1, 1, 1, 1, 1, 1, 2, 3, 2, 1, 1, 2, 1, 1, 1, 1, 1, 1, 1]
+prod_nt = [0, 44, 62, 62, 62, 70, 70, 72, 72, 49, 69, 69, 41, 41, 41, 43, 43, 43, 43, 42, 42, 42, 42, 42, 42, 40, 40, 40, 40, 40, 40, 40, 40, 40, 40, 40, 40, 40, 40, 40, 40, 40, 40, 40, 30, 30, 33, 33, 33, 32, 32, 32, 32, 32, 34, 34, 34, 34, 34, 34, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 29, 29, 29, 29, 29, 29, 29, 29, 29, 29, 29, 29, 31, 31, 21, 21, 21, 21, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 50, 50, 50, 50, 50, 50, 50, 50, 50, 50, 50, 50, 50, 50, 50, 50, 50, 50, 50, 50, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 28, 28, 25, 27, 26, 26, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 14, 14, 15, 15, 15, 15, 15, 15, 15, 15, 17, 17, 17, 17, 17, 17, 17, 17, 16, 16, 16, 16, 18, 18, 12, 12, 12, 12, 12, 12, 13, 13, 13, 13, 13, 13, 13, 13, 24, 24, 24, 23, 23, 23, 23, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 71, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 45, 45, 45, 45, 46, 46, 46, 48, 48, 48, 48, 47, 47, 47, 47, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 52, 52, 52, 52, 52, 51, 51, 55, 55, 55, 55, 55, 55, 56, 56, 56, 56, 56, 56, 57, 57, 57, 57, 57, 57, 57, 57, 57, 57, 57, 57, 53, 53, 54, 54, 54, 54, 54, 54, 54, 54, 54, 54, 54, 54, 13, 58, 58, 58, 58, 58, 58, 58, 58, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 59, 59, 59, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 63, 63, 64, 64, 64, 13, 13, 13, 13, 13, 13, 13, 13, 13, 67, 67, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 68, 68, 68, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 74, 74, 75, 73, 73, 73, 73, 13, 13, 13, 13, 13, 13, 13, 13, 13, 76, 76, 76, 76, 76, 76, 77, 77, 77, 77, 77, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 19, 19, 19, 19, 19, 20, 20, 20, 20, 20, 4, 4, 4, 2, 2, 2, 2, 2, 2, 2, 3, 3, 3, 3, 3, 3, 3, 1, 1, 5, 5, 5, 5, 5, 5, 61, 61, 61, 39, 39, 39, 39, 39, 39, 60, 60, 60, 60, 60, 60, 35, 35, 35, 35, 35, 35, 35, 35, 36, 36, 36, 36, 36, 36, 38, 38, 37, 37, 37, 6, 6, 7, 7, 7, 7, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 9, 9, 10, 65, 65, 66, 66, 66, 11, 11, 78, 78, 78, 78, 78, 79, 79, 80, 80, 78, 78, 78, 78, 78, 78, 78, 78, 78, 78, 78, 78, 78, 82, 82, 82, 78, 78, 81, 81, 81, 81, 81, 81, 81]
+prod_func = [None, 'p_mainsearch', 'p_search_exp', 'p_search_exp', 'p_search_exp', 'p_subsearch', 'p_subsearch', 'p_subsearches', 'p_subsearches', 'p_new_scope', 'p_subpipeline', 'p_subpipeline', 'p_filters', 'p_filters', 'p_filters', 'p_filters_logic_term', 'p_filters_logic_term', 'p_filters_logic_term', 'p_filters_logic_term', 'p_filters_logic_factor', 'p_filters_logic_factor', 'p_filters_logic_factor', 'p_filters_logic_factor', 'p_filters_logic_factor', 'p_filters_logic_factor', 'p_filter_eq', 'p_filter_eq', 'p_filter_neq', 'p_filter_neq', 'p_filters_sub', 'p_filter_comp_1', 'p_filter_comp_1', 'p_filter_comp_1', 'p_filter_comp_', 'p_filter_comp_', 'p_filter_comp_', 'p_filter_in', 'p_filter_phrases', 'p_filter_phrases', 'p_filter_any', 'p_filter_any', 'p_filter_notany', 'p_filter_raw', 'p_filter_error', 'p_expression_logic', 'p_expression_logic', 'p_expression_logic_term', 'p_expression_logic_term', 'p_expression_logic_term', 'p_expression_logic_factor', 'p_expression_logic_factor', 'p_expression_logic_factor', 'p_expression_logic_factor', 'p_expression_logic_factor_in', 'p_expression_value', 'p_expression_value', 'p_expression_value', 'p_expression_value', 'p_expression_value', 'p_expression_value', 'p_expression_binop', 'p_expression_binop', 'p_expression_binop', 'p_expression_binop', 'p_expression_binop', 'p_expression_binop', 'p_expression_binop', 'p_expression_binop', 'p_expression_binop', 'p_expression_binop', 'p_expression_fun_call', 'p_expression_fun_call', 'p_expression_fun_call', 'p_expression_fun_call', 'p_expression_fun_call', 'p_expression_fun_call', 'p_expression_fun_call', 'p_expression_fun_call', 'p_expression_fun_call', 'p_expression_fun_call', 'p_expression_fun_call', 'p_expression_fun_call', 'p_expression_fun_args', 'p_expression_fun_args', 'p_commands', 'p_commands', 'p_commands_error', 'p_commands_error', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_commands_names', 'p_op_names', 'p_op_names', 'p_op_names', 'p_op_names', 'p_op_names', 'p_op_names', 'p_op_names', 'p_op_names', 'p_op_names', 'p_op_names', 'p_op_names', 'p_op_names', 'p_op_names', 'p_op_names', 'p_op_names', 'p_op_names', 'p_op_names', 'p_op_names', 'p_op_names', 'p_op_names', 'p_command_search', 'p_command_stats', 'p_command_stats', 'p_command_stats', 'p_command_stats', 'p_command_stats', 'p_command_stats', 'p_command_stats', 'p_command_stats', 'p_command_stats', 'p_command_stats', 'p_command_stats', 'p_command_stats', 'p_command_stats', 'p_command_stats', 'p_command_stats', 'p_command_stats', 'p_command_eval', 'p_command_eval_exprs', 'p_command_eval_exprs', 'p_command_eval_expr_assign', 'p_command_eval_expr_fun_value', 'p_command_eval_expr_fun', 'p_command_eval_expr_fun', 'p_command_fields_keep', 'p_command_fields_keep', 'p_command_fields_remove', 'p_command_rename', 'p_command_dedup_args', 'p_command_dedup_args', 'p_command_dedup_args', 'p_command_dedup_args', 'p_command_dedup_args', 'p_command_dedup_args', 'p_command_dedup_args', 'p_command_dedup_args', 'p_command_dedup_args', 'p_command_dedup_args', 'p_command_dedup_args', 'p_command_dedup_args', 'p_command_dedup_noargs', 'p_command_dedup_noargs', 'p_command_dedup_noargs', 'p_command_dedup_noargs', 'p_command_basic_no_field', 'p_command_basic_no_field', 'p_command_basic_no_field', 'p_command_basic_no_field', 'p_command_basic_no_field', 'p_command_basic_no_field', 'p_command_basic_no_field', 'p_command_basic_no_field', 'p_command_basic_no_field', 'p_command_basic_no_field', 'p_command_basic_no_field', 'p_command_basic_no_field', 'p_command_basic_no_field', 'p_command_basic_no_field', 'p_command_basic_no_field', 'p_command_basic_no_field', 'p_command_basic_no_field', 'p_command_basic_no_field', 'p_command_basic_no_field', 'p_command_basic_no_field', 'p_command_basic_no_field', 'p_command_basic_no_field', 'p_command_basic_no_field', 'p_command_basic_no_field', 'p_command_basic_no_field', 'p_command_basic_no_field', 'p_command_basic_no_field', 'p_command_basic_no_field', 'p_command_basic_no_field', 'p_command_basic_no_field', 'p_command_basic_no_field', 'p_command_basic_no_field', 'p_command_basic_no_field', 'p_command_basic_no_field', 'p_command_basic_no_field', 'p_command_basic_no_field', 'p_command_basic_no_field', 'p_command_basic_no_field', 'p_command_basic_single_field', 'p_command_basic_single_field', 'p_command_basic_single_field', 'p_command_basic_single_arg', 'p_command_basic_single_arg', 'p_command_basic_single_arg', 'p_command_basic_single_arg', 'p_command_basic_single_arg', 'p_command_basic_single_arg', 'p_command_basic_only_args', 'p_command_basic_only_args', 'p_command_basic_only_args', 'p_command_basic_only_args', 'p_command_basic_only_args', 'p_command_basic_only_args', 'p_command_basic_only_args', 'p_command_basic_only_args', 'p_command_basic_only_args', 'p_command_basic_only_args', 'p_command_basic_only_args', 'p_command_basic_only_args', 'p_command_basic_only_args', 'p_command_basic_only_args', 'p_command_basic_only_args', 'p_command_basic_only_args', 'p_command_basic_only_args', 'p_command_basic_only_args', 'p_command_basic_only_args', 'p_command_basic_only_args', 'p_command_basic_only_args', 'p_command_basic_only_args', 'p_command_basic_only_args', 'p_command_basic_only_fields', 'p_command_basic_only_fields', 'p_command_basic_only_fields', 'p_command_basic_only_fields', 'p_command_basic_args_and_fields', 'p_command_basic_args_and_fields', 'p_command_basic_args_and_fields', 'p_command_basic_args_and_fields', 'p_command_basic_args_and_fields', 'p_command_basic_args_and_fields', 'p_command_basic_args_and_fields', 'p_command_basic_args_and_fields', 'p_command_basic_args_and_fields', 'p_command_basic_args_and_fields', 'p_command_basic_args_and_fields', 'p_command_basic_args_and_fields', 'p_command_basic_args_and_fields', 'p_command_basic_args_and_fields', 'p_command_basic_args_and_fields', 'p_command_basic_args_and_fields', 'p_command_basic_args_and_fields', 'p_command_custom', 'p_command_custom', 'p_command_where', 'p_command_accum', 'p_command_accum', 'p_command_anomalies', 'p_command_anomalies', 'p_command_anomalies', 'p_command_anomalies', 'p_command_append', 'p_command_append', 'p_command_append', 'p_command_append', 'p_command_appendpipe', 'p_command_appendpipe', 'p_command_autoregress', 'p_command_autoregress', 'p_command_autoregress', 'p_command_autoregress', 'p_command_autoregress', 'p_command_autoregress', 'p_command_bin', 'p_command_bin', 'p_command_bin', 'p_command_bin', 'p_command_bin', 'p_command_bin', 'p_command_bin', 'p_command_bin', 'p_command_bin', 'p_command_bin', 'p_command_bin', 'p_command_bin', 'p_command_chart', 'p_command_chart', 'p_command_chart_1', 'p_command_chart_1', 'p_command_chart_2', 'p_command_chart_2', 'p_command_chart_2', 'p_command_chart_2', 'p_command_chart_2', 'p_command_chart_2', 'p_command_chart_2', 'p_command_chart_2', 'p_command_chart_by_2', 'p_command_chart_by_2', 'p_command_chart_by_2', 'p_command_chart_by_2', 'p_command_chart_by_2', 'p_command_chart_by_2', 'p_command_chart_by_2', 'p_command_chart_by_2', 'p_command_chart_by_1', 'p_command_chart_by_1', 'p_command_chart_by_1', 'p_command_chart_by_1', 'p_command_chart_over', 'p_command_chart_over', 'p_command_chart_where_clause', 'p_command_chart_where_clause', 'p_command_chart_where_clause', 'p_command_chart_where_clause', 'p_command_chart_where_clause', 'p_command_chart_where_clause', 'p_command_cofilter', 'p_command_contingency', 'p_command_contingency', 'p_command_contingency', 'p_command_contingency', 'p_command_convert', 'p_command_convert', 'p_command_convert', 'p_command_convert_list', 'p_command_convert_list', 'p_command_convert_list', 'p_command_convert_fun', 'p_command_convert_fun', 'p_command_convert_fun', 'p_command_convert_fun', 'p_command_datamodel', 'p_command_datamodel', 'p_command_datamodel', 'p_command_datamodel', 'p_command_datamodel', 'p_command_datamodel', 'p_command_datamodel', 'p_command_datamodel', 'p_command_datamodel', 'p_command_datamodel', 'p_command_datamodel', 'p_command_datamodel', 'p_command_delta', 'p_command_delta', 'p_command_delta', 'p_command_delta', 'p_command_delta', 'p_command_delta', 'p_command_erex', 'p_command_erex', 'p_command_erex', 'p_command_erex', 'p_command_eventstats', 'p_command_eventstats', 'p_command_eventstats', 'p_command_eventstats', 'p_command_eventstats', 'p_command_eventstats', 'p_command_eventstats', 'p_command_extract', 'p_command_extract', 'p_command_extract', 'p_command_extract', 'p_command_extract', 'p_command_extract', 'p_command_fieldformat', 'p_command_findtypes', 'p_command_findtypes', 'p_command_findtypes', 'p_command_findtypes', 'p_command_foreach', 'p_command_foreach', 'p_command_foreach', 'p_command_foreach', 'p_command_foreach', 'p_command_foreach', 'p_command_foreach', 'p_command_foreach', 'p_command_foreach_subsearch', 'p_command_format', 'p_command_format', 'p_command_format', 'p_command_format', 'p_command_format', 'p_command_format', 'p_command_from', 'p_command_from', 'p_command_from', 'p_command_from', 'p_command_gauge', 'p_command_geom', 'p_command_geom', 'p_command_geom', 'p_command_geom', 'p_command_geom', 'p_command_geostats', 'p_command_geostats', 'p_command_geostats', 'p_command_geostats', 'p_command_geostats', 'p_command_geostats', 'p_command_geostats', 'p_commend_head', 'p_commend_head', 'p_commend_head', 'p_commend_head', 'p_commend_head', 'p_command_inputlookup', 'p_command_inputlookup', 'p_command_inputlookup', 'p_command_inputlookup', 'p_command_inputlookup', 'p_command_inputlookup', 'p_command_inputlookup', 'p_command_inputlookup', 'p_command_iplocation', 'p_command_iplocation', 'p_command_iplocation', 'p_command_iplocation', 'p_command_iplocation', 'p_command_join', 'p_command_join', 'p_command_join', 'p_command_join', 'p_command_join', 'p_command_join', 'p_command_join', 'p_command_join', 'p_command_join', 'p_command_join', 'p_command_join', 'p_command_loadjob', 'p_command_loadjob', 'p_command_loadjob', 'p_command_lookup', 'p_command_lookup', 'p_command_lookup', 'p_command_lookup', 'p_command_lookup_args', 'p_command_lookup_args', 'p_command_lookup_args', 'p_command_lookup_args', 'p_command_makecontinuous', 'p_command_makecontinuous', 'p_command_makecontinuous', 'p_command_makecontinuous', 'p_command_makemv', 'p_command_makemv', 'p_command_makemv', 'p_command_makemv', 'p_command_map', 'p_command_map', 'p_command_map', 'p_command_map', 'p_command_metasearch', 'p_command_metasearch', 'p_command_mstats', 'p_command_mstats', 'p_command_mstats_1', 'p_command_mstats_1', 'p_command_mstats_1', 'p_command_mstats_1', 'p_command_mstats_2', 'p_command_mstats_2', 'p_command_mstats_2', 'p_command_mstats_2_where', 'p_command_mstats_2_where', 'p_command_mstats_2_where', 'p_command_mstats_2_where', 'p_command_mstats_2_by', 'p_command_mstats_2_by', 'p_command_mstats_2_by', 'p_command_mstats_2_by', 'p_command_multikv', 'p_command_multikv', 'p_command_multikv', 'p_command_multikv', 'p_command_multikv', 'p_command_multikv', 'p_command_multikv', 'p_command_multikv', 'p_command_multikv', 'p_command_multikv', 'p_command_multikv', 'p_command_multikv', 'p_command_multikv', 'p_command_multikv', 'p_command_multikv', 'p_command_multikv', 'p_command_multikv', 'p_command_multisearch', 'p_command_mvcombine', 'p_command_mvcombine', 'p_command_mvcombine', 'p_command_mvcombine', 'p_command_mvcombine', 'p_command_mvcombine', 'p_command_outputlookup', 'p_command_outputlookup', 'p_command_outputlookup', 'p_command_outputlookup', 'p_command_outputlookup', 'p_command_outputlookup', 'p_command_outputlookup', 'p_command_outputlookup', 'p_command_pivot', 'p_command_pivot_element', 'p_command_pivot_element', 'p_command_pivot_element', 'p_command_pivot_element', 'p_command_pivot_element', 'p_command_pivot_cell_value', 'p_command_pivot_cell_value', 'p_command_pivot_split', 'p_command_pivot_split', 'p_command_pivot_split', 'p_command_pivot_split', 'p_command_pivot_split', 'p_command_pivot_split', 'p_command_pivot_splitcol', 'p_command_pivot_splitcol', 'p_command_pivot_splitcol', 'p_command_pivot_splitcol', 'p_command_pivot_splitcol', 'p_command_pivot_splitcol', 'p_command_pivot_splitrow', 'p_command_pivot_splitrow', 'p_command_pivot_splitrow', 'p_command_pivot_splitrow', 'p_command_pivot_splitrow', 'p_command_pivot_splitrow', 'p_command_pivot_splitrow', 'p_command_pivot_splitrow', 'p_command_pivot_splitrow', 'p_command_pivot_splitrow', 'p_command_pivot_splitrow', 'p_command_pivot_splitrow', 'p_command_pivot_element_2', 'p_command_pivot_element_2', 'p_command_pivot_element_term', 'p_command_pivot_element_term', 'p_command_pivot_element_term', 'p_command_pivot_element_term', 'p_command_pivot_element_term', 'p_command_pivot_element_term', 'p_command_pivot_element_term', 'p_command_pivot_element_term', 'p_command_pivot_element_term', 'p_command_pivot_element_term', 'p_command_pivot_element_term', 'p_command_pivot_element_term', 'p_command_predict', 'p_command_predict_list', 'p_command_predict_list', 'p_command_predict_list', 'p_command_predict_list', 'p_command_predict_list', 'p_command_predict_list', 'p_command_predict_list', 'p_command_predict_list', 'p_command_rangemap', 'p_command_rare', 'p_command_rare', 'p_command_rare', 'p_command_rare', 'p_command_rare', 'p_command_rare', 'p_command_rare', 'p_command_rare', 'p_command_redistribute', 'p_command_redistribute', 'p_command_redistribute', 'p_command_redistribute', 'p_command_redistribute', 'p_command_regex', 'p_command_regex', 'p_command_regex', 'p_command_replace', 'p_command_replace', 'p_command_replace_term', 'p_command_replace_term', 'p_command_replace_term', 'p_command_rest', 'p_command_rest', 'p_command_rest', 'p_command_rest', 'p_command_return', 'p_command_return', 'p_command_return', 'p_command_return', 'p_command_return', 'p_command_return', 'p_command_return', 'p_command_return', 'p_command_return', 'p_command_return', 'p_command_return', 'p_command_rex', 'p_command_rex', 'p_command_rex', 'p_command_rex', 'p_command_savedsearch', 'p_command_savedsearch', 'p_command_savedsearch', 'p_command_savedsearch', 'p_command_searchtxn', 'p_command_set', 'p_command_set', 'p_command_set', 'p_command_setfields', 'p_command_sort', 'p_command_sort', 'p_command_sort', 'p_command_sort', 'p_command_sort_clause', 'p_command_sort_clause', 'p_command_sort_term', 'p_command_sort_term', 'p_command_sort_term', 'p_command_spath', 'p_command_spath', 'p_command_spath', 'p_command_spath', 'p_command_spath', 'p_command_spath', 'p_command_strcat', 'p_command_strcat', 'p_command_strcat', 'p_command_strcat_fields', 'p_command_strcat_fields', 'p_command_streamstats', 'p_command_streamstats', 'p_command_streamstats', 'p_command_streamstats', 'p_command_streamstats', 'p_command_streamstats', 'p_command_streamstats', 'p_command_streamstats', 'p_command_streamstats', 'p_command_streamstats', 'p_command_streamstats', 'p_command_streamstats', 'p_command_streamstats_args', 'p_command_streamstats_args', 'p_command_streamstats_args', 'p_command_tail', 'p_command_tail', 'p_command_timechart_agg', 'p_command_timechart_agg', 'p_command_timechart_agg', 'p_command_timechart_agg', 'p_command_timechart_agg', 'p_command_timechart_agg', 'p_command_timechart_agg', 'p_command_timechart_agg', 'p_command_timechart_agg', 'p_command_timechart_agg', 'p_command_timechart_agg', 'p_command_timechart_agg', 'p_command_timechart_agg', 'p_command_timechart_agg', 'p_command_timechart_agg', 'p_command_timechart_agg', 'p_command_timechart_agg', 'p_command_timechart_agg', 'p_command_timechart_agg', 'p_command_timechart_agg', 'p_command_timechart_agg', 'p_command_timechart_agg', 'p_command_timechart_agg', 'p_command_timechart_agg', 'p_command_timewrap', 'p_command_timewrap', 'p_command_timewrap', 'p_command_timewrap', 'p_command_top', 'p_command_top', 'p_command_top', 'p_command_top', 'p_command_transpose', 'p_command_transpose', 'p_command_transpose', 'p_command_transpose', 'p_command_transpose', 'p_command_transpose', 'p_command_trendline', 'p_command_tstats', 'p_command_tstats', 'p_command_tstats', 'p_command_tstats', 'p_command_tstats', 'p_command_tstats', 'p_command_tstats', 'p_command_tstats', 'p_command_tstats', 'p_command_tstats', 'p_command_tstats', 'p_command_tstats', 'p_command_tstats', 'p_command_tstats', 'p_command_tstats', 'p_command_tstats', 'p_command_tstats_from', 'p_command_tstats_from', 'p_command_tstats_where', 'p_command_tstats_by', 'p_command_tstats_by', 'p_command_tstats_by', 'p_command_tstats_by', 'p_command_typelearner', 'p_command_typelearner', 'p_command_typelearner', 'p_command_typelearner', 'p_command_typelearner', 'p_command_union', 'p_command_union', 'p_command_union', 'p_command_union', 'p_command_union_datasets', 'p_command_union_datasets', 'p_command_union_datasets', 'p_command_union_datasets', 'p_command_union_datasets', 'p_command_union_datasets', 'p_union_named_dataset_str', 'p_union_named_dataset_str', 'p_union_named_dataset_str', 'p_union_named_dataset_str', 'p_union_named_dataset_str', 'p_command_untable', 'p_command_x11', 'p_command_x11', 'p_command_xmlkv', 'p_command_xmlkv', 'p_command_xmlkv', 'p_command_xmlkv', 'p_command_xmlkv', 'p_command_xpath', 'p_command_xpath', 'p_command_xpath', 'p_command_xpath', 'p_command_params_by_and_fields_or_args', 'p_command_params_by_and_fields_or_args', 'p_command_params_by_and_fields_or_args', 'p_command_params_by_and_fields_or_args', 'p_command_params_by_and_fields_or_args', 'p_command_params_fields_or_args', 'p_command_params_fields_or_args', 'p_command_params_fields_or_args', 'p_command_params_fields_or_args', 'p_command_params_fields_or_args', 'p_agg_terms_list', 'p_agg_terms_list', 'p_agg_terms_list', 'p_agg_term', 'p_agg_term', 'p_agg_term', 'p_agg_term', 'p_agg_term', 'p_agg_term', 'p_agg_term', 'p_agg_term_arg', 'p_agg_term_arg', 'p_agg_term_arg', 'p_agg_term_arg', 'p_agg_term_arg_fun', 'p_agg_term_arg_fun', 'p_agg_term_arg_fun', 'p_agg_or_eval_list', 'p_agg_or_eval_list', 'p_anyfields_list', 'p_anyfields_list', 'p_anyfields_list', 'p_anyfields_list', 'p_anyfields_list', 'p_anyfields_list', 'p_rfields_list', 'p_rfields_list', 'p_rfields_list', 'p_fields_list', 'p_fields_list', 'p_fields_list', 'p_fields_list', 'p_fields_list', 'p_fields_list', 'p_rfield_term', 'p_rfield_term', 'p_rfield_term', 'p_rfield_term', 'p_rfield_term', 'p_rfield_term', 'p_field_name', 'p_field_name', 'p_field_name', 'p_field_name', 'p_field_name', 'p_field_name_agg_fun', 'p_field_name_agg_fun', 'p_field_name_subsearch', 'p_field_name_logic', 'p_field_name_logic', 'p_field_name_logic', 'p_field_name_logic', 'p_field_name_logic', 'p_field_name_logic', 'p_field_or_num_list', 'p_field_or_num_list', 'p_field_or_num', 'p_field_or_num', 'p_field_or_num', 'p_args_list', 'p_args_list', 'p_args_term', 'p_args_term', 'p_args_term', 'p_args_term_subsearch', 'p_args_value', 'p_args_value', 'p_args_value', 'p_args_value', 'p_args_value', 'p_args_value', 'p_args_value', 'p_args_value', 'p_args_value', 'p_args_value', 'p_args_value', 'p_basic_args_list', 'p_basic_args_list', 'p_basic_args_term', 'p_str_args_list', 'p_str_args_list', 'p_str_args_term', 'p_str_args_term', 'p_str_args_term', 'p_command_chart_limit', 'p_command_chart_limit', 'p_value_number', 'p_value_number', 'p_value_number', 'p_value_number', 'p_value_concat', 'p_value_concat_expr', 'p_value_concat_expr', 'p_value_concat_term', 'p_value_concat_term_fun_call', 'p_value_string', 'p_value_string', 'p_value_string', 'p_value_string', 'p_value_string', 'p_value_string', 'p_value_string', 'p_value_string', 'p_value_string', 'p_value_string', 'p_value_time', 'p_value_date', 'p_value_minus', 'p_values_list', 'p_values_list', 'p_values_list', 'p_value_subsearch', 'p_value_path', 'p_value_op', 'p_value_op', 'p_value_op', 'p_value_op', 'p_value_op', 'p_value_op', 'p_value_op']
+
+
+def parse(gp,input,lexer,tokenfunc):
+    lr = gp.lr
+    prods = gp.prods
+    errorfunc = gp.errorfunc
+    lookahead = None
+    lookaheadstack = []
+    pslice = Production()
+    errorcount = 0
+    error_count = 3
+
+    pslice.lexer = lexer
+    pslice.parser = lr
+
+    if input is not None:
+        lexer.input(input)
+
+    if tokenfunc is None:
+        get_token = lexer.token
+    else:
+        get_token = tokenfunc
+    lr.token = get_token
+
+    statestack = []
+    lr.statestack = statestack
+    symstack = []
+    lr.symstack = symstack
+
+    pslice.stack = symstack
+    errtoken = None
+
+    statestack.append(0)
+    sym = Symbol()
+    sym.type = '$end'
+    symstack.append(sym)
+    state = 0
+    while True:
+        t = defaulted[state]
+        if t is None:
+            if lookahead is None:
+                if not lookaheadstack:
+                    lookahead = get_token()
+                else:
+                    lookahead = lookaheadstack.pop()
+                if lookahead is None:
+                    lookahead = Symbol()
+                    lookahead.type = '$end'
+            t = action[state*width + terminals.get(lookahead.type,width-1)]
+
+        if t < 0:
+            # Reduction, dispatched by production number
+            pname, plen, pnt, func = prods[-t]
+            sym = Symbol()
+            sym.type = pname
+            sym.value = None
+            if plen:
+                targ = symstack[-plen-1:]
+                targ[0] = sym
+                t1 = targ[1]
+                sym.lineno = t1.lineno
+                sym.lexpos = t1.lexpos
+                t1 = targ[-1]
+                if t1.__class__ is Symbol:
+                    sym.endlineno = t1.endlineno
+                    sym.endlexpos = t1.endlexpos
+                else:
+                    sym.endlineno = t1.lineno
+                    sym.endlexpos = getattr(t1, 'endlexpos', t1.lexpos)
+                pslice.slice = targ
+                try:
+                    del symstack[-plen:]
+                    lr.state = state
+                    func(pslice)
+                    del statestack[-plen:]
+                    symstack.append(sym)
+                    state = goto[statestack[-1]*nonterminals + pnt]
+                    statestack.append(state)
+                except SyntaxError:
+                    lookaheadstack.append(lookahead)
+                    symstack.extend(targ[1:-1])
+                    statestack.pop()
+                    state = statestack[-1]
+                    sym.type = 'error'
+                    sym.value = 'error'
+                    lookahead = sym
+                    errorcount = error_count
+                    lr.errorok = False
+            else:
+                sym.lineno = sym.endlineno = lexer.lineno
+                sym.lexpos = sym.endlexpos = lexer.lexpos
+                targ = [sym]
+                pslice.slice = targ
+                try:
+                    lr.state = state
+                    func(pslice)
+                    symstack.append(sym)
+                    state = goto[statestack[-1]*nonterminals + pnt]
+                    statestack.append(state)
+                except SyntaxError:
+                    lookaheadstack.append(lookahead)
+                    statestack.pop()
+                    state = statestack[-1]
+                    sym.type = 'error'
+                    sym.value = 'error'
+                    lookahead = sym
+                    errorcount = error_count
+                    lr.errorok = False
+            continue
+
+        if t != 32767:
+            if t > 0:
+                # Shift
+                statestack.append(t)
+                state = t
+                symstack.append(lookahead)
+                lookahead = None
+                if errorcount:
+                    errorcount -= 1
+                continue
+            # Accept
+            n = symstack[-1]
+            return getattr(n, 'value', None)
+
+        # Syntax error, same recovery as LRParser.parseopt
+        if errorcount == 0 or lr.errorok:
+            errorcount = error_count
+            lr.errorok = False
+            errtoken = lookahead
+            if errtoken.type == '$end':
+                errtoken = None
+            if errorfunc:
+                if errtoken and not hasattr(errtoken, 'lexer'):
+                    errtoken.lexer = lexer
+                lr.state = state
+                tok = call_errorfunc(errorfunc, errtoken, lr)
+                if lr.errorok:
+                    lookahead = tok
+                    errtoken = None
+                    continue
+            else:
+                return
+        else:
+            errorcount = error_count
+
+        if len(statestack) <= 1 and lookahead.type != '$end':
+            lookahead = None
+            errtoken = None
+            state = 0
+            del lookaheadstack[:]
+            continue
+
+        if lookahead.type == '$end':
+            return
+
+        if lookahead.type != 'error':
+            sym = symstack[-1]
+            if sym.type == 'error':
+                sym.endlineno = getattr(lookahead, 'lineno', sym.lineno)
+                sym.endlexpos = getattr(lookahead, 'lexpos', sym.lexpos)
+                lookahead = None
+                continue
+            t = Symbol()
+            t.type = 'error'
+            t.lineno = t.endlineno = getattr(lookahead, 'lineno', 0)
+            t.lexpos = t.endlexpos = getattr(lookahead, 'lexpos', 0)
+            t.value = lookahead
+            lookaheadstack.append(lookahead)
+            lookahead = t
+        else:
+            sym = symstack.pop()
+            lookahead.lineno = sym.lineno
+            lookahead.lexpos = sym.lexpos
+            statestack.pop()
+            state = statestack[-1]
@@ -1,8 +1,16 @@
 
-import sys, os, re, json, logging, fnmatch, pkg_resources, copy
+import sys, os, re, json, time, logging, fnmatch, importlib, pkg_resources
+from collections import namedtuple
+from types import MappingProxyType
 from .ply import lex
 from .ply import yacc
 from . import macros
+from . import nodes
+from . import lrgen
+from .scanner import Scanner
+
+# Types of the semantic values built by the grammar rules (as opposed to tokens values)
+NODES=(dict,nodes.Node)
 
 # LOGGING
 logger = logging.getLogger('spl_validator')
@@ -14,10 +22,36 @@ ch.setFormatter(formatter)
 logger.addHandler(ch)
 
 # CONF
+# The commands conf is compiled once loaded: the entries of the commands are
+# immutable, the lists of accepted values become frozensets (membership tests of
+# the grammar rules) with the text of the original list kept for the error
+# messages (<key>_text), the other lists become tuples
+CONF_VALUE_SETS=("args","search_modes","modes","selectors")
+
+def freeze(value):
+    if isinstance(value,dict):
+        return MappingProxyType({k:freeze(v) for k,v in value.items()})
+    if isinstance(value,list):
+        return tuple(freeze(v) for v in value)
+    return value
+
+def freeze_command(conf):
+    frozen = {}
+    for key in conf:
+        if key in CONF_VALUE_SETS and not conf[key] is None:
+            frozen[key] = frozenset(conf[key])
+            frozen[key + "_text"] = str(conf[key])
+        else:
+            frozen[key] = freeze(conf[key])
+    return MappingProxyType(frozen)
+
+def freeze_conf(conf):
+    return {cmd:freeze_command(conf[cmd]) for cmd in conf}
+
 cmd_conf=None
 try:
     with open(pkg_resources.resource_filename(__name__,'spl_commands.json')) as f:
-        cmd_conf = json.load(f)
+        cmd_conf = freeze_conf(json.load(f))
 except FileNotFoundError:
     logger.critical("spl_commands.json not found")
     exit()
@@ -30,6 +64,10 @@ if cmd_conf is None:
 #       LEX
 #---------------------------
 
+# Token of the custom commands registered at runtime (see register_command), the
+# parse tables do not depend on them
+CUSTOM_COMMAND_TOKEN = "CMD_CUSTOM"
+
 reserved = {
     'as' : 'AS_CLAUSE',
     'by' : 'BY_CLAUSE',
@@ -67,57 +105,68 @@ tokens = [
     'NUMBER', 'FLOAT', 'QUOTE', 'COMP_OP', 'PIPE', 'DOT', 'COLON',
     'MACRO',
     'NAME','STRING','PATTERN','TIMESPECIFIER','DATE','TEXT'
-] + list(set(reserved.values())) + list(set([cmd_conf[cmd]["token_name"] for cmd in cmd_conf]))
+] + list(set(reserved.values())) + list(set([cmd_conf[cmd]["token_name"] for cmd in cmd_conf])) + [CUSTOM_COMMAND_TOKEN]
 
 literals = []
 
+# Lexer states, used to stop looking for strings of a kind of quote once one of
+# them is not terminated (see t_ANY_QUOTE): a string can only fail at the end of
+# the query, so if a string starting at a quote has no closing quote, no string
+# starting at a later quote of the same kind has one. Without the states each
+# later quote would scan again to the end of the query, which is quadratic.
+states = (
+    ('nodquote','exclusive'),
+    ('nosquote','exclusive'),
+    ('noquote','exclusive')
+)
+
 # Tokens
 
-t_DEQ = r'\=\='
-t_EQ = r'\='
-t_NEQ = r'!\='
-t_NOTCHAR = r'!'
-t_PLUS    = r'\+'
-t_MINUS   = r'-'
-t_TIMES   = r'\*'
-t_DIVIDE  = r'/'
-t_MOD = r'%'
-t_LPAREN  = r'\('
-t_RPAREN  = r'\)'
-t_QLPAREN  = r'\"\(\"'
-t_QRPAREN  = r'\"\)\"'
-t_LBRACK  = r'\['
-t_RBRACK  = r'\]'
-t_PIPE = r'\|'
-t_COMMA = r'\,'
-t_QUOTE = r'"'
-t_COMP_OP = r'(<=|>=|<|>)'
-t_DOT = r'\.'
-t_COLON = r':'
-
-t_ignore = " \r\n\t"
-
-def t_MACRO(t):
+t_ANY_DEQ = r'\=\='
+t_ANY_EQ = r'\='
+t_ANY_NEQ = r'!\='
+t_ANY_NOTCHAR = r'!'
+t_ANY_PLUS    = r'\+'
+t_ANY_MINUS   = r'-'
+t_ANY_TIMES   = r'\*'
+t_ANY_DIVIDE  = r'/'
+t_ANY_MOD = r'%'
+t_ANY_LPAREN  = r'\('
+t_ANY_RPAREN  = r'\)'
+t_ANY_LBRACK  = r'\['
+t_ANY_RBRACK  = r'\]'
+t_ANY_PIPE = r'\|'
+t_ANY_COMMA = r'\,'
+t_ANY_COMP_OP = r'(<=|>=|<|>)'
+t_ANY_DOT = r'\.'
+t_ANY_COLON = r':'
+
+t_ANY_ignore = " \r\n\t"
+
+def t_ANY_MACRO(t):
     r'`([a-zA-Z][a-zA-Z0-9_\.-]*)(\(([^,\(\)]+(,[^,\(\)]+)*)\))?`'
-    #Ignoring
-    pass
+    #Ignoring, unless the macros are spliced (see spliced_tokens)
+    if params["macro_tokens"]:
+        return t
 
-def t_newline(t):
+def t_ANY_newline(t):
     r'\n+'
     t.lexer.lineno += t.value.count("\n")
 
-def t_DATE(t):
+def t_ANY_DATE(t):
     r'\d+/\d+/\d+(:\d+:\d+:\d+)?'
     return t
 
 #Strings
 # Patterns (having a starting and/or trailing *, be careful to not catch simple multiplications)
-def t_PATTERN(t):
-    r'(\*[a-zA-Z_\.\{\}\-:<>/\\\*]+|[a-zA-Z0-9_\.\{\}\-:<>/\\\*]+\*)'
+# The part before a trailing * is bounded, otherwise a long run of these characters
+# without any * (like a<a<a<...) is scanned again from each of its tokens. The
+# longer patterns are restored by long_tokens.
+def t_ANY_PATTERN(t):
+    r'(\*[a-zA-Z_\.\{\}\-:<>/\\\*]+|[a-zA-Z0-9_\.\{\}\-:<>/\\\*]{1,256}\*)'
     return t
 
-def t_STRING(t):
-    r'("([^"\\]*(\\.[^"\\]*)*)"|\'([^\'\\]*(\\.[^\'\\]*)*)\'|""|\'\')'
+def string_token(t):
     t.value=t.value[1:-1]
     if t.value == "(":
         t.type = "QLPAREN"
@@ -125,57 +174,173 @@ def t_STRING(t):
         t.type = "QRPAREN"
     return t
 
+def t_STRING(t):
+    r'("([^"\\]*(\\[\s\S][^"\\]*)*)"|\'([^\'\\]*(\\[\s\S][^\'\\]*)*)\'|""|\'\')'
+    return string_token(t)
+
+def t_nosquote_STRING(t):
+    r'("([^"\\]*(\\[\s\S][^"\\]*)*)"|"")'
+    return string_token(t)
+
+def t_nodquote_STRING(t):
+    r'(\'([^\'\\]*(\\[\s\S][^\'\\]*)*)\'|\'\')'
+    return string_token(t)
+
 # DOT is tricky to handle because it can only be in the middle
-def t_NAME(t):
-    r'([a-zA-Z0-9_\{\}/\\]*<<[a-zA-Z0-9_\{\}/@\\]+>>[a-zA-Z0-9_\{\}/\\]*|[a-zA-Z0-9_\{\}\$\\][a-zA-Z0-9_\{\}\-:/@\\\.]*[a-zA-Z0-9_\{\}\$\\]|[a-zA-Z0-9_\{\}\$\\][a-zA-Z0-9_\{\}\-:/@\\]*)'
-    global cmd_conf
-    if t.value.lower() in cmd_conf:
-        t.value = t.value.lower()
-        t.type = cmd_conf[t.value.lower()]["token_name"]    # Check for command names, lowercase
-    else:
-        t.type = reserved.get(t.value.lower(),"NAME")       # Check for reserved words, lowercase
-        if not t.type == "NAME":
-            t.value = t.value.lower()
+# The part before a << template is bounded for the same reason as the patterns
+# (and restored the same way)
+def t_ANY_NAME(t):
+    r'([a-zA-Z0-9_\{\}/\\]{0,256}<<[a-zA-Z0-9_\{\}/@\\]+>>[a-zA-Z0-9_\{\}/\\]*|[a-zA-Z0-9_\{\}\$\\][a-zA-Z0-9_\{\}\-:/@\\\.]*[a-zA-Z0-9_\{\}\$\\]|[a-zA-Z0-9_\{\}\$\\][a-zA-Z0-9_\{\}\-:/@\\]*)'
+    # Command names and reserved words, lowercase
+    lower = t.value.lower()
+    kw = keywords.get(lower)
+    if not kw is None:
+        t.type = kw
+        t.value = lower
     if t.value.isdigit():
         t.type = "NUMBER"
     if re.match(r'^\d+\.\d+$', t.value):
         t.type = "FLOAT"
     return t
 
-def t_TIMESPECIFIER(t):
-    r'[0-9a-zA-Z\+\-]*@[0-9a-zA-Z\+\-]+ '
+# Both parts are bounded for the same reason as the patterns (+a+a+a...), and
+# restored the same way
+def t_ANY_TIMESPECIFIER(t):
+    r'[0-9a-zA-Z\+\-]{0,64}@[0-9a-zA-Z\+\-]{1,64} '
     return t
 
-def t_FLOAT(t):
+def t_ANY_FLOAT(t):
     r'\d*\.\d+'
     t.value = float(t.value)
     return t
 
-def t_NUMBER(t):
+def t_ANY_NUMBER(t):
     r'\d+'
     t.value = int(t.value)
     return t
 
-def t_TEXT(t):
+def t_ANY_TEXT(t):
     r'[^\| =><\[\]"\'\(\)\+\*-/!\,]+'
-    global cmd_conf
-    if t.value.lower() in cmd_conf:
-        t.value = t.value.lower()
-        t.type = cmd_conf[t.value.lower()]["token_name"]    # Check for command names, lowercase
-    else:
-        t.type = reserved.get(t.value.lower(),"TEXT")       # Check for reserved words, lowercase
-        if not t.type == "TEXT":
-            t.value = t.value.lower()
+    # Command names and reserved words, lowercase
+    lower = t.value.lower()
+    kw = keywords.get(lower)
+    if not kw is None:
+        t.type = kw
+        t.value = lower
     if t.value.isdigit():
         t.type = "NUMBER"
     if re.match(r'^\d+\.\d+$', t.value):
         t.type = "FLOAT"
     return t
 
-def t_error(t):
+# Quotes not starting a string, they are only tried once the strings failed
+def t_ANY_QLPAREN(t):
+    r'\"\(\"'
+    return t
+
+def t_ANY_QRPAREN(t):
+    r'\"\)\"'
+    return t
+
+def t_ANY_QUOTE(t):
+    r'"'
+    # The string starting here is not terminated, so are all the next ones
+    if t.lexer.current_state() == "INITIAL":
+        t.lexer.begin("nodquote")
+    elif t.lexer.current_state() == "nosquote":
+        t.lexer.begin("noquote")
+    return t
+
+def t_ANY_error(t):
     report_error(t.lexpos,t.lexpos+len(t.value[0]),"Illegal character {}".format(t.value[0]),None,value=t.value[0])
+    # Same as t_ANY_QUOTE for the simple quotes
+    if t.value[0] == "'":
+        if t.lexer.current_state() == "INITIAL":
+            t.lexer.begin("nosquote")
+        elif t.lexer.current_state() == "nodquote":
+            t.lexer.begin("noquote")
     t.lexer.skip(1)
 
+# Rules with bounded repetitions (see t_ANY_PATTERN): token type, regex without
+# bounds, run of characters on which it fails (if it fails at a position, it
+# fails at the next ones of the run), token types of the rules tried before it,
+# first characters it can match at (the other ones being matched by a rule tried
+# before), bound, and character which must be in the query for a match. Like
+# the lexer regexes (verbose), the time specifiers do not include the space.
+LongRule = namedtuple("LongRule",["type","regex","run","before","first","bound","marker"])
+LONG_RULES = (
+    LongRule("PATTERN",re.compile(r'\*[a-zA-Z_\.\{\}\-:<>/\\\*]+|[a-zA-Z0-9_\.\{\}\-:<>/\\\*]+\*'),re.compile(r'[a-zA-Z0-9_\.\{\}\-:<>/\\\*]*'),frozenset(["MACRO","DATE"]),None,256,"*"),
+    LongRule("NAME",re.compile(r'[a-zA-Z0-9_\{\}/\\]*<<[a-zA-Z0-9_\{\}/@\\]+>>[a-zA-Z0-9_\{\}/\\]*'),re.compile(r'[a-zA-Z0-9_\{\}/\\]*'),frozenset(["MACRO","DATE","PATTERN"]),None,256,"<<"),
+    LongRule("TIMESPECIFIER",re.compile(r'[0-9a-zA-Z\+\-]*@[0-9a-zA-Z\+\-]+'),re.compile(r'[0-9a-zA-Z\+\-]*'),frozenset(["PATTERN"]),"+-@",64,"@")
+)
+
+# Wraps the token function of the lexer lx, reading the query s, to restore the
+# tokens longer than the bounds of their rules (LONG_RULES): when the rule
+# without bounds matches at the position of a token of a rule tried after it,
+# or matches a longer text, the token is replaced by its match and the lexer
+# continues after it. The positions where a rule failed are not tried again
+# until the end of their run, so the lexing stays linear.
+def long_tokens(lx,s):
+    next_token = lx.token
+    rules = [r for r in LONG_RULES if len(s) > r.bound and r.marker in s]
+    if len(rules) == 0:
+        return next_token
+    # Rule -> position until which it fails
+    failed = {r.type:0 for r in rules}
+    def token():
+        tok = next_token()
+        if tok is None:
+            return None
+        pos = tok.lexpos
+        for r in rules:
+            if tok.type in r.before or pos < failed[r.type] or (not r.first is None and not s[pos] in r.first):
+                continue
+            m = r.regex.match(s,pos)
+            if m is None:
+                failed[r.type] = r.run.match(s,pos).end()
+                continue
+            if tok.type != r.type or tok.endlexpos != m.end():
+                tok.type = r.type
+                tok.value = m.group()
+                tok.endlexpos = lx.lexpos = m.end()
+            break
+        return tok
+    return token
+
+# Rules of the scanner lexer backend (see scanner.py) for each lexer state, in
+# the order the PLY lexer tries them: the functions in the order of their
+# definition, then the strings by decreasing regex length. t_ANY_newline is left
+# out, it cannot match as the newlines are ignored characters.
+def scanner_rules():
+    funcs = [("MACRO",t_ANY_MACRO),("DATE",t_ANY_DATE),("PATTERN",t_ANY_PATTERN),("STRING",None),
+        ("NAME",t_ANY_NAME),("TIMESPECIFIER",t_ANY_TIMESPECIFIER),("FLOAT",t_ANY_FLOAT),("NUMBER",t_ANY_NUMBER),
+        ("TEXT",t_ANY_TEXT),("QLPAREN",t_ANY_QLPAREN),("QRPAREN",t_ANY_QRPAREN),("QUOTE",t_ANY_QUOTE)]
+    strings = [(name[6:],r) for name,r in globals().items() if name.startswith("t_ANY_") and isinstance(r,str) and name != "t_ANY_ignore"]
+    strings.sort(key=lambda x: len(x[1]), reverse=True)
+    string_rules = {"INITIAL":t_STRING,"nosquote":t_nosquote_STRING,"nodquote":t_nodquote_STRING,"noquote":None}
+    rules = {}
+    for state in string_rules:
+        rules[state] = []
+        for name,f in funcs:
+            if name == "STRING":
+                f = string_rules[state]
+                if f is None:
+                    continue
+            rules[state].append((name,f.__doc__))
+        rules[state] += strings
+    return rules
+
+# Token types of the lowercase command names and reserved words (the command
+# names take precedence over the reserved words)
+def scanner_keywords(conf):
+    keywords = dict(reserved)
+    for cmd in conf:
+        keywords[cmd] = conf[cmd]["token_name"]
+    return keywords
+
+def scanner_error(pos,char):
+    report_error(pos,pos+len(char),"Illegal character {}".format(char),None,value=char)
+
 #---------------------------
 #       YACC
 #---------------------------
@@ -204,37 +369,45 @@ def p_search_exp(p):
               | filters PIPE commands
               | PIPE commands'''
     global scope_level, params, data
+    want = params["facets"]
     flt,cmd=None,None
-    fields = {"type":"search_exp","input":[],"output":[],"fields-effect":[],"content":[],"cmd":[],"filters": []}
+    fields = nodes.Search("search_exp",[],[],[],[],[],[])
     if len(p) == 4:
         flt=p[1]
-        fields["content"] += p[1]["content"] + p[3]["content"]
         cmd=p[3]
-        fields["fields-effect"]=p[3]["fields-effect"]
     elif len(p) == 3:
         cmd=p[2]
-        fields["fields-effect"]=p[2]["fields-effect"]
-        fields["content"] += p[2]["content"]
     elif len(p) == 2:
         flt=p[1]
-        fields["content"] += p[1]["content"]
+    if "content" in want:
+        if not flt is None:
+            fields["content"] += flt["content"]
+        if not cmd is None:
+            fields["content"] += cmd["content"]
     if not flt is None:
-        for f in flt["input"]:
-            if not f in fields["input"] and f is not None:
-                fields["input"].append(f)
-        fields["filters"] = flt["filters"]
+        if "input" in want:
+            for f in flt["input"]:
+                if not f in fields["input"] and f is not None:
+                    fields["input"].append(f)
+        if "filters" in want:
+            fields["filters"] = flt["filters"]
     if not cmd is None:
-        fields["cmd"] = cmd["cmd"]
-        for f in cmd["input"]:
-            if not f in fields["input"] and f is not None:
-                fields["input"].append(f)
-        for f in cmd["output"]:
-            if not f in fields["output"] and f is not None:
-                fields["output"].append(f)
-        if "filters" in cmd and len(p) == 3:
+        if "fields-effect" in want:
+            fields["fields-effect"] = cmd["fields-effect"]
+        if "cmd" in want:
+            fields["cmd"] = cmd["cmd"]
+        if "input" in want:
+            for f in cmd["input"]:
+                if not f in fields["input"] and f is not None:
+                    fields["input"].append(f)
+        if "output" in want:
+            for f in cmd["output"]:
+                if not f in fields["output"] and f is not None:
+                    fields["output"].append(f)
+        if "filters" in want and "filters" in cmd and len(p) == 3:
             fields["filters"] = cmd["filters"]  # Do we want to only bring up filters that are in the generating command or also the ones after?
     p[0] = fields
-    logger.info("SEARCH [{}]: {}".format(scope_level,fields))
+    logger.info("SEARCH [%s]: %s",scope_level,fields)
     if scope_level > 0:
         data["subsearches"].append({"level":scope_level,"data":fields})
 
@@ -243,7 +416,7 @@ def p_subsearch(p):
     '''subsearch : LBRACK new_scope commands RBRACK
                  | LBRACK new_scope PIPE commands RBRACK'''
     global scope_level
-    p[0] = {"type":"subsearch","input":p[len(p)-2]["input"],"output":p[len(p)-2]["output"],"content":p[len(p)-2]["content"],"filters": []}
+    p[0] = nodes.Subsearch("subsearch",p[len(p)-2]["input"],p[len(p)-2]["output"],p[len(p)-2]["content"],[])
     scope_level = scope_level -1
     if "filters" in p[len(p)-2]:
         p[0]["filters"] = p[len(p)-2]["filters"]
@@ -251,7 +424,7 @@ def p_subsearch(p):
 def p_subsearches(p):
     '''subsearches : subsearches subsearch
                    | subsearch'''
-    p[0] = {"type":"subsearches","input":p[1]["input"],"output":p[1]["output"],"content":p[1]["content"],"filters": p[1]["filters"]}
+    p[0] = nodes.Subsearch("subsearches",p[1]["input"],p[1]["output"],p[1]["content"],p[1]["filters"])
     if len(p) > 2:
         p[0]["input"] += p[2]["input"]
         p[0]["output"] += p[2]["output"]
@@ -266,7 +439,7 @@ def p_new_scope(p):
 def p_subpipeline(p):
     '''subpipeline : LBRACK commands RBRACK
                    | LBRACK PIPE commands RBRACK'''
-    p[0] = {"type":"subpipeline","input":p[len(p)-2]["input"],"output":p[len(p)-2]["output"]}
+    p[0] = nodes.FieldList("subpipeline",p[len(p)-2]["input"],p[len(p)-2]["output"])
 
 #---------------------------
 # FILTERS
@@ -279,21 +452,21 @@ def p_filters(p):
                | filters filters_logic_term %prec IMPL_AND
                | filters_logic_term'''
     if len(p) == 4:
-        p[0] = {"type":"filters","input":p[1]["input"]+p[3]["input"],"output":p[1]["output"]+p[3]["output"],"content":p[1]["content"]+p[3]["content"],"op":p[1]["op"] + [p[2]] + p[3]["op"], "filters": p[1]["filters"]+p[3]["filters"]}
+        p[0] = nodes.FilterList("filters",[],[],[],p[1]["op"] + [p[2]] + p[3]["op"],[])
+        merge_facets(p[0],p[1],p[3])
     else:
-        p[0] = {"type":"filters","input":p[1]["input"],"output":p[1]["output"],"content":p[1]["content"],"op":p[1]["op"],"filters":p[1]["filters"]}
+        p[0] = nodes.FilterList("filters",p[1]["input"],p[1]["output"],p[1]["content"],p[1]["op"],p[1]["filters"])
 
 def p_filters_logic_term(p):
     '''filters_logic_term : filters_logic_term AND_OP filters_logic_factor
                           | filters_logic_term COMMA filters_logic_factor
                           | filters_logic_term filters_logic_factor %prec IMPL_AND
                           | filters_logic_factor'''
-    if len(p) == 4:
-        p[0] = {"type":"filters_logic_term","input":p[1]["input"]+p[3]["input"],"output":p[1]["output"]+p[3]["output"],"content":p[1]["content"]+p[3]["content"],"op":p[1]["op"] + ["and"] + p[3]["op"], "filters": p[1]["filters"]+p[3]["filters"]}
-    elif len(p) == 3:
-        p[0] = {"type":"filters_logic_term","input":p[1]["input"]+p[2]["input"],"output":p[1]["output"]+p[2]["output"],"content":p[1]["content"]+p[2]["content"],"op":p[1]["op"] + ["and"] + p[2]["op"], "filters": p[1]["filters"]+p[2]["filters"]}
+    if len(p) > 2:
+        p[0] = nodes.FilterList("filters_logic_term",[],[],[],p[1]["op"] + ["and"] + p[len(p)-1]["op"],[])
+        merge_facets(p[0],p[1],p[len(p)-1])
     else:
-        p[0] = {"type":"filters_logic_term","input":p[1]["input"],"output":p[1]["output"],"content":p[1]["content"],"op":p[1]["op"],"filters":p[1]["filters"]}
+        p[0] = nodes.FilterList("filters_logic_term",p[1]["input"],p[1]["output"],p[1]["content"],p[1]["op"],p[1]["filters"])
 
 def p_filters_logic_factor(p):
     '''filters_logic_factor : filter
@@ -302,17 +475,17 @@ def p_filters_logic_factor(p):
                             | filter AND_OP filters_logic_factor
                             | NOT_OP filters_logic_factor
                             | LPAREN filters RPAREN'''
-    if isinstance(p[1],dict):
-        p[0] = {"type":"filters_logic_factor","input":p[1]["input"],"output":p[1]["output"],"content":[p[1]["value"]],"op":[], "filters":[copy.deepcopy(p[1])]}
+    if isinstance(p[1],NODES):
+        want = params["facets"]
+        p[0] = nodes.FilterList("filters_logic_factor",p[1]["input"],p[1]["output"],[p[1]["value"]],[],[])
+        if "filters" in want:
+            p[0]["filters"].append(p[1].copy())
         if len(p) > 2:
-            p[0]["input"] += p[len(p)-1]["input"]
-            p[0]["output"] += p[len(p)-1]["output"]
-            p[0]["content"] += p[len(p)-1]["content"]
-            p[0]["filters"] += p[len(p)-1]["filters"]
+            merge_facets(p[0],p[0],p[len(p)-1])
             p[0]["op"].append("and")
     else:
         if len(p) > 2:
-            p[0] = {"type":"filters_logic_factor","input":p[2]["input"],"output":p[2]["output"],"content":p[2]["content"],"op":p[2]["op"],"filters":p[2]["filters"]}
+            p[0] = nodes.FilterList("filters_logic_factor",p[2]["input"],p[2]["output"],p[2]["content"],p[2]["op"],p[2]["filters"])
             if p[1] == "not":
                 p[0]["op"] = [p[1]] + p[0]["op"]
         
@@ -321,23 +494,23 @@ def p_filters_logic_factor(p):
 def p_filter_eq(p):
     '''filter : field_name_logic EQ value
               | field_name_logic EQ value_op'''
-    p[0] = {"type":"filter","input":[p[1]["field"]],"output":[],"value":p[3]["value"],"op":[p[2]]}
+    p[0] = nodes.Filter("filter",[p[1]["field"]],p[3]["value"],[p[2]])
 
 def p_filter_neq(p):
     '''filter : field_name_logic NEQ value
               | field_name_logic NEQ value_op'''
-    p[0] = {"type":"filter","input":[p[1]["field"]],"output":[],"value":p[3]["value"],"op":[p[2]]}
+    p[0] = nodes.Filter("filter",[p[1]["field"]],p[3]["value"],[p[2]])
 
 def p_filters_sub(p):
     'filter : subsearch'
-    p[0] = {"type":"filter_subsearch","input":p[1]["output"],"output":[],"value":"","op":[]}
+    p[0] = nodes.Filter("filter_subsearch",p[1]["output"],"",[])
 
 def p_filter_comp_1(p):
     '''filter : field_name_logic COMP_OP NUMBER
               | field_name_logic COMP_OP FLOAT
               | field_name_logic COMP_OP subsearch'''
-    p[0] = {"type":"filter","input":[p[1]["field"]],"output":[],"value":"","op":[p[2]]}
-    if isinstance(p[3],dict):
+    p[0] = nodes.Filter("filter",[p[1]["field"]],"",[p[2]])
+    if isinstance(p[3],NODES):
         p[0]["value"]=""
     else:
         p[0]["value"]=p[3]
@@ -346,36 +519,36 @@ def p_filter_comp_(p):
     '''filter : NUMBER COMP_OP field_name_logic
               | FLOAT COMP_OP field_name_logic
               | subsearch COMP_OP field_name_logic'''
-    p[0] = {"type":"filter","input":[p[3]["field"]],"output":[],"value":"","op":[p[2]]}
-    if isinstance(p[1],dict):
+    p[0] = nodes.Filter("filter",[p[3]["field"]],"",[p[2]])
+    if isinstance(p[1],NODES):
         p[0]["value"]=""
     else:
         p[0]["value"]=p[1]
 
 def p_filter_in(p):
     '''filter : field_name_logic IN_OP LPAREN values_list RPAREN'''
-    p[0] = {"type":"filter","input":[p[1]["field"]],"output":[],"value":p[4]["values"],"op":[p[2]]}
+    p[0] = nodes.Filter("filter",[p[1]["field"]],p[4]["values"],[p[2]])
 
 def p_filter_phrases(p):
     '''filter : CASE_OP LPAREN value RPAREN
               | TERM_OP LPAREN value RPAREN'''
-    p[0] = {"type":"filter_phrase","input":[],"output":[],"value":p[3],"op":[p[1]]}
+    p[0] = nodes.Filter("filter_phrase",[],p[3],[p[1]])
 
 def p_filter_any(p):
     '''filter : field_name_logic EQ TIMES
               | TIMES'''
     if len(p) > 2:
-        p[0] = {"type":"filter","input":[p[1]["field"]],"output":[],"value":p[3],"op":[p[2]]}
+        p[0] = nodes.Filter("filter",[p[1]["field"]],p[3],[p[2]])
     else:
-        p[0] = {"type":"filter","input":[],"output":[],"value":p[1],"op":[]}
+        p[0] = nodes.Filter("filter",[],p[1],[])
 
 def p_filter_notany(p):
     'filter : field_name_logic NEQ TIMES'
-    p[0] = {"type":"filter","input":[p[1]["field"]],"output":[],"value":p[3],"op":[p[2]]}
+    p[0] = nodes.Filter("filter",[p[1]["field"]],p[3],[p[2]])
 
 def p_filter_raw(p):
     'filter : value'
-    p[0] = {"type":"filter","input":[],"output":[],"value":p[1]["value"],"op":[]}
+    p[0] = nodes.Filter("filter",[],p[1]["value"],[])
 
 # ERROR HANDLING
 def p_filter_error(p):
@@ -391,45 +564,24 @@ def p_filter_error(p):
 def p_expression_logic(p):
     '''expression : expression OR_OP expression_logic_term
                   | expression_logic_term'''
-    s=""
-    for pp in p[1:]:
-        if isinstance(pp,dict) and "content" in pp:
-            s += pp["content"]
-        else:
-            s += " "+pp
-    p[0] = {"type":"expression","content":s,"input":[],"output":[]}
+    p[0] = nodes.expression("expression",p)
 
 def p_expression_logic_term(p):
     '''expression_logic_term : expression_logic_term AND_OP expression_logic_factor
                              | expression_logic_term expression_logic_factor
                              | expression_logic_factor'''
-    s=" "
-    for pp in p[1:]:
-        if isinstance(pp,dict) and "content" in pp:
-            s += pp["content"]
-        else:
-            s += " "+pp
-    p[0] = {"type":"expression_logic_term","content":s,"input":[],"output":[]}
+    p[0] = nodes.expression("expression_logic_term",p)
 
 def p_expression_logic_factor(p):
     '''expression_logic_factor : expression_value
                                | NOT_OP expression_logic_factor
                                | LPAREN expression RPAREN
                                | QLPAREN expression_logic_factor QRPAREN'''
-    s=""
-    for pp in p[1:]:
-        if isinstance(pp,dict) and "content" in pp:
-            s += pp["content"]
-        else:
-            if pp == "not":
-                s += " "
-            s += pp
-    p[0] = {"type":"expression_logic_factor","content":s,"input":[],"output":[]}
+    p[0] = nodes.expression("expression_logic_factor",p)
 
 def p_expression_logic_factor_in(p):
     '''expression_logic_factor : expression_value IN_OP LPAREN values_list RPAREN'''
-    s="{} IN ({})".format(p[1]["content"],",".join(p[4]["values"]))
-    p[0] = {"type":"expression_logic_factor","input":[],"output":[],"content":s}
+    p[0] = nodes.expression("expression_logic_factor",p)
 
 def p_expression_value(p):
     '''expression_value : expr_fun_call
@@ -438,16 +590,7 @@ def p_expression_value(p):
                         | op_names
                         | expression_value PATTERN
                         | PATTERN expression_value'''
-    s=""
-    for pp in p[1:]:
-        if isinstance(pp,dict):
-            if "content" in pp:
-                s += pp["content"]
-            elif "value" in pp:
-                s += pp["value"]
-        else:
-            s += pp
-    p[0] = {"type":"expression_value","content":s,"input":[],"output":[]}
+    p[0] = nodes.expression("expression_value",p)
 
 # Handling here some unwanted tokenizing with "*"
 def p_expression_binop(p):
@@ -461,13 +604,7 @@ def p_expression_binop(p):
                                | expression_logic_factor COMP_OP expression_logic_factor
                                | expression_logic_factor MOD expression_logic_factor
                                | expression_logic_factor DOT expression_logic_factor'''
-    s=""
-    for pp in p[1:]:
-        if isinstance(pp,dict) and "content" in pp:
-            s += pp["content"]
-        else:
-            s += pp
-    p[0] = {"type":"expression_logic_factor","content":s,"input":[],"output":[]}
+    p[0] = nodes.expression("expression_logic_factor",p)
 
 # ---
 def p_expression_fun_call(p):
@@ -483,29 +620,14 @@ def p_expression_fun_call(p):
                      | NOTCHAR commands_names LPAREN RPAREN
                      | NOTCHAR op_names LPAREN expression_fun_args RPAREN
                      | NOTCHAR op_names LPAREN RPAREN'''
-    p[0] = {"type":"expr_fun_call","content":[],"input":[],"output":[],"function":p[1]}
-    if ( not isinstance(p[1],dict)) and p[1] == "!":
-        if len(p) == 6:
-            p[0]["content"]="!{}({})".format(p[2],p[4]["content"])
-        else:
-            p[0]["content"]="!{}()".format(p[2])
-    else:
-        if len(p) == 5:
-            p[0]["content"]="{}({})".format(p[1],p[3]["content"])
-        else:
-            p[0]["content"]="{}()".format(p[1])
+    p[0] = nodes.expression("expr_fun_call",p)
+    p[0]["function"] = p[1]
 
 
 def p_expression_fun_args(p):
     '''expression_fun_args : expression_fun_args COMMA expression 
                            | expression'''
-    s=""
-    for pp in p[1:]:
-        if isinstance(pp,dict) and "content" in pp:
-            s += pp["content"]
-        else:
-            s += pp
-    p[0] = {"type":"expression_fun_args","content":s,"input":[],"output":[]}
+    p[0] = nodes.expression("expression_fun_args",p)
 
 #---------------------------
 # Commands
@@ -513,41 +635,22 @@ def p_expression_fun_args(p):
 def p_commands(p):
     '''commands : commands PIPE command
                 | command'''
+    want = params["facets"]
     if len(p) == 4:
-        p[0] = {"type":"command","input":p[1]["input"]+p[3]["input"],"output":[],"fields-effect":p[1]["fields-effect"]+[p[3]["fields-effect"]],"content":[],"cmd":p[1]["cmd"]+[p[3]["cmd"]],"filters":[]}
-        if p[3]["fields-effect"] == "replace":
-            p[0]["output"]=[]
-            for f in p[3]["output"]:
-                if "*" in f:
-                    if len(p[1]["output"]) > 0:
-                        p[0]["output"] += filterFields(p[1]["output"],f)
-                    else:
-                        p[0]["output"].append(f)
-                else:
-                    p[0]["output"].append(f)
-        elif p[3]["fields-effect"] == "remove":
-            p[0]["output"]=[]
-            rem=[]
-            for f in p[3]["output"]:
-                if "*" in f:
-                    rem += filterFields(p[1]["output"],f)
-                else:
-                    rem.append(f)
-            for f in p[1]["output"]:
-                if not f in rem:
-                    p[0]["output"].append(f)
-        elif p[3]["fields-effect"] == "rename":
-            p[0]["output"]=[]
-            for f in p[1]["output"]:
-                if not f in p[3]["input"]:
-                    p[0]["output"].append(f)
-            p[0]["output"] = p[0]["output"] + p[3]["output"]
-        else:
-            p[0]["output"] = p[1]["output"]+p[3]["output"]
-        if "content" in p[1]:
-            p[0]["content"] += p[1]["content"]
-        if "content" in p[3]:
-            p[0]["content"] += p[3]["content"]
+        p[0] = nodes.Command([],[],[],[],[],filters=[])
+        if "input" in want:
+            p[0]["input"] = p[1]["input"]+p[3]["input"]
+        if "fields-effect" in want:
+            p[0]["fields-effect"] = p[1]["fields-effect"]+[p[3]["fields-effect"]]
+        if "cmd" in want:
+            p[0]["cmd"] = p[1]["cmd"]+[p[3]["cmd"]]
+        if "output" in want:
+            p[0]["output"] = commands_output_update(p[1],p[3])
+        if "content" in want:
+            if "content" in p[1]:
+                p[0]["content"] += p[1]["content"]
+            if "content" in p[3]:
+                p[0]["content"] += p[3]["content"]
     else:
         p[0]=p[1]
         p[0]["cmd"] = [p[0]["cmd"]]
@@ -558,6 +661,38 @@ def p_commands(p):
         p[0]["filters"] = p[1]["filters"] # Should we consider extracting all filters found in subsequent commands or keep only the ones from the first generating command?
     
 
+# Computes the fields available after a command, according to its effect
+# on the fields coming from the previous commands
+def commands_output_update(prev,cmd):
+    out=[]
+    if cmd["fields-effect"] == "replace":
+        for f in cmd["output"]:
+            if "*" in f:
+                if len(prev["output"]) > 0:
+                    out += filterFields(prev["output"],f)
+                else:
+                    out.append(f)
+            else:
+                out.append(f)
+    elif cmd["fields-effect"] == "remove":
+        rem=[]
+        for f in cmd["output"]:
+            if "*" in f:
+                rem += filterFields(prev["output"],f)
+            else:
+                rem.append(f)
+        for f in prev["output"]:
+            if not f in rem:
+                out.append(f)
+    elif cmd["fields-effect"] == "rename":
+        for f in prev["output"]:
+            if not f in cmd["input"]:
+                out.append(f)
+        out = out + cmd["output"]
+    else:
+        out = prev["output"]+cmd["output"]
+    return out
+
 # ERROR HANDLING
 def p_commands_error(p):
     '''commands : commands PIPE error
@@ -713,6 +848,7 @@ def p_commands_names(p):
                       | CMD_XMLUNESCAPE
                       | CMD_XPATH
                       | CMD_XYSERIES
+                      | CMD_CUSTOM
                       '''
     # Removed CMD_WHERE on purpose because it also is a operator in various commands
     # and this creates unwanted behaviours
@@ -747,7 +883,7 @@ def p_op_names(p):
 # SEARCH COMMAND
 def p_command_search(p):
     'command : CMD_SEARCH filters'
-    p[0] = {"type":"command","input":p[2]["input"],"output":[],"fields-effect":"none","content":p[2]["content"],"op":p[2]["op"],"cmd":p[1],"filters":p[2]["filters"]}
+    p[0] = nodes.Command(p[2]["input"],[],"none",p[2]["content"],p[1],op=p[2]["op"],filters=p[2]["filters"])
 
 # STATS / SISTATS
 def p_command_stats(p):
@@ -767,12 +903,12 @@ def p_command_stats(p):
                | CMD_SISTATS agg_terms_list args_list
                | CMD_SISTATS args_list agg_terms_list 
                | CMD_SISTATS agg_terms_list'''
-    fields={"type":"command","input":[],"output":[],"fields-effect":"replace","content":[],"cmd":p[1]}
+    fields=nodes.Command([],[],"replace",[],p[1])
     aggclause = {}
     args={}
 
     for pp in p[2:]:
-        if isinstance(pp,dict):
+        if isinstance(pp,NODES):
             if pp["type"] == "args_list":
                 extendDict(args,pp["args"])
             elif pp["type"] == "agg_terms_list":
@@ -795,13 +931,13 @@ def p_command_stats(p):
     
     if len(args) > 0:
         checkArgs(p,args)
-    logger.info("Parsed a STATS: {}".format(fields))
+    logger.info("Parsed a STATS: %s",fields)
 
 # EVAL
 def p_command_eval(p):
     'command : CMD_EVAL eval_exprs'
-    p[0] = {"type":"command","input":p[2]["input"],"output":p[2]["output"],"fields-effect":"extend","content":p[2]["content"],"cmd":p[1]}
-    logger.info("Parsed a EVAL: {}".format(p[0]))
+    p[0] = nodes.Command(p[2]["input"],p[2]["output"],"extend",p[2]["content"],p[1])
+    logger.info("Parsed a EVAL: %s",p[0])
 
 def p_command_eval_exprs(p):
     '''eval_exprs : eval_exprs COMMA eval_expr_assign
@@ -833,16 +969,16 @@ def p_command_eval_expr_fun(p):
 def p_command_fields_keep(p):
     '''command : CMD_FIELDS PLUS fields_list
                | CMD_FIELDS fields_list'''
-    p[0] = {"type":"command","input":p[len(p)-1]["input"],"output":p[len(p)-1]["input"],"fields-effect":"replace","content":[],"cmd":p[1]}
+    p[0] = nodes.Command(p[len(p)-1]["input"],p[len(p)-1]["input"],"replace",[],p[1])
 
 def p_command_fields_remove(p):
     '''command : CMD_FIELDS MINUS fields_list'''
-    p[0] = {"type":"command","input":p[3]["input"],"output":p[3]["input"],"fields-effect":"remove","content":[],"cmd":p[1]}
+    p[0] = nodes.Command(p[3]["input"],p[3]["input"],"remove",[],p[1])
 
 # RENAME
 def p_command_rename(p):
     'command : CMD_RENAME rfields_list'
-    p[0] = {"type":"command","input":p[2]["input"],"output":p[2]["output"],"fields-effect":"rename","content":[],"cmd":p[1]}
+    p[0] = nodes.Command(p[2]["input"],p[2]["output"],"rename",[],p[1])
 
 # DEDUP
 def p_command_dedup_args(p):
@@ -859,9 +995,9 @@ def p_command_dedup_args(p):
                | CMD_DEDUP fields_list args_list
                | CMD_DEDUP args_list fields_list'''
     args={}
-    p[0] = {"type":"command","input":[],"output":[],"fields-effect":"none","content":[],"cmd":p[1]}
+    p[0] = nodes.Command([],[],"none",[],p[1])
     for pp in p[2:]:
-        if isinstance(pp,dict):
+        if isinstance(pp,NODES):
             if pp["type"] in ["fields_list","sort_clause"]:
                 p[0]["input"] += pp["input"]
             elif pp["type"] == "args_list":
@@ -873,9 +1009,9 @@ def p_command_dedup_noargs(p):
                | CMD_DEDUP fields_list SORTBY_CLAUSE sort_clause
                | CMD_DEDUP NUMBER fields_list
                | CMD_DEDUP fields_list'''
-    p[0] = {"type":"command","input":[],"output":[],"fields-effect":"none","content":[],"cmd":p[1]}
+    p[0] = nodes.Command([],[],"none",[],p[1])
     for pp in p[2:]:
-        if isinstance(pp,dict):
+        if isinstance(pp,NODES):
             if pp["type"] in ["fields_list","sort_clause"]:
                 p[0]["input"] += pp["input"]
 
@@ -920,7 +1056,7 @@ def p_command_basic_no_field(p):
                | CMD_TYPER
                | CMD_UNIQ
                | CMD_XMLUNESCAPE'''
-    p[0] = {"type":"command","input":[],"output":[],"fields-effect":"none","content":[],"cmd":p[1]}
+    p[0] = nodes.Command([],[],"none",[],p[1])
     p[0] = commands_args_and_fields_output_update(p,[])
 
 # BASIC SINGLE FIELD COMMAND
@@ -928,7 +1064,7 @@ def p_command_basic_single_field(p):
     '''command : CMD_EXPAND field_name
                | CMD_FLATTEN field_name
                | CMD_NOMV field_name'''
-    p[0] = {"type":"command","input":[p[2]["field"]],"output":[],"fields-effect":"none","content":[],"cmd":p[1]}
+    p[0] = nodes.Command([p[2]["field"]],[],"none",[],p[1])
 
 # BASIC SINGLE ARG COMMAND
 def p_command_basic_single_arg(p):
@@ -938,7 +1074,7 @@ def p_command_basic_single_arg(p):
                | CMD_HISTORY args_term
                | CMD_OUTPUTTEXT args_term
                | CMD_XMLUNESCAPE args_term'''
-    p[0] = {"type":"command","input":[],"output":[],"fields-effect":"none","content":[],"cmd":p[1]}
+    p[0] = nodes.Command([],[],"none",[],p[1])
     checkArgs(p,p[2]["args"])
     p[0]=commands_args_and_fields_output_update(p,p[2]["args"])
 
@@ -967,7 +1103,7 @@ def p_command_basic_only_args(p):
                | CMD_TYPEAHEAD args_list
                | CMD_TYPER args_list
                | CMD_WALKLEX args_list'''
-    p[0] = {"type":"command","input":[],"output":[],"fields-effect":"none","content":[],"cmd":p[1]}
+    p[0] = nodes.Command([],[],"none",[],p[1])
     checkArgs(p,p[2]["args"])
     p[0]=commands_args_and_fields_output_update(p,p[2]["args"])
 
@@ -977,7 +1113,7 @@ def p_command_basic_only_fields(p):
                | CMD_FILLDOWN fields_list
                | CMD_HIGHLIGHT fields_list
                | CMD_ICONIFY fields_list'''
-    p[0] = {"type":"command","input":p[2]["input"],"output":[],"fields-effect":"none","content":[],"cmd":p[1]}
+    p[0] = nodes.Command(p[2]["input"],[],"none",[],p[1])
     p[0] = commands_args_and_fields_output_update(p,[])
 
 # BASIC FIELDS AND ARGS
@@ -999,9 +1135,19 @@ def p_command_basic_args_and_fields(p):
                | CMD_SELFJOIN command_params_fields_or_args
                | CMD_TAGS command_params_fields_or_args
                | CMD_XYSERIES command_params_fields_or_args'''
-    p[0] = {"type":"command","input":p[2]["fields"],"output":[],"fields-effect":"none","content":[],"cmd":p[1]}
+    p[0] = nodes.Command(p[2]["fields"],[],"none",[],p[1])
     checkArgs(p,p[2]["args"])
     p[0] = commands_args_and_fields_output_update(p,p[2]["args"])
+
+# CUSTOM COMMANDS (registered at runtime)
+def p_command_custom(p):
+    '''command : CMD_CUSTOM command_params_fields_or_args
+               | CMD_CUSTOM'''
+    conf = cmd_conf[p[1]]
+    fields = p[2]["fields"] if len(p) > 2 else []
+    p[0] = nodes.Command(fields,list(conf["created_fields"]),"none" if len(conf["created_fields"]) == 0 else "extend",[],p[1])
+    if len(p) > 2:
+        checkArgs(p,p[2]["args"])
     
 # Performs the transformations necessary for the generic rules of command
 # containing arguments, a fields list or both or even none of all
@@ -1011,18 +1157,18 @@ def commands_args_and_fields_output_update(p,args):
     if p[1] == "anomalydetection":
         if "action" in args:
             if args["action"] in ["filter","annotate"]:
-                out["output"] = cmd_conf[p[1]]["created_fields"]["annotate_filter"]
+                out["output"] = list(cmd_conf[p[1]]["created_fields"]["annotate_filter"])
             elif args["action"] in ["summary"]:
-                out["output"] = cmd_conf[p[1]]["created_fields"]["summary"]
+                out["output"] = list(cmd_conf[p[1]]["created_fields"]["summary"])
                 out["fields-effect"]="replace"
         else:
-            out["output"] = cmd_conf[p[1]]["created_fields"]["annotate_filter"]
+            out["output"] = list(cmd_conf[p[1]]["created_fields"]["annotate_filter"])
     elif p[1] in ["af","analyzefields"]:
         out["input"] = p[2]["args"].values()
-        out["output"] = cmd_conf[p[1]]["created_fields"]
+        out["output"] = list(cmd_conf[p[1]]["created_fields"])
         out["fields-effect"] = "replace"
     elif p[1] == "associate":
-        out["output"] = cmd_conf[p[1]]["created_fields"]
+        out["output"] = list(cmd_conf[p[1]]["created_fields"])
         out["fields-effect"] = "replace"
     elif p[1] == "bucketdir":
         if "pathfield" in args:
@@ -1036,7 +1182,7 @@ def commands_args_and_fields_output_update(p,args):
             p[0]["input"].append(args["field"])
     elif p[1] == "dbinspect":
         out["fields-effect"] = "replace"
-        out["output"] = cmd_conf[p[1]]["created_fields"]
+        out["output"] = list(cmd_conf[p[1]]["created_fields"])
         if "index" in args:
             out["input"].append("index")
             out["content"]=[args["index"]]
@@ -1051,15 +1197,15 @@ def commands_args_and_fields_output_update(p,args):
                 p[0]["content"] = [args["index"]]
     elif p[1] == "makeresults":
         out["fields-effect"] = "generate"
-        out["output"] = cmd_conf[p[1]]["created_fields"]["default"]
+        out["output"] = list(cmd_conf[p[1]]["created_fields"]["default"])
         if "annotate" in args and args["annotate"] in ["t","true","TRUE","True"]:
-            out["output"] = cmd_conf[p[1]]["created_fields"]["annotate"]
+            out["output"] = list(cmd_conf[p[1]]["created_fields"]["annotate"])
     elif p[1] == "fieldsummary":
         out["fields-effect"] = "replace"
-        out["output"] = cmd_conf[p[1]]["created_fields"]
+        out["output"] = list(cmd_conf[p[1]]["created_fields"])
     elif p[1] == "gentimes":
         out["fields-effect"] = "generate"
-        out["output"] = cmd_conf[p[1]]["created_fields"]
+        out["output"] = list(cmd_conf[p[1]]["created_fields"])
     elif p[1] == "highlight":
         out["content"] = p[0]["input"]
         out["input"] = []
@@ -1146,16 +1292,16 @@ def commands_args_and_fields_output_update(p,args):
 # WHERE
 def p_command_where(p):
     'command : CMD_WHERE expression'
-    p[0] = {"type":"command","input":p[2]["input"],"output":p[2]["output"],"fields-effect":"none","content":[p[2]["content"]],"cmd":p[1]}
+    p[0] = nodes.Command(p[2]["input"],p[2]["output"],"none",[p[2]["content"]],p[1])
 
 # ACCUM
 def p_command_accum(p):
     '''command : CMD_ACCUM field_name AS_CLAUSE field_name
                | CMD_ACCUM field_name'''
     if len(p) == 5:
-        p[0] = {"type":"command","input":[p[2]["field"]],"output":[p[4]["field"]],"fields-effect":"extend","content":[],"cmd":p[1]}
+        p[0] = nodes.Command([p[2]["field"]],[p[4]["field"]],"extend",[],p[1])
     else:
-        p[0] = {"type":"command","input":[p[2]["field"]],"output":[],"fields-effect":"none","content":[],"cmd":p[1]}
+        p[0] = nodes.Command([p[2]["field"]],[],"none",[],p[1])
 
 # ANOMALIES
 def p_command_anomalies(p):
@@ -1169,7 +1315,7 @@ def p_command_anomalies(p):
         if "field" in p[2]["args"]:
             ipt.append(p[2]["args"]["field"])                
     
-    p[0] = {"type":"command","input":ipt,"output":cmd_conf[p[1]]["created_fields"],"fields-effect":"extend","content":[],"cmd":p[1]}
+    p[0] = nodes.Command(ipt,list(cmd_conf[p[1]]["created_fields"]),"extend",[],p[1])
 
 # APPEND
 def p_command_append(p):
@@ -1179,9 +1325,9 @@ def p_command_append(p):
                | CMD_APPENDCOLS subsearch'''
     if len(p) == 4:
         checkArgs(p,p[2]["args"])
-        p[0] = {"type":"command","input":p[3]["input"],"output":p[3]["output"],"fields-effect":"extend","content":[],"cmd":p[1]}
+        p[0] = nodes.Command(p[3]["input"],p[3]["output"],"extend",[],p[1])
     else:
-        p[0] = {"type":"command","input":p[2]["input"],"output":p[2]["output"],"fields-effect":"extend","content":[],"cmd":p[1]}
+        p[0] = nodes.Command(p[2]["input"],p[2]["output"],"extend",[],p[1])
 
 # APPENDPIPE
 def p_command_appendpipe(p):
@@ -1189,9 +1335,9 @@ def p_command_appendpipe(p):
                | CMD_APPENDPIPE subpipeline'''
     if len(p) == 4:
         checkArgs(p,p[2])
-        p[0] = {"type":"command","input":p[3]["input"],"output":p[3]["output"],"fields-effect":"extend","content":[],"cmd":p[1]}
+        p[0] = nodes.Command(p[3]["input"],p[3]["output"],"extend",[],p[1])
     else:
-        p[0] = {"type":"command","input":p[2]["input"],"output":p[2]["output"],"fields-effect":"extend","content":[],"cmd":p[1]}
+        p[0] = nodes.Command(p[2]["input"],p[2]["output"],"extend",[],p[1])
 
 # AUTOREGRESS
 def p_command_autoregress(p):
@@ -1204,9 +1350,9 @@ def p_command_autoregress(p):
     if len(p) == 6 :
         checkArgs(p,p[3])
     if p[2]["type"] == "rfield_term":
-        p[0] = {"type":"command","input":p[2]["input"],"output":p[2]["output"],"fields-effect":"extend","content":[],"cmd":p[1]}
+        p[0] = nodes.Command(p[2]["input"],p[2]["output"],"extend",[],p[1])
     elif p[2]["type"] == "field_name":
-        p[0] = {"type":"command","input":[p[2]["field"]],"output":[],"fields-effect":"none","content":[],"cmd":p[1]}
+        p[0] = nodes.Command([p[2]["field"]],[],"none",[],p[1])
 
 # BIN / BUCKET
 def p_command_bin(p):
@@ -1223,10 +1369,10 @@ def p_command_bin(p):
                | CMD_BIN rfield_term
                | CMD_BIN field_name'''
     args={}
-    p[0] = {"type":"command","input":[],"output":[],"fields-effect":"extend","content":[],"cmd":p[1]}
+    p[0] = nodes.Command([],[],"extend",[],p[1])
     
     for pp in p[2:]:
-        if isinstance(pp,dict):
+        if isinstance(pp,NODES):
             if pp["type"] == "args_list":
                 extendDict(args,pp["args"])
             elif pp["type"] == "rfield_term":
@@ -1243,7 +1389,7 @@ def p_command_bin(p):
 def p_command_chart(p):
     '''command : CMD_CHART command_chart_1 command_chart_2
                | CMD_SICHART command_chart_1 command_chart_2'''
-    p[0] = {"type":"command","input":p[2]["input"]+p[3]["fields"],"output":p[2]["output"],"fields-effect":"replace","content":[],"cmd":p[1]}
+    p[0] = nodes.Command(p[2]["input"]+p[3]["fields"],p[2]["output"],"replace",[],p[1])
     args=p[2]["args"]
     extendDict(args,p[3]["args"])
     if "modes" in p[3] and "chart_by" in p[3]["modes"]:
@@ -1325,7 +1471,7 @@ def p_command_chart_where_clause(p):
 # COFILTER
 def p_command_cofilter(p):
     'command : CMD_COFILTER field_name field_name'
-    p[0] = {"type":"command","input":[p[2]["field"],p[2]["field"]],"output":[],"fields-effect":"replace","content":[],"cmd":p[1]}
+    p[0] = nodes.Command([p[2]["field"],p[2]["field"]],[],"replace",[],p[1])
 
 # CONTINGENCY
 def p_command_contingency(p):
@@ -1334,7 +1480,7 @@ def p_command_contingency(p):
                | CMD_CONTINGENCY field_name fields_list args_list
                | CMD_CONTINGENCY field_name field_name'''
     args={}
-    p[0] = {"type":"command","input":[],"output":[],"fields-effect":"replace","content":[],"cmd":p[1]}
+    p[0] = nodes.Command([],[],"replace",[],p[1])
     for pp in p[2:]:
         if pp["type"] == "args_list":
             extendDict(args,pp["args"])
@@ -1349,10 +1495,10 @@ def p_command_convert(p):
     '''command : CMD_CONVERT args_term convert_list
                | CMD_CONVERT convert_list args_term
                | CMD_CONVERT convert_list'''
-    p[0] = {"type":"command","input":[],"output":[],"fields-effect":"none","content":[],"cmd":p[1]}
+    p[0] = nodes.Command([],[],"none",[],p[1])
     args={}
     for pp in p[2:]:
-        if isinstance(pp,dict):
+        if isinstance(pp,NODES):
             if pp["type"] == "args_term":
                 extendDict(args,pp["args"])
             elif pp["type"] == "convert_list":
@@ -1376,11 +1522,11 @@ def p_command_convert_fun(p):
                    | NAME LPAREN TIMES RPAREN
                    | NAME LPAREN TIMES RPAREN AS_CLAUSE field_name'''
     p[0] = {"type":"convert_fun","input":[],"output":[],"op":[p[1]]}
-    if isinstance(p[3],dict):
+    if isinstance(p[3],NODES):
         p[0]["input"].append(p[3]["field"])
     else:
         p[0]["input"].append(p[3])
-    if isinstance(p[len(p)-1],dict) and p[len(p)-1]["type"] == "field_name":
+    if isinstance(p[len(p)-1],NODES) and p[len(p)-1]["type"] == "field_name":
         p[0]["output"].append(p[len(p)-1]["field"])
 
 # DATAMODEL
@@ -1398,10 +1544,10 @@ def p_command_datamodel(p):
                | CMD_DATAMODEL field_name
                | CMD_DATAMODEL'''
     global cmd_conf
-    p[0] = {"type":"command","input":[],"output":[],"fields-effect":"generate","content":[],"cmd":p[1]}
+    p[0] = nodes.Command([],[],"generate",[],p[1])
     args={}
     for pp in p[2:]:
-        if isinstance(pp,dict):
+        if isinstance(pp,NODES):
             if pp["type"] == "args_list":
                 extendDict(args,pp["args"])
             elif pp["type"] == "field_name":
@@ -1411,7 +1557,7 @@ def p_command_datamodel(p):
     if len(p[0]["output"]) == 3:
         sm=p[0]["output"][2]
         if not sm in cmd_conf[p[1]]["search_modes"]:
-            report_error(p.lexpos(1),p.lexspan(len(p)-1)[1],"Unexpected datamode search mode '{}', expected {}".format(sm,cmd_conf[p[1]]["search_modes"]),None,value=sm)
+            report_error(p.lexpos(1),p.lexspan(len(p)-1)[1],"Unexpected datamode search mode '{}', expected {}".format(sm,cmd_conf[p[1]]["search_modes_text"]),None,value=sm)
     checkArgs(p,args)
 
 # DELTA
@@ -1422,10 +1568,10 @@ def p_command_delta(p):
                | CMD_DELTA args_term field_name
                | CMD_DELTA field_name args_term
                | CMD_DELTA field_name'''
-    p[0] = {"type":"command","input":[],"output":[],"fields-effect":"extend","content":[],"cmd":p[1]}
+    p[0] = nodes.Command([],[],"extend",[],p[1])
     args={}
     for pp in p[2:]:
-        if isinstance(pp,dict):
+        if isinstance(pp,NODES):
             if pp["type"] == "args_term":
                 extendDict(args,pp["args"])
             elif pp["type"] == "field_name":
@@ -1443,7 +1589,7 @@ def p_command_erex(p):
                | CMD_EREX args_list field_name
                | CMD_EREX field_name args_list
                | CMD_EREX args_list'''
-    p[0] = {"type":"command","input":[],"output":[],"fields-effect":"extend","content":[],"cmd":p[1]}
+    p[0] = nodes.Command([],[],"extend",[],p[1])
     args={}
     for pp in p[2:]:
         if pp["type"] == "args_list":
@@ -1464,10 +1610,10 @@ def p_command_eventstats(p):
                | CMD_EVENTSTATS agg_terms_list args_term
                | CMD_EVENTSTATS agg_terms_list
                '''
-    p[0] = {"type":"command","input":[],"output":[],"fields-effect":"extend","content":[],"cmd":p[1]}
+    p[0] = nodes.Command([],[],"extend",[],p[1])
     args={}
     for pp in p[2:]:
-        if isinstance(pp,dict):
+        if isinstance(pp,NODES):
             if pp["type"] == "args_term":
                 extendDict(args,pp["args"])
             elif pp["type"] == "agg_terms_list":
@@ -1485,7 +1631,7 @@ def p_command_extract(p):
                | CMD_EXTRACT args_list
                | CMD_EXTRACT value
                | CMD_EXTRACT'''
-    p[0] = {"type":"command","input":["_raw"],"output":[],"fields-effect":"none","content":[],"cmd":p[1]}
+    p[0] = nodes.Command(["_raw"],[],"none",[],p[1])
     args={}
     for pp in p[2:]:
         if pp["type"] == "args_list":
@@ -1497,7 +1643,7 @@ def p_command_extract(p):
 # FIELDFORMAT
 def p_command_fieldformat(p):
     'command : CMD_FIELDFORMAT field_name EQ expression_logic_factor'
-    p[0] = {"type":"command","input":[p[2]["field"]],"output":[],"fields-effect":"none","content":[p[4]["content"]],"cmd":p[1]}
+    p[0] = nodes.Command([p[2]["field"]],[],"none",[p[4]["content"]],p[1])
 
 # FINDTYPES
 def p_command_findtypes(p):
@@ -1505,7 +1651,7 @@ def p_command_findtypes(p):
                | CMD_FINDTYPES args_term field_name
                | CMD_FINDTYPES args_term
                | CMD_FINDTYPES'''
-    p[0] = {"type":"command","input":[],"output":[],"fields-effect":"none","content":[],"cmd":p[1]}
+    p[0] = nodes.Command([],[],"none",[],p[1])
     args={}
     for pp in p[2:]:
         if pp["type"] == "args_term":
@@ -1513,7 +1659,7 @@ def p_command_findtypes(p):
         elif pp["type"] == "field_name":
             arg=pp["field"]
             if not arg in cmd_conf[p[1]]["modes"]:
-                report_error(p.lexpos(1),p.lexspan(len(p)-1)[1],"Unexpected argument '{}' in {}, expected {}".format(arg,p[1],str(cmd_conf[p[1]]["modes"])),None,value=arg)
+                report_error(p.lexpos(1),p.lexspan(len(p)-1)[1],"Unexpected argument '{}' in {}, expected {}".format(arg,p[1],cmd_conf[p[1]]["modes_text"]),None,value=arg)
     checkArgs(p,args)
 
 # FOREACH
@@ -1526,10 +1672,10 @@ def p_command_foreach(p):
                | CMD_FOREACH TIMES args_list subsearch_foreach
                | CMD_FOREACH args_list TIMES subsearch_foreach
                | CMD_FOREACH TIMES subsearch_foreach'''
-    p[0] = {"type":"command","input":[],"output":[],"fields-effect":"none","content":[],"cmd":p[1]}
+    p[0] = nodes.Command([],[],"none",[],p[1])
     args={}
     for pp in p[2:]:
-        if isinstance(pp,dict):
+        if isinstance(pp,NODES):
             if pp["type"] == "args_list":
                 extendDict(args,pp["args"])
             elif pp["type"] == "fields_list":
@@ -1554,10 +1700,10 @@ def p_command_format(p):
                | CMD_FORMAT STRING STRING STRING STRING STRING STRING
                | CMD_FORMAT args_list
                | CMD_FORMAT'''
-    p[0] = {"type":"command","input":[],"output":[],"fields-effect":"none","content":[],"cmd":p[1]}
+    p[0] = nodes.Command([],[],"none",[],p[1])
     args={}
     for pp in p[2:]:
-        if isinstance(pp,dict):
+        if isinstance(pp,NODES):
             if pp["type"] == "args_list":
                 extendDict(args,pp["args"])
         else:
@@ -1570,7 +1716,7 @@ def p_command_from(p):
                | CMD_FROM field_name STRING DOT STRING
                | CMD_FROM field_name field_name
                | CMD_FROM field_name'''
-    p[0] = {"type":"command","input":[],"output":[],"fields-effect":"generate","content":[],"cmd":p[1]}
+    p[0] = nodes.Command([],[],"generate",[],p[1])
     if len(p) == 6:
         p[0]["input"].append("{}{}.{}".format(p[2]["field"],p[3],p[5]))
     elif len(p) > 3:
@@ -1585,7 +1731,7 @@ def p_command_from(p):
 #GAUGE
 def p_command_gauge(p):
     'command : CMD_GAUGE field_or_num_list'
-    p[0] = {"type":"command","input":p[2]["input"],"output":["x"],"fields-effect":"replace","content":[],"cmd":p[1]}
+    p[0] = nodes.Command(p[2]["input"],["x"],"replace",[],p[1])
     if len(p[2]["values"]) > 1:
         for i in range(1,len(p[2]["values"])):  # adding y1, y2 depending on the number of range values
             p[0]["output"].append("y{}".format(i))
@@ -1599,7 +1745,7 @@ def p_command_geom(p):
                | CMD_GEOM field_name args_list
                | CMD_GEOM field_name
                | CMD_GEOM'''
-    p[0] = {"type":"command","input":[],"output":[cmd_conf[p[1]]["created_fields"]],"fields-effect":"extend","content":[],"cmd":p[1]}
+    p[0] = nodes.Command([],[list(cmd_conf[p[1]]["created_fields"])],"extend",[],p[1])
     args={}
     for pp in p[2:]:
         if pp["type"] == "args_list":
@@ -1621,10 +1767,10 @@ def p_command_geostats(p):
                | CMD_GEOSTATS args_list agg_terms_list
                | CMD_GEOSTATS agg_terms_list args_list
                | CMD_GEOSTATS agg_terms_list'''
-    p[0] = {"type":"command","input":[],"output":[cmd_conf[p[1]]["created_fields"]],"fields-effect":"replace","content":[],"cmd":p[1]}
+    p[0] = nodes.Command([],[list(cmd_conf[p[1]]["created_fields"])],"replace",[],p[1])
     args={}
     for pp in p[2:]:
-        if isinstance(pp,dict):
+        if isinstance(pp,NODES):
             if pp["type"] == "args_list":
                 extendDict(args,pp["args"])
             elif pp["type"] == "agg_terms_list":
@@ -1642,10 +1788,10 @@ def p_commend_head(p):
                | CMD_HEAD args_list expression
                | CMD_HEAD expression
                | CMD_HEAD'''
-    p[0] = {"type":"command","input":[],"output":[],"fields-effect":"none","content":[],"cmd":p[1]}
+    p[0] = nodes.Command([],[],"none",[],p[1])
     args={}
     for pp in p[2:]:
-        if isinstance(pp,dict):
+        if isinstance(pp,NODES):
             if pp["type"] == "args_list":
                 extendDict(args,pp["args"])
             elif pp["type"] == "expression":
@@ -1663,10 +1809,10 @@ def p_command_inputlookup(p):
                | CMD_INPUTCSV args_list field_name
                | CMD_INPUTCSV field_name'''
 
-    p[0] = {"type":"command","input":[],"output":[],"fields-effect":"generate","content":[],"cmd":p[1]}
+    p[0] = nodes.Command([],[],"generate",[],p[1])
     args={}
     for pp in p[2:]:
-        if isinstance(pp,dict):
+        if isinstance(pp,NODES):
             if pp["type"] == "args_list":
                 extendDict(args,pp["args"])
             elif pp["type"] == "expression":
@@ -1682,7 +1828,7 @@ def p_command_iplocation(p):
                | CMD_IPLOCATION args_list field_name
                | CMD_IPLOCATION field_name
                | CMD_IPLOCATION'''
-    p[0] = {"type":"command","input":[],"output":[],"fields-effect":"extend","content":[],"cmd":p[1]}
+    p[0] = nodes.Command([],[],"extend",[],p[1])
     args={}
     for pp in p[2:]:
         if pp["type"] == "args_list":
@@ -1711,7 +1857,7 @@ def p_command_join(p):
                | CMD_JOIN args_list subsearch
                | CMD_JOIN subsearch args_list
                | CMD_JOIN subsearch'''
-    p[0] = {"type":"command","input":[],"output":[],"fields-effect":"none","content":[],"cmd":p[1]}
+    p[0] = nodes.Command([],[],"none",[],p[1])
     args={}
     for pp in p[2:]:
         if pp["type"] == "args_list":
@@ -1729,7 +1875,7 @@ def p_command_loadjob(p):
     '''command : CMD_LOADJOB value args_list
                | CMD_LOADJOB args_list
                | CMD_LOADJOB value'''
-    p[0] = {"type":"command","input":[],"output":[],"fields-effect":"generate","content":[],"cmd":p[1]}
+    p[0] = nodes.Command([],[],"generate",[],p[1])
     args={}
     for pp in p[2:]:
         if pp["type"] == "args_list":
@@ -1746,7 +1892,7 @@ def p_command_lookup(p):
                | CMD_LOOKUP field_name any_fields_list OUTPUT_NEW_OP any_fields_list
                | CMD_LOOKUP field_name any_fields_list
                | CMD_LOOKUP field_name'''
-    p[0] = {"type":"command","input":[],"output":[],"fields-effect":"extend","content":[p[2]["field"]],"cmd":p[1]}
+    p[0] = nodes.Command([],[],"extend",[p[2]["field"]],p[1])
     args={}
     if len(p) > 3:
         p[0]["input"] += p[3]["input"]+p[3]["output"]
@@ -1758,11 +1904,11 @@ def p_command_lookup_args(p):
                | CMD_LOOKUP args_list field_name any_fields_list OUTPUT_NEW_OP any_fields_list
                | CMD_LOOKUP args_list field_name any_fields_list
                | CMD_LOOKUP args_list field_name'''
-    p[0] = {"type":"command","input":[],"output":[],"fields-effect":"extend","file":p[3]["field"],"cmd":p[1]}
+    p[0] = nodes.Command([],[],"extend",[],p[1],file=p[3]["field"])
     if len(p) > 4:
         p[0]["input"] += p[4]["input"]+p[4]["output"]
     if len(p) > 6:
-        p[0]["output"] = p[5]["input"]
+        p[0]["output"] = p[6]["input"]
     checkArgs(p,p[2]["args"])
 
 # MAKECONTINUOUS
@@ -1771,10 +1917,10 @@ def p_command_makecontinuous(p):
                | CMD_MAKECONTINUOUS field_name args_list
                | CMD_MAKECONTINUOUS args_list field_name
                | CMD_MAKECONTINUOUS args_list'''
-    p[0] = {"type":"command","input":[],"output":[],"fields-effect":"none","content":[],"cmd":p[1]}
+    p[0] = nodes.Command([],[],"none",[],p[1])
     args={}
     for pp in p[2:]:
-        if isinstance(pp,dict):
+        if isinstance(pp,NODES):
             if pp["type"] == "args_list":
                 extendDict(args,pp["args"])
             elif pp["type"] == "field_name":
@@ -1787,10 +1933,10 @@ def p_command_makemv(p):
                | CMD_MAKEMV args_list field_name
                | CMD_MAKEMV field_name args_list
                | CMD_MAKEMV field_name'''
-    p[0] = {"type":"command","input":[],"output":[],"fields-effect":"none","content":[],"cmd":p[1]}
+    p[0] = nodes.Command([],[],"none",[],p[1])
     args={}
     for pp in p[2:]:
-        if isinstance(pp,dict):
+        if isinstance(pp,NODES):
             if pp["type"] == "args_list":
                 extendDict(args,pp["args"])
             elif pp["type"] == "field_name":
@@ -1803,7 +1949,7 @@ def p_command_map(p):
                | CMD_MAP value args_list
                | CMD_MAP value
                | CMD_MAP args_list'''
-    p[0] = {"type":"command","input":[],"output":[],"fields-effect":"none","content":[],"cmd":p[1]}
+    p[0] = nodes.Command([],[],"none",[],p[1])
     args={}
     for pp in p[2:]:
         if pp["type"] == "args_list":
@@ -1818,7 +1964,7 @@ def p_command_map(p):
 def p_command_metasearch(p):
     '''command : CMD_METASEARCH filters
                | CMD_METASEARCH'''
-    p[0] = {"type":"command","input":[],"output":cmd_conf[p[1]]["created_fields"],"fields-effect":"generate","content":[],"cmd":p[1]}
+    p[0] = nodes.Command([],list(cmd_conf[p[1]]["created_fields"]),"generate",[],p[1])
     if len(p) > 2:
         p[0]["input"] = p[2]["input"]
         p[0]["content"] = [p[2]["content"]]
@@ -1827,7 +1973,7 @@ def p_command_metasearch(p):
 def p_command_mstats(p):
     '''command : CMD_MSTATS mstats_1 mstats_2
                | CMD_MSTATS mstats_1'''
-    p[0] = {"type":"command","input":p[2]["input"],"output":p[2]["output"],"fields-effect":"generate","content":p[2]["content"],"cmd":p[1]}
+    p[0] = nodes.Command(p[2]["input"],p[2]["output"],"generate",p[2]["content"],p[1])
     args=p[2]["args"]
     if len(p) > 3:
         extendDict(args,p[3]["args"])
@@ -1869,7 +2015,7 @@ def p_command_mstats_2_where(p):
                       | CMD_WHERE filters'''
     p[0] = {"type":"mstats_2_where","input":[],"output":[],"fields-effect":"none","content":[],"args":{},"cmd":p[1]}
     for pp in p[2:]:
-        if isinstance(pp,dict):
+        if isinstance(pp,NODES):
             if pp["type"] == "args_list":
                 extendDict(p[0]["args"],pp["args"])
             elif pp["type"] == "filters":
@@ -1888,7 +2034,7 @@ def p_command_mstats_2_by(p):
                    | GROUPBY_CLAUSE fields_list'''
     p[0] = {"type":"mstats_2_by","input":[],"output":[],"fields-effect":"none","content":[],"args":{}}
     for pp in p[2:]:
-        if isinstance(pp,dict):
+        if isinstance(pp,NODES):
             if pp["type"] == "args_list":
                 extendDict(p[0]["args"],pp["args"])
             elif pp["type"] == "fields_list":
@@ -1914,10 +2060,10 @@ def p_command_multikv(p):
                | CMD_MULTIKV args_list FILTER_OP values_list
                | CMD_MULTIKV FILTER_OP values_list
                | CMD_MULTIKV args_list'''
-    p[0] = {"type":"command","input":[],"output":[],"fields-effect":"none","content":[],"cmd":p[1]}
+    p[0] = nodes.Command([],[],"none",[],p[1])
     args={}
     for pp in p[2:]:
-        if isinstance(pp,dict):
+        if isinstance(pp,NODES):
             if pp["type"] == "args_list":
                 extendDict(args,pp["args"])
             elif pp["type"] == "fields_list":
@@ -1926,13 +2072,13 @@ def p_command_multikv(p):
                 p[0]["content"] += pp["values"]
         else:
             if not pp in cmd_conf[p[1]]["selectors"]:
-                report_error(p.lexpos(1),p.lexspan(len(p)-1)[1],"Unexpected selector {} in {}, expected {}".format(pp,p[1],cmd_conf[p[1]]["selectors"]),None,value=pp)
+                report_error(p.lexpos(1),p.lexspan(len(p)-1)[1],"Unexpected selector {} in {}, expected {}".format(pp,p[1],cmd_conf[p[1]]["selectors_text"]),None,value=pp)
     checkArgs(p,args)
 
 # MULTISEARCH / MULTIREPORT
 def p_command_multisearch(p):
     '''command : CMD_MULTISEARCH subsearches'''
-    p[0] = {"type":"command","input":p[2]["input"],"output":p[2]["output"],"fields-effect":"generate","content":p[2]["content"],"cmd":p[1]}
+    p[0] = nodes.Command(p[2]["input"],p[2]["output"],"generate",p[2]["content"],p[1])
 
 # MVCOMBINE / MVEXPAND
 def p_command_mvcombine(p):
@@ -1942,7 +2088,7 @@ def p_command_mvcombine(p):
                | CMD_MVEXPAND args_term field_name
                | CMD_MVEXPAND field_name args_term
                | CMD_MVEXPAND field_name'''
-    p[0] = {"type":"command","input":[],"output":[],"fields-effect":"none","content":[],"cmd":p[1]}
+    p[0] = nodes.Command([],[],"none",[],p[1])
     for pp in p[2:]:
         if pp["type"] == "args_term":
             checkArgs(p,pp["args"])
@@ -1960,7 +2106,7 @@ def p_command_outputlookup(p):
                | CMD_OUTPUTCSV field_name args_list
                | CMD_OUTPUTCSV field_name'''
 
-    p[0] = {"type":"command","input":[],"output":[],"fields-effect":"none","content":[],"cmd":p[1]}
+    p[0] = nodes.Command([],[],"none",[],p[1])
     args={}
     for pp in p[2:]:
         if pp["type"] == "args_list":
@@ -1972,7 +2118,7 @@ def p_command_outputlookup(p):
 # PIVOT
 def p_command_pivot(p):
     '''command : CMD_PIVOT field_name field_name pivot_element'''
-    p[0] = {"type":"command","input":p[4]["input"],"output":p[4]["output"],"fields-effect":"generate","content":[p[2]["field"],p[3]["field"]]+p[4]["content"],"cmd":p[1]}
+    p[0] = nodes.Command(p[4]["input"],p[4]["output"],"generate",[p[2]["field"],p[3]["field"]]+p[4]["content"],p[1])
 
     checkArgs(p,p[4]["args"])
 
@@ -1984,7 +2130,7 @@ def p_command_pivot_element(p):
                      | pivot_cell_value'''
     p[0] = {"type":"pivot_element","input":[],"output":[],"content":[],"args":{}}
     for pp in p[1:]:
-        if isinstance(pp,dict):
+        if isinstance(pp,NODES):
             extendDict(p[0]["args"],pp["args"])
             p[0]["input"] += pp["input"]
             p[0]["output"] += pp["output"]
@@ -2006,7 +2152,7 @@ def p_command_pivot_split(p):
                    | pivot_splitrow'''
     p[0] = {"type":"pivot_split","input":[],"output":[],"content":[],"args":{}}
     for pp in p[1:]:
-        if isinstance(pp,dict):
+        if isinstance(pp,NODES):
             extendDict(p[0]["args"],pp["args"])
             p[0]["input"] += pp["input"]
             p[0]["output"] += pp["output"]
@@ -2021,7 +2167,7 @@ def p_command_pivot_splitcol(p):
                       | SPLITCOL_OP field_name'''
     p[0] = {"type":"pivot_splitcol","input":[p[2]["field"]],"output":[p[2]["field"]],"content":[],"args":{}}
     if len(p) > 3:
-        if not isinstance(p[4],dict):
+        if not isinstance(p[4],NODES):
             p[0]["content"].append(p[4])
         elif p[4]["type"] == "field_name":
             p[0]["content"].append(p[4]["field"])
@@ -2047,7 +2193,7 @@ def p_command_pivot_splitrow(p):
     if len(p) > 3:
         for i in range(4,len(p)):
             pp=p[i]
-            if isinstance(pp,dict):
+            if isinstance(pp,NODES):
                 if pp["type"] == "basic_args_list":
                     extendDict(p[0]["args"],pp["args"])
                 elif pp["type"] == "field_name":
@@ -2084,7 +2230,7 @@ def p_command_pivot_element_term(p):
     p[0] = {"type":"pivot_element_term","input":[],"output":[],"content":[],"args":{}}
     op=p[1]
     for pp in p[2:]:
-        if isinstance(pp,dict):
+        if isinstance(pp,NODES):
             if pp["type"] == "field_name":
                 p[0]["input"].append(pp["field"])
             elif pp["type"] == "sort_clause":
@@ -2093,7 +2239,7 @@ def p_command_pivot_element_term(p):
 # PREDICT
 def p_command_predict(p):
     '''command : CMD_PREDICT predict_list'''
-    p[0] = {"type":"command","input":[],"output":[],"fields-effect":"extend","content":[],"cmd":p[1]}
+    p[0] = nodes.Command([],[],"extend",[],p[1])
     args={}
     p[0]["input"] += p[2]["input"]
     p[0]["output"] += p[2]["output"]
@@ -2138,7 +2284,7 @@ def p_command_predict_list(p):
 # RANGEMAP
 def p_command_rangemap(p):
     '''command : CMD_RANGEMAP args_list'''
-    p[0] = {"type":"command","input":[],"output":[],"fields-effect":"none","content":[],"cmd":p[1]}
+    p[0] = nodes.Command([],[],"none",[],p[1])
     for arg in p[2]["args"]:
         if not arg in cmd_conf[p[1]]["args"]:
             p[0]["input"].append(arg)
@@ -2156,10 +2302,10 @@ def p_command_rare(p):
                | CMD_RARE args_list fields_list
                | CMD_RARE fields_list args_list
                | CMD_RARE fields_list'''
-    p[0] = {"type":"command","input":[],"output":[],"fields-effect":"none","content":[],"cmd":p[1]}
+    p[0] = nodes.Command([],[],"none",[],p[1])
     args={}
     for pp in p[2:]:
-        if isinstance(pp,dict):
+        if isinstance(pp,NODES):
             if pp["type"] == "args_list":
                 extendDict(args,pp["args"])
             elif pp["type"] == "fields_list":
@@ -2173,10 +2319,10 @@ def p_command_redistribute(p):
                | CMD_REDISTRIBUTE BY_CLAUSE fields_list
                | CMD_REDISTRIBUTE args_term
                | CMD_REDISTRIBUTE'''
-    p[0] = {"type":"command","input":[],"output":[],"fields-effect":"none","content":[],"cmd":p[1]}
+    p[0] = nodes.Command([],[],"none",[],p[1])
     if len(p) > 2:
         for pp in p[2:]:
-            if isinstance(pp,dict):
+            if isinstance(pp,NODES):
                 if pp["type"] == "args_term":
                     checkArgs(p,pp["args"])
                 elif pp["type"] == "fields_list":
@@ -2187,17 +2333,17 @@ def p_command_regex(p):
     '''command : CMD_REGEX field_name EQ STRING
                | CMD_REGEX field_name NEQ STRING
                | CMD_REGEX STRING'''
-    p[0] = {"type":"command","input":[],"output":[],"fields-effect":"none","content":[p[len(p)-1]],"cmd":p[1]}
-    if isinstance(p[2],dict):
+    p[0] = nodes.Command([],[],"none",[p[len(p)-1]],p[1])
+    if isinstance(p[2],NODES):
         p[0]["input"].append(p[2]["field"])
 
 # REPLACE
 def p_command_replace(p):
     '''command : CMD_REPLACE replace_list IN_OP fields_list
                | CMD_REPLACE replace_list'''
-    p[0] = {"type":"command","input":[],"output":[],"fields-effect":"none","content":[],"cmd":p[1]}
+    p[0] = nodes.Command([],[],"none",[],p[1])
     for pp in p[2:]:
-        if isinstance(pp,dict):
+        if isinstance(pp,NODES):
             if pp["type"] == "fields_list":
                 p[0]["input"] += pp["input"]
             elif pp["type"] == "replace_list":
@@ -2209,7 +2355,7 @@ def p_command_replace_term(p):
                     | value WITH_OP value'''
     p[0] = {"type":"replace_list","input":[],"output":[],"content":[]}
     for pp in p[1:]:
-        if isinstance(pp,dict):
+        if isinstance(pp,NODES):
             if pp["type"] == "value":
                 p[0]["content"].append(pp["value"])
             elif pp["type"] == "replace_list":
@@ -2224,7 +2370,7 @@ def p_command_rest(p):
     p[0] = {"type":"replace_list","input":[],"output":[],"fields-effect":"generate","content":[],"cmd":p[1]}
     args={}
     for pp in p[2:]:
-        if isinstance(pp,dict):
+        if isinstance(pp,NODES):
             if pp["type"] == "args_list":
                 extendDict(args,pp["args"])
             elif pp["type"] == "value":
@@ -2248,7 +2394,7 @@ def p_command_return(p):
                | CMD_RETURN'''
     p[0] = {"type":"replace_list","input":[],"output":["search"],"fields-effect":"generate","content":[],"cmd":p[1]}
     for pp in p[2:]:
-        if isinstance(pp,dict):
+        if isinstance(pp,NODES):
             if pp["type"] == "args_list":
                 p[0]["input"] += list(pp["args"].keys())
             elif pp["type"] == "fields_list":
@@ -2264,10 +2410,10 @@ def p_command_rex(p):
                | CMD_REX args_list STRING
                | CMD_REX STRING args_list
                | CMD_REX STRING'''
-    p[0] = {"type":"command","input":[],"output":[],"fields-effect":"extend","content":[],"cmd":p[1]}
+    p[0] = nodes.Command([],[],"extend",[],p[1])
     args={}
     for pp in p[2:]:
-        if isinstance(pp,dict):
+        if isinstance(pp,NODES):
             if pp["type"] == "args_list":
                 extendDict(args,pp["args"])
         else:
@@ -2283,7 +2429,7 @@ def p_command_savedsearch(p):
                | CMD_SAVEDSEARCH args_list field_name
                | CMD_SAVEDSEARCH field_name args_list
                | CMD_SAVEDSEARCH field_name'''
-    p[0] = {"type":"command","input":[],"output":[],"fields-effect":"generate","content":[],"cmd":p[1]}
+    p[0] = nodes.Command([],[],"generate",[],p[1])
     args={}
     for pp in p[2:]:
         if pp["type"] == "args_list":
@@ -2297,7 +2443,7 @@ def p_command_savedsearch(p):
 # SEARCHTXN
 def p_command_searchtxn(p):
     '''command : CMD_SEARCHTXN field_name filters'''
-    p[0] = {"type":"command","input":[],"output":[],"fields-effect":"generate","content":[],"cmd":p[1]}
+    p[0] = nodes.Command([],[],"generate",[],p[1])
     for pp in p[2:]:
         if pp["type"] == "field_name":
             p[0]["content"].append(pp["field"])
@@ -2312,7 +2458,7 @@ def p_command_set(p):
     '''command : CMD_SET NAME subsearch subsearch
                | CMD_SET CMD_DIFF subsearch subsearch
                | CMD_SET CMD_UNION subsearch subsearch'''
-    p[0] = {"type":"command","input":p[3]["input"]+p[4]["input"],"output":[],"fields-effect":"generate","content":p[3]["content"]+p[4]["content"],"cmd":p[1]}
+    p[0] = nodes.Command(p[3]["input"]+p[4]["input"],[],"generate",p[3]["content"]+p[4]["content"],p[1])
     checkArgs(p,[p[2]])
 
 # SETFIELDS
@@ -2320,7 +2466,7 @@ def p_command_setfields(p):
     '''command : CMD_SETFIELDS str_args_list'''
     k=list(p[2]["args"].keys())
     v=list(p[2]["args"].values())
-    p[0] = {"type":"command","input":k,"output":k,"fields-effect":"extend","content":v,"cmd":p[1]}
+    p[0] = nodes.Command(k,k,"extend",v,p[1])
 
 # SORT
 def p_command_sort(p):
@@ -2328,9 +2474,9 @@ def p_command_sort(p):
                | CMD_SORT sort_clause
                | CMD_SORT NUMBER sort_clause NAME
                | CMD_SORT sort_clause NAME'''
-    p[0] = {"type":"command","input":[],"output":[],"fields-effect":"none","content":[],"cmd":p[1]}
+    p[0] = nodes.Command([],[],"none",[],p[1])
     for pp in p[2:]:
-        if isinstance(pp,dict):
+        if isinstance(pp,NODES):
             if pp["type"] == "sort_clause":
                 p[0]["input"] = pp["input"]
                 p[0]["output"] = pp["output"]
@@ -2340,7 +2486,7 @@ def p_command_sort(p):
 def p_command_sort_clause(p):
     '''sort_clause : sort_clause COMMA sort_term
                    | sort_term'''
-    p[0] = {"type":"sort_clause","input":[],"output":[]}
+    p[0] = nodes.FieldList("sort_clause",[],[])
     if len(p) == 4:
         p[0]["input"] = p[1]["input"] + [p[3]["field"]]
     else:
@@ -2350,7 +2496,7 @@ def p_command_sort_term(p):
     '''sort_term : PLUS field_name
                  | MINUS field_name
                  | field_name'''
-    p[0] = {"type":"sort_term","field":p[len(p)-1]["field"]}
+    p[0] = nodes.Field("sort_term",p[len(p)-1]["field"])
 
 # SPATH
 def p_command_spath(p):
@@ -2360,7 +2506,7 @@ def p_command_spath(p):
                | CMD_SPATH field_name
                | CMD_SPATH args_list
                | CMD_SPATH'''
-    p[0] = {"type":"command","input":[],"output":[],"fields-effect":"extend","content":[],"cmd":p[1]}
+    p[0] = nodes.Command([],[],"extend",[],p[1])
     args={}
     for pp in p[2:]:
         if pp["type"] == "args_list":
@@ -2379,7 +2525,7 @@ def p_command_strcat(p):
     '''command : CMD_STRCAT args_term strcat_fields
                | CMD_STRCAT strcat_fields args_term
                | CMD_STRCAT strcat_fields'''
-    p[0] = {"type":"command","input":[],"output":[],"fields-effect":"extend","content":[],"cmd":p[1]}
+    p[0] = nodes.Command([],[],"extend",[],p[1])
     for pp in p[2:]:
         if pp["type"] == "args_term":
             checkArgs(p,pp["args"])
@@ -2411,10 +2557,10 @@ def p_command_streamstats(p):
                | CMD_STREAMSTATS agg_terms_list streamstats_args
                | CMD_STREAMSTATS streamstats_args agg_terms_list
                | CMD_STREAMSTATS agg_terms_list'''
-    p[0] = {"type":"command","input":[],"output":[],"fields-effect":"extend","content":[],"cmd":p[1]}
+    p[0] = nodes.Command([],[],"extend",[],p[1])
     args={}
     for pp in p[2:]:
-        if isinstance(pp,dict):
+        if isinstance(pp,NODES):
             if pp["type"] == "streamstats_args":
                 extendDict(args,pp["args"])
             elif pp["type"] == "agg_terms_list":
@@ -2436,7 +2582,7 @@ def p_command_streamstats_args(p):
 def p_command_tail(p):
     '''command : CMD_TAIL NUMBER
                | CMD_TAIL'''
-    p[0] = {"type":"command","input":[],"output":[],"fields-effect":"none","content":[],"cmd":p[1]}
+    p[0] = nodes.Command([],[],"none",[],p[1])
     if len(p) > 2:
         p[0]["content"].append(p[2])
 
@@ -2466,10 +2612,10 @@ def p_command_timechart_agg(p):
                | CMD_SITIMECHART args_list agg_terms_list
                | CMD_SITIMECHART agg_terms_list args_list
                | CMD_SITIMECHART agg_terms_list'''
-    p[0] = {"type":"command","input":[],"output":["_time"],"fields-effect":"replace","content":[],"cmd":p[1]}
+    p[0] = nodes.Command([],["_time"],"replace",[],p[1])
     args={}
     for pp in p[2:]:
-        if isinstance(pp,dict):
+        if isinstance(pp,NODES):
             if pp["type"] == "args_list":
                 extendDict(args,pp["args"])
             elif pp["type"] in ["agg_or_eval_list","agg_terms_list"]:
@@ -2487,7 +2633,7 @@ def p_command_timewrap(p):
                | CMD_TIMEWRAP args_list args_value
                | CMD_TIMEWRAP args_value args_list
                | CMD_TIMEWRAP args_value'''
-    p[0] = {"type":"command","input":[],"output":[],"fields-effect":"none","content":[],"cmd":p[1]}
+    p[0] = nodes.Command([],[],"none",[],p[1])
     args={}
     for pp in p[2:]:
         if pp["type"] == "args_list":
@@ -2505,7 +2651,7 @@ def p_command_top(p):
     data=p[len(p)-1]
     if "args" in data["args"]:
             checkArgs(p,data["args"]["args"])
-    p[0] = {"type":"command","input":data["fields"]+data["by"],"output":[],"fields-effect":"none","content":[],"cmd":p[1]}
+    p[0] = nodes.Command(data["fields"]+data["by"],[],"none",[],p[1])
     if len(p) > 3:
         p[0]["content"].append(p[2])
 
@@ -2517,11 +2663,11 @@ def p_command_transpose(p):
                | CMD_TRANSPOSE args_list
                | CMD_TRANSPOSE NUMBER
                | CMD_TRANSPOSE'''
-    p[0] = {"type":"command","input":[],"output":[],"fields-effect":"replace","content":[],"cmd":p[1]}
+    p[0] = nodes.Command([],[],"replace",[],p[1])
     args={}
     nb=5
     for pp in p[2:]:
-        if isinstance(pp,dict):
+        if isinstance(pp,NODES):
             if pp["type"] == "args_list":
                 extendDict(args,pp["args"])
         else:
@@ -2538,7 +2684,7 @@ def p_command_transpose(p):
 # TRENDLINE
 def p_command_trendline(p):
     '''command : CMD_TRENDLINE agg_terms_list'''
-    p[0] = {"type":"command","input":p[2]["input"],"output":p[2]["output"],"fields-effect":"extend","content":[],"cmd":p[1]}
+    p[0] = nodes.Command(p[2]["input"],p[2]["output"],"extend",[],p[1])
 
 # TSTATS
 def p_command_tstats(p):
@@ -2558,7 +2704,7 @@ def p_command_tstats(p):
                | CMD_TSTATS args_list agg_terms_list tstats_from
                | CMD_TSTATS args_list agg_terms_list tstats_where
                | CMD_TSTATS args_list agg_terms_list'''
-    p[0] = {"type":"command","input":[],"output":[],"fields-effect":"generate","content":[],"cmd":p[1], "filters":[]}
+    p[0] = nodes.Command([],[],"generate",[],p[1],filters=[])
     args={}
     for pp in p[2:]:
         if pp["type"] == "args_list":
@@ -2579,7 +2725,7 @@ def p_command_tstats_from(p):
     # Removed CMD_FROM args_term CMD_WHERE args_term to avoid ambiguity
     p[0] = {"type":"tstats_from","input":[],"output":[],"content":[],"args":{}}
     for pp in p[2:]:
-        if isinstance(pp,dict):
+        if isinstance(pp,NODES):
             if pp["type"] == "args_term":
                 extendDict(p[0]["args"],pp["args"])
             elif pp["type"] == "field_name":
@@ -2615,7 +2761,7 @@ def p_command_typelearner(p):
                | CMD_TYPELEARNER args_term
                | CMD_TYPELEARNER field_name
                | CMD_TYPELEARNER'''
-    p[0] = {"type":"command","input":["punct"],"output":[],"fields-effect":"extend","content":[],"cmd":p[1]}
+    p[0] = nodes.Command(["punct"],[],"extend",[],p[1])
     for pp in p[2:]:
         if pp["type"] == "args_term":
             checkArgs(p,pp["args"])
@@ -2628,7 +2774,7 @@ def p_command_union(p):
                | CMD_UNION args_list union_datasets
                | CMD_UNION union_datasets args_list
                | CMD_UNION union_datasets'''
-    p[0] = {"type":"command","input":[],"output":[],"fields-effect":"generate","content":[],"cmd":p[1],"filters":[]}
+    p[0] = nodes.Command([],[],"generate",[],p[1],filters=[])
     args={}
     for pp in p[2:]:
         if pp["type"] == "args_list":
@@ -2651,7 +2797,7 @@ def p_command_union_datasets(p):
                       | union_named_dataset'''
     p[0] = {"type":"union_datasets","input":[],"output":[],"content":[],"nb":1,"filters":[]}
     for pp in p[1:]:
-        if isinstance(pp,dict):
+        if isinstance(pp,NODES):
             if pp["type"] == "subsearch":
                 p[0]["input"] += pp["input"]
                 p[0]["output"] += pp["output"]
@@ -2683,7 +2829,7 @@ def p_union_named_dataset_str(p):
 # UNTABLE
 def p_command_untable(p):
     '''command : CMD_UNTABLE field_name field_name field_name'''
-    p[0] = {"type":"command","input":[],"output":[],"fields-effect":"replace","content":[],"cmd":p[1]}
+    p[0] = nodes.Command([],[],"replace",[],p[1])
     for pp in p[2:]:
         p[0]["input"].append(pp["field"])
         p[0]["output"].append(pp["field"])
@@ -2692,7 +2838,7 @@ def p_command_untable(p):
 def p_command_x11(p):
     '''command : CMD_X11 NAME LPAREN field_name RPAREN AS_CLAUSE field_name
                | CMD_X11 NAME LPAREN field_name RPAREN'''
-    p[0] = {"type":"command","input":[p[4]["field"]],"output":[],"fields-effect":"extend","content":[],"cmd":p[1]}
+    p[0] = nodes.Command([p[4]["field"]],[],"extend",[],p[1])
     if len(p) > 6:
         p[0]["output"].append(p[len(p)-1]["field"])
     else:
@@ -2705,7 +2851,7 @@ def p_command_xmlkv(p):
                | CMD_XMLKV args_term
                | CMD_XMLKV field_name
                | CMD_XMLKV'''
-    p[0] = {"type":"command","input":["_raw"],"output":[],"fields-effect":"extend","content":[],"cmd":p[1]}
+    p[0] = nodes.Command(["_raw"],[],"extend",[],p[1])
     for pp in p[2:]:
         if pp["type"] == "args_term":
             checkArgs(p,pp["args"])
@@ -2718,10 +2864,10 @@ def p_command_xpath(p):
                | CMD_XPATH args_list STRING
                | CMD_XPATH STRING args_list
                | CMD_XPATH STRING'''
-    p[0] = {"type":"command","input":["_raw"],"output":["xpath"],"fields-effect":"extend","content":[],"cmd":p[1]}
+    p[0] = nodes.Command(["_raw"],["xpath"],"extend",[],p[1])
     args={}
     for pp in p[2:]:
-        if isinstance(pp,dict):
+        if isinstance(pp,NODES):
             if pp["type"] == "args_list":
                 extendDict(args,pp["args"])
         else:
@@ -2744,7 +2890,7 @@ def p_command_params_by_and_fields_or_args(p):
                                             | command_params_fields_or_args'''
     data = {"args":{},"fields":[],"by":[]}
     for pp in p[1:]:
-        if isinstance(pp,dict):
+        if isinstance(pp,NODES):
             if pp["type"] == "command_params_fields_or_args":
                 data["fields"] += pp["fields"]
             elif pp["type"] == "args_list":
@@ -2772,12 +2918,15 @@ def p_command_params_fields_or_args(p):
 #---------------------------
 def checkArgs(p,args):
     global cmd_conf
+    # The arguments of the custom commands are not always known
+    if cmd_conf[p[1]]["args"] is None:
+        return
     for arg in args:
         if not arg in cmd_conf[p[1]]["args"]:
             if arg == "_unknown_":
-                report_error(p.lexpos(1),p.lexspan(len(p)-1)[1],"[WARNING] Anonymous argument in '{}' command, expected {}".format(p[1],str(cmd_conf[p[1]]["args"])),None,value=arg)
+                report_error(p.lexpos(1),p.lexspan(len(p)-1)[1],"[WARNING] Anonymous argument in '{}' command, expected {}".format(p[1],cmd_conf[p[1]]["args_text"]),None,value=arg)
             else:
-                report_error(p.lexpos(1),p.lexspan(len(p)-1)[1],"Unexpected argument '{}' in '{}' command, expected {}".format(arg,p[1],str(cmd_conf[p[1]]["args"])),None,value=arg)
+                report_error(p.lexpos(1),p.lexspan(len(p)-1)[1],"Unexpected argument '{}' in '{}' command, expected {}".format(arg,p[1],cmd_conf[p[1]]["args_text"]),None,value=arg)
 
 def extractData(p):
     data={}
@@ -2802,6 +2951,16 @@ def extendDict(a,b):
 def filterFields(flist,pattern):
     return fnmatch.filter(flist,pattern)
 
+# Concatenates the result facets of two sub-results into dst, only for the
+# facets requested by the caller of analyze (others are left empty)
+def merge_facets(dst,a,b):
+    want = params["facets"]
+    for k in ["input","output","content","filters"]:
+        if k in want:
+            dst[k] = a[k]+b[k]
+        else:
+            dst[k] = []
+
 #---------------------------
 # AGGREGATION fields
 #---------------------------
@@ -2825,14 +2984,14 @@ def p_agg_term(p):
                 | PREFIX_OP LPAREN agg_term_arg RPAREN
                 | NAME'''
     if len(p) == 7:
-        if isinstance(p[6],dict):
+        if isinstance(p[6],NODES):
             p[0] = {"type":"agg_term","input":p[3]["input"],"output":[p[6]["field"]],"content":[]}
         else:
             p[0] = {"type":"agg_term","input":p[3]["input"],"output":[p[6]],"content":[]}
     elif len(p) == 5:
         p[0] = {"type":"agg_term","input":p[3]["input"],"output":["{}({})".format(p[1],p[3]["input"][0])],"content":[]}
     elif len(p) == 4:
-        if isinstance(p[3],dict):
+        if isinstance(p[3],NODES):
             p[0] = {"type":"agg_term","input":[p[1]],"output":[p[3]["field"]],"content":[]}
         else:
             p[0] = {"type":"agg_term","input":[p[1]],"output":[p[3]],"content":[]}
@@ -2877,9 +3036,9 @@ def p_anyfields_list(p):
                        | any_fields_list field_name
                        | rfield_term
                        | field_name'''
-    p[0] = {"type":"any_fields_list","input":[],"output":[]}
+    p[0] = nodes.FieldList("any_fields_list",[],[])
     if len(p) > 2:
-        p[0] = {"type":"any_fields_list","input":p[1]["input"],"output":p[1]["output"]}
+        p[0] = nodes.FieldList("any_fields_list",p[1]["input"],p[1]["output"])
     if p[len(p)-1]["type"] == "rfield_term":
         p[0]["input"] += p[len(p)-1]["input"]
         p[0]["output"] += p[len(p)-1]["output"]
@@ -2891,9 +3050,9 @@ def p_rfields_list(p):
                     | rfields_list rfield_term
                     | rfield_term'''
     if len(p) == 4:
-        p[0] = {"type":"rfields_list","input":p[1]["input"]+p[3]["input"],"output":p[1]["output"]+p[3]["output"]}
+        p[0] = nodes.FieldList("rfields_list",p[1]["input"]+p[3]["input"],p[1]["output"]+p[3]["output"])
     elif len(p) == 3:
-        p[0] = {"type":"rfields_list","input":p[1]["input"]+p[2]["input"],"output":p[1]["output"]+p[2]["output"]}
+        p[0] = nodes.FieldList("rfields_list",p[1]["input"]+p[2]["input"],p[1]["output"]+p[2]["output"])
     else:
         p[0] = p[1]
 
@@ -2904,9 +3063,9 @@ def p_fields_list(p):
                    | fields_list COMMA TIMES
                    | fields_list TIMES
                    | TIMES'''
-    p[0] = {"type":"fields_list","input":[],"output":[]}
+    p[0] = nodes.FieldList("fields_list",[],[])
     for pp in p[1:]:
-        if isinstance(pp,dict):
+        if isinstance(pp,NODES):
             if pp["type"] == "fields_list":
                 p[0]["input"] += pp["input"]
             elif pp["type"] == "field_name":
@@ -2921,12 +3080,12 @@ def p_rfield_term(p):
                    | TIMES AS_CLAUSE PATTERN
                    | PATTERN AS_CLAUSE TIMES
                    | PATTERN AS_CLAUSE PATTERN'''
-    p[0] = {"type":"rfield_term","input":[],"output":[]}
-    if isinstance(p[1],dict):
+    p[0] = nodes.FieldList("rfield_term",[],[])
+    if isinstance(p[1],NODES):
         p[0]["output"] = [p[1]["field"]]
     else:
         p[0]["output"] = [p[1]]
-    if isinstance(p[3],dict):
+    if isinstance(p[3],NODES):
         p[0]["output"] = [p[3]["field"]]
     else:
         p[0]["output"] = [p[3]]
@@ -2937,13 +3096,13 @@ def p_field_name(p):
                   | STRING
                   | commands_names
                   | op_names'''
-    p[0] = {"type":"field_name","field":p[1]}
+    p[0] = nodes.Field("field_name",p[1])
 
 def p_field_name_agg_fun(p):
     '''field_name : NAME LPAREN field_name RPAREN
                   | commands_names LPAREN field_name RPAREN'''
     # Case when a field has been named after the use of an agregation function
-    p[0] = {"type":"field_name","field":["{}({})".format(p[1],p[3]["field"])]}
+    p[0] = nodes.Field("field_name",["{}({})".format(p[1],p[3]["field"])])
 
 def p_field_name_subsearch(p):
     '''field_name : subsearch'''
@@ -2958,8 +3117,8 @@ def p_field_name_logic(p):
                         | commands_names
                         | op_names
                         | subsearch'''
-    p[0] = {"type":"field_name","field":p[1]}
-    if isinstance(p[1],dict) and p[1]["type"] == "subsearch":
+    p[0] = nodes.Field("field_name",p[1])
+    if isinstance(p[1],NODES) and p[1]["type"] == "subsearch":
         p[0] = p[1]
         p[0]["field"]=""
 
@@ -2976,7 +3135,7 @@ def p_field_or_num(p):
                     | NUMBER
                     | MINUS NUMBER'''
     p[0] = {"type":"field_or_num","value":"","field":""}
-    if isinstance(p[1],dict):
+    if isinstance(p[1],NODES):
         p[0]["value"] = p[1]["field"]
         p[0]["field"] = p[1]["field"]
     else:
@@ -2991,7 +3150,7 @@ def p_field_or_num(p):
 def p_args_list(p):
     '''args_list : args_list args_term
                  | args_term'''
-    p[0] = {"type":"args_list","args":{}}
+    p[0] = nodes.Args("args_list",{})
     p[0]["args"] = p[1]["args"].copy()
     if len(p) == 3:
         extendDict(p[0]["args"],p[2]["args"])
@@ -3002,12 +3161,12 @@ def p_args_term(p):
                  | op_names EQ args_value'''
     # Command names have to be allowed as argument names for cases
     # like append which can be both a command or an argument
-    p[0] = {"type":"args_term","args":{}}
+    p[0] = nodes.Args("args_term",{})
     p[0]["args"][p[1].lower()]=p[3]["value"]
 
 def p_args_term_subsearch(p):
     '''args_term : subsearch'''
-    p[0] = {"type":"args_term","args":{"_unknown_":"_subsearch_"}}
+    p[0] = nodes.Args("args_term",{"_unknown_":"_subsearch_"})
 
 def p_args_value(p):
     '''args_value : value
@@ -3021,7 +3180,7 @@ def p_args_value(p):
                   | AND_OP
                   | OR_OP
                   | NOT_OP'''
-    p[0] = {"type":"args_value","value":""}
+    p[0] = nodes.Value("args_value","")
     if "type" in p[1]:
         if p[1]["type"] == "eval_expr_fun_value":
             p[0]["value"] = p[1]["content"]
@@ -3074,7 +3233,7 @@ def p_value_number(p):
              | FLOAT
              | MINUS NUMBER %prec UMINUS
              | MINUS FLOAT %prec UMINUS"""
-    p[0] = {"type":"value","value":""}
+    p[0] = nodes.Value("value","")
     if len(p) == 3:
         p[0]["value"] = "-"+str(p[2])
     else:
@@ -3082,21 +3241,21 @@ def p_value_number(p):
 
 def p_value_concat(p):
     'value : value_concat'
-    p[0] = {"type":"value","value":p[1]["value"]}
+    p[0] = nodes.Value("value",p[1]["value"])
 
 def p_value_concat_expr(p):
     """value_concat : value_concat value_concat_factor
              | value value_concat_factor"""
-    p[0] = {"type":"value_concat","value":"{}{}".format(p[1]["value"],p[2]["value"])}
+    p[0] = nodes.Value("value_concat","{}{}".format(p[1]["value"],p[2]["value"]))
 
 
 def p_value_concat_term(p):
     """value_concat_factor : DOT value"""
-    p[0] = {"type":"value_concat_factor","value":"{}{}".format(p[1],p[2]["value"])}
+    p[0] = nodes.Value("value_concat_factor","{}{}".format(p[1],p[2]["value"]))
 
 def p_value_concat_term_fun_call(p):
     """value_concat_factor : DOT expr_fun_call"""
-    p[0] = {"type":"value_concat_factor","value":"{}{}".format(p[1],p[2]["content"])}
+    p[0] = nodes.Value("value_concat_factor","{}{}".format(p[1],p[2]["content"]))
     
 
 def p_value_string(p):
@@ -3110,7 +3269,7 @@ def p_value_string(p):
              | commands_names
              | op_names
              | TEXT"""
-    p[0] = {"type":"value","value":""}
+    p[0] = nodes.Value("value","")
     if len(p) == 4:
         p[0]["value"] = p[2]
     elif len(p) == 3:
@@ -3122,35 +3281,34 @@ def p_value_string(p):
 
 def p_value_time(p):
     'value : TIMESPECIFIER'
-    p[0] = {"type":"value","value":str(p[1])}
+    p[0] = nodes.Value("value",str(p[1]))
 
 def p_value_date(p):
     'value : DATE'
-    p[0] = {"type":"value","value":str(p[1])}
+    p[0] = nodes.Value("value",str(p[1]))
 
 def p_value_minus(p):
     'value : MINUS NAME'
-    p[0] = {"type":"value","value":"-{}".format(str(p[2]))}
+    p[0] = nodes.Value("value","-{}".format(str(p[2])))
 
 def p_values_list(p):
     '''values_list : values_list COMMA value
                    | values_list value
                    | value'''
-    p[0] = {"type":"values_list","values":[]}
-    if len(p) == 4:
-        p[0]["values"] = p[1]["values"] + [p[3]["value"]]
-    elif len(p) == 3:
-        p[0]["values"] = p[1]["values"] + [p[2]["value"]]
+    if len(p) == 2:
+        p[0] = {"type":"values_list","values":[p[1]["value"]]}
     else:
-        p[0]["values"].append(p[1]["value"])
+        # The list is extended in place, copying it at each value is quadratic for long IN lists
+        p[0] = p[1]
+        p[0]["values"].append(p[len(p)-1]["value"])
 
 def p_value_subsearch(p):
     'value : subsearch'
-    p[0] = {"type":"value","value":"_subsearch_"}
+    p[0] = nodes.Value("value","_subsearch_")
 
 def p_value_path(p):
     'value : DIVIDE value'
-    p[0] = {"type":"value","value":"/{}".format(str(p[2]))}
+    p[0] = nodes.Value("value","/{}".format(str(p[2])))
 
 def p_value_op(p):
     '''value_op : PLUS
@@ -3160,7 +3318,7 @@ def p_value_op(p):
                 | COMMA
                 | DOT
                 | COLON'''
-    p[0] = {"type":"value","value":p[1]}
+    p[0] = nodes.Value("value",p[1])
 
 '''
 def p_empty(p):
@@ -3185,15 +3343,158 @@ def p_error(p):
 #---------------------------
 #Custom global vars
 scope_level=0
-errors={"list":[],"ref":{}}
-params={"verbose":True,"print_errs":True}
+errors={"list":[],"ref":{},"truncated":False}
+# Parts of the result that can be requested through the facets of analyze
+FACETS=frozenset(["input","output","fields-effect","content","cmd","filters"])
+params={"verbose":True,"print_errs":True,"facets":FACETS,"max_errors":100,"macro_tokens":False}
 data = {"main":{},"subsearches":[]}
 lexer = None
 parser = None
-
-def init_analyser(optimize=True):
-    global errors, scope_level, data, logger, parser, lex
-    errors={"list":[],"ref":{}}
+scanner = None
+lalr_parser = None
+# Lexer backends selectable in analyze
+LEXER_BACKENDS = ("ply","scanner")
+# Parser backends selectable in analyze: the PLY parse loop or the one generated
+# by lrgen for this grammar (module spl_lalr, built on first use)
+PARSER_BACKENDS = ("ply","lalr")
+# Macro expansions selectable in analyze: rewriting of the query text before
+# lexing, or splicing of the tokens of the macros (see spliced_tokens)
+MACRO_EXPANSIONS = ("text","tokens")
+# Lexer used to lex the expansions of the macros, and the tokens of the
+# expansions by (macro graph, keywords of the profile, macro call), emptied when
+# more than MAX_MACRO_TEMPLATES are kept (the graphs of changed files stay in
+# the keys)
+macro_lexer = None
+macro_templates = {}
+MAX_MACRO_TEMPLATES = 10000
+
+# Command profiles: versions of spl_commands.json (for instance the commands of
+# a Splunk version), selected with the profile argument of analyze. The grammar,
+# and so the parse tables, are shared by all the profiles: the commands of a
+# profile without rule in the grammar are lexed as custom commands (CMD_CUSTOM)
+# and the commands it does not define are not recognized. A profile is only
+# loaded when first used, then kept for the next analyses.
+DEFAULT_PROFILE = "default"
+# Profile name -> path of its commands file (the ones not registered are looked
+# for in the profiles folder, as <name>.json)
+profile_paths = {DEFAULT_PROFILE: pkg_resources.resource_filename(__name__,'spl_commands.json')}
+# Loaded profiles: name -> {"conf": commands conf, "keywords": keywords of the scanner}
+profiles = {DEFAULT_PROFILE: {"conf": cmd_conf, "keywords": scanner_keywords(cmd_conf)}}
+# Custom commands registered at runtime, added to all the profiles
+custom_commands = {}
+# Arguments of the registrations of the custom commands: name -> (args,
+# created_fields), replayed in the worker processes (see registrations)
+registered_commands = {}
+# Token types of the command names and reserved words of the current profile
+# (looked up by the lexers for the NAME and TEXT tokens)
+keywords = profiles[DEFAULT_PROFILE]["keywords"]
+
+# Registers (or replaces) a profile defined by the commands file at path
+def register_profile(name,path):
+    profile_paths[name] = path
+    profiles.pop(name,None)
+
+def load_profile(name):
+    path = profile_paths.get(name)
+    if path is None:
+        path = os.path.join(table_dir(),"profiles",name + ".json")
+    if not os.path.exists(path):
+        raise ValueError("Unknown profile '{}', no commands file {}".format(name,path))
+    with open(path) as f:
+        conf = json.load(f)
+    for cmd in conf:
+        if not conf[cmd]["token_name"] in tokens:
+            conf[cmd] = dict(conf[cmd],token_name=CUSTOM_COMMAND_TOKEN)
+    conf = freeze_conf(conf)
+    profile = {"conf": conf, "keywords": scanner_keywords(conf)}
+    for cmd in custom_commands:
+        add_custom_command(profile,cmd,custom_commands[cmd])
+    logger.info("Profile '{}' loaded ({} commands)".format(name,len(conf)))
+    return profile
+
+# Loaded profile (ValueError when unknown), without using it
+def get_profile(name):
+    if name is None:
+        name = DEFAULT_PROFILE
+    profile = profiles.get(name)
+    if profile is None:
+        profile = profiles[name] = load_profile(name)
+    return profile
+
+# Profile used by the next analysis (conf of the grammar rules and of the lexers)
+def use_profile(name):
+    global cmd_conf, keywords
+    profile = get_profile(name)
+    cmd_conf = profile["conf"]
+    keywords = profile["keywords"]
+    if not scanner is None:
+        scanner.keywords = keywords
+    return profile
+
+# Names which can be registered as custom commands (lexed as a single NAME)
+CUSTOM_COMMAND_NAME = re.compile(r'^[a-z_][a-z0-9_]*$')
+
+# A custom command does not replace a command of the profile
+def add_custom_command(profile,name,conf):
+    current = profile["conf"].get(name)
+    if current is None or current["token_name"] == CUSTOM_COMMAND_TOKEN:
+        profile["conf"][name] = conf
+        profile["keywords"][name] = CUSTOM_COMMAND_TOKEN
+
+# Registers a custom command at runtime (in all the profiles), without
+# rebuilding the parse tables
+# args: list of the accepted arguments, None to accept any argument
+# created_fields: fields added to the results by the command
+def register_command(name,args=None,created_fields=[]):
+    name = name.lower()
+    base = profiles[DEFAULT_PROFILE]["conf"]
+    if not CUSTOM_COMMAND_NAME.match(name) or name in reserved or (name in base and base[name]["token_name"] != CUSTOM_COMMAND_TOKEN):
+        raise ValueError("'{}' cannot be registered as a custom command".format(name))
+    custom_commands[name] = freeze_command({"token_name":CUSTOM_COMMAND_TOKEN,"args":None if args is None else list(args),"created_fields":list(created_fields)})
+    registered_commands[name] = (None if args is None else list(args),list(created_fields))
+    for profile in profiles.values():
+        add_custom_command(profile,name,custom_commands[name])
+    # The expansions of the macros may use the command
+    macro_templates.clear()
+
+# Registers the custom commands defined in the given commands.conf files (one
+# stanza per command), returns the names of the registered commands
+def register_commands_conf(paths):
+    names = []
+    for path in paths:
+        for name in macros.loadFile(path):
+            if name == "default":
+                continue
+            try:
+                register_command(name)
+                names.append(name.lower())
+            except ValueError as e:
+                logger.warning("{} ({})".format(e,path))
+    return names
+
+# Profiles and custom commands registered in this process, to be replayed by
+# apply_registrations in another one (the workers of pool.py)
+def registrations():
+    return {"profiles": {name:path for name,path in profile_paths.items() if name != DEFAULT_PROFILE}, "commands": dict(registered_commands)}
+
+# Registers the profiles and the custom commands of registrations() which are
+# not registered yet (or differently) in this process
+def apply_registrations(regs):
+    for name, path in regs["profiles"].items():
+        if profile_paths.get(name) != path:
+            register_profile(name,path)
+    for name, (args, created_fields) in regs["commands"].items():
+        if registered_commands.get(name) != (args,created_fields):
+            register_command(name,args,created_fields)
+
+# Directory of the generated table files
+def table_dir():
+    return os.path.dirname(pkg_resources.resource_filename(__name__,'spl_validator.py'))
+
+# debug writes the PLY debugging file parser.out when the parse tables are built
+def init_analyser(optimize=True,debug=False):
+    global errors, scope_level, data, logger, parser, lex, scanner
+    errors={"list":[],"ref":{},"truncated":False}
     scope_level=0
     data = {"main":{},"subsearches":[]}
     opti = 1 if optimize else 0
@@ -3208,93 +3509,362 @@ def init_analyser(optimize=True):
         ch.setLevel(logging.CRITICAL)
     #Initializing parser only once
     if parser is None:
-        tabdir = os.path.dirname(pkg_resources.resource_filename(__name__,'spl_validator.py'))
+        tabdir = table_dir()
         logger.info("Lexer initializing")
         lexer = lex.lex(errorlog=logger, optimize=opti,lextab="lexer_tab", outputdir=tabdir)
         logger.info("Yacc initializing")
-        parser = yacc.yacc(debug=True,errorlog=logger, optimize=opti, outputdir=tabdir)
+        parser = yacc.yacc(debug=debug,errorlog=logger, optimize=opti, outputdir=tabdir)
+        scanner = Scanner(scanner_rules(),t_ANY_ignore,profiles[DEFAULT_PROFILE]["keywords"],scanner_error)
     logger.info("Parser initialization finished")
 
+# Errors are stored as compact entries, the LexToken objects are not kept
+ErrorEntry = namedtuple("ErrorEntry",["start_pos","end_pos","reason","token_type","token_value"])
+
+# Raised to stop the parsing before its end
+class AnalysisStopped(Exception):
+    pass
+
+# Raised when the maximum number of errors is reached
+class ErrorLimitReached(AnalysisStopped):
+    pass
+
+# Raised when the cancel function given to analyze returns True, the analysis is
+# abandoned without result
+class AnalysisCancelled(AnalysisStopped):
+    pass
+
+# Raised when one of the complexity budgets of the analysis is exceeded
+class BudgetExceeded(AnalysisStopped):
+    def __init__(self,budget,limit,pos):
+        AnalysisStopped.__init__(self,"Budget exceeded: {} over {}".format(budget,limit))
+        self.budget = budget
+        self.limit = limit
+        self.pos = pos
+
 def error_build_token_id(tk):
-    return "{}_{}".format(str(tk.lexpos),str(tk.value))
+    return (tk.lexpos,str(tk.value))
 
 def error_build_message_id(st,ed,value):
-    return "{}_{}_{}".format(str(st),str(ed),str(value))
+    return (st,ed,str(value))
 
 def report_error(st,ed,msg,tk,value=None):
     global errors
     if tk is None:
         tkid=error_build_message_id(st,ed,value)
-        if not tkid in errors["ref"]:
-            errors["ref"][tkid] = [{"start_pos":st,"end_pos":ed,"reason":msg,"token":tk}]
-            errors["list"].append(tkid)
-        else:
-            errors["ref"][tkid].append({"start_pos":st,"end_pos":ed,"reason":msg,"token":tk})
+        entry=ErrorEntry(st,ed,msg,None,None)
     else:
         tkid=error_build_token_id(tk)
-        if not tkid in errors["ref"]:
-            errors["ref"][tkid] = [{"start_pos":st,"end_pos":ed,"reason":msg,"token":tk}]
-            errors["list"].append(tkid)
-        else:
-            errors["ref"][tkid].append({"start_pos":st,"end_pos":ed,"reason":msg,"token":tk})
+        entry=ErrorEntry(st,ed,msg,tk.type,tk.value)
+    if tkid in errors["ref"]:
+        errors["ref"][tkid].append(entry)
+    elif not params["max_errors"] is None and len(errors["list"]) >= params["max_errors"]:
+        errors["truncated"]=True
+        raise ErrorLimitReached()
+    else:
+        errors["ref"][tkid] = [entry]
+        errors["list"].append(tkid)
 
-def prepare_error_messages(s):
+# Budget errors are always recorded, even when max_errors was reached
+def report_budget_error(e):
     global errors
-    for eid in errors["list"]:
-        e=errors["ref"][eid][-1]
-        st,ed,msg,tk=e["start_pos"],e["end_pos"],e["reason"],e["token"]
-        if st < 0:
-            st,ed = max(0,len(s) + st), max(0,len(s) + ed)
-        if tk is None:
-            err_str=s[st:ed]
-            errors["ref"][eid][-1]["message"] = "[{}->{}] {}\n\t{}".format(st,ed,msg,err_str)
-        else:
-            err_str=s[st:min(ed+10,len(s))]
-            errors["ref"][eid][-1]["message"] = "[{}->{}] {} : for value '{}' of type {}\n\t{}".format(st,ed,msg,tk.value,tk.type,err_str)
+    errors["budget"] = {"budget":e.budget,"limit":e.limit,"position":e.pos}
+    tkid=error_build_message_id(e.pos,e.pos+1,e.budget)
+    errors["ref"][tkid] = [ErrorEntry(e.pos,e.pos+1,"Budget exceeded: {} over {}".format(e.budget,e.limit),None,None)]
+    errors["list"].append(tkid)
+
+def error_message(s,e):
+    st,ed = e.start_pos,e.end_pos
+    if st < 0:
+        st,ed = max(0,len(s) + st), max(0,len(s) + ed)
+    if e.token_type is None:
+        err_str=s[st:ed]
+        return "[{}->{}] {}\n\t{}".format(st,ed,e.reason,err_str)
+    err_str=s[st:min(ed+10,len(s))]
+    return "[{}->{}] {} : for value '{}' of type {}\n\t{}".format(st,ed,e.reason,e.token_value,e.token_type,err_str)
+
+# Human readable messages of the errors, by error identifier
+# A message is only rendered (from the latest reported error) when first read
+class ErrorMessages(dict):
+    def __init__(self,s,ref):
+        dict.__init__(self)
+        self.s = s
+        self.ref = ref
+
+    def __missing__(self,eid):
+        msg = error_message(self.s,self.ref[eid][-1])
+        self[eid] = msg
+        return msg
 
 def print_errors(s):
     global errors
+    messages = errors.get("messages")
+    if messages is None:
+        messages = ErrorMessages(s,errors["ref"])
     for eid in errors["list"]:
-        e=errors["ref"][eid][-1]
-        st,ed,msg,tk=e["start_pos"],e["end_pos"],e["reason"],e["token"]
-        
-        if "message" in e:
-            logger.error(e["message"])
-        else:
-            if st < 0:
-                st,ed = max(0,len(s) + st), max(0,len(s) + ed)
-            if tk is None:
-                err_str=s[st:ed]
-                logger.error("[{}->{}] {}\n\t{}".format(st,ed,msg,err_str))
-            else:
-                err_str=s[st:min(ed+10,len(s))]
-                logger.error("[{}->{}] {} : for value '{}' of type {}\n\t{}".format(st,ed,msg,tk.value,tk.type,err_str))
+        logger.error(messages[eid])
 
 
 #---------------------------
 #       EXECUTION
 #---------------------------
 
-def analyze(s,verbose=False,print_errs=True,macro_files=[],optimize=True):
+# Tokens opening and closing a nesting level (parenthesis, subsearch)
+NESTING_OPEN = frozenset(["LPAREN","QLPAREN","LBRACK"])
+NESTING_CLOSE = frozenset(["RPAREN","QRPAREN","RBRACK"])
+
+# Wraps the token function next_token to check the budgets at each token read
+# by the parser, a budget set to None is not checked
+def budgeted_tokens(next_token,max_tokens=None,max_depth=None,timeout=None,cancel=None):
+    state = {"count":0,"depth":0}
+    deadline = None if timeout is None else time.perf_counter() + timeout
+    def token():
+        if not cancel is None and cancel():
+            raise AnalysisCancelled()
+        tok = next_token()
+        if tok is None:
+            return tok
+        state["count"] += 1
+        if not max_tokens is None and state["count"] > max_tokens:
+            raise BudgetExceeded("max_tokens",max_tokens,tok.lexpos)
+        if tok.type in NESTING_OPEN:
+            state["depth"] += 1
+            if not max_depth is None and state["depth"] > max_depth:
+                raise BudgetExceeded("max_depth",max_depth,tok.lexpos)
+        elif tok.type in NESTING_CLOSE:
+            state["depth"] -= 1
+        if not deadline is None and time.perf_counter() > deadline:
+            raise BudgetExceeded("timeout",timeout,tok.lexpos)
+        return tok
+    return token
+
+# Tokens of the expansion of a macro call: list of (type, value, start and end
+# in the expansion), the illegal characters found and the expanded text, None
+# when the call cannot be
+# expanded. The expansion is lexed once, by a clone of the PLY lexer, with its
+# own errors.
+def macro_template(graph_key,graph,mcall):
+    global errors, macro_lexer
+    # The token types of the command names depend on the profile
+    key = (graph_key,id(keywords),mcall)
+    if key in macro_templates:
+        return macro_templates[key]
+    if len(macro_templates) >= MAX_MACRO_TEMPLATES:
+        macro_templates.clear()
+    text = graph.expansion(mcall)
+    template = None
+    if not text is None:
+        if macro_lexer is None:
+            macro_lexer = lex.lexer.clone()
+        saved, max_errors = errors, params["max_errors"]
+        errors, params["max_errors"] = {"list":[],"ref":{},"truncated":False}, None
+        try:
+            macro_lexer.begin("INITIAL")
+            macro_lexer.input(text)
+            toks = [(t.type,t.value,t.lexpos,t.endlexpos) for t in iter(long_tokens(macro_lexer,text),None)]
+            illegal = [errors["ref"][eid][-1].reason for eid in errors["list"]]
+        finally:
+            errors, params["max_errors"] = saved, max_errors
+        template = (toks,illegal,text)
+    macro_templates[key] = template
+    return template
+
+# Wraps the token function next_token (lexer returning the MACRO tokens) to
+# replace each macro call by the tokens of its expansion. The spliced tokens
+# have the position of the call in the query (lexpos and endlexpos, so the
+# errors are reported on the call, nodes.MacroPos positions) and their origin:
+# the macro call and their position in its expansion. The calls which cannot be
+# expanded are reported. The expanded calls are added to calls (start of the
+# call -> (end of the call, expanded text), see nodes.expanded_slice).
+def spliced_tokens(next_token,graph_key,graph,calls):
+    pending = []
+    def token():
+        while True:
+            if len(pending) > 0:
+                return pending.pop()
+            tok = next_token()
+            if tok is None or tok.type != "MACRO":
+                return tok
+            pending.extend(reversed(splice_macro(tok,graph_key,graph,calls)))
+    return token
+
+def splice_macro(tok,graph_key,graph,calls):
+    mcall = tok.value[1:-1]
+    template = macro_template(graph_key,graph,mcall)
+    if template is None:
+        report_error(tok.lexpos,tok.endlexpos,"[WARNING] Macro could not be expanded",None,value=mcall)
+        return []
+    toks, illegal, text = template
+    call = (tok.lexpos,tok.endlexpos)
+    calls[tok.lexpos] = (tok.endlexpos,text)
+    for reason in illegal:
+        report_error(tok.lexpos,tok.endlexpos,"{} in the expansion of macro {}".format(reason,mcall),None,value=reason)
+    spliced = []
+    for ttype, value, pos, end in toks:
+        if ttype == "MACRO":
+            # Nested call which cannot be expanded
+            report_error(tok.lexpos,tok.endlexpos,"[WARNING] Macro could not be expanded",None,value=value[1:-1])
+            continue
+        t = lex.LexToken()
+        t.type = ttype
+        t.value = value
+        t.lineno = tok.lineno
+        t.lexpos = nodes.MacroPos(tok.lexpos,call,text,pos)
+        t.endlexpos = nodes.MacroPos(tok.endlexpos,call,text,end)
+        t.origin = (mcall,pos)
+        spliced.append(t)
+    return spliced
+
+# Removes from a search result the facets which were not requested
+def prune_facets(res,want):
+    if isinstance(res,NODES):
+        for k in FACETS - want:
+            res.pop(k,None)
+
+# Lexer of the given backend, ready to read a new query
+# macro_tokens: whether the macro calls are returned as MACRO tokens (ignored
+# otherwise)
+def get_lexer(backend,macro_tokens=False):
+    if not backend in LEXER_BACKENDS:
+        raise ValueError("Unknown lexer backend '{}', expected one of {}".format(backend,list(LEXER_BACKENDS)))
+    params["macro_tokens"] = macro_tokens
+    scanner.macro_tokens = macro_tokens
+    lx = scanner if backend == "scanner" else lex.lexer
+    # The lexer state is kept from one query to another
+    lx.begin("INITIAL")
+    # Macro calls spliced in the query (see spliced_tokens)
+    lx.macro_calls = None
+    return lx
+
+# Signature of the grammar, as stored in the parse tables
+def grammar_signature(optimize=True):
+    if optimize:
+        # Like yacc in optimize mode, the parse tables are trusted
+        from . import parsetab
+        return parsetab._lr_signature
+    pinfo = yacc.ParserReflect(globals(),log=logger)
+    pinfo.get_all()
+    return pinfo.signature()
+
+# Parser of the given backend (the generated one is loaded on first use)
+def get_parser(backend,optimize=True):
+    global lalr_parser
+    if not backend in PARSER_BACKENDS:
+        raise ValueError("Unknown parser backend '{}', expected one of {}".format(backend,list(PARSER_BACKENDS)))
+    if backend == "ply":
+        return parser
+    if lalr_parser is None:
+        lalr_parser = lrgen.load("spl_lalr",globals(),parser,grammar_signature(optimize),table_dir())
+    return lalr_parser
+
+# Generates the parse module of the "lalr" parser backend ahead of time
+def build_parser(optimize=True):
+    global lalr_parser
+    params["verbose"]=False
+    params["print_errs"]=False
+    init_analyser(optimize)
+    lalr_parser = lrgen.build("spl_lalr",globals(),parser,grammar_signature(optimize),table_dir())
+    return lalr_parser
+
+# Generated table files, rebuilt by build_tables
+TABLE_MODULES = ("lexer_tab","parsetab","spl_lalr")
+
+# Rebuilds all the table files ahead of time (for instance before installing in
+# a read-only location), the PLY debugging file parser.out is only written with
+# debug=True
+def build_tables(debug=False):
+    global parser, lalr_parser
+    tabdir = table_dir()
+    for name in TABLE_MODULES:
+        path = os.path.join(tabdir,name + ".py")
+        if os.path.exists(path):
+            os.remove(path)
+        sys.modules.pop(__package__ + "." + name,None)
+    importlib.invalidate_caches()
+    parser = None
+    params["verbose"]=False
+    params["print_errs"]=False
+    init_analyser(True,debug)
+    lalr_parser = lrgen.build("spl_lalr",globals(),parser,grammar_signature(True),tabdir)
+    return [os.path.join(tabdir,name + ".py") for name in TABLE_MODULES]
+
+# macro_tokens: whether the macro calls are returned as MACRO tokens
+def tokenize(s,verbose=False,optimize=True,lexer_backend="ply",profile=None,macro_tokens=False):
+    params["verbose"]=verbose
+    params["print_errs"]=False
+    params["max_errors"]=None
+    init_analyser(optimize)
+    use_profile(profile)
+    lx = get_lexer(lexer_backend,macro_tokens)
+    lx.input(s)
+    return list(iter(long_tokens(lx,s),None))
+
+def analyze(s,verbose=False,print_errs=True,macro_files=[],optimize=True,facets=None,max_errors=100,max_length=None,max_tokens=None,max_depth=None,timeout=None,lexer_backend="ply",parser_backend="ply",profile=None,cancel=None,macro_expansion="text"):
     global errors, params, data, logger
     try:
         params["verbose"]=verbose
         params["print_errs"]=print_errs
+        params["max_errors"]=max_errors
+        if facets is None:
+            params["facets"]=FACETS
+        else:
+            want=frozenset(facets)
+            if len(want - FACETS) > 0:
+                raise ValueError("Unknown facets {}, expected some of {}".format(sorted(want - FACETS),sorted(FACETS)))
+            # The output of a subsearch is the input of its filter
+            # (filter_subsearch), it is computed for these facets and pruned
+            params["facets"]=want | {"output"} if want & {"input","filters"} else want
+        if not macro_expansion in MACRO_EXPANSIONS:
+            raise ValueError("Unknown macro expansion '{}', expected one of {}".format(macro_expansion,list(MACRO_EXPANSIONS)))
         init_analyser(optimize)
-        if len(macro_files) > 0:
-            res = macros.handleMacros(s,macro_files)
-            if res["unique_macros_found"] > 0:
-                logger.info("{} unique macros found and {} were expanded".format(res["unique_macros_found"],res["unique_macros_expanded"]))
-            if res["unique_macros_found"] > res["unique_macros_expanded"]:
-                logger.warning("{} macros could not be expanded".format(res["unique_macros_found"]-res["unique_macros_expanded"]))
-            s = res["text"]
-        r = yacc.parse(s,tracking=True,debug=False)
-        # Prepare human readable error messages for later uses
-        prepare_error_messages(s)
+        use_profile(profile)
+        try:
+            if not max_length is None and len(s) > max_length:
+                raise BudgetExceeded("max_length",max_length,max_length)
+            splice = None
+            if len(macro_files) > 0 and macro_expansion == "tokens":
+                # The macros are expanded while lexing
+                splice = macros.loadGraph(macro_files)
+                for e in splice[1].cycleErrors():
+                    logger.warning(e)
+            elif len(macro_files) > 0:
+                res = macros.handleMacros(s,macro_files)
+                for e in res["errors"]:
+                    logger.warning(e)
+                if res["unique_macros_found"] > 0:
+                    logger.info("{} unique macros found and {} were expanded".format(res["unique_macros_found"],res["unique_macros_expanded"]))
+                if res["unique_macros_found"] > res["unique_macros_expanded"]:
+                    logger.warning("{} macros could not be expanded".format(res["unique_macros_found"]-res["unique_macros_expanded"]))
+                s = res["text"]
+                # The expanded text is checked too
+                if not max_length is None and len(s) > max_length:
+                    raise BudgetExceeded("max_length",max_length,max_length)
+            lx = get_lexer(lexer_backend,not splice is None)
+            # The token functions are bound to the lexer input
+            lx.input(s)
+            tokens = long_tokens(lx,s)
+            if not splice is None:
+                lx.macro_calls = {}
+                tokens = spliced_tokens(tokens,splice[0],splice[1],lx.macro_calls)
+            if not (max_tokens is None and max_depth is None and timeout is None and cancel is None):
+                tokens = budgeted_tokens(tokens,max_tokens,max_depth,timeout,cancel)
+            r = get_parser(parser_backend,optimize).parse(None,lexer=lx,tracking=True,debug=False,tokenfunc=tokens)
+        except ErrorLimitReached:
+            r = None
+            logger.warning("Maximum number of errors reached ({}), the analysis was stopped".format(max_errors))
+        except BudgetExceeded as e:
+            r = None
+            report_budget_error(e)
+            logger.warning("{}, the analysis was stopped".format(e))
+        # Human readable error messages, rendered when read
+        errors["messages"] = ErrorMessages(s,errors["ref"])
         if print_errs:
             print_errors(s)
         logger.info("[RES] finished")
         data["main"]=r
+        if not facets is None:
+            prune_facets(data["main"],want)
+            for sub in data["subsearches"]:
+                prune_facets(sub["data"],want)
         return {"data":data,"errors":errors,"errors_count":len(errors["ref"])}
     except SyntaxError:
         pass
\ No newline at end of file
@@ -1,13 +1,18 @@
-import sys, os, json
+import sys, os, json, time, random, tempfile, threading, sqlite3
 
 from lib import spl_validator  
+from lib import pool
+from lib import daemon, client, lsp, macros, macro_index, confs, dashboards, corpus_index, near_duplicates, prefix_trie, canonical
 
 conf=None
 with open('test_conf.json') as f:
     conf = json.load(f)
 
 res={"success":0,"failure":0,"analysed":0}
-if not conf is None:
+if __name__ != "__main__":
+	# Imported by the workers of the pool test
+	pass
+elif not conf is None:
 	print("[INIT] Tests selected: {}".format(conf["selection"]))
 	for test_id in conf["test_cases"]:
 		test = conf["test_cases"][test_id]
@@ -23,13 +28,683 @@ if not conf is None:
 
 		if selected:
 			res["analysed"] += 1
-			r = spl_validator.analyze(test["search"],print_errs=False,verbose=False)
+			r = spl_validator.analyze(test["search"],print_errs=False,verbose=False,**test.get("params",{}))
 			if r["errors_count"] == test["exp_err"]:
 				res["success"] += 1
 			else:
 				res["failure"] += 1
 				print("[FAILED] {} : {} errors instead of {}\n\t{}".format(test_id,r["errors_count"],test["exp_err"],test["search"]))
 
+	# Adversarial inputs for the lexer, the lexing time must grow linearly with the length
+	adversarial={
+		"pattern_run": "a<",
+		"pattern_dots": "a.....",
+		"pattern_dates": "1/",
+		"name_template": "a<<",
+		"timespecifier": "+a",
+		"dquote_escapes": '"\\',
+		"squote_escapes": "'\\",
+		"macro_args": "`a(x,"
+	}
+	for backend in spl_validator.LEXER_BACKENDS:
+		for name in adversarial:
+			times=[]
+			for n in [2000,8000]:
+				s=adversarial[name]*n
+				best=None
+				for i in range(3):
+					st=time.perf_counter()
+					spl_validator.tokenize(s,lexer_backend=backend)
+					dt=time.perf_counter()-st
+					if best is None or dt < best:
+						best=dt
+				times.append(best)
+			res["analysed"] += 1
+			# Linear: x4, quadratic: x16
+			if times[1] < 8*times[0]:
+				res["success"] += 1
+			else:
+				res["failure"] += 1
+				print("[FAILED] adversarial {} ({}) : lexing time x{:.1f} for an input 4 times longer ({:.1f} ms)".format(name,backend,times[1]/times[0],times[1]*1000))
+
+	# Tokens longer than the bounds of the lexer regexes: same tokens as short ones
+	long_queries={
+		"earliest="+"+1d"*30+"@d latest=now | stats count": ["NAME","EQ","TIMESPECIFIER","NAME","EQ","NAME","PIPE","CMD_STATS","NAME"],
+		"index=a "+"b"*300+"* | stats count": ["NAME","EQ","NAME","PATTERN","PIPE","CMD_STATS","NAME"],
+		"index=a | eval "+"x"*300+"<<y>>=1": ["NAME","EQ","NAME","PIPE","CMD_EVAL","NAME","EQ","NUMBER"]
+	}
+	for q in long_queries:
+		for backend in spl_validator.LEXER_BACKENDS:
+			toks=spl_validator.tokenize(q,lexer_backend=backend)
+			r=spl_validator.analyze(q,print_errs=False,lexer_backend=backend)
+			res["analysed"] += 1
+			if [t.type for t in toks] == long_queries[q] and r["errors_count"] == 0:
+				res["success"] += 1
+			else:
+				res["failure"] += 1
+				print("[FAILED] long tokens ({}) : {} errors, {}\n\t{}".format(backend,r["errors_count"],[t.type for t in toks],q))
+
+	# Facets requested alone: same values as in the full analysis, for the main
+	# search and the subsearches (the input of a filter_subsearch is the output
+	# of its subsearch)
+	queries=[
+		'error [ search user=boss | return ip ]',
+		'error [ search login | return 2 user ip ] | stats count by host',
+		'index=a [search index=b | fields host] | eval x=1 | table x host',
+		'| inputlookup a.csv | search [ | inputlookup b.csv | fields user ] | stats count by user'
+	]
+	diffs=[]
+	for q in queries:
+		# The data of a result is reused by the next analysis
+		data=spl_validator.analyze(q,print_errs=False)["data"]
+		expected={facet:repr([r.get(facet) for r in [data["main"]] + [sub["data"] for sub in data["subsearches"]]]) for facet in spl_validator.FACETS}
+		for facet in sorted(spl_validator.FACETS):
+			data=spl_validator.analyze(q,print_errs=False,facets=[facet])["data"]
+			if repr([r.get(facet) for r in [data["main"]] + [sub["data"] for sub in data["subsearches"]]]) != expected[facet]:
+				diffs.append((facet,q))
+	res["analysed"] += 1
+	if len(diffs) == 0:
+		res["success"] += 1
+	else:
+		res["failure"] += 1
+		print("[FAILED] facets alone : {}".format(diffs))
+
+	# Differential test of the lexer backends: same tokens and same errors on the
+	# test cases and on fuzzed queries (random characters inserted in the test
+	# cases, random sequences of characters)
+	random.seed(0)
+	chars='ab1_.*<>/\\"\'`()[]|=,-+@:{} \n\t$!%'
+	queries=[conf["test_cases"][t]["search"] for t in conf["test_cases"]]
+	for q in list(queries):
+		for i in range(3):
+			p=random.randint(0,len(q))
+			queries.append(q[:p]+random.choice(chars)+q[p:])
+	for i in range(2000):
+		queries.append("".join(random.choice(chars) for j in range(random.randint(1,60))))
+	diffs=0
+	for q in queries:
+		tokens={}
+		for backend in spl_validator.LEXER_BACKENDS:
+			toks=spl_validator.tokenize(q,lexer_backend=backend)
+			tokens[backend]=([(t.type,t.value,t.lexpos,t.lineno,t.endlexpos) for t in toks],list(spl_validator.errors["list"]))
+		if tokens["ply"] != tokens["scanner"]:
+			diffs += 1
+			print("[FAILED] lexer backends : different tokens for\n\t{}".format(q))
+	res["analysed"] += 1
+	if diffs == 0:
+		res["success"] += 1
+	else:
+		res["failure"] += 1
+
+	# Differential test of the parser backends: same results and same errors
+	diffs=0
+	for q in queries:
+		results={}
+		for backend in spl_validator.PARSER_BACKENDS:
+			r=spl_validator.analyze(q,print_errs=False,parser_backend=backend)
+			results[backend]=(repr(r["data"]),list(r["errors"]["list"]))
+		if results["ply"] != results["lalr"]:
+			diffs += 1
+			print("[FAILED] parser backends : different results for\n\t{}".format(q))
+	res["analysed"] += 1
+	if diffs == 0:
+		res["success"] += 1
+	else:
+		res["failure"] += 1
+
+	# Custom commands registered at runtime from a commands.conf file (unknown
+	# commands before), the precompiled parse tables are used as they are
+	custom_queries=["index=a | mycommand","| mygenerator count=10 | mycommand x y opt=1 | table x"]
+	for exp_err in [1,0]:
+		if exp_err == 0:
+			spl_validator.register_commands_conf([os.path.join("lib","commands.conf")])
+		for q in custom_queries:
+			for backend in spl_validator.LEXER_BACKENDS:
+				r=spl_validator.analyze(q,print_errs=False,lexer_backend=backend)
+				res["analysed"] += 1
+				if (r["errors_count"] > 0) == (exp_err > 0):
+					res["success"] += 1
+				else:
+					res["failure"] += 1
+					print("[FAILED] custom commands ({}) : {} errors, expected {}\n\t{}".format(backend,r["errors_count"],exp_err,q))
+
+	# Command profiles: a profile without the "abstract" command and with a
+	# command unknown to the grammar (lexed as a custom command)
+	with open(os.path.join("lib","spl_commands.json")) as f:
+		profile_conf=json.load(f)
+	del profile_conf["abstract"]
+	profile_conf["newcommand"]={"token_name":"CMD_NEWCOMMAND","args":["opt"],"created_fields":[]}
+	with tempfile.TemporaryDirectory() as d:
+		with open(os.path.join(d,"test.json"),"w") as f:
+			json.dump(profile_conf,f)
+		spl_validator.register_profile("test",os.path.join(d,"test.json"))
+		profile_cases=[
+			("index=a | abstract maxterms=3",None,0),
+			("index=a | abstract maxterms=3","test",1),
+			("index=a | newcommand opt=1",None,1),
+			("index=a | newcommand opt=1","test",0),
+			("index=a | newcommand other=1","test",1)
+		]
+		for q,profile,exp_err in profile_cases:
+			r=spl_validator.analyze(q,print_errs=False,profile=profile)
+			res["analysed"] += 1
+			if r["errors_count"] == exp_err:
+				res["success"] += 1
+			else:
+				res["failure"] += 1
+				print("[FAILED] profile {} : {} errors instead of {}\n\t{}".format(profile,r["errors_count"],exp_err,q))
+
+	# Worker pool: same results as the analyses in this process, the workers
+	# being replaced along the way
+	pool_queries=[conf["test_cases"][t]["search"] for t in conf["test_cases"]]
+	with pool.ValidatorPool(2,max_queries_per_worker=100) as vp:
+		pool_res=vp.analyze(pool_queries)
+		pool_stats=vp.stats()
+	res["analysed"] += 1
+	diffs=[q for q,r in zip(pool_queries,pool_res) if r["errors_count"] != spl_validator.analyze(q,print_errs=False)["errors_count"]]
+	if len(diffs) == 0 and len(pool_stats) > 2 and sum(w["queries"] for w in pool_stats) == len(pool_queries):
+		res["success"] += 1
+	else:
+		res["failure"] += 1
+		print("[FAILED] worker pool : {} different results, {} workers used".format(len(diffs),len(pool_stats)))
+
+	# Worker pool: the custom commands and profiles registered after the start
+	# of the pool are used by the workers
+	with tempfile.TemporaryDirectory() as d:
+		with open(os.path.join(d,"test.json"),"w") as f:
+			json.dump(profile_conf,f)
+		with pool.ValidatorPool(2) as vp:
+			vp.analyze(pool_queries[:4])
+			spl_validator.register_command("mycmd")
+			spl_validator.register_profile("pooltest",os.path.join(d,"test.json"))
+			reg_cases=[("index=a | mycmd x",None),("| mygenerator count=10 | mycommand x",None),("index=a | mycmd x | newcommand opt=1","pooltest")]
+			reg_res=[[r["errors_count"] for r in vp.analyze([q]*4,profile=profile)] for q,profile in reg_cases]
+		for (q,profile),counts in zip(reg_cases,reg_res):
+			res["analysed"] += 1
+			if counts == [0]*4 and spl_validator.analyze(q,print_errs=False,profile=profile)["errors_count"] == 0:
+				res["success"] += 1
+			else:
+				res["failure"] += 1
+				print("[FAILED] worker pool registrations : {} errors\n\t{}".format(counts,q))
+
+	# Validation daemon: same errors and messages through the client as with a
+	# direct analysis
+	with tempfile.TemporaryDirectory() as d:
+		address=os.path.join(d,"test.sock")
+		mdir=os.path.join(d,"macros")
+		os.mkdir(mdir)
+		server=daemon.make_server(address,[mdir])
+		threading.Thread(target=server.serve_forever,daemon=True).start()
+		diffs=0
+		with client.Client(address) as c:
+			for test_id in list(conf["test_cases"])[:50]:
+				q=conf["test_cases"][test_id]["search"]
+				r=spl_validator.analyze(q,print_errs=False)
+				exp=[r["errors"]["messages"][eid] for eid in r["errors"]["list"]]
+				rc=c.analyze(q)
+				if [rc["errors"]["messages"][eid] for eid in rc["errors"]["list"]] != exp or rc["errors"]["ref"] != r["errors"]["ref"]:
+					diffs += 1
+					print("[FAILED] daemon : different errors for\n\t{}".format(q))
+			# A malformed macros file is an error response, the connection is kept
+			bad=os.path.join(mdir,"bad.conf")
+			with open(bad,"w") as f:
+				f.write("definition = index=a\n")
+			try:
+				c.analyze("`m`",macro_files=[bad])
+				diffs += 1
+			except client.DaemonError as e:
+				if not "MissingSectionHeaderError" in str(e):
+					diffs += 1
+			if c.analyze("index=a")["errors_count"] != 0:
+				diffs += 1
+			# The macros of a request are the ones of its files only, in order,
+			# and a changed file is read again
+			m1,m2=os.path.join(mdir,"m1.conf"),os.path.join(mdir,"m2.conf")
+			with open(m1,"w") as f:
+				f.write("[mm]\ndefinition = index=a\n")
+			with open(m2,"w") as f:
+				f.write("[mm]\ndefinition = | stats count by\n")
+			counts=[c.analyze("`mm`",macro_files=files)["errors_count"] > 0 for files in [[m1],[m2],[m2,m1],[m1]]]
+			with open(m1,"w") as f:
+				f.write("[mm]\ndefinition = | eval x=\n")
+			counts.append(c.analyze("`mm`",macro_files=[m1])["errors_count"] > 0)
+			if counts != [False,True,True,False,True]:
+				diffs += 1
+				print("[FAILED] daemon : macros of the requests {}".format(counts))
+			# Files out of the macro paths of the daemon, directly or by a link
+			outside=os.path.join(d,"outside.conf")
+			with open(outside,"w") as f:
+				f.write("[mm]\ndefinition = index=a\n")
+			os.symlink(outside,os.path.join(mdir,"link.conf"))
+			for path in [outside,os.path.join(mdir,"link.conf"),os.path.join(mdir,"..","outside.conf")]:
+				try:
+					c.analyze("`mm`",macro_files=[path])
+					diffs += 1
+					print("[FAILED] daemon : macro file {} not denied".format(path))
+				except client.DaemonError:
+					pass
+		server.shutdown()
+		server.server_close()
+	res["analysed"] += 1
+	if diffs == 0:
+		res["success"] += 1
+	else:
+		res["failure"] += 1
+
+	# Validation daemon: loopback TCP hosts only, the socket in a folder of the
+	# user only (the default one being created so) and readable by the user only
+	rejected=[]
+	for address in ["0.0.0.0:8765","10.1.2.3:8765","example.com:8765","127.0.0.1:8765","localhost:8765","[::1]:8765"]:
+		try:
+			client.parse_address(address)
+		except ValueError:
+			rejected.append(address)
+	denied=False
+	with tempfile.TemporaryDirectory() as d:
+		saved_env=os.environ.get("XDG_RUNTIME_DIR")
+		os.environ["XDG_RUNTIME_DIR"]=d
+		try:
+			server=daemon.make_server()
+		finally:
+			if saved_env is None:
+				del os.environ["XDG_RUNTIME_DIR"]
+			else:
+				os.environ["XDG_RUNTIME_DIR"]=saved_env
+		modes=[os.stat(os.path.join(d,"spl_validator")).st_mode & 0o777,os.stat(server.server_address).st_mode & 0o777]
+		server.server_close()
+		shared=os.path.join(d,"shared")
+		os.mkdir(shared)
+		os.chmod(shared,0o755)
+		try:
+			daemon.make_server(os.path.join(shared,"test.sock")).server_close()
+		except PermissionError:
+			denied=True
+	res["analysed"] += 1
+	if rejected == ["0.0.0.0:8765","10.1.2.3:8765","example.com:8765"] and modes == [0o700,0o600] and denied:
+		res["success"] += 1
+	else:
+		res["failure"] += 1
+		print("[FAILED] daemon addresses : rejected {}, modes {}, shared folder denied {}".format(rejected,[oct(m) for m in modes],denied))
+
+	# Language server: rapid changes of a document give a single analysis, of its
+	# latest version, with the error range converted to a line and a character
+	r_in,w_in=os.pipe()
+	r_out,w_out=os.pipe()
+	with open(r_in,"rb") as rf_in, open(w_in,"wb") as wf_in, open(r_out,"rb") as rf_out, open(w_out,"wb") as wf_out:
+		server=lsp.LanguageServer(rf_in,wf_out,delay=0.2)
+		th=threading.Thread(target=server.run)
+		th.start()
+		lsp.write_message(wf_in,{"jsonrpc":"2.0","id":1,"method":"initialize","params":{}})
+		lsp.read_message(rf_out)
+		text="index=a\n| stats count by x\n| foo"
+		doc={"uri":"file:///test.spl","version":0}
+		lsp.write_message(wf_in,{"jsonrpc":"2.0","method":"textDocument/didOpen","params":{"textDocument":dict(doc,text="")}})
+		for v in range(1,len(text)+1):
+			lsp.write_message(wf_in,{"jsonrpc":"2.0","method":"textDocument/didChange","params":{"textDocument":dict(doc,version=v),"contentChanges":[{"text":text[:v]}]}})
+		published=lsp.read_message(rf_out)["params"]
+		lsp.write_message(wf_in,{"jsonrpc":"2.0","method":"textDocument/didClose","params":{"textDocument":doc}})
+		closed=lsp.read_message(rf_out)["params"]
+		lsp.write_message(wf_in,{"jsonrpc":"2.0","id":2,"method":"shutdown"})
+		lsp.read_message(rf_out)
+		lsp.write_message(wf_in,{"jsonrpc":"2.0","method":"exit"})
+		th.join()
+	res["analysed"] += 1
+	diags=published["diagnostics"]
+	if published["version"] == len(text) and len(diags) == 1 and diags[0]["range"] == {"start":{"line":2,"character":2},"end":{"line":2,"character":5}} and closed["diagnostics"] == []:
+		res["success"] += 1
+	else:
+		res["failure"] += 1
+		print("[FAILED] language server : unexpected diagnostics {}".format(published))
+
+	# Language server: an unknown profile fails the initialization, a failed
+	# analysis is reported and the next ones still run
+	r_in,w_in=os.pipe()
+	r_out,w_out=os.pipe()
+	with open(r_in,"rb") as rf_in, open(w_in,"wb") as wf_in, open(r_out,"rb") as rf_out, open(w_out,"wb") as wf_out:
+		server=lsp.LanguageServer(rf_in,wf_out,delay=0.05,options={"lexer_backend":"nope"})
+		th=threading.Thread(target=server.run)
+		th.start()
+		lsp.write_message(wf_in,{"jsonrpc":"2.0","id":1,"method":"initialize","params":{"initializationOptions":{"profile":"9.2"}}})
+		init=lsp.read_message(rf_out)
+		lsp.write_message(wf_in,{"jsonrpc":"2.0","method":"textDocument/didOpen","params":{"textDocument":{"uri":"file:///a.spl","version":1,"text":"index=a | foo"}}})
+		failed=lsp.read_message(rf_out)
+		server.options["lexer_backend"]="ply"
+		lsp.write_message(wf_in,{"jsonrpc":"2.0","method":"textDocument/didOpen","params":{"textDocument":{"uri":"file:///b.spl","version":1,"text":"index=a | foo"}}})
+		published=lsp.read_message(rf_out)
+		lsp.write_message(wf_in,{"jsonrpc":"2.0","method":"exit"})
+		th.join()
+	res["analysed"] += 1
+	if init.get("error",{}).get("code") == lsp.INVALID_PARAMS and failed["method"] == "window/showMessage" and "a.spl" in failed["params"]["message"] and published["params"]["uri"] == "file:///b.spl" and len(published["params"]["diagnostics"]) == 1:
+		res["success"] += 1
+	else:
+		res["failure"] += 1
+		print("[FAILED] language server errors : {} {} {}".format(init,failed,published))
+
+	# Macros of an etc/apps tree: local over default, app "a" over app "b", the
+	# cached index being rebuilt when a file changes
+	with tempfile.TemporaryDirectory() as d:
+		apps=os.path.join(d,"apps")
+		files={
+			("b","default"):"[m1]\ndefinition = index=b_default\n[m2]\ndefinition = index=b_default\n",
+			("b","local"):"[m1]\ndefinition = index=b_local\n",
+			("a","default"):"[m1]\ndefinition = index=a_default\n[m3(1)]\nargs = x\ndefinition = index=$x$\n"
+		}
+		for (app,folder),content in files.items():
+			os.makedirs(os.path.join(apps,app,folder))
+			with open(os.path.join(apps,app,folder,"macros.conf"),"w") as f:
+				f.write(content)
+		cache=os.path.join(d,"cache.json")
+		index=macros.loadAppsTree(apps,cache)
+		cached=macros.loadAppsTree(apps,cache)
+		path=os.path.join(apps,"a","default","macros.conf")
+		with open(path,"a") as f:
+			f.write("[m4]\ndefinition = index=a\n")
+		os.utime(path,ns=(0,0))
+		changed=macros.loadAppsTree(apps,cache)
+		r=spl_validator.analyze("`m2` | search `m3(c)`",print_errs=False,macro_files=[apps])
+		# A cache file writable by others is not trusted
+		with open(cache) as f:
+			content=json.load(f)
+		content["macros"]["m1"]["definition"]="index=injected"
+		with open(cache,"w") as f:
+			json.dump(content,f)
+		os.chmod(cache,0o600)
+		trusted=macros.loadAppsTree(apps,cache)["m1"]["definition"]
+		os.chmod(cache,0o666)
+		untrusted=macros.loadAppsTree(apps,cache)["m1"]["definition"]
+		res["analysed"] += 1
+		if index["m1"]["definition"] == "index=b_local" and index["m2"]["definition"] == "index=b_default" and cached == index and "m4" in changed and r["errors_count"] == 0 and trusted == "index=injected" and untrusted == "index=b_local" and os.stat(cache).st_mode & 0o777 == 0o600:
+			res["success"] += 1
+		else:
+			res["failure"] += 1
+			print("[FAILED] macros apps tree : {}".format(index))
+
+	# Macro dependency graph: nesting deeper than 100 levels fully expanded, a
+	# cycle reported and left unexpanded
+	with tempfile.TemporaryDirectory() as d:
+		path=os.path.join(d,"macros.conf")
+		with open(path,"w") as f:
+			for i in range(150):
+				f.write("[chain{}]\ndefinition = `chain{}`\n".format(i,i+1))
+			f.write("[chain150]\ndefinition = index=deep\n")
+			f.write("[cycle_a]\ndefinition = `cycle_b(1)`\n[cycle_b(1)]\nargs = x\ndefinition = `cycle_a` $x$\n")
+		r=macros.handleMacros("`chain0` | search `cycle_a`",[path])
+		res["analysed"] += 1
+		if r["text"] == "index=deep | search `cycle_a`" and r["errors"] == ["Macro cycle: cycle_a -> cycle_b(1) -> cycle_a"]:
+			res["success"] += 1
+		else:
+			res["failure"] += 1
+			print("[FAILED] macro graph : {}".format(r))
+
+	# Macro splicing: same number of errors as the expansion of the query text,
+	# the errors found in an expansion being reported on the macro call
+	macro_file=os.path.join("lib","macros.conf")
+	macro_cases=[
+		("index=a | eval y=`fooeval(1,2)` | search `foobar`",0),
+		("index=a | stats count by x `foobar`",1),
+		("index=a | `fooeval(1,2)`",1)
+	]
+	for q,exp_err in macro_cases:
+		for backend in spl_validator.LEXER_BACKENDS:
+			rt=spl_validator.analyze(q,print_errs=False,macro_files=[macro_file],lexer_backend=backend)
+			rs=spl_validator.analyze(q,print_errs=False,macro_files=[macro_file],lexer_backend=backend,macro_expansion="tokens")
+			call=q.index("`")
+			positions=[rs["errors"]["ref"][eid][-1].end_pos for eid in rs["errors"]["list"]]
+			res["analysed"] += 1
+			if rt["errors_count"] == exp_err and rs["errors_count"] == exp_err and all(call < pos <= len(q) for pos in positions):
+				res["success"] += 1
+			else:
+				res["failure"] += 1
+				print("[FAILED] macro splicing ({}) : {} errors instead of {} at {}\n\t{}".format(backend,rs["errors_count"],exp_err,positions,q))
+
+	# Macro splicing: the content of the expressions is the expanded text, as
+	# with the expansion of the query text
+	for q in ["index=a | eval y=1+`fooeval(1,2)`*3 | where x > `fooeval(5,6)`","index=a | eval y=len(`foobar(1,2)`) | search `foobar`"]:
+		for backend in spl_validator.LEXER_BACKENDS:
+			ct=spl_validator.analyze(q,print_errs=False,macro_files=[macro_file],lexer_backend=backend)["data"]["main"]["content"]
+			cs=spl_validator.analyze(q,print_errs=False,macro_files=[macro_file],lexer_backend=backend,macro_expansion="tokens")["data"]["main"]["content"]
+			res["analysed"] += 1
+			if ct == cs:
+				res["success"] += 1
+			else:
+				res["failure"] += 1
+				print("[FAILED] macro splicing content ({}) : {} instead of {}\n\t{}".format(backend,cs,ct,q))
+
+	# Macro usage index: searches affected by a change of a macro, directly or
+	# through another macro, the index being updated incrementally
+	old_conf={"base":{"definition":"index=a"},"wrap(1)":{"args":"x","definition":"`base` $x$"},"other":{"definition":"index=b"}}
+	new_conf=dict(old_conf,base={"definition":"index=c"})
+	mindex=macro_index.MacroUsageIndex(":memory:")
+	mindex.update({"s1":"`wrap(1)` | stats count","s2":"`other`","s3":"`base` | `other`"})
+	first=mindex.affected(old_conf,new_conf)
+	updated=mindex.update({"s1":"`wrap(1)` | stats count","s2":"`other` | `wrap(2)` | `wrap(z)`"})
+	second=mindex.affected(old_conf,new_conf)
+	mindex.remove(["s3"])
+	res["analysed"] += 1
+	if first == {"s1","s3"} and updated == 1 and second == {"s1","s2","s3"} and mindex.affected(old_conf,new_conf) == {"s1","s2"}:
+		res["success"] += 1
+	else:
+		res["failure"] += 1
+		print("[FAILED] macro usage index : {} then {}".format(first,second))
+	mindex.close()
+
+	# Saved searches of an apps tree: multi-line searches, local settings over
+	# the default ones, early cut-off
+	with tempfile.TemporaryDirectory() as d:
+		files={
+			("app1","default"):"[default]\ndispatch.earliest_time = -24h\n\n[s1]\nsearch = index=a \\\n| stats count by host\ncron_schedule = */5 * * * *\n\n[s2]\nsearch = index=b | foo\n[nosearch]\naction.email = 1\n",
+			("app1","local"):"[s1]\ncron_schedule = 0 * * * *\n[s3]\nsearch = index=c\n",
+			("app2","default"):"# comment\n[s4]\nsearch = index=d\n"
+		}
+		for (app,folder),content in files.items():
+			os.makedirs(os.path.join(d,app,folder))
+			with open(os.path.join(d,app,folder,"savedsearches.conf"),"w") as f:
+				f.write(content)
+		records=list(confs.read([d]))
+		results=[(r.stanza,v["errors_count"]) for r,v in confs.validate(confs.read([d]))]
+		res["analysed"] += 1
+		if [(r.app,r.stanza) for r in records] == [("app1","s1"),("app1","s2"),("app1","s3"),("app2","s4")] and records[0].search == "index=a \n| stats count by host" and records[0].metadata == {"cron_schedule":"0 * * * *","dispatch.earliest_time":"-24h"} and results == [("s1",0),("s2",1),("s3",0),("s4",0)] and len(list(confs.read([d],limit=2))) == 2:
+			res["success"] += 1
+		else:
+			res["failure"] += 1
+			print("[FAILED] saved searches reader : {}".format(records))
+
+	# Precedence of the settings in an app: default [default] < local [default]
+	# < default stanza < local stanza, a local [default] applying to all the
+	# stanzas of the app
+	with tempfile.TemporaryDirectory() as d:
+		files={
+			"default":"[default]\ndispatch.earliest_time = -24h\ndispatch.latest_time = now\n[s1]\nsearch = index=a\n[s2]\nsearch = index=b\ndispatch.earliest_time = -1h\n",
+			"local":"[default]\ndisabled = 1\ndispatch.earliest_time = -7d\n[s2]\ndispatch.latest_time = -5m\n[s3]\nsearch = index=c\n"
+		}
+		for folder,content in files.items():
+			os.makedirs(os.path.join(d,"app",folder))
+			with open(os.path.join(d,"app",folder,"savedsearches.conf"),"w") as f:
+				f.write(content)
+		found={r.stanza:r.metadata for r in confs.read([d])}
+		res["analysed"] += 1
+		if found == {
+			"s1":{"disabled":"1","dispatch.earliest_time":"-7d","dispatch.latest_time":"now"},
+			"s2":{"disabled":"1","dispatch.earliest_time":"-1h","dispatch.latest_time":"-5m"},
+			"s3":{"disabled":"1","dispatch.earliest_time":"-7d","dispatch.latest_time":"now"}
+		}:
+			res["success"] += 1
+		else:
+			res["failure"] += 1
+			print("[FAILED] saved searches precedence : {}".format(found))
+
+	# Dashboard searches: token defaults, post-process searches, Dashboard Studio
+	# data sources, the identical queries being analyzed once
+	with tempfile.TemporaryDirectory() as d:
+		xml='''<form>
+  <search id="base"><query>index=a sourcetype=$st$</query></search>
+  <fieldset><input type="dropdown" token="st"><default>web</default></input></fieldset>
+  <row>
+    <panel><chart><search base="base"><query>stats count by host</query></search></chart></panel>
+    <panel><table><search><query>index=a sourcetype=$st$ | stats count by host</query></search></table></panel>
+  </row>
+  <row><single><search><query>index=b | foo</query></search></single></row>
+</form>'''
+		studio={"inputs":{"in1":{"options":{"token":"idx","defaultValue":"c"}}},
+			"dataSources":{"ds1":{"type":"ds.search","options":{"query":"index=$idx$"}},"ds2":{"type":"ds.chain","options":{"extend":"ds1","query":"| stats count"}}},
+			"visualizations":{"viz1":{"dataSources":{"primary":"ds2"}}}}
+		with open(os.path.join(d,"a.xml"),"w") as f:
+			f.write(xml)
+		with open(os.path.join(d,"b.json"),"w") as f:
+			json.dump(studio,f)
+		panels=list(dashboards.read([d]))
+		results=dashboards.validate(panels)
+		found=[(os.path.basename(p.dashboard),p.panel,p.query) for p in panels]
+		expected=[
+			("a.xml","search:base","index=a sourcetype=web"),
+			("a.xml","row1/panel1","index=a sourcetype=web | stats count by host"),
+			("a.xml","row1/panel2","index=a sourcetype=web | stats count by host"),
+			("a.xml","row2/panel1","index=b | foo"),
+			("b.json","ds:ds1","index=c"),
+			("b.json","viz1","index=c | stats count")
+		]
+		res["analysed"] += 1
+		if found == expected and results[1][1] is results[2][1] and [r["errors_count"] for p,r in results] == [0,0,0,1,0,0]:
+			res["success"] += 1
+		else:
+			res["failure"] += 1
+			print("[FAILED] dashboard searches : {}".format(found))
+		# Malformed files: reported with their path, the other files still read
+		with open(os.path.join(d,"c.xml"),"w") as f:
+			f.write("<form><row><panel><search><query>index=a</query></panel>")
+		with open(os.path.join(d,"d.json"),"w") as f:
+			f.write('{"dataSources": {')
+		read_errors=[]
+		found=[(os.path.basename(p.dashboard),p.panel) for p in dashboards.read([d],errors=read_errors)]
+		res["analysed"] += 1
+		if found == [e[:2] for e in expected] and [os.path.basename(path) for path,msg in read_errors] == ["c.xml","d.json"]:
+			res["success"] += 1
+		else:
+			res["failure"] += 1
+			print("[FAILED] malformed dashboards : {} {}".format(found,read_errors))
+
+	# Corpus index: postings of the fields, commands, lookups, indexes,
+	# sourcetypes and macros, only the changed searches being analyzed again
+	ix=corpus_index.CorpusIndex(":memory:")
+	corpus={
+		"a":'index=main sourcetype=web src_ip=1 | lookup local=t geo ip OUTPUT city | stats count by host',
+		"b":'(index=x OR index=main) | transaction host | outputlookup bar.csv',
+		"c":'| inputlookup append=t foo.csv | stats count by src_ip'
+	}
+	counts=[ix.update(corpus),ix.update(corpus)]
+	counts.append(ix.update({"a":'sourcetype=web  index=main src_ip="1" | LOOKUP local=t geo ip output city | stats count BY host'}))
+	corpus["b"]='index=x | `m(1)` | transaction host'
+	del corpus["c"]
+	counts.append(ix.sync(corpus))
+	found=[ix.searches("field","src_ip"),ix.searches("command",["lookup","stats"]),ix.searches("index","main"),ix.searches("lookup","geo"),ix.searches("macro","m(1)"),ix.searches("lookup","foo.csv")]
+	res["analysed"] += 1
+	if counts == [3,0,0,1] and found == [{"a"},{"a"},{"a"},{"a"},{"b"},set()] and len(ix) == 2 and ix.terms("sourcetype") == [("web",1)]:
+		res["success"] += 1
+	else:
+		res["failure"] += 1
+		print("[FAILED] corpus index : {} {}".format(counts,found))
+	ix.close()
+
+	# Corpus index built before the fingerprints: upgraded on opening, its
+	# searches are kept
+	with tempfile.TemporaryDirectory() as d:
+		path=os.path.join(d,"old.db")
+		db=sqlite3.connect(path)
+		db.executescript("""
+CREATE TABLE searches (id INTEGER PRIMARY KEY, name TEXT NOT NULL UNIQUE, digest TEXT NOT NULL);
+CREATE TABLE terms (id INTEGER PRIMARY KEY, kind TEXT NOT NULL, term TEXT NOT NULL, UNIQUE (kind, term));
+CREATE TABLE postings (term INTEGER NOT NULL, search INTEGER NOT NULL, PRIMARY KEY (term, search)) WITHOUT ROWID;
+INSERT INTO searches VALUES (1, 'a', '{}');
+INSERT INTO terms VALUES (1, 'command', 'stats');
+INSERT INTO postings VALUES (1, 1);
+""".format(corpus_index.digest("index=a | stats count")))
+		db.close()
+		ix=corpus_index.CorpusIndex(path)
+		counts=[ix.update({"a":"index=a | stats count"}),ix.update({"a":"index=a | top x"}),ix.update({"a":"index=a  | TOP x"})]
+		found=[ix.searches("command","top"),ix.db.execute("PRAGMA user_version").fetchone()[0]]
+		ix.close()
+	res["analysed"] += 1
+	if counts == [0,1,0] and found == [{"a"},corpus_index.SCHEMA_VERSION]:
+		res["success"] += 1
+	else:
+		res["failure"] += 1
+		print("[FAILED] corpus index migration : {} {}".format(counts,found))
+
+	# Near-duplicate searches: clusters of the searches with similar token
+	# streams (the numbers being ignored)
+	corpus={
+		"a":"index=web sourcetype=access status=500 | stats count by host, uri | where count > 10 | sort - count",
+		"b":"index=web sourcetype=access status=500 | stats count by host, uri | where count > 50 | sort - count",
+		"c":"index=web sourcetype=access status=500 | stats count by host, uri | where count > 50 | sort - count | head 20",
+		"d":"index=fw action=blocked | timechart span=1h count by src_ip",
+		"e":"index=fw action=blocked | timechart span=5m count by src_ip",
+		"f":"| inputlookup users.csv | table user",
+		"g":"",
+		"h":"`fw_blocked` | stats count by src",
+		"i":"`web_errors` | stats count by src"
+	}
+	clusters=near_duplicates.find_clusters(corpus)
+	res["analysed"] += 1
+	if [c.names for c in clusters] == [["a","b","c"],["d","e"]] and clusters[0].similarity >= 0.7 and near_duplicates.similarity(near_duplicates.signature(corpus["a"]),near_duplicates.signature(corpus["b"])) == 1.0 and near_duplicates.similarity(near_duplicates.signature(corpus["h"]),near_duplicates.signature(corpus["i"])) < 1.0:
+		res["success"] += 1
+	else:
+		res["failure"] += 1
+		print("[FAILED] near-duplicates : {}".format(clusters))
+
+	# Shared pipeline prefixes: normalized stages (terms of the base search
+	# sorted), the longest prefixes shared by enough searches
+	trie=prefix_trie.PrefixTrie()
+	corpus={"fw{}".format(i):"index=fw sourcetype=pan | stats count by src | where count > {}".format(i) for i in range(4)}
+	corpus["fw_head"]="search sourcetype=pan  index=fw | stats count by src | head 5"
+	corpus["web"]="index=web | stats count by uri"
+	corpus["invalid"]="index=fw sourcetype=pan | stats count by"
+	inserted=trie.update(corpus)
+	shared=trie.shared(min_searches=3)
+	res["analysed"] += 1
+	if inserted == 6 and [(p.stages,p.names) for p in shared] == [(["index=fw sourcetype=pan","stats count by src"],["fw0","fw1","fw2","fw3","fw_head"])] and prefix_trie.stages('| inputlookup a.csv | search (index=b OR x="y  z")') == ["","inputlookup a.csv",'search ( index=b or x="y z" )'] and prefix_trie.stages("index=fw `only_blocked` | stats count by src") == ["index=fw `only_blocked`","stats count by src"] != prefix_trie.stages("index=fw | stats count by src"):
+		res["success"] += 1
+	else:
+		res["failure"] += 1
+		print("[FAILED] shared prefixes : {}".format(shared))
+
+	# Canonical text: equivalent queries (spaces, case, quotes, order of the
+	# terms and options) share a fingerprint, the others do not
+	same=[
+		['search sourcetype=pan  index=fw | STATS count BY src','index=fw sourcetype="pan" | stats count by src'],
+		['index=a (x=1 OR y=2) | top showperc=f limit="5" user','index=a ( x = 1 or y=2 ) | top limit=5 showperc=f user'],
+		['| inputlookup foo.csv | join x [search index=y  |  eval z = 1]','|inputlookup foo.csv|join x [ search index=y | eval z=1 ]']
+	]
+	different=[
+		['index=a | eval x="b"','index=a | eval x=b'],
+		['index=a x OR y z','index=a x OR z y'],
+		['index=a | rex "abc"','index=a | rex abc'],
+		['index=a | eval x=1, y=x+1','index=a | eval y=x+1, x=1'],
+		['`m` a b','a `m` b']
+	]
+	res["analysed"] += 1
+	if all(canonical.fingerprint(a) == canonical.fingerprint(b) for a,b in same) and all(canonical.fingerprint(a) != canonical.fingerprint(b) for a,b in different) and len(canonical.fingerprint(same[0][0])) == 32 and canonical.canonicalize(same[1][0]) == "index=a (x=1 OR y=2) | top limit=5 showperc=f user":
+		res["success"] += 1
+	else:
+		res["failure"] += 1
+		print("[FAILED] canonical text : {}".format([(canonical.canonicalize(a),canonical.canonicalize(b)) for a,b in same+different]))
+	# The canonical text of the valid queries of the tests is valid, with the
+	# same fields and commands, and is its own canonical text
+	failed=[]
+	for t in conf["test_cases"].values():
+		r=spl_validator.analyze(t["search"],print_errs=False)
+		if r["errors_count"] > 0:
+			continue
+		text=canonical.canonicalize(t["search"])
+		r2=spl_validator.analyze(text,print_errs=False)
+		if r2["errors_count"] > 0 or canonical.canonicalize(text) != text or sorted(map(str,r["data"]["main"]["input"])) != sorted(map(str,r2["data"]["main"]["input"])) or r["data"]["main"]["cmd"] != r2["data"]["main"]["cmd"]:
+			failed.append(t["search"])
+	res["analysed"] += 1
+	if len(failed) == 0:
+		res["success"] += 1
+	else:
+		res["failure"] += 1
+		print("[FAILED] canonical text of the tests : {}".format(failed))
+
 	print("[RESULT] {} on {} success".format(res["success"],res["analysed"]))
 else:
 	print("[ERROR] Could not find the configuration file 'test_conf.json'")
\ No newline at end of file